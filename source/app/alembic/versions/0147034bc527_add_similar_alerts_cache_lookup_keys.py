@@ -0,0 +1,61 @@
+"""Add similar alerts cache lookup keys
+
+Revision ID: 0147034bc527
+Revises: 9b2e374ab6a7
+Create Date: 2026-10-18 11:04:27.190343
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import text
+
+from app.alembic.alembic_utils import _has_table, _table_has_column, index_exists
+
+# revision identifiers, used by Alembic.
+revision = '0147034bc527'
+down_revision = '9b2e374ab6a7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not _has_table('similar_alerts_cache'):
+        return
+
+    if not _table_has_column('similar_alerts_cache', 'observable_hash'):
+        op.add_column('similar_alerts_cache', sa.Column('observable_hash', sa.BigInteger, nullable=True))
+
+    if not _table_has_column('similar_alerts_cache', 'time_bucket'):
+        op.add_column('similar_alerts_cache', sa.Column('time_bucket', sa.Integer, nullable=True))
+
+    # Same keys as similar_alerts_observable_hash and similar_alerts_time_bucket in app.models.alerts
+    op.execute(text("""
+        UPDATE similar_alerts_cache
+        SET observable_hash = ('x' || substr(md5(
+                CASE WHEN asset_name IS NOT NULL
+                    THEN 'asset:' || coalesce(asset_type_id::text, '') || ':' || asset_name
+                    ELSE 'ioc:' || coalesce(ioc_type_id::text, '') || ':' || coalesce(ioc_value, '')
+                END), 1, 16))::bit(64)::bigint,
+            time_bucket = created_at::date - DATE '1970-01-01'
+        WHERE observable_hash IS NULL OR time_bucket IS NULL
+    """))
+
+    # The ids are included so that the related alerts lookups and their cache checks are index only scans
+    if not index_exists('similar_alerts_cache', 'idx_similar_alerts_cache_observable'):
+        op.create_index('idx_similar_alerts_cache_observable', 'similar_alerts_cache',
+                        ['customer_id', 'observable_hash', 'time_bucket'],
+                        postgresql_include=['alert_id', 'id'])
+
+
+def downgrade():
+    if not _has_table('similar_alerts_cache'):
+        return
+
+    if index_exists('similar_alerts_cache', 'idx_similar_alerts_cache_observable'):
+        op.drop_index('idx_similar_alerts_cache_observable', table_name='similar_alerts_cache')
+
+    if _table_has_column('similar_alerts_cache', 'time_bucket'):
+        op.drop_column('similar_alerts_cache', 'time_bucket')
+
+    if _table_has_column('similar_alerts_cache', 'observable_hash'):
+        op.drop_column('similar_alerts_cache', 'observable_hash')
@@ -0,0 +1,45 @@
+"""Add user case effective access unique index
+
+Revision ID: 5d0c7a1e94b3
+Revises: 0147034bc527
+Create Date: 2026-10-18 14:21:09.528106
+
+"""
+from alembic import op
+from sqlalchemy import text
+
+from app.alembic.alembic_utils import _has_table, index_exists
+
+# revision identifiers, used by Alembic.
+revision = '5d0c7a1e94b3'
+down_revision = '0147034bc527'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not _has_table('user_case_effective_access'):
+        return
+
+    if index_exists('user_case_effective_access', 'idx_user_case_effective_access_user_case'):
+        return
+
+    # Duplicated accesses were possible, keep the most recent one of each user and case
+    op.execute(text("""
+        DELETE FROM user_case_effective_access older
+        USING user_case_effective_access newer
+        WHERE older.user_id = newer.user_id
+            AND older.case_id = newer.case_id
+            AND older.id < newer.id
+    """))
+
+    op.create_index('idx_user_case_effective_access_user_case', 'user_case_effective_access',
+                    ['user_id', 'case_id'], unique=True)
+
+
+def downgrade():
+    if not _has_table('user_case_effective_access'):
+        return
+
+    if index_exists('user_case_effective_access', 'idx_user_case_effective_access_user_case'):
+        op.drop_index('idx_user_case_effective_access_user_case', table_name='user_case_effective_access')
@@ -0,0 +1,47 @@
+"""Add data store blobs
+
+Revision ID: a1c5e8f3d047
+Revises: f7b3c0d82e19
+Create Date: 2026-10-18 20:12:33.618204
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from app.alembic.alembic_utils import _has_table, _table_has_column, index_exists
+
+# revision identifiers, used by Alembic.
+revision = 'a1c5e8f3d047'
+down_revision = 'f7b3c0d82e19'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not _has_table('data_store_blob'):
+        op.create_table('data_store_blob',
+                        sa.Column('blob_id', sa.BigInteger, primary_key=True),
+                        sa.Column('blob_sha256', sa.Text, nullable=False),
+                        sa.Column('blob_password_sha256', sa.Text, nullable=False, server_default=''),
+                        sa.Column('blob_size', sa.BigInteger, nullable=False),
+                        sa.Column('blob_local_name', sa.Text, nullable=False),
+                        sa.Column('blob_ref_count', sa.BigInteger, nullable=False, server_default='0'),
+                        sa.Column('blob_date_added', sa.DateTime, nullable=True),
+                        sa.UniqueConstraint('blob_sha256', 'blob_password_sha256',
+                                            name='data_store_blob_sha256_password_key'))
+
+    # The existing files keep their own copy, they are not moved into the blobs
+    if _has_table('data_store_file') and not _table_has_column('data_store_file', 'file_blob_id'):
+        op.add_column('data_store_file', sa.Column('file_blob_id', sa.BigInteger,
+                                                   sa.ForeignKey('data_store_blob.blob_id'), nullable=True))
+
+    if not index_exists('data_store_file', 'ix_data_store_file_file_blob_id'):
+        op.create_index('ix_data_store_file_file_blob_id', 'data_store_file', ['file_blob_id'])
+
+
+def downgrade():
+    if _table_has_column('data_store_file', 'file_blob_id'):
+        op.drop_column('data_store_file', 'file_blob_id')
+
+    if _has_table('data_store_blob'):
+        op.drop_table('data_store_blob')
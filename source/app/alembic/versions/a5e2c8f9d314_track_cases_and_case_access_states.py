@@ -0,0 +1,96 @@
+"""Track the cases and case access states in the database
+
+Revision ID: a5e2c8f9d314
+Revises: f1d8a3b6c072
+Create Date: 2026-10-19 10:27:53.640215
+
+"""
+from alembic import op
+from sqlalchemy import text
+
+from app.alembic.alembic_utils import _table_has_column
+
+# revision identifiers, used by Alembic.
+revision = 'a5e2c8f9d314'
+down_revision = 'f1d8a3b6c072'
+branch_labels = None
+depends_on = None
+
+_CASE_ACCESS_EVENTS = {
+    'insert': ('INSERT', 'NEW'),
+    'update': ('UPDATE', 'NEW'),
+    'delete': ('DELETE', 'OLD')
+}
+
+
+def upgrade():
+    # Shadowed the query attribute of the models
+    if _table_has_column('graphql_persisted_query', 'query'):
+        op.alter_column('graphql_persisted_query', 'query', new_column_name='query_document')
+
+    # Same bump as the global states of app.datamgmt.states, for the given names
+    op.execute(text("""
+        CREATE OR REPLACE FUNCTION object_state_bump(p_object_names text[]) RETURNS void AS $$
+        BEGIN
+            UPDATE object_state
+            SET object_state = object_state + 1, object_last_update = timezone('utc', now())
+            WHERE object_case_id IS NULL AND object_name = ANY(p_object_names);
+
+            INSERT INTO object_state (object_name, object_state, object_last_update)
+            SELECT DISTINCT n.name, 0, timezone('utc', now())
+            FROM unnest(p_object_names) AS n(name)
+            WHERE NOT EXISTS (
+                SELECT 1 FROM object_state s WHERE s.object_case_id IS NULL AND s.object_name = n.name
+            );
+        END
+        $$ LANGUAGE plpgsql
+    """))
+
+    # Once per statement, so that batch updates of the cases bump the state once
+    op.execute(text("""
+        CREATE OR REPLACE FUNCTION cases_state_update() RETURNS trigger AS $$
+        BEGIN
+            PERFORM object_state_bump(ARRAY['cases']);
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """))
+    op.execute(text("DROP TRIGGER IF EXISTS cases_state_update_trigger ON cases"))
+    op.execute(text("""
+        CREATE TRIGGER cases_state_update_trigger
+        AFTER INSERT OR UPDATE OR DELETE ON cases
+        FOR EACH STATEMENT EXECUTE PROCEDURE cases_state_update()
+    """))
+
+    # Each user whose effective access changed gets a new case_access:<user_id> state
+    op.execute(text("""
+        CREATE OR REPLACE FUNCTION user_case_effective_access_state_update() RETURNS trigger AS $$
+        BEGIN
+            PERFORM object_state_bump(ARRAY(SELECT DISTINCT 'case_access:' || user_id FROM changed_rows));
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """))
+    for name, (event, transition) in _CASE_ACCESS_EVENTS.items():
+        op.execute(text(f"DROP TRIGGER IF EXISTS user_case_effective_access_state_{name}_trigger "
+                        f"ON user_case_effective_access"))
+        op.execute(text(f"""
+            CREATE TRIGGER user_case_effective_access_state_{name}_trigger
+            AFTER {event} ON user_case_effective_access
+            REFERENCING {transition} TABLE AS changed_rows
+            FOR EACH STATEMENT EXECUTE PROCEDURE user_case_effective_access_state_update()
+        """))
+
+
+def downgrade():
+    for name in _CASE_ACCESS_EVENTS:
+        op.execute(text(f"DROP TRIGGER IF EXISTS user_case_effective_access_state_{name}_trigger "
+                        f"ON user_case_effective_access"))
+    op.execute(text("DROP FUNCTION IF EXISTS user_case_effective_access_state_update()"))
+
+    op.execute(text("DROP TRIGGER IF EXISTS cases_state_update_trigger ON cases"))
+    op.execute(text("DROP FUNCTION IF EXISTS cases_state_update()"))
+    op.execute(text("DROP FUNCTION IF EXISTS object_state_bump(text[])"))
+
+    if _table_has_column('graphql_persisted_query', 'query_document'):
+        op.alter_column('graphql_persisted_query', 'query_document', new_column_name='query')
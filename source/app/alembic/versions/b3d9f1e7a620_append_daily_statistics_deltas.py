@@ -0,0 +1,158 @@
+"""Append the daily statistics deltas
+
+Revision ID: b3d9f1e7a620
+Revises: a5e2c8f9d314
+Create Date: 2026-10-19 11:42:08.215673
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import text
+
+from app.alembic.alembic_utils import _has_table
+
+# revision identifiers, used by Alembic.
+revision = 'b3d9f1e7a620'
+down_revision = 'a5e2c8f9d314'
+branch_labels = None
+depends_on = None
+
+# Object type, day, customer and status of the rows of each table, selected from a transition table named {rows}.
+# The tasks count for the customer of their case
+_STATISTICS_SOURCES = {
+    'cases': ('case', """
+        SELECT open_date, client_id, state_id FROM {rows}
+    """),
+    'alerts': ('alert', """
+        SELECT alert_creation_time::date, alert_customer_id, alert_status_id FROM {rows}
+    """),
+    'case_tasks': ('task', """
+        SELECT r.task_open_date::date, c.client_id, r.task_status_id FROM {rows} r
+        JOIN cases c ON c.case_id = r.task_case_id
+    """)
+}
+
+# Transition tables of each event, with the sign of their rows in the deltas
+_EVENTS = {
+    'insert': ('INSERT', {'new_rows': 1}),
+    'update': ('UPDATE', {'old_rows': -1, 'new_rows': 1}),
+    'delete': ('DELETE', {'old_rows': -1})
+}
+
+_REFERENCING = {
+    'old_rows': 'OLD TABLE AS old_rows',
+    'new_rows': 'NEW TABLE AS new_rows'
+}
+
+# The tasks follow the case when it is moved to another customer
+_CASES_TASKS_MOVE = """
+    INSERT INTO daily_statistics_delta (stat_day, client_id, object_type, status_id, object_count)
+    SELECT t.task_open_date::date, moved.client_id, 'task', coalesce(t.task_status_id, 0), sum(moved.sign)
+    FROM (
+        SELECT o.case_id, o.client_id, -1 FROM old_rows o
+        JOIN new_rows n ON n.case_id = o.case_id AND n.client_id IS DISTINCT FROM o.client_id
+        UNION ALL
+        SELECT n.case_id, n.client_id, 1 FROM new_rows n
+        JOIN old_rows o ON o.case_id = n.case_id AND o.client_id IS DISTINCT FROM n.client_id
+    ) AS moved (case_id, client_id, sign)
+    JOIN case_tasks t ON t.task_case_id = moved.case_id
+    WHERE t.task_open_date IS NOT NULL AND moved.client_id IS NOT NULL
+    GROUP BY 1, 2, 4;
+"""
+
+
+def _delta_function(table, event):
+    object_type, source = _STATISTICS_SOURCES[table]
+    _, transition_tables = _EVENTS[event]
+    rows = ' UNION ALL '.join(f'SELECT *, {sign} FROM ({source.format(rows=transition_table)}) AS s'
+                              for transition_table, sign in transition_tables.items())
+
+    # The rows of the statement are aggregated, so the statement appends at most one delta per day, customer and
+    # status, and none when the counted columns did not change
+    return f"""
+        CREATE OR REPLACE FUNCTION {table}_statistics_{event}() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO daily_statistics_delta (stat_day, client_id, object_type, status_id, object_count)
+            SELECT day, client_id, '{object_type}', coalesce(status_id, 0), sum(sign)
+            FROM ({rows}) AS delta (day, client_id, status_id, sign)
+            WHERE day IS NOT NULL AND client_id IS NOT NULL
+            GROUP BY 1, 2, 4
+            HAVING sum(sign) <> 0;
+            {_CASES_TASKS_MOVE if table == 'cases' and event == 'update' else ''}
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """
+
+
+def upgrade():
+    # The triggers only append to this table, so the concurrent writers never wait on the same rows. The deltas are
+    # periodically rolled up into daily_statistics, by a single worker at a time
+    if not _has_table('daily_statistics_delta'):
+        op.create_table('daily_statistics_delta',
+                        sa.Column('id', sa.BigInteger, primary_key=True),
+                        sa.Column('stat_day', sa.Date, nullable=False),
+                        sa.Column('client_id', sa.Integer, nullable=False),
+                        sa.Column('object_type', sa.Text, nullable=False),
+                        sa.Column('status_id', sa.Integer, nullable=False),
+                        sa.Column('object_count', sa.BigInteger, nullable=False))
+
+    op.execute(text("""
+        CREATE OR REPLACE FUNCTION daily_statistics_rollup() RETURNS bigint AS $$
+        DECLARE
+            rolled_up bigint;
+        BEGIN
+            IF NOT pg_try_advisory_xact_lock(hashtext('daily_statistics_rollup')) THEN
+                RETURN 0;
+            END IF;
+
+            WITH deltas AS (
+                DELETE FROM daily_statistics_delta
+                RETURNING stat_day, client_id, object_type, status_id, object_count
+            ), rolled AS (
+                INSERT INTO daily_statistics (stat_day, client_id, object_type, status_id, object_count)
+                SELECT stat_day, client_id, object_type, status_id, sum(object_count) FROM deltas
+                GROUP BY 1, 2, 3, 4
+                ORDER BY 1, 2, 3, 4
+                ON CONFLICT (stat_day, client_id, object_type, status_id)
+                DO UPDATE SET object_count = daily_statistics.object_count + EXCLUDED.object_count
+                RETURNING 1
+            )
+            SELECT count(*) INTO rolled_up FROM rolled;
+
+            RETURN rolled_up;
+        END
+        $$ LANGUAGE plpgsql
+    """))
+
+    for table in _STATISTICS_SOURCES:
+        op.execute(text(f"DROP TRIGGER IF EXISTS {table}_statistics_update_trigger ON {table}"))
+        op.execute(text(f"DROP FUNCTION IF EXISTS {table}_statistics_update()"))
+
+        for event, (operation, transition_tables) in _EVENTS.items():
+            referencing = ' '.join(_REFERENCING[transition_table] for transition_table in transition_tables)
+            op.execute(text(_delta_function(table, event)))
+            op.execute(text(f"DROP TRIGGER IF EXISTS {table}_statistics_{event}_trigger ON {table}"))
+            op.execute(text(f"""
+                CREATE TRIGGER {table}_statistics_{event}_trigger
+                AFTER {operation} ON {table}
+                REFERENCING {referencing}
+                FOR EACH STATEMENT EXECUTE PROCEDURE {table}_statistics_{event}()
+            """))
+
+    op.execute(text("DROP FUNCTION IF EXISTS daily_statistics_move_case_tasks(bigint, bigint, bigint)"))
+    op.execute(text("DROP FUNCTION IF EXISTS daily_statistics_add(date, bigint, text, bigint, bigint)"))
+
+
+def downgrade():
+    # The pending deltas are rolled up, but the row triggers of the previous revision are not restored
+    for table in _STATISTICS_SOURCES:
+        for event in _EVENTS:
+            op.execute(text(f"DROP TRIGGER IF EXISTS {table}_statistics_{event}_trigger ON {table}"))
+            op.execute(text(f"DROP FUNCTION IF EXISTS {table}_statistics_{event}()"))
+
+    if _has_table('daily_statistics_delta'):
+        op.execute(text("SELECT daily_statistics_rollup()"))
+        op.drop_table('daily_statistics_delta')
+
+    op.execute(text("DROP FUNCTION IF EXISTS daily_statistics_rollup()"))
@@ -0,0 +1,36 @@
+"""Add timeline filter indexes
+
+Revision ID: b81f4c2d7e60
+Revises: 5d0c7a1e94b3
+Create Date: 2026-10-18 15:02:44.731925
+
+"""
+from alembic import op
+
+from app.alembic.alembic_utils import _has_table, index_exists
+
+# revision identifiers, used by Alembic.
+revision = 'b81f4c2d7e60'
+down_revision = '5d0c7a1e94b3'
+branch_labels = None
+depends_on = None
+
+_INDEXES = [
+    # Ordered timeline of a case, and keyset of its pagination
+    ('cases_events', 'idx_cases_events_case_date_id', ['case_id', 'event_date', 'event_id']),
+    # Links of the events of a case, read by the timeline filter
+    ('case_events_assets', 'idx_case_events_assets_case_event', ['case_id', 'event_id']),
+    ('case_events_ioc', 'idx_case_events_ioc_case_event', ['case_id', 'event_id'])
+]
+
+
+def upgrade():
+    for table_name, index_name, columns in _INDEXES:
+        if _has_table(table_name) and not index_exists(table_name, index_name):
+            op.create_index(index_name, table_name, columns)
+
+
+def downgrade():
+    for table_name, index_name, _ in _INDEXES:
+        if _has_table(table_name) and index_exists(table_name, index_name):
+            op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,49 @@
+"""Add data store uploads
+
+Revision ID: b8d2f4a6c913
+Revises: a1c5e8f3d047
+Create Date: 2026-10-18 21:03:18.240571
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.alembic.alembic_utils import _has_table, index_exists
+
+# revision identifiers, used by Alembic.
+revision = 'b8d2f4a6c913'
+down_revision = 'a1c5e8f3d047'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not _has_table('data_store_upload'):
+        op.create_table('data_store_upload',
+                        sa.Column('upload_id', sa.BigInteger, primary_key=True),
+                        sa.Column('upload_uuid', UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'),
+                                  nullable=False, unique=True),
+                        sa.Column('upload_case_id', sa.BigInteger, sa.ForeignKey('cases.case_id'), nullable=False),
+                        sa.Column('upload_user_id', sa.BigInteger, sa.ForeignKey('user.id'), nullable=False),
+                        sa.Column('upload_parent_id', sa.BigInteger, sa.ForeignKey('data_store_path.path_id'),
+                                  nullable=False),
+                        sa.Column('upload_size', sa.BigInteger, nullable=False),
+                        sa.Column('upload_offset', sa.BigInteger, nullable=False, server_default='0'),
+                        sa.Column('upload_local_name', sa.Text, nullable=False),
+                        sa.Column('upload_date_created', sa.DateTime, nullable=False),
+                        sa.Column('upload_date_updated', sa.DateTime, nullable=False),
+                        sa.Column('file_original_name', sa.Text, nullable=False),
+                        sa.Column('file_description', sa.Text, nullable=True),
+                        sa.Column('file_tags', sa.Text, nullable=True),
+                        sa.Column('file_password', sa.Text, nullable=True),
+                        sa.Column('file_is_ioc', sa.Boolean, nullable=False, server_default=sa.false()),
+                        sa.Column('file_is_evidence', sa.Boolean, nullable=False, server_default=sa.false()))
+
+    if not index_exists('data_store_upload', 'ix_data_store_upload_upload_case_id'):
+        op.create_index('ix_data_store_upload_upload_case_id', 'data_store_upload', ['upload_case_id'])
+
+
+def downgrade():
+    if _has_table('data_store_upload'):
+        op.drop_table('data_store_upload')
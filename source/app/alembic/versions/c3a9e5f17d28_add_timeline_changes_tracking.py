@@ -0,0 +1,67 @@
+"""Add timeline changes tracking
+
+Revision ID: c3a9e5f17d28
+Revises: b81f4c2d7e60
+Create Date: 2026-10-18 16:37:12.094518
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import text
+
+from app.alembic.alembic_utils import _has_table, _table_has_column, index_exists
+
+# revision identifiers, used by Alembic.
+revision = 'c3a9e5f17d28'
+down_revision = 'b81f4c2d7e60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(text("CREATE SEQUENCE IF NOT EXISTS cases_events_change_seq"))
+
+    if _has_table('cases_events'):
+        if not _table_has_column('cases_events', 'event_change_seq'):
+            op.add_column('cases_events', sa.Column('event_change_seq', sa.BigInteger, nullable=True))
+
+        # Existing events are numbered in their creation order
+        op.execute(text("""
+            UPDATE cases_events
+            SET event_change_seq = numbered.change_seq
+            FROM (
+                SELECT event_id, nextval('cases_events_change_seq') AS change_seq
+                FROM (SELECT event_id FROM cases_events WHERE event_change_seq IS NULL ORDER BY event_id) AS pending
+            ) AS numbered
+            WHERE cases_events.event_id = numbered.event_id
+        """))
+
+        if not index_exists('cases_events', 'idx_cases_events_case_change_seq'):
+            op.create_index('idx_cases_events_case_change_seq', 'cases_events', ['case_id', 'event_change_seq'])
+
+    if not _has_table('cases_events_deletions'):
+        op.create_table('cases_events_deletions',
+                        sa.Column('id', sa.BigInteger, primary_key=True),
+                        sa.Column('case_id', sa.BigInteger, sa.ForeignKey('cases.case_id'), nullable=False),
+                        sa.Column('event_id', sa.BigInteger, nullable=False),
+                        sa.Column('event_change_seq', sa.BigInteger, nullable=False,
+                                  server_default=text("nextval('cases_events_change_seq')"))
+                        )
+
+    if not index_exists('cases_events_deletions', 'idx_cases_events_deletions_case_seq'):
+        op.create_index('idx_cases_events_deletions_case_seq', 'cases_events_deletions',
+                        ['case_id', 'event_change_seq'])
+
+
+def downgrade():
+    if _has_table('cases_events_deletions'):
+        op.drop_table('cases_events_deletions')
+
+    if _has_table('cases_events'):
+        if index_exists('cases_events', 'idx_cases_events_case_change_seq'):
+            op.drop_index('idx_cases_events_case_change_seq', table_name='cases_events')
+
+        if _table_has_column('cases_events', 'event_change_seq'):
+            op.drop_column('cases_events', 'event_change_seq')
+
+    op.execute(text("DROP SEQUENCE IF EXISTS cases_events_change_seq"))
@@ -0,0 +1,32 @@
+"""Add graphql persisted queries
+
+Revision ID: c4f7a2e9d150
+Revises: b8d2f4a6c913
+Create Date: 2026-10-18 22:14:05.617392
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from app.alembic.alembic_utils import _has_table
+
+# revision identifiers, used by Alembic.
+revision = 'c4f7a2e9d150'
+down_revision = 'b8d2f4a6c913'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not _has_table('graphql_persisted_query'):
+        op.create_table('graphql_persisted_query',
+                        sa.Column('id', sa.BigInteger, primary_key=True),
+                        sa.Column('query_hash', sa.Text, nullable=False, unique=True),
+                        sa.Column('query', sa.Text, nullable=False),
+                        sa.Column('created_by_id', sa.BigInteger, sa.ForeignKey('user.id'), nullable=False),
+                        sa.Column('created_at', sa.DateTime, nullable=False))
+
+
+def downgrade():
+    if _has_table('graphql_persisted_query'):
+        op.drop_table('graphql_persisted_query')
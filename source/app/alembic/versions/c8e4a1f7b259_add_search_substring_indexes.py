@@ -0,0 +1,45 @@
+"""Add search substring indexes
+
+Revision ID: c8e4a1f7b259
+Revises: b3d9f1e7a620
+Create Date: 2026-10-19 13:05:44.381920
+
+"""
+from alembic import op
+from sqlalchemy import text
+
+from app.alembic.alembic_utils import _has_table, index_exists
+
+# revision identifiers, used by Alembic.
+revision = 'c8e4a1f7b259'
+down_revision = 'b3d9f1e7a620'
+branch_labels = None
+depends_on = None
+
+# Columns searched by substring along with the full text search, for the partial IPs, hostnames and hashes
+_SUBSTRING_COLUMNS = {
+    'notes': ['note_title', 'note_content'],
+    'comments': ['comment_text'],
+    'cases_events': ['event_title', 'event_content', 'event_raw'],
+    'case_assets': ['asset_name', 'asset_description']
+}
+
+
+def upgrade():
+    op.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+    for table, columns in _SUBSTRING_COLUMNS.items():
+        if not _has_table(table):
+            continue
+
+        for column in columns:
+            if not index_exists(table, f'idx_{table}_{column}_trgm'):
+                op.create_index(f'idx_{table}_{column}_trgm', table, [column], postgresql_using='gin',
+                                postgresql_ops={column: 'gin_trgm_ops'})
+
+
+def downgrade():
+    for table, columns in _SUBSTRING_COLUMNS.items():
+        for column in columns:
+            if index_exists(table, f'idx_{table}_{column}_trgm'):
+                op.drop_index(f'idx_{table}_{column}_trgm', table_name=table)
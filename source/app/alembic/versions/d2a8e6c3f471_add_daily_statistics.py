@@ -0,0 +1,173 @@
+"""Add daily statistics
+
+Revision ID: d2a8e6c3f471
+Revises: c4f7a2e9d150
+Create Date: 2026-10-18 22:58:31.904126
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import text
+
+from app.alembic.alembic_utils import _has_table
+
+# revision identifiers, used by Alembic.
+revision = 'd2a8e6c3f471'
+down_revision = 'c4f7a2e9d150'
+branch_labels = None
+depends_on = None
+
+# Each object counts once, at its day of creation, customer and current status. The tasks count for the customer of
+# their case
+_STATISTICS_SOURCES = {
+    'case': """
+        SELECT open_date, client_id, state_id, count(*) FROM cases
+        GROUP BY 1, 2, 3
+    """,
+    'alert': """
+        SELECT alert_creation_time::date, alert_customer_id, alert_status_id, count(*) FROM alerts
+        GROUP BY 1, 2, 3
+    """,
+    'task': """
+        SELECT t.task_open_date::date, c.client_id, t.task_status_id, count(*) FROM case_tasks t
+        JOIN cases c ON c.case_id = t.task_case_id
+        GROUP BY 1, 2, 3
+    """
+}
+
+_TRIGGERS = {
+    'cases': ('cases_statistics_update', 'open_date, client_id, state_id'),
+    'alerts': ('alerts_statistics_update', 'alert_creation_time, alert_customer_id, alert_status_id'),
+    'case_tasks': ('case_tasks_statistics_update', 'task_open_date, task_case_id, task_status_id')
+}
+
+
+def upgrade():
+    if not _has_table('daily_statistics'):
+        op.create_table('daily_statistics',
+                        sa.Column('stat_day', sa.Date, nullable=False),
+                        sa.Column('client_id', sa.Integer, nullable=False),
+                        sa.Column('object_type', sa.Text, nullable=False),
+                        sa.Column('status_id', sa.Integer, nullable=False),
+                        sa.Column('object_count', sa.BigInteger, nullable=False, server_default='0'),
+                        sa.PrimaryKeyConstraint('stat_day', 'client_id', 'object_type', 'status_id'))
+
+    op.execute(text("""
+        CREATE OR REPLACE FUNCTION daily_statistics_add(p_day date, p_client_id bigint, p_object_type text,
+                                                        p_status_id bigint, p_count bigint) RETURNS void AS $$
+        BEGIN
+            IF p_day IS NULL OR p_client_id IS NULL THEN
+                RETURN;
+            END IF;
+
+            INSERT INTO daily_statistics (stat_day, client_id, object_type, status_id, object_count)
+            VALUES (p_day, p_client_id, p_object_type, coalesce(p_status_id, 0), p_count)
+            ON CONFLICT (stat_day, client_id, object_type, status_id)
+            DO UPDATE SET object_count = daily_statistics.object_count + EXCLUDED.object_count;
+        END
+        $$ LANGUAGE plpgsql
+    """))
+
+    op.execute(text("""
+        CREATE OR REPLACE FUNCTION daily_statistics_move_case_tasks(p_case_id bigint, p_client_id bigint,
+                                                                    p_sign bigint) RETURNS void AS $$
+        BEGIN
+            INSERT INTO daily_statistics (stat_day, client_id, object_type, status_id, object_count)
+            SELECT task_open_date::date, p_client_id, 'task', coalesce(task_status_id, 0), p_sign * count(*)
+            FROM case_tasks
+            WHERE task_case_id = p_case_id AND task_open_date IS NOT NULL
+            GROUP BY 1, 4
+            ON CONFLICT (stat_day, client_id, object_type, status_id)
+            DO UPDATE SET object_count = daily_statistics.object_count + EXCLUDED.object_count;
+        END
+        $$ LANGUAGE plpgsql
+    """))
+
+    op.execute(text("""
+        CREATE OR REPLACE FUNCTION cases_statistics_update() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                PERFORM daily_statistics_add(OLD.open_date, OLD.client_id, 'case', OLD.state_id, -1);
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                PERFORM daily_statistics_add(NEW.open_date, NEW.client_id, 'case', NEW.state_id, 1);
+            END IF;
+
+            -- The tasks follow the case when it is moved to another customer
+            IF TG_OP = 'UPDATE' AND NEW.client_id IS DISTINCT FROM OLD.client_id THEN
+                PERFORM daily_statistics_move_case_tasks(NEW.case_id, OLD.client_id, -1);
+                PERFORM daily_statistics_move_case_tasks(NEW.case_id, NEW.client_id, 1);
+            END IF;
+
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """))
+
+    op.execute(text("""
+        CREATE OR REPLACE FUNCTION alerts_statistics_update() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                PERFORM daily_statistics_add(OLD.alert_creation_time::date, OLD.alert_customer_id, 'alert',
+                                             OLD.alert_status_id, -1);
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                PERFORM daily_statistics_add(NEW.alert_creation_time::date, NEW.alert_customer_id, 'alert',
+                                             NEW.alert_status_id, 1);
+            END IF;
+
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """))
+
+    op.execute(text("""
+        CREATE OR REPLACE FUNCTION case_tasks_statistics_update() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                PERFORM daily_statistics_add(OLD.task_open_date::date,
+                                             (SELECT client_id FROM cases WHERE case_id = OLD.task_case_id),
+                                             'task', OLD.task_status_id, -1);
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                PERFORM daily_statistics_add(NEW.task_open_date::date,
+                                             (SELECT client_id FROM cases WHERE case_id = NEW.task_case_id),
+                                             'task', NEW.task_status_id, 1);
+            END IF;
+
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """))
+
+    for table, (function, watched_columns) in _TRIGGERS.items():
+        op.execute(text(f"DROP TRIGGER IF EXISTS {function}_trigger ON {table}"))
+        op.execute(text(f"""
+            CREATE TRIGGER {function}_trigger
+            AFTER INSERT OR DELETE OR UPDATE OF {watched_columns} ON {table}
+            FOR EACH ROW EXECUTE PROCEDURE {function}()
+        """))
+
+    # Backfill from the existing objects, in the same transaction as the creation of the triggers
+    op.execute(text("DELETE FROM daily_statistics"))
+    for object_type, source in _STATISTICS_SOURCES.items():
+        op.execute(text(f"""
+            INSERT INTO daily_statistics (stat_day, client_id, object_type, status_id, object_count)
+            SELECT day, client_id, '{object_type}', coalesce(status_id, 0), sum(object_count) FROM (
+                {source}
+            ) AS source (day, client_id, status_id, object_count)
+            WHERE day IS NOT NULL AND client_id IS NOT NULL
+            GROUP BY 1, 2, 4
+        """))
+
+
+def downgrade():
+    for table, (function, _) in _TRIGGERS.items():
+        op.execute(text(f"DROP TRIGGER IF EXISTS {function}_trigger ON {table}"))
+        op.execute(text(f"DROP FUNCTION IF EXISTS {function}()"))
+
+    op.execute(text("DROP FUNCTION IF EXISTS daily_statistics_move_case_tasks(bigint, bigint, bigint)"))
+    op.execute(text("DROP FUNCTION IF EXISTS daily_statistics_add(date, bigint, text, bigint, bigint)"))
+
+    if _has_table('daily_statistics'):
+        op.drop_table('daily_statistics')
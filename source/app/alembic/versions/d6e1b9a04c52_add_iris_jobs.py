@@ -0,0 +1,51 @@
+"""Add iris jobs
+
+Revision ID: d6e1b9a04c52
+Revises: c3a9e5f17d28
+Create Date: 2026-10-18 17:52:40.318207
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.alembic.alembic_utils import _has_table, index_exists
+
+# revision identifiers, used by Alembic.
+revision = 'd6e1b9a04c52'
+down_revision = 'c3a9e5f17d28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not _has_table('iris_jobs'):
+        op.create_table('iris_jobs',
+                        sa.Column('id', sa.BigInteger, primary_key=True),
+                        sa.Column('job_uuid', UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'),
+                                  nullable=False, unique=True),
+                        sa.Column('job_type', sa.Text, nullable=False),
+                        sa.Column('status', sa.Text, nullable=False),
+                        sa.Column('case_id', sa.BigInteger, nullable=True),
+                        sa.Column('user_id', sa.Integer, nullable=False),
+                        sa.Column('task_id', sa.Text, nullable=True),
+                        sa.Column('parameters', JSONB, nullable=True),
+                        sa.Column('progress_current', sa.BigInteger, nullable=False, server_default='0'),
+                        sa.Column('progress_total', sa.BigInteger, nullable=True),
+                        sa.Column('message', sa.Text, nullable=True),
+                        sa.Column('result', JSONB, nullable=True),
+                        sa.Column('result_file_path', sa.Text, nullable=True),
+                        sa.Column('result_file_name', sa.Text, nullable=True),
+                        sa.Column('cancel_requested', sa.Boolean, nullable=False, server_default=sa.false()),
+                        sa.Column('created_at', sa.DateTime, nullable=False),
+                        sa.Column('started_at', sa.DateTime, nullable=True),
+                        sa.Column('finished_at', sa.DateTime, nullable=True))
+
+    if not index_exists('iris_jobs', 'ix_iris_jobs_user_id'):
+        op.create_index('ix_iris_jobs_user_id', 'iris_jobs', ['user_id'])
+
+
+def downgrade():
+    if _has_table('iris_jobs'):
+        op.drop_table('iris_jobs')
@@ -0,0 +1,88 @@
+"""Add full text search vectors
+
+Revision ID: e4f2a7c91b35
+Revises: d6e1b9a04c52
+Create Date: 2026-10-18 18:41:07.552093
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from app.alembic.alembic_utils import _has_table, _table_has_column, index_exists
+
+# revision identifiers, used by Alembic.
+revision = 'e4f2a7c91b35'
+down_revision = 'd6e1b9a04c52'
+branch_labels = None
+depends_on = None
+
+# The 'simple' configuration does not stem nor drop stop words, which suits indicators, hostnames and identifiers
+_SEARCH_VECTORS = {
+    'notes': [('note_title', 'A'), ('note_content', 'B')],
+    'comments': [('comment_text', 'A')],
+    'cases_events': [('event_title', 'A'), ('event_content', 'B'), ('event_raw', 'C')],
+    'case_assets': [('asset_name', 'A'), ('asset_description', 'B')]
+}
+
+
+def _vector_expression(columns, prefix):
+    return ' || '.join(
+        f"setweight(to_tsvector('simple', coalesce({prefix}{column}, '')), '{weight}')" for column, weight in columns
+    )
+
+
+def upgrade():
+    for table, columns in _SEARCH_VECTORS.items():
+        if not _has_table(table):
+            continue
+
+        if not _table_has_column(table, 'search_vector'):
+            op.add_column(table, sa.Column('search_vector', TSVECTOR, nullable=True))
+
+        op.execute(text(f"""
+            CREATE OR REPLACE FUNCTION {table}_search_vector_update() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector := {_vector_expression(columns, 'NEW.')};
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+        """))
+
+        watched_columns = ', '.join(column for column, _ in columns)
+        op.execute(text(f"DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON {table}"))
+        op.execute(text(f"""
+            CREATE TRIGGER {table}_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF {watched_columns} ON {table}
+            FOR EACH ROW EXECUTE PROCEDURE {table}_search_vector_update()
+        """))
+
+        op.execute(text(f"UPDATE {table} SET search_vector = {_vector_expression(columns, '')}"))
+
+        if not index_exists(table, f'idx_{table}_search_vector'):
+            op.create_index(f'idx_{table}_search_vector', table, ['search_vector'], postgresql_using='gin')
+
+    # IOCs are searched by value with LIKE patterns, which a trigram index serves whatever the wildcards
+    op.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    if _has_table('ioc') and not index_exists('ioc', 'idx_ioc_value_trgm'):
+        op.create_index('idx_ioc_value_trgm', 'ioc', ['ioc_value'], postgresql_using='gin',
+                        postgresql_ops={'ioc_value': 'gin_trgm_ops'})
+
+
+def downgrade():
+    if index_exists('ioc', 'idx_ioc_value_trgm'):
+        op.drop_index('idx_ioc_value_trgm', table_name='ioc')
+
+    for table in _SEARCH_VECTORS:
+        if not _has_table(table):
+            continue
+
+        op.execute(text(f"DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON {table}"))
+        op.execute(text(f"DROP FUNCTION IF EXISTS {table}_search_vector_update()"))
+
+        if index_exists(table, f'idx_{table}_search_vector'):
+            op.drop_index(f'idx_{table}_search_vector', table_name=table)
+
+        if _table_has_column(table, 'search_vector'):
+            op.drop_column(table, 'search_vector')
@@ -0,0 +1,27 @@
+"""Add the progress timestamp of the iris jobs
+
+Revision ID: e7b2d4c9f816
+Revises: c8e4a1f7b259
+Create Date: 2026-10-19 16:42:18.905713
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from app.alembic.alembic_utils import _table_has_column
+
+# revision identifiers, used by Alembic.
+revision = 'e7b2d4c9f816'
+down_revision = 'c8e4a1f7b259'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not _table_has_column('iris_jobs', 'progress_updated_at'):
+        op.add_column('iris_jobs', sa.Column('progress_updated_at', sa.DateTime, nullable=True))
+
+
+def downgrade():
+    if _table_has_column('iris_jobs', 'progress_updated_at'):
+        op.drop_column('iris_jobs', 'progress_updated_at')
@@ -0,0 +1,165 @@
+"""Partition the user activities by month
+
+Revision ID: e9c4b7d21a58
+Revises: d2a8e6c3f471
+Create Date: 2026-10-18 23:41:07.518342
+
+"""
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = 'e9c4b7d21a58'
+down_revision = 'd2a8e6c3f471'
+branch_labels = None
+depends_on = None
+
+# Number of months after the current one which get a partition, the following ones are created by the worker
+_PARTITIONS_AHEAD_MONTHS = 2
+
+# The partition key is part of the primary key, so the activities recorded without a date get this one. They stay
+# in the default partition
+_UNDATED_ACTIVITY_DATE = '1970-01-01'
+
+
+def _is_partitioned(table_name):
+    return op.get_bind().execute(text(
+        "SELECT count(*) FROM pg_partitioned_table WHERE partrelid = to_regclass(:table_name)"
+    ), {'table_name': table_name}).scalar() > 0
+
+
+def _create_functions():
+    # The activities written while the partition of their month was missing went to the default partition. They
+    # are moved to the new partition, as it cannot be attached while the default partition holds rows of its range
+    op.execute(text("""
+        CREATE OR REPLACE FUNCTION user_activity_create_partition(p_month date) RETURNS void AS $$
+        DECLARE
+            v_start timestamp := date_trunc('month', p_month);
+            v_end timestamp := date_trunc('month', p_month) + interval '1 month';
+            v_name text := 'user_activity_' || to_char(p_month, 'YYYYMM');
+        BEGIN
+            IF to_regclass(v_name) IS NOT NULL THEN
+                RETURN;
+            END IF;
+
+            EXECUTE format('CREATE TABLE %I (LIKE user_activity INCLUDING DEFAULTS)', v_name);
+            EXECUTE format('WITH moved AS (DELETE FROM user_activity_default WHERE activity_date >= %L '
+                           'AND activity_date < %L RETURNING *) INSERT INTO %I SELECT * FROM moved',
+                           v_start, v_end, v_name);
+            EXECUTE format('ALTER TABLE user_activity ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                           v_name, v_start, v_end);
+        END
+        $$ LANGUAGE plpgsql
+    """))
+
+    # An archived partition keeps its rows as a standalone table, without the foreign keys which would prevent the
+    # deletion of their cases and users
+    op.execute(text("""
+        CREATE OR REPLACE FUNCTION user_activity_expire_partition(p_name text, p_archive boolean) RETURNS void AS $$
+        DECLARE
+            v_constraint text;
+        BEGIN
+            EXECUTE format('ALTER TABLE user_activity DETACH PARTITION %I', p_name);
+
+            IF NOT p_archive THEN
+                EXECUTE format('DROP TABLE %I', p_name);
+                RETURN;
+            END IF;
+
+            FOR v_constraint IN
+                SELECT conname FROM pg_constraint WHERE conrelid = p_name::regclass AND contype = 'f'
+            LOOP
+                EXECUTE format('ALTER TABLE %I DROP CONSTRAINT %I', p_name, v_constraint);
+            END LOOP;
+
+            EXECUTE format('ALTER TABLE %I RENAME TO %I', p_name,
+                           regexp_replace(p_name, '^user_activity_', 'user_activity_archive_'));
+        END
+        $$ LANGUAGE plpgsql
+    """))
+
+
+def upgrade():
+    _create_functions()
+
+    if _is_partitioned('user_activity'):
+        return
+
+    sequence = op.get_bind().execute(text("SELECT pg_get_serial_sequence('user_activity', 'id')")).scalar()
+
+    # The sequence of the IDs is kept, while the table owning it is replaced
+    op.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY NONE"))
+    op.execute(text("ALTER TABLE user_activity RENAME TO user_activity_unpartitioned"))
+
+    op.execute(text("""
+        CREATE TABLE user_activity (
+            LIKE user_activity_unpartitioned INCLUDING DEFAULTS,
+            CONSTRAINT user_activity_partitioned_pkey PRIMARY KEY (id, activity_date)
+        ) PARTITION BY RANGE (activity_date)
+    """))
+    op.execute(text("CREATE TABLE user_activity_default PARTITION OF user_activity DEFAULT"))
+
+    op.execute(text(f"""
+        SELECT user_activity_create_partition(month::date)
+        FROM generate_series(
+            date_trunc('month', coalesce(
+                (SELECT min(activity_date) FROM user_activity_unpartitioned
+                 WHERE activity_date > '{_UNDATED_ACTIVITY_DATE}'),
+                now()
+            )),
+            date_trunc('month', now()) + interval '{_PARTITIONS_AHEAD_MONTHS} months',
+            interval '1 month'
+        ) AS month
+    """))
+
+    op.execute(text(f"""
+        INSERT INTO user_activity (id, user_id, case_id, activity_date, activity_desc, user_input, is_from_api,
+                                   display_in_ui)
+        SELECT id, user_id, case_id, coalesce(activity_date, '{_UNDATED_ACTIVITY_DATE}'), activity_desc, user_input,
+               is_from_api, display_in_ui
+        FROM user_activity_unpartitioned
+    """))
+
+    op.execute(text("DROP TABLE user_activity_unpartitioned"))
+    op.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY user_activity.id"))
+
+    op.execute(text("ALTER TABLE user_activity RENAME CONSTRAINT user_activity_partitioned_pkey TO user_activity_pkey"))
+    op.execute(text("""
+        ALTER TABLE user_activity
+        ADD CONSTRAINT user_activity_user_id_fkey FOREIGN KEY (user_id) REFERENCES "user" (id)
+    """))
+    op.execute(text("""
+        ALTER TABLE user_activity
+        ADD CONSTRAINT user_activity_case_id_fkey FOREIGN KEY (case_id) REFERENCES cases (case_id)
+    """))
+
+    # Keysets of the cursor paginated activities, unfiltered and filtered by case or user
+    op.execute(text("CREATE INDEX idx_user_activity_date_id ON user_activity (activity_date, id)"))
+    op.execute(text("CREATE INDEX idx_user_activity_case_date_id ON user_activity (case_id, activity_date, id)"))
+    op.execute(text("CREATE INDEX idx_user_activity_user_date_id ON user_activity (user_id, activity_date, id)"))
+
+
+def downgrade():
+    if _is_partitioned('user_activity'):
+        sequence = op.get_bind().execute(text("SELECT pg_get_serial_sequence('user_activity', 'id')")).scalar()
+
+        op.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY NONE"))
+        op.execute(text("CREATE TABLE user_activity_unpartitioned (LIKE user_activity INCLUDING DEFAULTS)"))
+        op.execute(text("INSERT INTO user_activity_unpartitioned SELECT * FROM user_activity"))
+        op.execute(text("DROP TABLE user_activity"))
+        op.execute(text("ALTER TABLE user_activity_unpartitioned RENAME TO user_activity"))
+        op.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY user_activity.id"))
+
+        op.execute(text("ALTER TABLE user_activity ALTER COLUMN activity_date DROP NOT NULL"))
+        op.execute(text("ALTER TABLE user_activity ADD CONSTRAINT user_activity_pkey PRIMARY KEY (id)"))
+        op.execute(text("""
+            ALTER TABLE user_activity
+            ADD CONSTRAINT user_activity_user_id_fkey FOREIGN KEY (user_id) REFERENCES "user" (id)
+        """))
+        op.execute(text("""
+            ALTER TABLE user_activity
+            ADD CONSTRAINT user_activity_case_id_fkey FOREIGN KEY (case_id) REFERENCES cases (case_id)
+        """))
+
+    op.execute(text("DROP FUNCTION IF EXISTS user_activity_expire_partition(text, boolean)"))
+    op.execute(text("DROP FUNCTION IF EXISTS user_activity_create_partition(date)"))
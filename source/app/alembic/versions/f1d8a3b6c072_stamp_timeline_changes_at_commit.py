@@ -0,0 +1,103 @@
+"""Stamp the timeline changes at commit time
+
+Revision ID: f1d8a3b6c072
+Revises: e9c4b7d21a58
+Create Date: 2026-10-19 09:12:44.306918
+
+"""
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = 'f1d8a3b6c072'
+down_revision = 'e9c4b7d21a58'
+branch_labels = None
+depends_on = None
+
+# The links of an event, whose changes are changes of the event
+_EVENT_LINKS_TABLES = ['case_events_category', 'case_events_assets', 'case_events_ioc']
+
+
+def upgrade():
+    # The changes are numbered by deferred triggers, while the transaction commits. The lock is held until the
+    # transaction is visible, so that the changes become visible in the order of their numbers, and a reader never
+    # skips a change committed after it read a greater one
+    op.execute(text("""
+        CREATE OR REPLACE FUNCTION cases_events_stamp_change(p_event_id bigint) RETURNS void AS $$
+        BEGIN
+            PERFORM pg_advisory_xact_lock(hashtext('cases_events_change_seq'));
+            UPDATE cases_events SET event_change_seq = nextval('cases_events_change_seq')
+            WHERE event_id = p_event_id;
+        END
+        $$ LANGUAGE plpgsql
+    """))
+
+    op.execute(text("""
+        CREATE OR REPLACE FUNCTION cases_events_change_stamp() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM cases_events_stamp_change(OLD.event_id);
+                RETURN NULL;
+            END IF;
+
+            PERFORM cases_events_stamp_change(NEW.event_id);
+            IF TG_OP = 'UPDATE' AND NEW.event_id IS DISTINCT FROM OLD.event_id THEN
+                PERFORM cases_events_stamp_change(OLD.event_id);
+            END IF;
+
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """))
+
+    op.execute(text("""
+        CREATE OR REPLACE FUNCTION cases_events_deletions_change_stamp() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_advisory_xact_lock(hashtext('cases_events_change_seq'));
+            UPDATE cases_events_deletions SET event_change_seq = nextval('cases_events_change_seq')
+            WHERE id = NEW.id;
+
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """))
+
+    # The stamp itself updates the event from within the trigger, which must not queue another stamp
+    op.execute(text("DROP TRIGGER IF EXISTS cases_events_change_stamp_trigger ON cases_events"))
+    op.execute(text("""
+        CREATE CONSTRAINT TRIGGER cases_events_change_stamp_trigger
+        AFTER INSERT OR UPDATE ON cases_events
+        DEFERRABLE INITIALLY DEFERRED
+        FOR EACH ROW WHEN (pg_trigger_depth() = 0)
+        EXECUTE PROCEDURE cases_events_change_stamp()
+    """))
+
+    for table in _EVENT_LINKS_TABLES:
+        op.execute(text(f"DROP TRIGGER IF EXISTS {table}_change_stamp_trigger ON {table}"))
+        op.execute(text(f"""
+            CREATE CONSTRAINT TRIGGER {table}_change_stamp_trigger
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            DEFERRABLE INITIALLY DEFERRED
+            FOR EACH ROW
+            EXECUTE PROCEDURE cases_events_change_stamp()
+        """))
+
+    op.execute(text("DROP TRIGGER IF EXISTS cases_events_deletions_change_stamp_trigger ON cases_events_deletions"))
+    op.execute(text("""
+        CREATE CONSTRAINT TRIGGER cases_events_deletions_change_stamp_trigger
+        AFTER INSERT ON cases_events_deletions
+        DEFERRABLE INITIALLY DEFERRED
+        FOR EACH ROW
+        EXECUTE PROCEDURE cases_events_deletions_change_stamp()
+    """))
+
+
+def downgrade():
+    op.execute(text("DROP TRIGGER IF EXISTS cases_events_deletions_change_stamp_trigger ON cases_events_deletions"))
+    for table in _EVENT_LINKS_TABLES:
+        op.execute(text(f"DROP TRIGGER IF EXISTS {table}_change_stamp_trigger ON {table}"))
+    op.execute(text("DROP TRIGGER IF EXISTS cases_events_change_stamp_trigger ON cases_events"))
+
+    op.execute(text("DROP FUNCTION IF EXISTS cases_events_deletions_change_stamp()"))
+    op.execute(text("DROP FUNCTION IF EXISTS cases_events_change_stamp()"))
+    op.execute(text("DROP FUNCTION IF EXISTS cases_events_stamp_change(bigint)"))
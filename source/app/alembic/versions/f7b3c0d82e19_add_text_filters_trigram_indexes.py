@@ -0,0 +1,47 @@
+"""Add text filters trigram indexes
+
+Revision ID: f7b3c0d82e19
+Revises: e4f2a7c91b35
+Create Date: 2026-10-18 19:26:51.734160
+
+"""
+from alembic import op
+from sqlalchemy import text
+
+from app.alembic.alembic_utils import _has_table, index_exists
+
+# revision identifiers, used by Alembic.
+revision = 'f7b3c0d82e19'
+down_revision = 'e4f2a7c91b35'
+branch_labels = None
+depends_on = None
+
+# Columns filtered with LIKE patterns, which the b-tree indexes cannot serve
+_TRIGRAM_INDEXES = {
+    'alerts': ['alert_title', 'alert_description', 'alert_source', 'alert_tags', 'alert_source_ref'],
+    'cases': ['name', 'description'],
+    'tags': ['tag_title']
+}
+
+
+def upgrade():
+    op.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+    for table, columns in _TRIGRAM_INDEXES.items():
+        if not _has_table(table):
+            continue
+
+        for column in columns:
+            if not index_exists(table, f'idx_{table}_{column}_trgm'):
+                op.create_index(f'idx_{table}_{column}_trgm', table, [column], postgresql_using='gin',
+                                postgresql_ops={column: 'gin_trgm_ops'})
+
+
+def downgrade():
+    for table, columns in _TRIGRAM_INDEXES.items():
+        if not _has_table(table):
+            continue
+
+        for column in columns:
+            if index_exists(table, f'idx_{table}_{column}_trgm'):
+                op.drop_index(f'idx_{table}_{column}_trgm', table_name=table)
@@ -42,9 +42,13 @@ from app import TEMPLATE_PATH
 from app import app
 from app import db
 from app.blueprints.responses import response_error
+from app.datamgmt.case.case_db import case_db_exists
 from app.datamgmt.case.case_db import get_case
 from app.datamgmt.manage.manage_access_control_db import user_has_client_access
 from app.datamgmt.manage.manage_users_db import get_user
+from app.iris_engine.access_control.case_access_cache import CASE_ACCESS_NOT_CACHED
+from app.iris_engine.access_control.case_access_cache import case_exists_cache_get
+from app.iris_engine.access_control.case_access_cache import case_exists_cache_set
 from app.iris_engine.access_control.utils import ac_fast_check_user_has_case_access
 from app.iris_engine.access_control.utils import ac_get_effective_permissions_of_user
 from app.iris_engine.utils.tracker import track_activity
@@ -173,6 +177,16 @@ def _update_session(caseid, eaccess_level):
     _update_current_case(caseid, restricted_access)
 
 
+def _case_exists(caseid):
+    exists = case_exists_cache_get(caseid)
+    if exists is CASE_ACCESS_NOT_CACHED:
+        exists = case_db_exists(caseid)
+        if exists:
+            case_exists_cache_set(caseid)
+
+    return exists
+
+
 # TODO would be nice to remove parameter no_cid_required
 def _get_case_access(request_data, access_level, no_cid_required=False):
     redir, caseid, has_access = _get_caseid_from_request_data(request_data, no_cid_required)
@@ -189,7 +203,7 @@ def _get_case_access(request_data, access_level, no_cid_required=False):
 
     _update_session(caseid, eaccess_level)
 
-    if caseid is not None and not get_case(caseid):
+    if caseid is not None and not _case_exists(caseid):
         log.warning('No case found. Using default case')
         return True, 1, True
 
@@ -259,7 +273,7 @@ def get_case_access_from_api(request_data, access_level):
     if eaccess_level is None and access_level:
         return redir, caseid, False
 
-    if caseid is not None and not get_case(caseid):
+    if caseid is not None and not _case_exists(caseid):
         log.warning('No case found. Using default case')
         return True, 1, True
 
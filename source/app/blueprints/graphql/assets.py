@@ -0,0 +1,46 @@
+#  IRIS Source Code
+#  Copyright (C) 2024 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from graphene_sqlalchemy import SQLAlchemyObjectType
+from graphene import Int
+from graphene.relay import Connection
+
+from app.blueprints.graphql.loaders import get_loaders
+from app.models.models import CaseAssets
+
+
+class AssetObject(SQLAlchemyObjectType):
+    class Meta:
+        model = CaseAssets
+
+    @staticmethod
+    def resolve_user(root, info):
+        if root.user_id is None:
+            return None
+        return get_loaders().users.load(root.user_id)
+
+
+class AssetConnection(Connection):
+    class Meta:
+        node = AssetObject
+
+    total_count = Int()
+
+    @staticmethod
+    def resolve_total_count(root, info, **kwargs):
+        return root.length
@@ -17,7 +17,6 @@
 #  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
 from graphene_sqlalchemy import SQLAlchemyObjectType
-from graphene_sqlalchemy import SQLAlchemyConnectionField
 from graphene.relay import Node
 from graphene.relay import Connection
 from graphene import Field
@@ -31,14 +30,18 @@ from app.models.cases import Cases
 from app.models.authorization import Permissions
 from app.models.authorization import CaseAccessLevel
 
-from app.business.iocs import iocs_build_filter_query
 from app.business.cases import cases_create
 from app.business.cases import cases_delete
 from app.business.cases import cases_update
 from app.blueprints.graphql.permissions import permissions_check_current_user_has_some_permission
 from app.blueprints.graphql.permissions import permissions_check_current_user_has_some_case_access
 
+from app.blueprints.graphql.connections import PageSizeLimitedConnectionField
 from app.blueprints.graphql.iocs import IOCConnection
+from app.blueprints.graphql.assets import AssetConnection
+from app.blueprints.graphql.clients import ClientObject
+from app.blueprints.graphql.loaders import get_loaders
+from app.blueprints.graphql.users import UserObject
 
 
 class CaseObject(SQLAlchemyObjectType):
@@ -46,27 +49,78 @@ class CaseObject(SQLAlchemyObjectType):
         model = Cases
         interfaces = [Node]
 
-    iocs = SQLAlchemyConnectionField(IOCConnection, ioc_id=Int(), ioc_uuid=String(), ioc_value=String(), ioc_type_id=Int(),
-                                     ioc_description=String(), ioc_tlp_id=Int(), ioc_tags=String(), ioc_misp=String(),
-                                     user_id=Float())
+    iocs = PageSizeLimitedConnectionField(IOCConnection, ioc_id=Int(), ioc_uuid=String(), ioc_value=String(),
+                                          ioc_type_id=Int(), ioc_description=String(), ioc_tlp_id=Int(),
+                                          ioc_tags=String(), ioc_misp=String(), user_id=Float())
+
+    assets = PageSizeLimitedConnectionField(AssetConnection)
+    owner = Field(UserObject)
+    user = Field(UserObject)
+    reviewer = Field(UserObject)
+    client = Field(ClientObject)
 
     # TODO why is kwargs necessary? Should investigate and try to remove
     @staticmethod
     def resolve_iocs(root, info, ioc_id=None, ioc_uuid=None, ioc_value=None, ioc_type_id=None, ioc_description=None, ioc_tlp_id=None, ioc_tags=None,
                      ioc_misp=None, user_id=None, **kwargs):
-
+        loaders = get_loaders()
+        loaders.cases_access.load(root.case_id)
         permissions_check_current_user_has_some_case_access(root.case_id, [CaseAccessLevel.full_access])
 
-        return iocs_build_filter_query(ioc_id=ioc_id, ioc_uuid=ioc_uuid, ioc_value=ioc_value,
-                                       ioc_type_id=ioc_type_id, ioc_description=ioc_description,
-                                       ioc_tlp_id=ioc_tlp_id, ioc_tags=ioc_tags, ioc_misp=ioc_misp,
-                                       user_id=user_id)
+        return loaders.cases_iocs(ioc_id=ioc_id, ioc_uuid=ioc_uuid, ioc_value=ioc_value, ioc_type_id=ioc_type_id,
+                                  ioc_description=ioc_description, ioc_tlp_id=ioc_tlp_id, ioc_tags=ioc_tags,
+                                  ioc_misp=ioc_misp, user_id=user_id).load(root.case_id)
+
+    @staticmethod
+    def resolve_assets(root, info, **kwargs):
+        loaders = get_loaders()
+        loaders.cases_access.load(root.case_id)
+        permissions_check_current_user_has_some_case_access(root.case_id, [CaseAccessLevel.read_only,
+                                                                           CaseAccessLevel.full_access])
+
+        return loaders.cases_assets.load(root.case_id)
+
+    @staticmethod
+    def resolve_owner(root, info):
+        if root.owner_id is None:
+            return None
+        return get_loaders().users.load(root.owner_id)
+
+    @staticmethod
+    def resolve_user(root, info):
+        if root.user_id is None:
+            return None
+        return get_loaders().users.load(root.user_id)
+
+    @staticmethod
+    def resolve_reviewer(root, info):
+        if root.reviewer_id is None:
+            return None
+        return get_loaders().users.load(root.reviewer_id)
+
+    @staticmethod
+    def resolve_client(root, info):
+        return get_loaders().clients.load(root.client_id)
 
     @staticmethod
     def resolve_case(root, info, case_id):
         permissions_check_current_user_has_some_case_access(case_id, [CaseAccessLevel.full_access])
         return Cases.query.get(case_id)
 
+
+class CasesConnectionField(PageSizeLimitedConnectionField):
+    """
+    Connection of cases, priming the loaders with the cases of the page
+    """
+
+    @classmethod
+    def resolve_connection(cls, connection_type, model, info, args, resolved):
+        connection = super().resolve_connection(connection_type, model, info, args, resolved)
+        get_loaders().prime_cases([edge.node for edge in connection.edges])
+
+        return connection
+
+
 class CaseConnection(Connection):
     class Meta:
         node = CaseObject
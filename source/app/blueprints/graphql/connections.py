@@ -0,0 +1,40 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+from graphene_sqlalchemy import SQLAlchemyConnectionField
+
+from app import app
+
+
+class PageSizeLimitedConnectionField(SQLAlchemyConnectionField):
+    """
+    Connection field returning at most GRAPHQL_MAX_PAGE_SIZE elements per page, the first ones when neither first nor
+    last is given
+    """
+
+    @classmethod
+    def connection_resolver(cls, resolver, connection_type, model, root, info, **args):
+        max_page_size = app.config.get('GRAPHQL_MAX_PAGE_SIZE')
+        if args.get('first') is None and args.get('last') is None:
+            args['first'] = max_page_size
+        for argument in ('first', 'last'):
+            if args.get(argument) is not None:
+                args[argument] = min(args[argument], max_page_size)
+
+        return super().connection_resolver(resolver, connection_type, model, root, info, **args)
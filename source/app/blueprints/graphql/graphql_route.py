@@ -23,7 +23,6 @@ from flask_wtf import FlaskForm
 from flask import Blueprint
 from flask_login import current_user
 
-from graphql_server.flask import GraphQLView
 from graphene import ObjectType
 from graphene import Schema
 from graphene import Float
@@ -31,8 +30,6 @@ from graphene import Int
 from graphene import Field
 from graphene import String
 
-from graphene_sqlalchemy import SQLAlchemyConnectionField
-
 from app.datamgmt.manage.manage_cases_db import build_filter_case_query
 from app.blueprints.access_controls import is_user_authenticated
 from app.blueprints.responses import response_error
@@ -48,6 +45,9 @@ from app.blueprints.graphql.cases import CaseCreate
 from app.blueprints.graphql.cases import CaseDelete
 from app.blueprints.graphql.cases import CaseUpdate
 from app.blueprints.graphql.cases import CaseConnection
+from app.blueprints.graphql.cases import CasesConnectionField
+from app.blueprints.graphql.query_cost import query_validation_rules
+from app.blueprints.graphql.graphql_view import IrisGraphQLView
 
 from app.business.cases import cases_get_by_identifier
 from app.business.iocs import iocs_get
@@ -62,9 +62,9 @@ warnings.filterwarnings("ignore", category=UserWarning)
 class Query(ObjectType):
     """This is the IRIS GraphQL queries documentation!"""
 
-    cases = SQLAlchemyConnectionField(CaseConnection, classification_id=Float(), client_id=Float(), state_id=Int(),
-                                      owner_id=Float(), open_date=String(), name=String(), soc_id=String(),
-                                      severity_id=Int(), tags=String(), open_since=Int())
+    cases = CasesConnectionField(CaseConnection, classification_id=Float(), client_id=Float(), state_id=Int(),
+                                owner_id=Float(), open_date=String(), name=String(), soc_id=String(),
+                                severity_id=Int(), tags=String(), open_since=Int())
     case = Field(CaseObject, case_id=Float(), description='Retrieve a case by its identifier')
     ioc = Field(IOCObject, ioc_id=Float(), description='Retrieve an ioc by its identifier')
 
@@ -120,7 +120,7 @@ def _check_authentication_wrapper(f):
 
 def _create_blueprint():
     schema = Schema(query=Query, mutation=Mutation)
-    graphql_view = GraphQLView.as_view('graphql', schema=schema)
+    graphql_view = IrisGraphQLView.as_view('graphql', schema=schema, validation_rules=query_validation_rules())
     graphql_view_with_authentication = _check_authentication_wrapper(graphql_view)
 
     blueprint = Blueprint('graphql', __name__)
@@ -0,0 +1,186 @@
+#  IRIS Source Code
+#  Copyright (C) 2024 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# GraphQL view supporting the persisted queries: a query is registered once with its SHA256 in the persistedQuery
+# extension, and then called with its hash only. The parsed and validated documents are kept by each worker, keyed
+# by their hash, so the documents sent repeatedly are parsed and validated once. The responses to the queries may
+# also be cached per user, keyed by the hash of the document and the variables, and are invalidated when the cases,
+# IOCs or assets change, or when the cases the user can access change.
+import hashlib
+import json
+from collections import OrderedDict
+from flask import Response
+from flask_login import current_user
+from graphql import ExecutionResult
+from graphql import GraphQLError
+from graphql import OperationType
+from graphql import execute
+from graphql import get_operation_ast
+from graphql import parse
+from graphql import validate
+from graphql_server import HttpQueryError
+from graphql_server import assume_not_awaitable
+from graphql_server import encode_execution_results
+from graphql_server import load_json_variables
+from graphql_server.flask import GraphQLView
+
+from app import app
+from app import cache
+from app.datamgmt.graphql.persisted_queries_db import get_persisted_query
+from app.datamgmt.graphql.persisted_queries_db import register_persisted_query
+from app.datamgmt.states import get_case_access_state_version
+from app.datamgmt.states import get_objects_states_version
+
+# States of the objects exposed through GraphQL, which invalidate the cached responses when they change
+_RESPONSES_STATES = ['cases', 'ioc', 'assets']
+
+# query hash -> (document, validation errors)
+_documents = OrderedDict()
+
+
+def _hash_query(query: str) -> str:
+    return hashlib.sha256(query.encode('utf-8')).hexdigest()
+
+
+def _get_cached_document(query_hash: str):
+    entry = _documents.pop(query_hash, None)
+    if entry is not None:
+        _documents[query_hash] = entry
+
+    return entry
+
+
+def _keep_document(query_hash: str, entry):
+    _documents[query_hash] = entry
+    while len(_documents) > app.config.get('GRAPHQL_DOCUMENTS_CACHE_SIZE'):
+        _documents.popitem(last=False)
+
+
+def _get_query(data: dict):
+    """
+    Returns the document of the request and its hash. Registers the persisted queries sent along with their document.
+    The document is None when only the hash of a persisted query is given
+    """
+    query = data.get('query')
+    if query is not None and not isinstance(query, str):
+        raise HttpQueryError(400, 'Unexpected query type.')
+
+    persisted_query = (data.get('extensions') or {}).get('persistedQuery')
+    if not persisted_query:
+        if not query:
+            raise HttpQueryError(400, 'Must provide query string.')
+        return query, _hash_query(query)
+
+    query_hash = persisted_query.get('sha256Hash') if isinstance(persisted_query, dict) else None
+    if not isinstance(query_hash, str):
+        raise HttpQueryError(400, 'Expecting the sha256Hash of the persisted query.')
+    query_hash = query_hash.lower()
+
+    if query:
+        if _hash_query(query) != query_hash:
+            raise HttpQueryError(400, 'The sha256Hash does not match the query.')
+        register_persisted_query(query_hash, query, current_user.id)
+
+    return query, query_hash
+
+
+def _response_cache_key(query_hash: str, variables, operation_name) -> str:
+    request_hash = hashlib.sha256(json.dumps([variables, operation_name], sort_keys=True).encode('utf-8'))
+
+    return (f'graphql:{current_user.id}:{query_hash}:{request_hash.hexdigest()}:'
+            f'{get_objects_states_version(_RESPONSES_STATES)}:{get_case_access_state_version(current_user.id)}')
+
+
+class IrisGraphQLView(GraphQLView):
+
+    def _encode_response(self, result: ExecutionResult):
+        body, status_code = encode_execution_results([result], format_error=self.format_error, encode=self.encode)
+
+        return Response(body, status=status_code, content_type='application/json')
+
+    def _get_document(self, query, query_hash):
+        entry = _get_cached_document(query_hash)
+        if entry is not None:
+            return entry
+
+        if query is None:
+            query = get_persisted_query(query_hash)
+            if query is None:
+                return None, [GraphQLError('PersistedQueryNotFound', extensions={'code': 'PERSISTED_QUERY_NOT_FOUND'})]
+
+        try:
+            document = parse(query)
+        except GraphQLError as e:
+            return None, [e]
+
+        entry = document, validate(self.schema, document, rules=self.get_validation_rules())
+        _keep_document(query_hash, entry)
+
+        return entry
+
+    def _execute(self, document, variables, operation_name) -> ExecutionResult:
+        return execute(
+            self.schema,
+            document,
+            root_value=self.get_root_value(),
+            context_value=self.get_context(),
+            variable_values=variables,
+            operation_name=operation_name,
+            middleware=self.get_middleware(),
+            is_awaitable=assume_not_awaitable
+        )
+
+    def dispatch_request(self):
+        try:
+            data = self.parse_body()
+            if not isinstance(data, dict):
+                raise HttpQueryError(400, 'Batch GraphQL requests are not enabled.')
+
+            query, query_hash = _get_query(data)
+            variables = load_json_variables(data.get('variables'))
+            operation_name = data.get('operationName')
+
+            document, errors = self._get_document(query, query_hash)
+            if errors:
+                return self._encode_response(ExecutionResult(data=None, errors=errors))
+
+            cache_timeout = app.config.get('GRAPHQL_RESPONSES_CACHE_TIMEOUT')
+            operation = get_operation_ast(document, operation_name)
+            if cache_timeout <= 0 or operation is None or operation.operation != OperationType.QUERY:
+                return self._encode_response(self._execute(document, variables, operation_name))
+
+            # The version of the states is part of the key, so the responses become stale as soon as a state changes
+            cache_key = _response_cache_key(query_hash, variables, operation_name)
+            body = cache.get(cache_key)
+            if body is None:
+                result = self._execute(document, variables, operation_name)
+                if result.errors:
+                    return self._encode_response(result)
+
+                body, _ = encode_execution_results([result], format_error=self.format_error, encode=self.encode)
+                cache.set(cache_key, body, timeout=cache_timeout)
+
+            return Response(body, status=200, content_type='application/json')
+
+        except HttpQueryError as e:
+            return Response(
+                self.encode(dict(errors=[self.format_error(GraphQLError(e.message))])),
+                status=e.status_code,
+                headers=e.headers,
+                content_type='application/json'
+            )
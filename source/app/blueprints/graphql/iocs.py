@@ -24,6 +24,7 @@ from graphene import Int
 from graphene import Float
 from graphene import String
 
+from app.blueprints.graphql.loaders import get_loaders
 from app.blueprints.graphql.permissions import permissions_check_current_user_has_some_case_access
 from app.blueprints.graphql.permissions import permissions_check_current_user_has_some_case_access_stricter
 from app.models.authorization import CaseAccessLevel
@@ -40,6 +41,12 @@ class IOCObject(SQLAlchemyObjectType):
     class Meta:
         model = Ioc
 
+    @staticmethod
+    def resolve_user(root, info):
+        if root.user_id is None:
+            return None
+        return get_loaders().users.load(root.user_id)
+
 
 class IOCConnection(Connection):
     class Meta:
@@ -0,0 +1,172 @@
+#  IRIS Source Code
+#  Copyright (C) 2024 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# Request scoped batch loaders of the GraphQL API. The execution is synchronous, so the loaders cannot wait for the
+# sibling resolvers to ask for their keys: the connections prime the loaders with the objects of the page they
+# resolved, and the first resolver needing a key loads the keys of the whole page in a single query.
+from collections import defaultdict
+from flask import g
+from flask_login import current_user
+from typing import Callable
+
+from app.business.iocs import iocs_build_filter_query
+from app.iris_engine.access_control.utils import ac_prefetch_user_cases_access
+from app.models.authorization import User
+from app.models.models import CaseAssets
+from app.models.models import Client
+from app.models.models import Ioc
+
+
+class BatchLoader:
+
+    def __init__(self, batch_load: Callable[[list], dict], default: Callable = lambda: None):
+        """
+        :param batch_load: Function loading a list of keys, returning a dict of their values. The missing keys get
+                           the default value
+        :param default: Factory of the value of the keys not found
+        """
+        self._batch_load = batch_load
+        self._default = default
+        self._pending = {}
+        self._values = {}
+
+    def prime(self, keys):
+        """
+        Register keys to load along with the next key loaded
+        """
+        for key in keys:
+            if key is not None and key not in self._values:
+                self._pending[key] = None
+
+    def load(self, key):
+        """
+        Get the value of a key, loading it along with the pending keys if it is not loaded yet
+        """
+        if key not in self._values:
+            self._pending[key] = None
+            keys = list(self._pending)
+            self._pending.clear()
+
+            values = self._batch_load(keys)
+            for k in keys:
+                self._values[k] = values[k] if k in values else self._default()
+
+        return self._values[key]
+
+
+def _group_by_case(objects, case_id_attribute) -> dict:
+    groups = defaultdict(list)
+    for obj in objects:
+        groups[getattr(obj, case_id_attribute)].append(obj)
+
+    return groups
+
+
+def _load_cases_access(case_ids) -> dict:
+    ac_prefetch_user_cases_access(current_user.id, case_ids)
+    return {}
+
+
+def _cases_iocs_loader(filters: dict) -> Callable[[list], dict]:
+    def _load_cases_iocs(case_ids) -> dict:
+        iocs = iocs_build_filter_query(**filters).filter(
+            Ioc.case_id.in_(case_ids)
+        ).order_by(
+            Ioc.ioc_id
+        ).all()
+
+        get_loaders().users.prime(ioc.user_id for ioc in iocs)
+
+        return _group_by_case(iocs, 'case_id')
+
+    return _load_cases_iocs
+
+
+def _load_cases_assets(case_ids) -> dict:
+    assets = CaseAssets.query.filter(
+        CaseAssets.case_id.in_(case_ids)
+    ).order_by(
+        CaseAssets.asset_id
+    ).all()
+
+    get_loaders().users.prime(asset.user_id for asset in assets)
+
+    return _group_by_case(assets, 'case_id')
+
+
+def _load_users(user_ids) -> dict:
+    return {user.id: user for user in User.query.filter(User.id.in_(user_ids)).all()}
+
+
+def _load_clients(client_ids) -> dict:
+    return {client.client_id: client for client in Client.query.filter(Client.client_id.in_(client_ids)).all()}
+
+
+class GraphQLLoaders:
+    """
+    Loaders of a GraphQL request, see get_loaders
+    """
+
+    def __init__(self):
+        self._case_ids = []
+        self._cases_iocs = {}
+
+        self.cases_access = BatchLoader(_load_cases_access)
+        self.cases_assets = BatchLoader(_load_cases_assets, default=list)
+        self.users = BatchLoader(_load_users)
+        self.clients = BatchLoader(_load_clients)
+
+    def prime_cases(self, cases):
+        """
+        Register the cases of a page, so that their access, IOCs, assets, users and clients are loaded together
+        """
+        case_ids = [case.case_id for case in cases]
+        self._case_ids.extend(case_ids)
+
+        self.cases_access.prime(case_ids)
+        self.cases_assets.prime(case_ids)
+        for loader in self._cases_iocs.values():
+            loader.prime(case_ids)
+
+        self.users.prime(user_id for case in cases for user_id in (case.owner_id, case.user_id, case.reviewer_id))
+        self.clients.prime(case.client_id for case in cases)
+
+    def cases_iocs(self, **filters) -> BatchLoader:
+        """
+        Loader of the IOCs of the cases matching the filters of an iocs field. There is one loader per set of filters
+        """
+        filters_key = tuple(sorted(filters.items()))
+        loader = self._cases_iocs.get(filters_key)
+        if loader is None:
+            loader = BatchLoader(_cases_iocs_loader(filters), default=list)
+            loader.prime(self._case_ids)
+            self._cases_iocs[filters_key] = loader
+
+        return loader
+
+
+def get_loaders() -> GraphQLLoaders:
+    """
+    Get the loaders of the current GraphQL request
+    """
+    loaders = g.get('graphql_loaders')
+    if loaders is None:
+        loaders = GraphQLLoaders()
+        g.graphql_loaders = loaders
+
+    return loaders
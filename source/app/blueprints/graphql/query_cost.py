@@ -0,0 +1,105 @@
+#  IRIS Source Code
+#  Copyright (C) 2024 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# Validation rules bounding the work of a GraphQL query before it runs. The depth bounds the number of round-trips,
+# as the loaders fetch each level in a constant number of queries, and the cost bounds the number of objects
+# resolved: the fields under a connection are counted once per element of the page. The connections return at most
+# GRAPHQL_MAX_PAGE_SIZE elements, so it bounds the pages without a literal first or last argument.
+from graphql import FieldNode
+from graphql import FragmentSpreadNode
+from graphql import GraphQLError
+from graphql import InlineFragmentNode
+from graphql import IntValueNode
+from graphql import OperationDefinitionNode
+from graphql import SelectionSetNode
+from graphql import ValidationRule
+from graphql import specified_rules
+
+from app import app
+
+
+def _page_size(field: FieldNode):
+    max_page_size = app.config.get('GRAPHQL_MAX_PAGE_SIZE')
+    for argument in field.arguments or []:
+        if argument.name.value in ('first', 'last') and isinstance(argument.value, IntValueNode):
+            return min(int(argument.value.value), max_page_size)
+
+    return max_page_size
+
+
+def _is_connection(field: FieldNode):
+    return field.selection_set is not None and any(
+        isinstance(selection, FieldNode) and selection.name.value == 'edges'
+        for selection in field.selection_set.selections
+    )
+
+
+class QueryCostRule(ValidationRule):
+    """
+    Rejects the operations deeper than GRAPHQL_MAX_DEPTH or costlier than GRAPHQL_MAX_COST
+    """
+
+    def _fields(self, selection_set: SelectionSetNode, visited_fragments: frozenset):
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                yield selection, visited_fragments
+
+            elif isinstance(selection, InlineFragmentNode):
+                yield from self._fields(selection.selection_set, visited_fragments)
+
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.context.get_fragment(name)
+                # Unknown fragments and cycles are reported by the specified rules
+                if fragment is not None and name not in visited_fragments:
+                    yield from self._fields(fragment.selection_set, visited_fragments | {name})
+
+    def _measure(self, selection_set: SelectionSetNode, multiplier: int, visited_fragments: frozenset):
+        depth = 0
+        cost = 0
+        for field, fragments in self._fields(selection_set, visited_fragments):
+            cost += multiplier
+            if field.selection_set is None:
+                depth = max(depth, 1)
+                continue
+
+            children_multiplier = multiplier
+            if _is_connection(field):
+                children_multiplier *= _page_size(field)
+
+            field_depth, field_cost = self._measure(field.selection_set, children_multiplier, fragments)
+            depth = max(depth, field_depth + 1)
+            cost += field_cost
+
+        return depth, cost
+
+    def enter_operation_definition(self, node: OperationDefinitionNode, *_args):
+        max_depth = app.config.get('GRAPHQL_MAX_DEPTH')
+        max_cost = app.config.get('GRAPHQL_MAX_COST')
+
+        depth, cost = self._measure(node.selection_set, 1, frozenset())
+
+        if max_depth and depth > max_depth:
+            self.report_error(GraphQLError(f'The query depth {depth} exceeds the maximum of {max_depth}', node))
+
+        if max_cost and cost > max_cost:
+            self.report_error(GraphQLError(f'The query cost {cost} exceeds the maximum of {max_cost}', node))
+
+
+def query_validation_rules() -> list:
+    return [*specified_rules, QueryCostRule]
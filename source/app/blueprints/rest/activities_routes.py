@@ -35,7 +35,6 @@ def list_activities():
     user_activities = get_users_activities()
 
     data = [row._asdict() for row in user_activities]
-    data = sorted(data, key=lambda i: i['activity_date'], reverse=True)
 
     return response_success("", data=data)
 
@@ -48,6 +47,5 @@ def list_all_activities():
     user_activities = get_all_users_activities()
 
     data = [row._asdict() for row in user_activities]
-    data = sorted(data, key=lambda i: i['activity_date'], reverse=True)
 
     return response_success("", data=data)
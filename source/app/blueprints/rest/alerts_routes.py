@@ -29,7 +29,9 @@ import app
 from app import db
 from app.blueprints.rest.endpoints import endpoint_deprecated
 from app.blueprints.rest.parsing import parse_comma_separated_identifiers
+from app.blueprints.rest.parsing import parse_boolean
 from app.blueprints.rest.case_comments import case_comment_update
+from app.business.alerts import alerts_batch_merge
 from app.datamgmt.alerts.alerts_db import get_filtered_alerts
 from app.datamgmt.alerts.alerts_db import get_alert_by_id
 from app.datamgmt.alerts.alerts_db import create_case_from_alert
@@ -39,6 +41,7 @@ from app.datamgmt.alerts.alerts_db import unmerge_alert_from_case
 from app.datamgmt.alerts.alerts_db import cache_similar_alert
 from app.datamgmt.alerts.alerts_db import get_related_alerts
 from app.datamgmt.alerts.alerts_db import get_related_alerts_details
+from app.datamgmt.alerts.alerts_db import register_related_alerts
 from app.datamgmt.alerts.alerts_db import get_alert_comments
 from app.datamgmt.alerts.alerts_db import delete_alert_comment
 from app.datamgmt.alerts.alerts_db import get_alert_comment
@@ -50,6 +53,7 @@ from app.datamgmt.manage.manage_access_control_db import check_ua_case_client
 from app.datamgmt.manage.manage_access_control_db import user_has_client_access
 from app.iris_engine.access_control.utils import ac_set_new_case_access
 from app.iris_engine.module_handler.module_handler import call_modules_hook
+from app.iris_engine.module_handler.module_handler import call_modules_hook_batch
 from app.iris_engine.utils.tracker import track_activity
 from app.models.alerts import AlertStatus
 from app.models.authorization import Permissions
@@ -131,6 +135,13 @@ def alerts_list_route() -> Response:
     else:
         fields = None
 
+    # Keyset pagination is enabled as soon as the cursor argument is present, even empty for the first page
+    cursor_mode = 'cursor' in request.args
+    try:
+        with_total = parse_boolean(request.args.get('with_total', 'false' if cursor_mode else 'true'))
+    except ValueError:
+        return response_error('Invalid with_total value')
+
     try:
         filtered_alerts = get_filtered_alerts(
             start_date=request.args.get('creation_start_date'),
@@ -156,7 +167,10 @@ def alerts_list_route() -> Response:
             assets=alert_assets,
             iocs=alert_iocs,
             resolution_status=request.args.get('alert_resolution_id', type=int),
-            current_user_id=current_user.id
+            current_user_id=current_user.id,
+            cursor_mode=cursor_mode,
+            cursor=request.args.get('cursor'),
+            with_total=with_total
         )
 
     except Exception as e:
@@ -176,6 +190,18 @@ def alerts_list_route() -> Response:
     else:
         alert_schema = AlertSchema()
 
+    if cursor_mode:
+        filtered_data = {
+            'total': filtered_alerts.total,
+            'total_is_estimate': filtered_alerts.total_is_estimate,
+            'alerts': alert_schema.dump(filtered_alerts.items, many=True),
+            'per_page': filtered_alerts.per_page,
+            'next_cursor': filtered_alerts.next_cursor,
+            'prev_cursor': filtered_alerts.prev_cursor
+        }
+
+        return response_success(data=filtered_data)
+
     filtered_data = {
         'total': filtered_alerts.total,
         'alerts': alert_schema.dump(filtered_alerts, many=True),
@@ -236,13 +262,14 @@ def alerts_add_route() -> Response:
         # Add history entry
         add_obj_history_entry(new_alert, 'Alert created')
 
+        # Link the similar alerts, committed along with the similarities cache below
+        register_related_alerts(new_alert, assets_list=assets, iocs_list=iocs)
+
         # Cache the alert for similarities check
         cache_similar_alert(new_alert.alert_customer_id, assets=assets_list,
                             iocs=iocs_list, alert_id=new_alert.alert_id,
                             creation_date=new_alert.alert_source_event_time)
 
-        #register_related_alerts(new_alert, assets_list=assets, iocs_list=iocs)
-        
         new_alert = call_modules_hook('on_postload_alert_create', data=new_alert)
 
         track_activity(f"created alert #{new_alert.alert_id} - {new_alert.alert_title}", ctx_less=True)
@@ -334,7 +361,8 @@ def alerts_similarities_route(alert_id) -> Response:
     similar_alerts = get_related_alerts_details(alert.alert_customer_id, alert.assets, alert.iocs,
                                                 open_alerts=open_alerts, open_cases=open_cases,
                                                 closed_cases=closed_cases, closed_alerts=closed_alerts,
-                                                days_back=days_back, number_of_results=number_of_results)
+                                                days_back=days_back, number_of_results=number_of_results,
+                                                alert_id=alert.alert_id)
 
     return response_success(data=similar_alerts)
 
@@ -458,53 +486,67 @@ def alerts_batch_update_route() -> Response:
         return response_error('No alert IDs provided')
 
     alert_schema = AlertSchema()
+    updated_alerts = []
 
-    # Process each alert ID
-    for alert_id in alert_ids:
-        alert = get_alert_by_id(alert_id)
-        if not alert:
-            return response_error(f'Alert with ID {alert_id} not found')
+    try:
+        # Process each alert ID
+        for alert_id in alert_ids:
+            alert = get_alert_by_id(alert_id)
+            if not alert:
+                return response_error(f'Alert with ID {alert_id} not found')
 
-        try:
+            try:
 
-            activity_data = []
-            for key, value in updates.items():
-                old_value = getattr(alert, key, None)
+                activity_data = []
+                for key, value in updates.items():
+                    old_value = getattr(alert, key, None)
 
-                if old_value != value:
-                    activity_data.append(f"\"{key}\"")
+                    if old_value != value:
+                        activity_data.append(f"\"{key}\"")
 
-            # Check if the user has access to the client
-            if not user_has_client_access(current_user.id, alert.alert_customer_id):
-                return response_error('User not entitled to update alerts for the client', status=403)
+                # Check if the user has access to the client
+                if not user_has_client_access(current_user.id, alert.alert_customer_id):
+                    return response_error('User not entitled to update alerts for the client', status=403)
 
-            if getattr(alert, 'alert_owner_id') is None:
-                updates['alert_owner_id'] = current_user.id
+                if getattr(alert, 'alert_owner_id') is None:
+                    updates['alert_owner_id'] = current_user.id
 
-            if data.get('alert_owner_id') == "-1" or data.get('alert_owner_id') == -1:
-                updates['alert_owner_id'] = None
+                if data.get('alert_owner_id') == "-1" or data.get('alert_owner_id') == -1:
+                    updates['alert_owner_id'] = None
 
-            # Deserialize the JSON data into an Alert object
-            alert_schema.load(updates, instance=alert, partial=True)
-
-            db.session.commit()
+                # Deserialize the JSON data into an Alert object
+                alert_schema.load(updates, instance=alert, partial=True)
 
-            alert = call_modules_hook('on_postload_alert_update', data=alert)
+                db.session.commit()
 
-            if activity_data:
-                track_activity(f"updated alert #{alert_id}: {','.join(activity_data)}", ctx_less=True)
-                add_obj_history_entry(alert, f"updated alert: {','.join(activity_data)}")
+                updated_alerts.append((alert, activity_data))
 
-            db.session.commit()
+            except Exception as e:
+                # Handle any errors during deserialization or DB operations
+                return response_error(str(e))
 
-        except Exception as e:
-            # Handle any errors during deserialization or DB operations
-            return response_error(str(e))
+    finally:
+        # The alerts committed so far are notified even if the batch stopped on an error
+        _alerts_batch_post_update(updated_alerts)
 
     # Return a success response
     return response_success(msg='Batch update successful')
 
 
+def _alerts_batch_post_update(updated_alerts):
+    if not updated_alerts:
+        return
+
+    alerts = call_modules_hook_batch('on_postload_alert_update', data=[alert for alert, _ in updated_alerts])
+
+    for alert, (_, activity_data) in zip(alerts, updated_alerts):
+        if activity_data:
+            track_activity(f"updated alert #{alert.alert_id}: {','.join(activity_data)}", ctx_less=True)
+            add_obj_history_entry(alert, f"updated alert: {','.join(activity_data)}")
+
+    db.session.commit()
+
+
 @alerts_rest_blueprint.route('/alerts/batch/delete', methods=['POST'])
 @ac_api_requires(Permissions.alerts_delete)
 def alerts_batch_delete_route() -> Response:
@@ -545,6 +587,8 @@ def alerts_batch_delete_route() -> Response:
 
     alert = call_modules_hook('on_postload_alert_delete', data={"alert_ids": alert_ids})
 
+    db.session.commit()
+
     track_activity(f"deleted alerts #{','.join(str(alert_id) for alert_id in alert_ids)}", ctx_less=True)
 
     return response_success(msg='Batch delete successful')
@@ -648,7 +692,7 @@ def alerts_escalate_route(alert_id) -> Response:
 
         case = call_modules_hook('on_postload_case_create', data=case)
 
-        add_obj_history_entry(case, 'created')
+        add_obj_history_entry(case, 'created', commit=True)
         track_activity("new case {case_name} created from alert".format(case_name=case.name),
                        ctx_less=True)
 
@@ -830,8 +874,8 @@ def alerts_batch_merge_route() -> Response:
     if not check_ua_case_client(current_user.id, target_case_id):
         return response_error('User not entitled to merge alerts for the case', status=403)
 
+    merged_alerts = []
     try:
-        # Merge the alerts into a case
         for alert_id in parse_comma_separated_identifiers(alert_ids):
 
             alert = get_alert_by_id(alert_id)
@@ -842,23 +886,12 @@ def alerts_batch_merge_route() -> Response:
             if not user_has_client_access(current_user.id, alert.alert_customer_id):
                 return response_error('User not entitled to merge alerts for the client', status=403)
 
-            alert.alert_status_id = AlertStatus.query.filter_by(status_name='Merged').first().status_id
-            db.session.commit()
-
-            # Merge alert in the case
-            merge_alert_in_case(alert, case, iocs_list=iocs_import_list, assets_list=assets_import_list, note=None,
-                                import_as_event=import_as_event, case_tags=case_tags)
-
-            add_obj_history_entry(alert, f"Alert merged into existing case #{target_case_id}")
-
-            alert = call_modules_hook('on_postload_alert_merge', data=alert)
+            merged_alerts.append(alert)
 
-        if note:
-            case.description += f"\n\n### Escalation note\n\n{note}\n\n" if case.description else f"\n\n{note}\n\n"
-            db.session.commit()
-
-        track_activity(f"batched merge alerts {alert_ids} into existing case #{target_case_id}",
-                       caseid=target_case_id)
+        # Merge the alerts into a case
+        alerts_batch_merge(case, merged_alerts, iocs_import_list=iocs_import_list,
+                           assets_import_list=assets_import_list, note=note, import_as_event=import_as_event,
+                           case_tags=case_tags)
 
         # Return the updated case as JSON
         return response_success(data=CaseSchema().dump(case))
@@ -913,10 +946,11 @@ def alerts_batch_escalate_route() -> Response:
 
             alert.alert_status_id = AlertStatus.query.filter_by(status_name='Merged').first().status_id
             db.session.commit()
-            alert = call_modules_hook('on_postload_alert_escalate', data=alert)
 
             alerts_list.append(alert)
 
+        alerts_list = call_modules_hook_batch('on_postload_alert_escalate', data=alerts_list)
+
         # Merge alerts in the case
         case = create_case_from_alerts(alerts_list, iocs_list=iocs_import_list, assets_list=assets_import_list,
                                        note=note, import_as_event=import_as_event, case_tags=case_tags,
@@ -929,7 +963,7 @@ def alerts_batch_escalate_route() -> Response:
 
         case = call_modules_hook('on_postload_case_create', data=case)
 
-        add_obj_history_entry(case, 'created')
+        add_obj_history_entry(case, 'created', commit=True)
         track_activity("new case {case_name} created from alerts".format(case_name=case.name),
                        caseid=case.case_id)
 
@@ -45,7 +45,6 @@ from app.datamgmt.case.case_assets_db import get_case_asset_comments
 from app.datamgmt.case.case_assets_db import get_similar_assets
 from app.datamgmt.case.case_db import get_case_client_id
 from app.datamgmt.manage.manage_attribute_db import get_default_custom_attributes
-from app.datamgmt.manage.manage_users_db import get_user_cases_fast
 from app.datamgmt.states import get_assets_state
 from app.iris_engine.access_control.utils import ac_fast_check_current_user_has_case_access
 from app.iris_engine.module_handler.module_handler import call_modules_hook
@@ -86,15 +85,13 @@ def case_filter_assets(caseid):
         else:
             cache_ioc_link[ioc.asset_id].append(ioc._asdict())
 
-    cases_access = get_user_cases_fast(current_user.id)
-
     for a in assets:
         a['ioc_links'] = cache_ioc_link.get(a['asset_id'])
 
         if len(assets) < 300:
             # Find similar assets from other cases with the same customer
             a['link'] = list(get_similar_assets(
-                a['asset_name'], a['asset_type_id'], caseid, customer_id, cases_access))
+                a['asset_name'], a['asset_type_id'], caseid, customer_id, current_user.id))
         else:
             a['link'] = []
 
@@ -129,15 +126,13 @@ def case_list_assets(caseid):
         else:
             cache_ioc_link[ioc.asset_id].append(ioc._asdict())
 
-    cases_access = get_user_cases_fast(current_user.id)
-
     for asset in assets:
         asset = asset._asdict()
 
         if len(assets) < 300:
             # Find similar assets from other cases with the same customer
             asset['link'] = list(get_similar_assets(
-                asset['asset_name'], asset['asset_type_id'], caseid, customer_id, cases_access))
+                asset['asset_name'], asset['asset_type_id'], caseid, customer_id, current_user.id))
         else:
             asset['link'] = []
 
@@ -129,6 +129,8 @@ def case_note_delete(cur_id, caseid):
 
     call_modules_hook('on_postload_note_delete', data=cur_id, caseid=caseid)
 
+    db.session.commit()
+
     track_activity(f"deleted note \"{note.note_title}\"", caseid=caseid)
     return response_success(f"Note deleted {cur_id}")
 
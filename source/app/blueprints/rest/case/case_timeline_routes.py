@@ -30,6 +30,12 @@ from sqlalchemy import and_
 from app import db
 from app import app
 from app.blueprints.rest.case_comments import case_comment_update
+from app.business.errors import BusinessProcessingError
+from app.business.errors import ObjectNotFoundError
+from app.business.events import events_csv_store
+from app.business.jobs import JOB_TYPE_TIMELINE_CSV_IMPORT
+from app.business.jobs import jobs_get
+from app.business.jobs import jobs_submit
 from app.datamgmt.case.case_assets_db import get_asset_by_name
 from app.datamgmt.case.case_events_db import add_comment_to_event
 from app.datamgmt.case.case_events_db import get_category_by_name
@@ -40,25 +46,29 @@ from app.datamgmt.case.case_events_db import get_case_event
 from app.datamgmt.case.case_events_db import get_case_event_comment
 from app.datamgmt.case.case_events_db import get_case_event_comments
 from app.datamgmt.case.case_events_db import get_case_events_comments_count
+from app.datamgmt.case.case_events_db import get_case_timeline_changes
+from app.datamgmt.case.case_events_db import get_case_timeline_filter_query
+from app.datamgmt.case.case_events_db import get_case_timeline_links
 from app.datamgmt.case.case_events_db import get_event_assets_ids
 from app.datamgmt.case.case_events_db import get_event_category
 from app.datamgmt.case.case_events_db import get_event_iocs_ids
 from app.datamgmt.case.case_events_db import get_events_categories
+from app.datamgmt.case.case_events_db import get_timeline_changes_version
 from app.datamgmt.case.case_events_db import save_event_category
 from app.datamgmt.case.case_events_db import update_event_assets
 from app.datamgmt.case.case_events_db import update_event_iocs
 from app.datamgmt.case.case_iocs_db import get_ioc_by_value
+from app.datamgmt.cursor_pagination import cursor_paginate
 from app.datamgmt.states import get_timeline_state
 from app.datamgmt.states import update_timeline_state
 from app.iris_engine.module_handler.module_handler import call_modules_hook
+from app.iris_engine.module_handler.module_handler import call_modules_hook_batch
 from app.iris_engine.utils.collab import collab_notify
 from app.iris_engine.utils.common import parse_bf_date_format
 from app.iris_engine.utils.tracker import track_activity
 from app.models.models import CompromiseStatus
 from app.models.authorization import CaseAccessLevel
-from app.models.authorization import User
 from app.models.cases import CasesEvent
-from app.models.models import AssetsType
 from app.models.models import CaseAssets
 from app.models.models import CaseEventsAssets
 from app.models.models import CaseEventsIoc
@@ -66,6 +76,7 @@ from app.models.models import EventCategory
 from app.models.models import Ioc
 from app.schema.marshables import CommentSchema
 from app.schema.marshables import EventSchema
+from app.schema.marshables import IrisJobSchema
 from app.blueprints.access_controls import ac_requires_case_identifier
 from app.blueprints.access_controls import ac_api_requires
 from app.util import add_obj_history_entry
@@ -74,6 +85,9 @@ from app.blueprints.responses import response_success
 
 case_timeline_rest_blueprint = Blueprint('case_timeline_rest', __name__)
 
+_TIMELINE_DEFAULT_PER_PAGE = 500
+_TIMELINE_MAX_PER_PAGE = 10000
+
 
 @case_timeline_rest_blueprint.route('/case/timeline/events/<int:cur_id>/comments/list', methods=['GET'])
 @ac_requires_case_identifier(CaseAccessLevel.read_only, CaseAccessLevel.full_access)
@@ -162,6 +176,8 @@ def case_comment_add(cur_id, caseid):
 def case_get_timeline_state(caseid):
     os = get_timeline_state(caseid=caseid)
     if os:
+        # Version to request the following changes from /case/timeline/events/changes
+        os['changes_version'] = get_timeline_changes_version(caseid)
         return response_success(data=os)
     return response_error('No timeline state for this case. Add an event to begin')
 
@@ -334,6 +350,114 @@ def case_gettimeline_api(asset_id, caseid):
     return response_success("", data=resp)
 
 
+def _timeline_rows_to_dict(timeline, assets_links, iocs_links, cache=None):
+    tim = []
+    for row in timeline:
+        ras = row._asdict()
+
+        ras['event_date'] = ras['event_date'].strftime('%Y-%m-%dT%H:%M:%S.%f')
+        ras['event_date_wtz'] = ras['event_date_wtz'].strftime('%Y-%m-%dT%H:%M:%S.%f') if ras[
+            'event_date_wtz'] else None
+        ras['event_added'] = ras['event_added'].strftime('%Y-%m-%dT%H:%M:%S')
+
+        alki = []
+        for asset in assets_links.get(row.event_id, []):
+            alki.append(
+                {
+                    "name": "{} ({})".format(asset.asset_name, asset.type),
+                    "ip": asset.asset_ip,
+                    "description": asset.asset_description,
+                    "compromised": asset.asset_compromise_status_id == CompromiseStatus.compromised.value
+                }
+            )
+        ras['assets'] = alki
+
+        alki = []
+        for ioc in iocs_links.get(row.event_id, []):
+            if cache is not None and ioc.ioc_id not in cache:
+                cache[ioc.ioc_id] = [ioc.ioc_value]
+
+            alki.append(
+                {
+                    "name": "{}".format(ioc.ioc_value),
+                    "description": ioc.ioc_description
+                }
+            )
+
+        ras['iocs'] = alki
+
+        tim.append(ras)
+
+    return tim
+
+
+def _timeline_per_page():
+    per_page = request.args.get('per_page', default=_TIMELINE_DEFAULT_PER_PAGE, type=int)
+    return max(1, min(per_page, _TIMELINE_MAX_PER_PAGE))
+
+
+@case_timeline_rest_blueprint.route('/case/timeline/events/window', methods=['GET'])
+@ac_requires_case_identifier(CaseAccessLevel.read_only, CaseAccessLevel.full_access)
+@ac_api_requires()
+def case_timeline_window(caseid):
+    condition = (CasesEvent.case_id == caseid)
+
+    try:
+        start_date = request.args.get('start_date')
+        if start_date:
+            condition = and_(condition, CasesEvent.event_date >= datetime.fromisoformat(start_date))
+
+        end_date = request.args.get('end_date')
+        if end_date:
+            condition = and_(condition, CasesEvent.event_date <= datetime.fromisoformat(end_date))
+
+    except ValueError:
+        return response_error('Invalid date, expecting ISO 8601 format')
+
+    try:
+        pagination = cursor_paginate(get_case_timeline_filter_query(caseid, condition),
+                                     [CasesEvent.event_date, CasesEvent.event_id],
+                                     cursor=request.args.get('cursor'), per_page=_timeline_per_page(), sort='asc',
+                                     with_total=None)
+    except ValueError:
+        return response_error('Invalid cursor')
+
+    assets_links, iocs_links = get_case_timeline_links(caseid, events_list=[row.event_id for row in pagination.items])
+
+    resp = {
+        "timeline": _timeline_rows_to_dict(pagination.items, assets_links, iocs_links),
+        "next_cursor": pagination.next_cursor,
+        "prev_cursor": pagination.prev_cursor,
+        "changes_version": get_timeline_changes_version(caseid),
+        "state": get_timeline_state(caseid=caseid)
+    }
+
+    return response_success(data=resp)
+
+
+@case_timeline_rest_blueprint.route('/case/timeline/events/changes', methods=['GET'])
+@ac_requires_case_identifier(CaseAccessLevel.read_only, CaseAccessLevel.full_access)
+@ac_api_requires()
+def case_timeline_changes(caseid):
+    since = request.args.get('since', type=int)
+    if since is None or since < 0:
+        return response_error('Expecting since as the changes_version of a previous call')
+
+    events, deleted_events, version, has_more = get_case_timeline_changes(caseid, since, _timeline_per_page())
+
+    assets_links, iocs_links = get_case_timeline_links(caseid, events_list=[row.event_id for row in events])
+
+    resp = {
+        "timeline": _timeline_rows_to_dict(events, assets_links, iocs_links),
+        "deleted": deleted_events,
+        "changes_version": version,
+        "has_more": has_more,
+        "state": get_timeline_state(caseid=caseid)
+    }
+
+    return response_success(data=resp)
+
+
 @case_timeline_rest_blueprint.route('/case/timeline/advanced-filter', methods=['GET'])
 @ac_requires_case_identifier(CaseAccessLevel.read_only, CaseAccessLevel.full_access)
 @ac_api_requires()
@@ -437,155 +561,37 @@ def case_filter_timeline(caseid):
         condition = and_(condition,
                          CasesEvent.event_id.in_(event_ids))
 
-    timeline = CasesEvent.query.with_entities(
-        CasesEvent.event_id,
-        CasesEvent.event_uuid,
-        CasesEvent.event_date,
-        CasesEvent.event_date_wtz,
-        CasesEvent.event_tz,
-        CasesEvent.event_title,
-        CasesEvent.event_color,
-        CasesEvent.event_tags,
-        CasesEvent.event_content,
-        CasesEvent.event_in_summary,
-        CasesEvent.event_in_graph,
-        CasesEvent.event_is_flagged,
-        CasesEvent.parent_event_id,
-        User.user,
-        CasesEvent.event_added,
-        EventCategory.name.label("category_name")
-    ).filter(condition).order_by(
-        CasesEvent.event_date
-    ).outerjoin(
-        CasesEvent.category
-    ).join(
-        CasesEvent.user
-    ).all()
-
-    assets_cache_condition = and_(
-        CaseEventsAssets.case_id == caseid
-    )
-
-    if assets_id:
-        assets_cache_condition = and_(
-            assets_cache_condition,
-            CaseEventsAssets.asset_id.in_(assets_id)
-        )
-
-    assets_cache = (CaseAssets.query.with_entities(
-        CaseEventsAssets.event_id,
-        CaseAssets.asset_id,
-        CaseAssets.asset_name,
-        AssetsType.asset_name.label('type'),
-        CaseAssets.asset_ip,
-        CaseAssets.asset_description,
-        CaseAssets.asset_compromise_status_id
-    ).filter(
-        assets_cache_condition
-    ).join(CaseEventsAssets.asset)
-     .join(CaseAssets.asset_type).all())
-
-    iocs_cache_condition = and_(
-        CaseEventsIoc.case_id == caseid
-    )
+    timeline_query = get_case_timeline_filter_query(caseid, condition, assets=assets, assets_id=assets_id,
+                                                    iocs=iocs, iocs_id=iocs_id)
 
-    if iocs_id:
-        iocs_cache_condition = and_(
-            iocs_cache_condition,
-            CaseEventsIoc.ioc_id.in_(iocs_id)
-        )
+    pagination = None
+    per_page = request.args.get('per_page', type=int)
+    if per_page:
+        try:
+            pagination = cursor_paginate(timeline_query, [CasesEvent.event_date, CasesEvent.event_id],
+                                         cursor=request.args.get('cursor'),
+                                         per_page=min(per_page, _TIMELINE_MAX_PER_PAGE), sort='asc',
+                                         with_total=None)
+        except ValueError:
+            return response_error('Invalid cursor')
+
+        timeline = pagination.items
+        events_list = [row.event_id for row in timeline]
+        assets_links, iocs_links = get_case_timeline_links(caseid, events_list=events_list,
+                                                           assets_id=assets_id, iocs_id=iocs_id)
 
-    iocs_cache = CaseEventsIoc.query.with_entities(
-        CaseEventsIoc.event_id,
-        CaseEventsIoc.ioc_id,
-        Ioc.ioc_value,
-        Ioc.ioc_description
-    ).filter(
-        iocs_cache_condition
-    ).join(
-        CaseEventsIoc.ioc
-    ).all()
+    else:
+        timeline = timeline_query.order_by(CasesEvent.event_date, CasesEvent.event_id).all()
+        events_list = [row.event_id for row in timeline]
+        assets_links, iocs_links = get_case_timeline_links(caseid, assets_id=assets_id, iocs_id=iocs_id)
 
-    assets_map = {}
     cache = {}
+    for event_assets in assets_links.values():
+        for asset in event_assets:
+            if asset.asset_id not in cache:
+                cache[asset.asset_id] = [asset.asset_name, asset.type]
 
-    for asset in assets_cache:
-        if asset.asset_id not in cache:
-            cache[asset.asset_id] = [asset.asset_name, asset.type]
-
-        if (assets and asset.asset_name.lower() in assets) \
-                or (assets_id and asset.asset_id in assets_id):
-            if asset.event_id in assets_map:
-                assets_map[asset.event_id] += 1
-            else:
-                assets_map[asset.event_id] = 1
-
-    assets_filter = []
-    len_assets = 0
-    if assets:
-        len_assets += len(assets)
-    if assets_id:
-        len_assets += len(assets_id)
-
-    for event_id in assets_map:
-        if assets_map[event_id] == len_assets:
-            assets_filter.append(event_id)
-
-    iocs_filter = []
-    if iocs:
-        for ioc in iocs_cache:
-            if ioc.event_id not in iocs_filter and ioc.ioc_value.lower() in iocs:
-                iocs_filter.append(ioc.event_id)
-
-    tim = []
-    events_list = []
-    for row in timeline:
-        if (assets is not None or assets_id is not None) and row.event_id not in assets_filter:
-                continue
-
-        if iocs is not None and row.event_id not in iocs_filter:
-                continue
-
-        ras = row._asdict()
-
-        ras['event_date'] = ras['event_date'].strftime('%Y-%m-%dT%H:%M:%S.%f')
-        ras['event_date_wtz'] = ras['event_date_wtz'].strftime('%Y-%m-%dT%H:%M:%S.%f') if ras[
-            'event_date_wtz'] else None
-        ras['event_added'] = ras['event_added'].strftime('%Y-%m-%dT%H:%M:%S')
-
-        if row.event_id not in events_list:
-            events_list.append(row.event_id)
-
-        alki = []
-        for asset in assets_cache:
-
-            if asset.event_id == ras['event_id']:
-                alki.append(
-                    {
-                        "name": "{} ({})".format(asset.asset_name, asset.type),
-                        "ip": asset.asset_ip,
-                        "description": asset.asset_description,
-                        "compromised": asset.asset_compromise_status_id == CompromiseStatus.compromised.value
-                    }
-                )
-        ras['assets'] = alki
-
-        alki = []
-        for ioc in iocs_cache:
-            if ioc.event_id == ras['event_id']:
-                if ioc.ioc_id not in cache:
-                    cache[ioc.ioc_id] = [ioc.ioc_value]
-
-                alki.append(
-                    {
-                        "name": "{}".format(ioc.ioc_value),
-                        "description": ioc.ioc_description
-                    }
-                )
-
-        ras['iocs'] = alki
-
-        tim.append(ras)
+    tim = _timeline_rows_to_dict(timeline, assets_links, iocs_links, cache)
 
     if request.cookies.get('session'):
 
@@ -617,6 +623,10 @@ def case_filter_timeline(caseid):
             "state": get_timeline_state(caseid=caseid)
         }
 
+    if pagination is not None:
+        resp['next_cursor'] = pagination.next_cursor
+        resp['prev_cursor'] = pagination.prev_cursor
+
     return response_success("ok", data=resp)
 
 
@@ -1000,13 +1010,15 @@ def case_events_upload_csv(caseid):
     # ========================== begin saving data ============================
     session = db.session.begin_nested()
     line = 0
+    created_events = []
     try:
-        for row in csv_lines:
-            if row is None:
+        csv_lines = call_modules_hook_batch('on_preload_event_create', data=csv_lines, caseid=caseid)
+
+        for request_data in csv_lines:
+            if request_data is None:
                 continue
             line += 1
 
-            request_data = call_modules_hook('on_preload_event_create', data=row, caseid=caseid)
             event = event_schema.load(request_data)
             event.event_date, event.event_date_wtz = event_schema.validate_date(request_data.get(u'event_date'),
                                                                                 request_data.get(u'event_tz'))
@@ -1039,10 +1051,12 @@ def case_events_upload_csv(caseid):
 
             setattr(event, 'event_category_id', request_data.get('event_category_id'))
 
-            event = call_modules_hook('on_postload_event_create', data=event, caseid=caseid)
+            created_events.append(event)
 
             track_activity("added event {}".format(event.event_id), caseid=caseid)
 
+        call_modules_hook_batch('on_postload_event_create', data=created_events, caseid=caseid)
+
     except marshmallow.exceptions.ValidationError as e:
         return response_error(msg="Data error", data=e.normalized_messages())
 
@@ -1057,3 +1071,44 @@ def case_events_upload_csv(caseid):
     app.logger.info("======================== END_CSV_IMPORT ==========================================")
 
     return response_success(msg="Events added (CSV File)")
+
+
+@case_timeline_rest_blueprint.route('/case/timeline/events/csv_upload/stream', methods=['POST'])
+@ac_requires_case_identifier(CaseAccessLevel.full_access)
+@ac_api_requires()
+def case_events_upload_csv_stream(caseid):
+    csv_file = request.files.get('file')
+    if csv_file is None:
+        return response_error('Expecting the CSV file in the file field')
+
+    try:
+        csv_options = json.loads(request.form.get('CSVOptions') or '{}')
+    except json.JSONDecodeError:
+        return response_error('Invalid CSVOptions, expecting a JSON object')
+
+    try:
+        csv_path, lines_count = events_csv_store(csv_file)
+    except BusinessProcessingError as e:
+        return response_error(msg=e.get_message(), data=e.get_data())
+
+    job = jobs_submit(JOB_TYPE_TIMELINE_CSV_IMPORT, caseid, {
+        'csv_path': csv_path,
+        'csv_options': csv_options
+    }, progress_total=lines_count)
+
+    return response_success(msg='CSV import queued', data=IrisJobSchema().dump(job))
+
+
+@case_timeline_rest_blueprint.route('/case/timeline/events/csv_upload/jobs/<int:job_id>', methods=['GET'])
+@ac_requires_case_identifier(CaseAccessLevel.read_only, CaseAccessLevel.full_access)
+@ac_api_requires()
+def case_events_upload_csv_status(job_id, caseid):
+    try:
+        job = jobs_get(job_id)
+    except ObjectNotFoundError:
+        return response_error('Unknown CSV import job for this case', status=404)
+
+    if job.job_type != JOB_TYPE_TIMELINE_CSV_IMPORT or job.case_id != caseid:
+        return response_error('Unknown CSV import job for this case', status=404)
+
+    return response_success(data=IrisJobSchema().dump(job))
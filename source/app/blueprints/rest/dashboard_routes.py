@@ -37,11 +37,11 @@ from app.datamgmt.dashboard.dashboard_db import get_global_task, list_user_cases
 from app.datamgmt.dashboard.dashboard_db import get_tasks_status
 from app.datamgmt.dashboard.dashboard_db import list_global_tasks
 from app.datamgmt.dashboard.dashboard_db import list_user_tasks
+from app.datamgmt.dashboard.statistics_db import get_daily_counts
 from app.forms import CaseGlobalTaskForm
 from app.iris_engine.module_handler.module_handler import call_modules_hook
 from app.iris_engine.utils.tracker import track_activity
 from app.models.authorization import User
-from app.models.cases import Cases
 from app.models.models import CaseTasks
 from app.models.models import GlobalTasks
 from app.models.models import TaskStatus
@@ -113,25 +113,11 @@ def get_cases_charts():
     Get case charts
     :return: JSON
     """
-    res = Cases.query.with_entities(
-        Cases.open_date
-    ).filter(
-        Cases.open_date > (datetime.utcnow() - timedelta(days=365))
-    ).order_by(
-        Cases.open_date
-    ).all()
-    retr = [[], []]
-    rk = {}
-    for case in res:
-        month = "{}/{}/{}".format(case.open_date.day,
-                                  case.open_date.month, case.open_date.year)
-
-        if month in rk:
-            rk[month] += 1
-        else:
-            rk[month] = 1
-
-        retr = [list(rk.keys()), list(rk.values())]
+    days = get_daily_counts('case', datetime.utcnow().date() - timedelta(days=364))
+    retr = [
+        [f'{day.stat_day.day}/{day.stat_day.month}/{day.stat_day.year}' for day in days],
+        [day.object_count for day in days]
+    ]
 
     return response_success("", retr)
 
@@ -16,7 +16,6 @@
 #  along with this program; if not, write to the Free Software Foundation,
 #  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
-import base64
 import datetime
 import json
 import marshmallow.exceptions
@@ -39,7 +38,6 @@ from app.datamgmt.datastore.datastore_db import datastore_get_file
 from app.datamgmt.datastore.datastore_db import datastore_get_interactive_path_node
 from app.datamgmt.datastore.datastore_db import datastore_get_local_file_path
 from app.datamgmt.datastore.datastore_db import datastore_get_path_node
-from app.datamgmt.datastore.datastore_db import datastore_get_standard_path
 from app.datamgmt.datastore.datastore_db import datastore_rename_node
 from app.datamgmt.datastore.datastore_db import ds_list_tree
 from app.iris_engine.utils.tracker import track_activity
@@ -125,10 +123,9 @@ def datastore_update_file(cur_id: int, caseid: int):
         db.session.commit()
 
         if request.files.get('file_content'):
-            ds_location = datastore_get_standard_path(dsf_sc, caseid)
-            dsf_sc.file_local_name, dsf_sc.file_size, dsf_sc.file_sha256 = dsf_schema.ds_store_file(
+            dsf_schema.ds_store_file(
                 request.files.get('file_content'),
-                ds_location,
+                dsf_sc,
                 dsf_sc.file_is_ioc,
                 dsf_sc.file_password)
 
@@ -253,10 +250,9 @@ def datastore_add_file(cur_id: int, caseid: int):
         db.session.add(dsf_sc)
         db.session.commit()
 
-        ds_location = datastore_get_standard_path(dsf_sc, caseid)
-        dsf_sc.file_local_name, dsf_sc.file_size, dsf_sc.file_sha256 = dsf_schema.ds_store_file(
+        dsf_schema.ds_store_file(
             request.files.get('file_content'),
-            ds_location,
+            dsf_sc,
             dsf_sc.file_is_ioc,
             dsf_sc.file_password)
 
@@ -290,11 +286,10 @@ def datastore_add_interactive_file(caseid: int):
     try:
         js_data = request.json
 
-        try:
-            file_content = base64.b64decode(js_data.get('file_content'))
-            filename = js_data.get('file_original_name')
-        except Exception as e:
-            return response_error(msg=str(e))
+        file_content = js_data.get('file_content')
+        filename = js_data.get('file_original_name')
+        if not isinstance(file_content, str) or not isinstance(filename, str):
+            return response_error(msg='Expecting the file_content in base64 and the file_original_name')
 
         dsf_sc, existed = dsf_schema.ds_store_file_b64(filename, file_content, dsp, caseid)
 
@@ -102,6 +102,7 @@ def view_assets(cur_id):
             asset_sc.asset_icon_compromised = fpath_c
 
         if asset_sc:
+            db.session.commit()
             track_activity("updated asset type {}".format(asset_sc.asset_name))
             return response_success("Asset type updated", asset_sc)
 
@@ -131,7 +132,6 @@ def add_assets():
         if asset_sc:
             db.session.add(asset_sc)
             db.session.commit()
-
             track_activity("updated asset type {}".format(asset_sc.asset_name))
             return response_success("Asset type updated", asset_sc)
 
@@ -166,6 +166,7 @@ def delete_assets(cur_id):
         logging.error(f"Unable to delete {e}")
 
     db.session.delete(asset)
+    db.session.commit()
 
     track_activity("Deleted asset type ID {asset_id}".format(asset_id=cur_id), ctx_less=True)
 
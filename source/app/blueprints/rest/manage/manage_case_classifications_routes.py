@@ -100,6 +100,7 @@ def update_case_classification(classification_id: int) -> Response:
         ccls = ccl.load(request.get_json(), instance=case_classification)
 
         if ccls:
+            db.session.commit()
             track_activity(f"updated case classification {ccls.id}")
             return response_success("Case classification updated", ccl.dump(ccls))
 
@@ -129,7 +130,6 @@ def add_case_classification() -> Response:
         if ccls:
             db.session.add(ccls)
             db.session.commit()
-
             track_activity(f"added case classification {ccls.name}")
             return response_success("Case classification added", ccl.dump(ccls))
 
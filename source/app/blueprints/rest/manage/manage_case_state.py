@@ -98,6 +98,7 @@ def update_case_state(state_id: int) -> Response:
         ccls = ccl.load(request.get_json(), instance=case_state)
 
         if ccls:
+            db.session.commit()
             track_activity(f"updated case state {ccls.state_id}")
             return response_success("Case state updated", ccl.dump(ccls))
 
@@ -127,7 +128,6 @@ def add_case_state() -> Response:
         if ccls:
             db.session.add(ccls)
             db.session.commit()
-
             track_activity(f"added case state {ccls.state_name}")
             return response_success("Case state added", ccl.dump(ccls))
 
@@ -186,7 +186,7 @@ def api_reopen_case(identifier):
 
     case = call_modules_hook('on_postload_case_update', data=case, caseid=identifier)
 
-    add_obj_history_entry(case, 'case reopen')
+    add_obj_history_entry(case, 'case reopen', commit=True)
     track_activity("reopen case ID {}".format(identifier), caseid=identifier)
     case_schema = CaseSchema()
 
@@ -231,7 +231,7 @@ def api_case_close(identifier):
 
     case = call_modules_hook('on_postload_case_update', data=case, caseid=identifier)
 
-    add_obj_history_entry(case, 'case closed')
+    add_obj_history_entry(case, 'case closed', commit=True)
     track_activity("closed case ID {}".format(identifier), caseid=identifier, ctx_less=False)
     case_schema = CaseSchema()
 
@@ -96,6 +96,7 @@ def update_case_classification(evidence_type_id: int) -> Response:
         ccls = ccl.load(request.get_json(), instance=evidence_type)
 
         if ccls:
+            db.session.commit()
             track_activity(f"updated evidence type {ccls.id}")
             return response_success("Evidence type updated", ccl.dump(ccls))
 
@@ -125,7 +126,6 @@ def add_evidence_type() -> Response:
         if ccls:
             db.session.add(ccls)
             db.session.commit()
-
             track_activity(f"added evidence type {ccls.name}")
             return response_success("Evidence type added", ccl.dump(ccls))
 
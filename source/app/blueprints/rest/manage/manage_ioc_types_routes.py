@@ -89,6 +89,7 @@ def remove_ioc_type(cur_id):
 
     if type_id:
         db.session.delete(type_id)
+        db.session.commit()
         track_activity("Deleted ioc type ID {type_id}".format(type_id=cur_id), ctx_less=True)
         return response_success("Deleted ioc type ID {type_id}".format(type_id=cur_id))
 
@@ -114,6 +115,7 @@ def update_ioc(cur_id):
         ioct_sc = ioct_schema.load(request.get_json(), instance=ioc_type)
 
         if ioct_sc:
+            db.session.commit()
             track_activity("updated ioc type type {}".format(ioct_sc.type_name))
             return response_success("IOC type updated", ioct_sc)
 
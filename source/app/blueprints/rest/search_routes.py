@@ -18,22 +18,32 @@
 
 from flask import Blueprint
 from flask import request
-from sqlalchemy import and_
+from flask_login import current_user
 
+from app.datamgmt.search.search_db import search_assets
+from app.datamgmt.search.search_db import search_comments
+from app.datamgmt.search.search_db import search_events
+from app.datamgmt.search.search_db import search_iocs
+from app.datamgmt.search.search_db import search_notes
 from app.iris_engine.utils.tracker import track_activity
-from app.models.models import Comments
 from app.models.authorization import Permissions
-from app.models.cases import Cases
-from app.models.models import Client
-from app.models.models import Ioc
-from app.models.models import IocType
-from app.models.models import Notes
-from app.models.models import Tlp
 from app.blueprints.access_controls import ac_api_requires
+from app.blueprints.responses import response_error
 from app.blueprints.responses import response_success
 
 search_rest_blueprint = Blueprint('search_rest', __name__)
 
+_SEARCH_DEFAULT_PER_PAGE = 100
+_SEARCH_MAX_PER_PAGE = 1000
+
+_SEARCH_TYPES = {
+    'ioc': search_iocs,
+    'notes': search_notes,
+    'comments': search_comments,
+    'events': search_events,
+    'assets': search_assets
+}
+
 
 @search_rest_blueprint.route('/search', methods=['POST'])
 @ac_api_requires(Permissions.search_across_cases)
@@ -42,79 +52,21 @@ def search_file_post():
     jsdata = request.get_json()
     search_value = jsdata.get('search_value')
     search_type = jsdata.get('search_type')
-    files = []
-    search_condition = and_()
-
-    track_activity("started a global search for {} on {}".format(search_value, search_type))
 
-    if search_type == "ioc":
-        res = Ioc.query.with_entities(
-                            Ioc.ioc_value.label('ioc_name'),
-                            Ioc.ioc_description.label('ioc_description'),
-                            Ioc.ioc_misp,
-                            IocType.type_name,
-                            Tlp.tlp_name,
-                            Tlp.tlp_bscolor,
-                            Cases.name.label('case_name'),
-                            Cases.case_id,
-                            Client.name.label('customer_name')
-                    ).filter(
-                        and_(
-                            Ioc.ioc_value.like(search_value),
-                            Ioc.case_id == Cases.case_id,
-                            Client.client_id == Cases.client_id,
-                            Ioc.ioc_tlp_id == Tlp.tlp_id,
-                            search_condition
-                        )
-                    ).join(Ioc.ioc_type).all()
+    search = _SEARCH_TYPES.get(search_type)
+    if search is None:
+        return response_error(f'Unknown search type, expecting one of {", ".join(_SEARCH_TYPES)}')
 
-        files = [row._asdict() for row in res]
+    page = jsdata.get('page', 1)
+    per_page = jsdata.get('per_page', _SEARCH_DEFAULT_PER_PAGE)
+    if not isinstance(page, int) or not isinstance(per_page, int) or page < 1 or per_page < 1:
+        return response_error('page and per_page are expected as positive integers')
 
-    if search_type == "notes":
-
-        ns = []
-        if search_value:
-            search_value = "%{}%".format(search_value)
-            ns = Notes.query.filter(
-                Notes.note_content.like(search_value),
-                Cases.client_id == Client.client_id,
-                search_condition
-            ).with_entities(
-                Notes.note_id,
-                Notes.note_title,
-                Cases.name.label('case_name'),
-                Client.name.label('client_name'),
-                Cases.case_id
-            ).join(
-                Notes.case
-            ).order_by(
-                Client.name
-            ).all()
-
-            ns = [row._asdict() for row in ns]
-
-        files = ns
+    track_activity("started a global search for {} on {}".format(search_value, search_type))
 
-    if search_type == "comments":
-        search_value = "%{}%".format(search_value)
-        comments = Comments.query.filter(
-            Comments.comment_text.like(search_value),
-            Cases.client_id == Client.client_id,
-            search_condition
-        ).with_entities(
-            Comments.comment_id,
-            Comments.comment_text,
-            Cases.name.label('case_name'),
-            Client.name.label('customer_name'),
-            Cases.case_id
-        ).join(
-            Comments.case
-        ).join(
-            Cases.client
-        ).order_by(
-            Client.name
-        ).all()
+    if not search_value:
+        return response_success("Results fetched", [])
 
-        files = [row._asdict() for row in comments]
+    files = search(search_value, current_user.id, page, min(per_page, _SEARCH_MAX_PER_PAGE))
 
     return response_success("Results fetched", files)
@@ -7,6 +7,9 @@ from app.blueprints.rest.v2.assets import assets_blueprint
 from app.blueprints.rest.v2.alerts import alerts_blueprint
 from app.blueprints.rest.v2.dashboard import dashboard_blueprint
 from app.blueprints.rest.v2.cases import cases_blueprint
+from app.blueprints.rest.v2.jobs import jobs_blueprint
+from app.blueprints.rest.v2.datastore_uploads import datastore_uploads_blueprint
+from app.blueprints.rest.v2.activities import activities_blueprint
 
 
 # Create root /api/v2 blueprint
@@ -21,3 +24,6 @@ rest_v2_blueprint.register_blueprint(iocs_blueprint)
 rest_v2_blueprint.register_blueprint(assets_blueprint)
 rest_v2_blueprint.register_blueprint(alerts_blueprint)
 rest_v2_blueprint.register_blueprint(dashboard_blueprint)
+rest_v2_blueprint.register_blueprint(jobs_blueprint)
+rest_v2_blueprint.register_blueprint(datastore_uploads_blueprint)
+rest_v2_blueprint.register_blueprint(activities_blueprint)
@@ -0,0 +1,78 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+from flask import Blueprint
+from flask import request
+
+from app.blueprints.access_controls import ac_api_requires
+from app.blueprints.access_controls import ac_api_return_access_denied
+from app.blueprints.rest.endpoints import response_api_error
+from app.blueprints.rest.endpoints import response_api_success
+from app.blueprints.rest.parsing import parse_boolean
+from app.business.activities import activities_get
+from app.business.errors import BusinessProcessingError
+from app.iris_engine.access_control.utils import ac_current_user_has_permission
+from app.models.authorization import Permissions
+
+_ACTIVITIES_DEFAULT_PER_PAGE = 100
+_ACTIVITIES_MAX_PER_PAGE = 1000
+
+activities_blueprint = Blueprint('activities',
+                                 __name__,
+                                 url_prefix='/activities')
+
+
+@activities_blueprint.get('')
+@ac_api_requires(Permissions.activities_read, Permissions.all_activities_read)
+def list_activities():
+    try:
+        include_hidden = parse_boolean(request.args.get('include_hidden', 'false'))
+        with_total = parse_boolean(request.args.get('with_total', 'false'))
+    except ValueError:
+        return response_api_error('Invalid include_hidden or with_total value')
+
+    if include_hidden and not ac_current_user_has_permission(Permissions.all_activities_read):
+        return ac_api_return_access_denied()
+
+    per_page = request.args.get('per_page', _ACTIVITIES_DEFAULT_PER_PAGE, type=int)
+
+    try:
+        activities = activities_get(case_id=request.args.get('case_id', type=int),
+                                    user_id=request.args.get('user_id', type=int),
+                                    start_date=request.args.get('start_date', type=str),
+                                    end_date=request.args.get('end_date', type=str),
+                                    include_hidden=include_hidden,
+                                    cursor=request.args.get('cursor', type=str),
+                                    per_page=max(1, min(per_page, _ACTIVITIES_MAX_PER_PAGE)),
+                                    with_total=with_total)
+
+    except BusinessProcessingError as e:
+        return response_api_error(e.get_message())
+
+    return response_api_success({
+        'total': activities.total,
+        'total_is_estimate': activities.total_is_estimate,
+        'data': [{
+            **row._asdict(),
+            'activity_date': row.activity_date.isoformat()
+        } for row in activities.items],
+        'per_page': activities.per_page,
+        'next_cursor': activities.next_cursor,
+        'prev_cursor': activities.prev_cursor
+    })
@@ -16,12 +16,15 @@
 #  along with this program; if not, write to the Free Software Foundation,
 #  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
+import json
 from flask import Blueprint, request, Response
 from flask_login import current_user
 
 from app.blueprints.access_controls import ac_api_requires
 from app.blueprints.rest.endpoints import response_api_success, response_api_error
 from app.blueprints.rest.parsing import parse_comma_separated_identifiers
+from app.blueprints.rest.parsing import parse_boolean
+from app.business.alerts import alerts_bulk_create
 from app.datamgmt.alerts.alerts_db import get_filtered_alerts
 from app.models.authorization import Permissions
 from app.schema.marshables import AlertSchema
@@ -29,6 +32,8 @@ from app.schema.marshables import AlertSchema
 
 alerts_blueprint = Blueprint('alerts', __name__, url_prefix='/alerts')
 
+_NDJSON_MIMETYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonl')
+
 
 @alerts_blueprint.get('')
 @ac_api_requires(Permissions.alerts_read)
@@ -82,32 +87,45 @@ def alerts_list_route() -> Response:
     else:
         fields = None
 
-    filtered_alerts = get_filtered_alerts(
-        start_date=request.args.get('creation_start_date'),
-        end_date=request.args.get('creation_end_date'),
-        source_start_date=request.args.get('source_start_date'),
-        source_end_date=request.args.get('source_end_date'),
-        source_reference=request.args.get('source_reference'),
-        title=request.args.get('alert_title'),
-        description=request.args.get('alert_description'),
-        status=request.args.get('alert_status_id', type=int),
-        severity=request.args.get('alert_severity_id', type=int),
-        owner=request.args.get('alert_owner_id', type=int),
-        source=request.args.get('alert_source'),
-        tags=request.args.get('alert_tags'),
-        classification=request.args.get('alert_classification_id', type=int),
-        client=request.args.get('alert_customer_id'),
-        case_id=request.args.get('case_id', type=int),
-        alert_ids=alert_ids,
-        page=page,
-        per_page=per_page,
-        sort=request.args.get('sort'),
-        custom_conditions=request.args.get('custom_conditions'),
-        assets=alert_assets,
-        iocs=alert_iocs,
-        resolution_status=request.args.get('alert_resolution_id', type=int),
-        current_user_id=current_user.id
-    )
+    # Keyset pagination is enabled as soon as the cursor argument is present, even empty for the first page
+    cursor_mode = 'cursor' in request.args
+    try:
+        with_total = parse_boolean(request.args.get('with_total', 'false' if cursor_mode else 'true'))
+    except ValueError:
+        return response_api_error('Invalid with_total value')
+
+    try:
+        filtered_alerts = get_filtered_alerts(
+            start_date=request.args.get('creation_start_date'),
+            end_date=request.args.get('creation_end_date'),
+            source_start_date=request.args.get('source_start_date'),
+            source_end_date=request.args.get('source_end_date'),
+            source_reference=request.args.get('source_reference'),
+            title=request.args.get('alert_title'),
+            description=request.args.get('alert_description'),
+            status=request.args.get('alert_status_id', type=int),
+            severity=request.args.get('alert_severity_id', type=int),
+            owner=request.args.get('alert_owner_id', type=int),
+            source=request.args.get('alert_source'),
+            tags=request.args.get('alert_tags'),
+            classification=request.args.get('alert_classification_id', type=int),
+            client=request.args.get('alert_customer_id'),
+            case_id=request.args.get('case_id', type=int),
+            alert_ids=alert_ids,
+            page=page,
+            per_page=per_page,
+            sort=request.args.get('sort'),
+            custom_conditions=request.args.get('custom_conditions'),
+            assets=alert_assets,
+            iocs=alert_iocs,
+            resolution_status=request.args.get('alert_resolution_id', type=int),
+            current_user_id=current_user.id,
+            cursor_mode=cursor_mode,
+            cursor=request.args.get('cursor'),
+            with_total=with_total
+        )
+    except ValueError as e:
+        return response_api_error(str(e))
 
     if filtered_alerts is None:
         return response_api_error('Filtering error')
@@ -121,6 +139,17 @@ def alerts_list_route() -> Response:
     else:
         alert_schema = AlertSchema()
 
+    if cursor_mode:
+        filtered_data = {
+            'total': filtered_alerts.total,
+            'total_is_estimate': filtered_alerts.total_is_estimate,
+            'data': alert_schema.dump(filtered_alerts.items, many=True),
+            'per_page': filtered_alerts.per_page,
+            'next_cursor': filtered_alerts.next_cursor,
+            'prev_cursor': filtered_alerts.prev_cursor
+        }
+        return response_api_success(data=filtered_data)
+
     filtered_data = {
         'total': filtered_alerts.total,
         'data': alert_schema.dump(filtered_alerts, many=True),
@@ -129,3 +158,42 @@ def alerts_list_route() -> Response:
         'next_page': filtered_alerts.next_num if filtered_alerts.has_next else None,
     }
     return response_api_success(data=filtered_data)
+
+
+def _read_ndjson_alerts(stream):
+    # Lines are decoded one at a time, so that the request body is never held entirely in memory
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            yield json.loads(line)
+        except ValueError:
+            # Reported as an invalid alert, at its position
+            yield None
+
+
+@alerts_blueprint.post('/bulk')
+@ac_api_requires(Permissions.alerts_write)
+def alerts_bulk_create_route() -> Response:
+    """
+    Create alerts in bulk, from a JSON array or from NDJSON (one alert per line, Content-Type application/x-ndjson)
+
+    returns:
+        Response: The number of created alerts and one result per alert, in the input order
+    """
+    if request.mimetype in _NDJSON_MIMETYPES:
+        alerts_data = _read_ndjson_alerts(request.stream)
+    else:
+        alerts_data = request.get_json(silent=True)
+        if not isinstance(alerts_data, list):
+            return response_api_error('A JSON array of alerts or NDJSON content is expected')
+
+    results = alerts_bulk_create(alerts_data)
+
+    return response_api_success(data={
+        'created': sum(1 for result in results if result['success']),
+        'failed': sum(1 for result in results if not result['success']),
+        'results': results
+    })
@@ -19,7 +19,10 @@
 from flask import Blueprint, request
 
 from app.blueprints.access_controls import ac_api_requires
+from app.blueprints.rest.endpoints import response_api_error
 from app.blueprints.rest.endpoints import response_api_success
+from app.business.errors import BusinessProcessingError
+from app.business.statistics import statistics_get_daily
 from app.datamgmt.dashboard.dashboard_db import list_user_cases, list_user_tasks, list_user_reviews
 from app.schema.marshables import CaseDetailsSchema, CaseTaskSchema, CaseSchema
 
@@ -61,3 +64,17 @@ def list_own_reviews():
             only=["case_id", "case_name",
                   "review_status.status_name", "status_id"]
         ).dump(reviews))
+
+
+@dashboard_blueprint.get('/statistics')
+@ac_api_requires()
+def get_statistics():
+    try:
+        statistics = statistics_get_daily(request.args.get('object_type', 'case', type=str),
+                                          start_date=request.args.get('start_date', type=str),
+                                          end_date=request.args.get('end_date', type=str),
+                                          client_id=request.args.get('client_id', type=int))
+        return response_api_success(statistics)
+
+    except BusinessProcessingError as e:
+        return response_api_error(e.get_message())
@@ -0,0 +1,140 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from flask import Blueprint
+from flask import request
+
+from app.blueprints.access_controls import ac_api_requires
+from app.blueprints.access_controls import ac_api_return_access_denied
+from app.blueprints.rest.endpoints import response_api_created
+from app.blueprints.rest.endpoints import response_api_deleted
+from app.blueprints.rest.endpoints import response_api_error
+from app.blueprints.rest.endpoints import response_api_not_found
+from app.blueprints.rest.endpoints import response_api_success
+from app.blueprints.responses import response
+from app.business.datastore_uploads import datastore_uploads_abort
+from app.business.datastore_uploads import datastore_uploads_commit
+from app.business.datastore_uploads import datastore_uploads_create
+from app.business.datastore_uploads import datastore_uploads_get
+from app.business.datastore_uploads import datastore_uploads_write_chunk
+from app.business.errors import BusinessProcessingError
+from app.business.errors import ObjectNotFoundError
+from app.business.errors import UploadOffsetError
+from app.iris_engine.access_control.utils import ac_fast_check_current_user_has_case_access
+from app.models.authorization import CaseAccessLevel
+from app.schema.marshables import DSFileSchema
+from app.schema.marshables import DataStoreUploadSchema
+
+datastore_uploads_blueprint = Blueprint('datastore_uploads',
+                                        __name__,
+                                        url_prefix='/datastore/uploads')
+
+
+def _has_upload_access(case_identifier):
+    return ac_fast_check_current_user_has_case_access(case_identifier, [CaseAccessLevel.full_access])
+
+
+@datastore_uploads_blueprint.post('')
+@ac_api_requires()
+def create_upload():
+    request_data = request.get_json(silent=True)
+    if not isinstance(request_data, dict):
+        return response_api_error('Expecting a JSON object with the case_id, file_original_name and file_size')
+
+    case_identifier = request_data.get('case_id')
+    if not isinstance(case_identifier, int) or not _has_upload_access(case_identifier):
+        return ac_api_return_access_denied(caseid=case_identifier)
+
+    try:
+        upload = datastore_uploads_create(case_identifier, request_data)
+        return response_api_created(DataStoreUploadSchema().dump(upload))
+
+    except BusinessProcessingError as e:
+        return response_api_error(e.get_message(), data=e.get_data())
+
+
+@datastore_uploads_blueprint.get('/<uuid:upload_uuid>')
+@ac_api_requires()
+def get_upload(upload_uuid):
+    try:
+        upload = datastore_uploads_get(upload_uuid)
+        if not _has_upload_access(upload.upload_case_id):
+            return ac_api_return_access_denied(caseid=upload.upload_case_id)
+
+        return response_api_success(DataStoreUploadSchema().dump(upload))
+
+    except ObjectNotFoundError:
+        return response_api_not_found()
+
+
+@datastore_uploads_blueprint.put('/<uuid:upload_uuid>')
+@ac_api_requires()
+def put_upload_chunk(upload_uuid):
+    try:
+        offset = int(request.headers.get('Upload-Offset', ''))
+    except ValueError:
+        return response_api_error('The Upload-Offset header is expected')
+
+    try:
+        upload = datastore_uploads_get(upload_uuid, for_update=True)
+        if not _has_upload_access(upload.upload_case_id):
+            return ac_api_return_access_denied(caseid=upload.upload_case_id)
+
+        datastore_uploads_write_chunk(upload, offset, request.stream, request.content_length)
+        return response_api_success(DataStoreUploadSchema().dump(upload))
+
+    except ObjectNotFoundError:
+        return response_api_not_found()
+    except UploadOffsetError as e:
+        return response(409, data={'message': e.get_message(), 'data': e.get_data()})
+    except BusinessProcessingError as e:
+        return response_api_error(e.get_message(), data=e.get_data())
+
+
+@datastore_uploads_blueprint.post('/<uuid:upload_uuid>/commit')
+@ac_api_requires()
+def commit_upload(upload_uuid):
+    request_data = request.get_json(silent=True) or {}
+
+    try:
+        upload = datastore_uploads_get(upload_uuid, for_update=True)
+        if not _has_upload_access(upload.upload_case_id):
+            return ac_api_return_access_denied(caseid=upload.upload_case_id)
+
+        dsf = datastore_uploads_commit(upload, expected_sha256=request_data.get('file_sha256'))
+        return response_api_created(DSFileSchema().dump(dsf))
+
+    except ObjectNotFoundError:
+        return response_api_not_found()
+    except BusinessProcessingError as e:
+        return response_api_error(e.get_message(), data=e.get_data())
+
+
+@datastore_uploads_blueprint.delete('/<uuid:upload_uuid>')
+@ac_api_requires()
+def delete_upload(upload_uuid):
+    try:
+        upload = datastore_uploads_get(upload_uuid, for_update=True)
+        if not _has_upload_access(upload.upload_case_id):
+            return ac_api_return_access_denied(caseid=upload.upload_case_id)
+
+        datastore_uploads_abort(upload)
+        return response_api_deleted()
+
+    except ObjectNotFoundError:
+        return response_api_not_found()
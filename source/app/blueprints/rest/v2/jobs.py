@@ -0,0 +1,103 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from flask import Blueprint
+from flask import request
+from flask import send_file
+
+from app.blueprints.access_controls import ac_api_requires
+from app.blueprints.access_controls import ac_api_return_access_denied
+from app.blueprints.rest.endpoints import response_api_created
+from app.blueprints.rest.endpoints import response_api_error
+from app.blueprints.rest.endpoints import response_api_not_found
+from app.blueprints.rest.endpoints import response_api_success
+from app.business.errors import BusinessProcessingError
+from app.business.errors import ObjectNotFoundError
+from app.business.jobs import jobs_cancel
+from app.business.jobs import jobs_check_submit_access
+from app.business.jobs import jobs_get
+from app.business.jobs import jobs_get_result_file
+from app.business.jobs import jobs_submit
+from app.schema.marshables import IrisJobSchema
+
+jobs_blueprint = Blueprint('jobs',
+                           __name__,
+                           url_prefix='/jobs')
+
+
+@jobs_blueprint.post('')
+@ac_api_requires()
+def create_job():
+    request_data = request.get_json(silent=True)
+    if not isinstance(request_data, dict):
+        return response_api_error('Expecting a JSON object with the job_type, case_id and parameters')
+
+    job_type = request_data.get('job_type')
+    case_identifier = request_data.get('case_id')
+    parameters = request_data.get('parameters') or {}
+
+    try:
+        if not jobs_check_submit_access(job_type, case_identifier, parameters):
+            return ac_api_return_access_denied(caseid=case_identifier)
+
+        job = jobs_submit(job_type, case_identifier, parameters)
+        return response_api_created(IrisJobSchema().dump(job))
+
+    except ObjectNotFoundError:
+        return response_api_not_found()
+    except BusinessProcessingError as e:
+        return response_api_error(e.get_message(), data=e.get_data())
+
+
+@jobs_blueprint.get('/<int:identifier>')
+@ac_api_requires()
+def get_job(identifier):
+    try:
+        job = jobs_get(identifier)
+        return response_api_success(IrisJobSchema().dump(job))
+
+    except ObjectNotFoundError:
+        return response_api_not_found()
+
+
+@jobs_blueprint.post('/<int:identifier>/cancel')
+@ac_api_requires()
+def cancel_job(identifier):
+    try:
+        job = jobs_get(identifier)
+        jobs_cancel(job)
+        return response_api_success(IrisJobSchema().dump(job))
+
+    except ObjectNotFoundError:
+        return response_api_not_found()
+    except BusinessProcessingError as e:
+        return response_api_error(e.get_message())
+
+
+@jobs_blueprint.get('/<int:identifier>/result')
+@ac_api_requires()
+def get_job_result(identifier):
+    try:
+        job = jobs_get(identifier)
+        file_path, file_name = jobs_get_result_file(job)
+        return send_file(file_path, as_attachment=True, download_name=file_name)
+
+    except ObjectNotFoundError:
+        return response_api_not_found()
+    except BusinessProcessingError as e:
+        return response_api_error(e.get_message())
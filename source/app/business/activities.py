@@ -0,0 +1,73 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+import datetime
+
+from app.business.errors import BusinessProcessingError
+from app.datamgmt.activities.activities_db import get_filtered_activities_query
+from app.datamgmt.cursor_pagination import CursorPagination
+from app.datamgmt.cursor_pagination import cursor_paginate
+from app.iris_engine.tasker import activities  # noqa: F401
+from app.models.models import UserActivity
+
+
+def _parse_date(value, name):
+    try:
+        parsed = datetime.datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise BusinessProcessingError(f'The {name} is expected in ISO 8601 format')
+
+    # The activities are dated in naive UTC
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+    return parsed
+
+
+def activities_get(case_id=None, user_id=None, start_date=None, end_date=None, include_hidden=False, cursor=None,
+                   per_page=100, with_total=False) -> CursorPagination:
+    """
+    Get a page of the activities, most recent first
+
+    args:
+        case_id (int): Only the activities of this case
+        user_id (int): Only the activities of this user
+        start_date (str): Only the activities since this date, in ISO 8601 format
+        end_date (str): Only the activities before this date, in ISO 8601 format
+        include_hidden (bool): Whether the activities not displayed in the UI are included
+        cursor (str): The cursor of the page, returned along with the previous one
+        per_page (int): The number of activities per page
+        with_total (bool): Whether the exact number of activities is counted, rather than estimated
+
+    returns:
+        CursorPagination: The page of activities
+    """
+    start = _parse_date(start_date, 'start_date') if start_date else None
+    end = _parse_date(end_date, 'end_date') if end_date else None
+    if start and end and start > end:
+        raise BusinessProcessingError('The start_date is expected before the end_date')
+
+    query = get_filtered_activities_query(case_id=case_id, user_id=user_id, start_date=start, end_date=end,
+                                          include_hidden=include_hidden)
+
+    try:
+        return cursor_paginate(query, [UserActivity.activity_date, UserActivity.id], cursor=cursor, per_page=per_page,
+                               sort='desc', with_total=with_total)
+    except ValueError:
+        raise BusinessProcessingError('Invalid cursor')
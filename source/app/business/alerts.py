@@ -0,0 +1,247 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+import json
+from datetime import datetime
+from flask_login import current_user
+from marshmallow.exceptions import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from typing import Callable
+from typing import Iterable
+from typing import List
+
+from app import app
+from app import db
+from app import socket_io
+from app.datamgmt.alerts.alerts_db import cache_similar_alerts
+from app.datamgmt.alerts.alerts_db import get_missing_references
+from app.datamgmt.alerts.alerts_db import merge_alert_in_case
+from app.datamgmt.alerts.alerts_db import register_related_alerts_batch
+from app.datamgmt.manage.manage_access_control_db import get_user_clients_id
+from app.iris_engine.access_control.utils import ac_current_user_has_permission
+from app.iris_engine.module_handler.module_handler import call_modules_hook_batch
+from app.iris_engine.utils.tracker import track_activity
+from app.models.alerts import Alert
+from app.models.alerts import AlertStatus
+from app.models.authorization import Permissions
+from app.models.cases import Cases
+from app.schema.marshables import AlertSchema
+from app.schema.marshables import CaseAssetsSchema
+from app.schema.marshables import IocSchema
+from app.util import add_obj_history_entry
+
+
+class _AlertsBulkSchemas:
+
+    def __init__(self):
+        self.alert_schema = AlertSchema()
+        self.ioc_schema = IocSchema()
+        self.asset_schema = CaseAssetsSchema()
+
+
+def _alerts_bulk_error(index, message, data=None):
+    result = {
+        'index': index,
+        'success': False,
+        'message': message
+    }
+    if data:
+        result['data'] = data
+
+    return result
+
+
+def _alerts_bulk_load(schemas: _AlertsBulkSchemas, alert_data: dict):
+    # Same loading as the single alert creation, without altering the caller's data
+    alert_data = dict(alert_data)
+    iocs_list = alert_data.pop('alert_iocs', [])
+    assets_list = alert_data.pop('alert_assets', [])
+
+    iocs = schemas.ioc_schema.load(iocs_list, many=True, partial=True)
+    assets = schemas.asset_schema.load(assets_list, many=True, partial=True)
+    alert = schemas.alert_schema.load(alert_data)
+
+    alert.alert_creation_time = datetime.utcnow()
+    if alert.alert_source_event_time is None:
+        # Set here rather than by the database, so that the similarities cache does not need to reload each alert
+        alert.alert_source_event_time = alert.alert_creation_time
+
+    alert.iocs = iocs
+    alert.assets = assets
+
+    return alert
+
+
+def _alerts_bulk_create_batch(schemas: _AlertsBulkSchemas, batch: list, user_clients) -> list:
+    results = {}
+    loaded = []
+
+    for index, alert_data in batch:
+        if not isinstance(alert_data, dict):
+            results[index] = _alerts_bulk_error(index, 'Invalid alert, a JSON object is expected')
+            continue
+
+        try:
+            alert = _alerts_bulk_load(schemas, alert_data)
+        except ValidationError as e:
+            results[index] = _alerts_bulk_error(index, 'Data error', e.messages)
+            continue
+
+        if user_clients is not None and alert.alert_customer_id not in user_clients:
+            results[index] = _alerts_bulk_error(index, 'User not entitled to create alerts for the client')
+            continue
+
+        loaded.append((index, alert))
+
+    # The schemas do not check all the references, so they are checked for the whole batch at once rather than
+    # letting a single alert fail the insertion of the others
+    referenced_objects = []
+    for _, alert in loaded:
+        referenced_objects.append(alert)
+        referenced_objects.extend(alert.iocs)
+        referenced_objects.extend(alert.assets)
+    missing_references = get_missing_references(referenced_objects)
+
+    alerts = []
+    for index, alert in loaded:
+        invalid_fields = []
+        for obj in [alert, *alert.iocs, *alert.assets]:
+            invalid_fields.extend(missing_references.get(id(obj), []))
+
+        if invalid_fields:
+            results[index] = _alerts_bulk_error(index, 'Invalid references', {field: ['Unknown identifier']
+                                                                               for field in invalid_fields})
+            continue
+
+        add_obj_history_entry(alert, 'Alert created')
+        alerts.append((index, alert))
+
+    if alerts:
+        try:
+            # Alerts, assets, IOCs and association rows are each inserted with multi-rows statements by the flush
+            db.session.add_all([alert for _, alert in alerts])
+            db.session.flush()
+
+            cache_similar_alerts([alert for _, alert in alerts])
+            register_related_alerts_batch([alert for _, alert in alerts])
+
+            # Read before the commit expires the alerts, which would reload them one by one
+            for index, alert in alerts:
+                results[index] = {
+                    'index': index,
+                    'success': True,
+                    'alert_id': alert.alert_id,
+                    'alert_uuid': str(alert.alert_uuid)
+                }
+
+            db.session.commit()
+
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            app.logger.exception(e)
+            for index, _ in alerts:
+                results[index] = _alerts_bulk_error(index, 'Unable to store the alert')
+            alerts = []
+
+    if alerts:
+        call_modules_hook_batch('on_postload_alert_create', data=[alert for _, alert in alerts])
+
+        track_activity(f"created {len(alerts)} alerts in bulk", ctx_less=True)
+
+        for index, _ in alerts:
+            socket_io.emit('new_alert', json.dumps({
+                'alert_id': results[index]['alert_id']
+            }), namespace='/alerts')
+
+    return [results[index] for index, _ in batch]
+
+
+def alerts_bulk_create(alerts_data: Iterable) -> list:
+    """
+    Create alerts in batches of ALERTS_BULK_BATCH_SIZE. Each batch is validated, inserted and committed at once,
+    and an invalid alert does not prevent the others from being created.
+
+    args:
+        alerts_data (Iterable): The alerts, as accepted by the single alert creation. The items may be read lazily
+                                from the request
+
+    returns:
+        list: One result per alert, in the input order, with the alert_id on success or the error message
+    """
+    batch_size = app.config.get('ALERTS_BULK_BATCH_SIZE')
+    schemas = _AlertsBulkSchemas()
+
+    user_clients = None
+    if not ac_current_user_has_permission(Permissions.server_administrator):
+        user_clients = set(get_user_clients_id(current_user.id))
+
+    results = []
+    batch = []
+    for index, alert_data in enumerate(alerts_data):
+        batch.append((index, alert_data))
+
+        if len(batch) >= batch_size:
+            results.extend(_alerts_bulk_create_batch(schemas, batch, user_clients))
+            batch = []
+
+    if batch:
+        results.extend(_alerts_bulk_create_batch(schemas, batch, user_clients))
+
+    return results
+
+
+def alerts_batch_merge(case: Cases, alerts: List[Alert], iocs_import_list: List[str], assets_import_list: List[str],
+                       note: str, import_as_event: bool, case_tags: str,
+                       progress_callback: Callable[[int], None] = None):
+    """
+    Merge alerts into an existing case. The access of the user to the case and to the alerts clients is checked by
+    the caller.
+
+    args:
+        case (Cases): The target case
+        alerts (list): The alerts to merge
+        iocs_import_list (list): The IOCs of the alerts to import in the case
+        assets_import_list (list): The assets of the alerts to import in the case
+        note (str): The note to add to the case description
+        import_as_event (bool): Whether to import the alerts as events
+        case_tags (str): The tags to add to the case
+        progress_callback (Callable): Called with the number of alerts merged after each alert
+    """
+    merged_status_id = AlertStatus.query.filter_by(status_name='Merged').first().status_id
+
+    for index, alert in enumerate(alerts, start=1):
+        alert.alert_status_id = merged_status_id
+        db.session.commit()
+
+        # Merge alert in the case
+        merge_alert_in_case(alert, case, iocs_list=iocs_import_list, assets_list=assets_import_list, note=None,
+                            import_as_event=import_as_event, case_tags=case_tags)
+
+        add_obj_history_entry(alert, f"Alert merged into existing case #{case.case_id}")
+
+        if progress_callback:
+            progress_callback(index)
+
+    call_modules_hook_batch('on_postload_alert_merge', data=alerts, caseid=case.case_id)
+
+    if note:
+        case.description += f"\n\n### Escalation note\n\n{note}\n\n" if case.description else f"\n\n{note}\n\n"
+        db.session.commit()
+
+    alert_ids = ','.join(str(alert.alert_id) for alert in alerts)
+    track_activity(f"batched merge alerts {alert_ids} into existing case #{case.case_id}", caseid=case.case_id)
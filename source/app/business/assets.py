@@ -25,7 +25,6 @@ from app.business.errors import BusinessProcessingError
 from app.business.errors import ObjectNotFoundError
 from app.business.cases import cases_exists
 from app.datamgmt.case.case_db import get_case_client_id
-from app.datamgmt.manage.manage_users_db import get_user_cases_fast
 from app.datamgmt.states import get_assets_state
 from app.datamgmt.states import update_assets_state
 from app.models.models import CaseAssets
@@ -118,15 +117,13 @@ def get_assets_case(case_identifier):
         else:
             cache_ioc_link[ioc.asset_id].append(ioc._asdict())
 
-    cases_access = get_user_cases_fast(current_user.id)
-
     for asset in assets:
         asset = asset._asdict()
 
         if len(assets) < 300:
             # Find similar assets from other cases with the same customer
             asset['link'] = list(get_similar_assets(
-                asset['asset_name'], asset['asset_type_id'], case_identifier, customer_id, cases_access))
+                asset['asset_name'], asset['asset_type_id'], case_identifier, customer_id, current_user.id))
         else:
             asset['link'] = []
 
@@ -33,10 +33,10 @@ from app.schema.marshables import CaseSchema
 from app.models.models import ReviewStatusList
 
 from app.business.errors import BusinessProcessingError
-from app.business.iocs import iocs_exports_to_json
 
 from app.iris_engine.module_handler.module_handler import call_modules_hook
 from app.iris_engine.utils.tracker import track_activity
+from app.iris_engine.access_control.utils import ac_recompute_effective_access
 from app.iris_engine.access_control.utils import ac_set_new_case_access
 
 from app.datamgmt.case.case_db import case_db_exists
@@ -56,11 +56,8 @@ from app.datamgmt.case.case_db import get_case
 from app.datamgmt.reporter.report_db import export_caseinfo_json
 from app.datamgmt.reporter.report_db import process_md_images_links_for_report
 from app.datamgmt.reporter.report_db import export_case_evidences_json
-from app.datamgmt.reporter.report_db import export_case_tm_json
-from app.datamgmt.reporter.report_db import export_case_assets_json
-from app.datamgmt.reporter.report_db import export_case_tasks_json
+from app.datamgmt.reporter.report_loader import ReportDataLoader
 from app.datamgmt.reporter.report_db import export_case_comments_json
-from app.datamgmt.reporter.report_db import export_case_notes_json
 
 
 def _load(request_data, **kwargs):
@@ -113,7 +110,7 @@ def cases_create(request_data):
     # TODO remove caseid doesn't seems to be useful for call_modules_hook => remove argument
     case = call_modules_hook('on_postload_case_create', case, None)
 
-    add_obj_history_entry(case, 'created')
+    add_obj_history_entry(case, 'created', commit=True)
     track_activity(f'new case "{case.name}" created', caseid=case.case_id, ctx_less=False)
 
     return case
@@ -132,6 +129,7 @@ def cases_delete(case_identifier):
             track_activity(f'tried to delete case {case_identifier}, but it doesn\'t exist',
                            caseid=case_identifier, ctx_less=True)
             raise BusinessProcessingError('Tried to delete a non-existing case')
+        db.session.commit()
         call_modules_hook('on_postload_case_delete', data=case_identifier, caseid=case_identifier)
         track_activity(f'case {case_identifier} deleted successfully', ctx_less=True)
     except Exception as e:
@@ -147,6 +145,7 @@ def cases_update(case_identifier, request_data):
     try:
 
         previous_case_state = case_i.state_id
+        previous_client_id = case_i.client_id
         case_previous_reviewer_id = case_i.reviewer_id
         closed_state_id = get_case_state_by_name('Closed').state_id
 
@@ -166,6 +165,10 @@ def cases_update(case_identifier, request_data):
 
         db.session.commit()
 
+        if previous_client_id != case.client_id:
+            # The users of the previous and new customers gain or lose their access to the case
+            ac_recompute_effective_access(case_ids=[case.case_id])
+
         if previous_case_state != case.state_id:
             if case.state_id == closed_state_id:
                 track_activity('case closed', caseid=case_identifier)
@@ -212,7 +215,7 @@ def cases_update(case_identifier, request_data):
 
         case = call_modules_hook('on_postload_case_update', data=case, caseid=case_identifier)
 
-        add_obj_history_entry(case_i, 'case info updated')
+        add_obj_history_entry(case_i, 'case info updated', commit=True)
         track_activity(f'case updated "{case.name}"', caseid=case_identifier)
 
         return case, 'Updated'
@@ -240,14 +243,16 @@ def cases_export_to_json(case_id):
 
     case['description'] = process_md_images_links_for_report(case['description'])
 
+    loader = ReportDataLoader(case_id)
+
     export['case'] = case
     export['evidences'] = export_case_evidences_json(case_id)
-    export['timeline'] = export_case_tm_json(case_id)
-    export['iocs'] = iocs_exports_to_json(case_id)
-    export['assets'] = export_case_assets_json(case_id)
-    export['tasks'] = export_case_tasks_json(case_id)
+    export['timeline'] = loader.timeline()
+    export['iocs'] = loader.iocs()
+    export['assets'] = loader.assets()
+    export['tasks'] = loader.tasks()
     export['comments'] = export_case_comments_json(case_id)
-    export['notes'] = export_case_notes_json(case_id)
+    export['notes'] = loader.notes()
     export['export_date'] = datetime.datetime.utcnow()
 
     return export
@@ -264,13 +269,15 @@ def cases_export_to_report_json(case_id):
 
     case['description'] = process_md_images_links_for_report(case['description'])
 
+    loader = ReportDataLoader(case_id)
+
     export['case'] = case
     export['evidences'] = export_case_evidences_json(case_id)
-    export['timeline'] = export_case_tm_json(case_id)
-    export['iocs'] = iocs_exports_to_json(case_id)
-    export['assets'] = export_case_assets_json(case_id)
-    export['tasks'] = export_case_tasks_json(case_id)
-    export['notes'] = export_case_notes_json(case_id)
+    export['timeline'] = loader.timeline()
+    export['iocs'] = loader.iocs()
+    export['assets'] = loader.assets()
+    export['tasks'] = loader.tasks()
+    export['notes'] = loader.notes()
     export['comments'] = export_case_comments_json(case_id)
     export['export_date'] = datetime.datetime.utcnow()
 
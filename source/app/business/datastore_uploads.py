@@ -0,0 +1,198 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+import datetime
+from flask_login import current_user
+from pathlib import Path
+
+from app import db
+from app.business.errors import BusinessProcessingError
+from app.business.errors import ObjectNotFoundError
+from app.business.errors import UploadOffsetError
+from app.datamgmt.datastore.datastore_blobs_db import datastore_attach_blob
+from app.datamgmt.datastore.datastore_blobs_db import datastore_blob_store_file
+from app.datamgmt.datastore.datastore_db import datastore_add_file_as_ioc
+from app.datamgmt.datastore.datastore_db import datastore_get_path_node
+from app.datamgmt.datastore.datastore_db import datastore_get_root
+from app.datamgmt.datastore.datastore_uploads_db import datastore_upload_create
+from app.datamgmt.datastore.datastore_uploads_db import datastore_upload_delete
+from app.datamgmt.datastore.datastore_uploads_db import datastore_upload_get
+from app.datamgmt.datastore.datastore_uploads_db import datastore_upload_restart
+from app.datamgmt.datastore.datastore_uploads_db import datastore_upload_sha256
+from app.datamgmt.datastore.datastore_uploads_db import datastore_upload_write
+from app.datamgmt.iris_engine.evidence_storage import EvidenceStorage
+from app.iris_engine.utils.tracker import track_activity
+from app.models.models import DataStoreFile
+from app.models.models import DataStoreUpload
+from app.util import add_obj_history_entry
+
+# Registers the periodic purge of the expired uploads
+from app.iris_engine.tasker import datastore_uploads  # noqa: F401
+
+
+def datastore_uploads_create(case_identifier, request_data: dict) -> DataStoreUpload:
+    """
+    Open a resumable upload of a file into a folder of the datastore of a case. The access to the case is checked by
+    the caller
+
+    args:
+        case_identifier (int): The case
+        request_data (dict): The file_original_name, file_size and the optional parent_id folder, defaulting to the
+            root of the datastore, file_description, file_tags, file_password, file_is_ioc and file_is_evidence
+
+    returns:
+        DataStoreUpload: The upload
+    """
+    parent_identifier = request_data.get('parent_id')
+    if parent_identifier is None:
+        dsp = datastore_get_root(case_identifier)
+    else:
+        dsp = datastore_get_path_node(parent_identifier, case_identifier)
+    if not dsp:
+        raise BusinessProcessingError('Invalid parent_id folder for this case')
+
+    file_original_name = request_data.get('file_original_name')
+    if not isinstance(file_original_name, str) or not file_original_name.strip():
+        raise BusinessProcessingError('A file_original_name is expected')
+
+    file_size = request_data.get('file_size')
+    if not isinstance(file_size, int) or isinstance(file_size, bool) or file_size < 0:
+        raise BusinessProcessingError('The file_size is expected as a positive integer')
+
+    upload = DataStoreUpload()
+    upload.upload_case_id = case_identifier
+    upload.upload_user_id = current_user.id
+    upload.upload_parent_id = dsp.path_id
+    upload.upload_size = file_size
+    upload.file_original_name = file_original_name.strip()
+    upload.file_description = request_data.get('file_description')
+    upload.file_tags = request_data.get('file_tags')
+    upload.file_password = request_data.get('file_password')
+    upload.file_is_ioc = bool(request_data.get('file_is_ioc'))
+    upload.file_is_evidence = bool(request_data.get('file_is_evidence'))
+
+    if upload.file_is_ioc and not upload.file_password:
+        upload.file_password = 'infected'
+
+    return datastore_upload_create(upload)
+
+
+def datastore_uploads_get(upload_uuid, for_update=False) -> DataStoreUpload:
+    """
+    Get an upload of the current user
+
+    args:
+        upload_uuid (UUID): The upload
+        for_update (bool): Lock the upload until the end of the transaction
+
+    returns:
+        DataStoreUpload: The upload
+    """
+    upload = datastore_upload_get(upload_uuid, for_update=for_update)
+    if upload is None or upload.upload_user_id != current_user.id:
+        raise ObjectNotFoundError()
+
+    return upload
+
+
+def datastore_uploads_write_chunk(upload: DataStoreUpload, offset, stream, length):
+    """
+    Write a chunk of an upload, which must start at the offset the upload reached
+
+    args:
+        upload (DataStoreUpload): The upload, locked
+        offset (int): The offset of the chunk
+        stream (BinaryIO): The chunk
+        length (int): The length of the chunk
+    """
+    if offset != upload.upload_offset:
+        raise UploadOffsetError(upload.upload_offset)
+
+    if length is None:
+        raise BusinessProcessingError('The Content-Length of the chunk is expected')
+
+    if offset + length > upload.upload_size:
+        raise BusinessProcessingError('The chunk goes beyond the size of the file')
+
+    datastore_upload_write(upload, stream, length)
+
+
+def datastore_uploads_commit(upload: DataStoreUpload, expected_sha256=None) -> DataStoreFile:
+    """
+    Store a complete upload in the datastore of its case, and register it as IOC or evidence if requested
+
+    args:
+        upload (DataStoreUpload): The upload, locked
+        expected_sha256 (str): The SHA256 computed by the client, checked against the data received
+
+    returns:
+        DataStoreFile: The datastore file
+    """
+    if upload.upload_offset != upload.upload_size:
+        raise BusinessProcessingError('The upload is not complete', data={'upload_offset': upload.upload_offset})
+
+    file_hash = datastore_upload_sha256(upload)
+    if expected_sha256 is not None and str(expected_sha256).upper() != file_hash:
+        raise BusinessProcessingError('The SHA256 of the data received does not match', data={'file_sha256': file_hash})
+
+    dsf = DataStoreFile()
+    dsf.file_original_name = upload.file_original_name
+    dsf.file_description = upload.file_description
+    dsf.file_tags = upload.file_tags
+    dsf.file_password = upload.file_password
+    dsf.file_is_ioc = upload.file_is_ioc
+    dsf.file_is_evidence = upload.file_is_evidence
+    dsf.file_parent_id = upload.upload_parent_id
+    dsf.file_case_id = upload.upload_case_id
+    dsf.file_date_added = datetime.datetime.now()
+    dsf.added_by_user_id = current_user.id
+    add_obj_history_entry(dsf, 'created')
+
+    try:
+        blob = datastore_blob_store_file(Path(upload.upload_local_name), file_hash, upload.upload_size,
+                                         password=upload.file_password or None)
+        datastore_attach_blob(dsf, blob)
+
+        db.session.add(dsf)
+        datastore_upload_delete(upload)
+
+    except Exception:
+        db.session.rollback()
+        # The partial file is kept when the blob cannot be stored, so the commit can be retried. It is gone when the
+        # failure happened once it was moved into the blob, the client then has to send it again
+        if not Path(upload.upload_local_name).is_file():
+            datastore_upload_restart(upload)
+        raise
+
+    if dsf.file_is_ioc:
+        datastore_add_file_as_ioc(dsf, dsf.file_case_id)
+
+    if dsf.file_is_evidence and not EvidenceStorage.is_evidence_registered(dsf.file_case_id, dsf.file_sha256):
+        EvidenceStorage.add_evidence(dsf.file_case_id, dsf.file_original_name,
+                                     f'Imported from datastore. {dsf.file_description or ""}', dsf.file_size,
+                                     dsf.file_sha256, dsf.file_date_added, current_user.id)
+
+    db.session.commit()
+
+    track_activity(f"File \"{dsf.file_original_name}\" uploaded to DS", caseid=dsf.file_case_id)
+
+    return dsf
+
+
+def datastore_uploads_abort(upload: DataStoreUpload):
+    datastore_upload_delete(upload)
@@ -44,3 +44,9 @@ class UnhandledBusinessError(BusinessProcessingError):
         self._data = data
         app.logger.exception(message)
         app.logger.exception(data)
+
+
+class UploadOffsetError(BusinessProcessingError):
+
+    def __init__(self, upload_offset):
+        super().__init__('The chunk does not start at the offset of the upload', data={'upload_offset': upload_offset})
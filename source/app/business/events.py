@@ -0,0 +1,302 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+import csv
+import os
+import uuid
+from datetime import datetime
+from flask_login import current_user
+from itertools import islice
+from marshmallow.exceptions import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from typing import Callable
+
+from app import app
+from app import db
+from app.business.errors import BusinessProcessingError
+from app.datamgmt.case.case_events_db import add_events_links
+from app.datamgmt.case.case_events_db import add_iocs_assets_links
+from app.datamgmt.case.case_events_db import get_case_assets_ids_by_name
+from app.datamgmt.case.case_events_db import get_case_iocs_ids_by_value
+from app.datamgmt.case.case_events_db import get_categories_ids_by_name
+from app.datamgmt.manage.manage_tags_db import add_db_tags
+from app.datamgmt.states import update_timeline_state
+from app.iris_engine.module_handler.module_handler import call_modules_hook_batch
+from app.iris_engine.utils.tracker import track_activity
+from app.models.cases import CasesEvent
+from app.schema.marshables import EventSchema
+from app.util import add_obj_history_entry
+
+EVENTS_CSV_FIELDS = [
+    "event_date",
+    "event_tz",
+    "event_title",
+    "event_category",
+    "event_content",
+    "event_raw",
+    "event_source",
+    "event_assets",
+    "event_iocs",
+    "event_tags"
+]
+
+_EVENTS_CSV_COPY_BUFFER_SIZE = 1024 * 1024
+
+
+class _EventsCsvImport:
+
+    def __init__(self, caseid: int, csv_options: dict):
+        self.caseid = caseid
+        self.event_schema = EventSchema(context={'bulk_import': True})
+
+        self.sync_iocs_assets = csv_options.get('event_sync_iocs_assets') or False
+        self.event_in_summary = csv_options.get('event_in_summary') or False
+        self.event_in_graph = csv_options.get('event_in_graph') if csv_options.get('event_in_graph') else True
+        self.event_source = csv_options.get('event_source') or ''
+
+        # Resolved once for the whole file rather than with one query per row
+        self.categories = get_categories_ids_by_name()
+        self.default_category_id = self.categories.get('Unspecified')
+        self.assets = get_case_assets_ids_by_name(caseid)
+        self.iocs = get_case_iocs_ids_by_value(caseid)
+
+        self.events_ids = []
+        self.tags = set()
+        self.iocs_assets_links = set()
+
+    def prepare_row(self, row: dict, line: int) -> dict:
+        if not row.get('event_title'):
+            raise BusinessProcessingError('Data error',
+                                          data={"Error": f"Event Title can not be empty.\nrow number: {line}"})
+
+        assets = []
+        for asset_name in (row.get('event_assets') or '').split(';'):
+            if asset_name == '':
+                continue
+            if asset_name not in self.assets:
+                raise BusinessProcessingError('Data error', data={
+                    "Error": f"Asset not recognized : {asset_name}.\nrow number: {line}"})
+            assets.append(self.assets[asset_name])
+        row['event_assets'] = assets
+
+        iocs = []
+        for ioc_value in (row.get('event_iocs') or '').split('|'):
+            if ioc_value == '':
+                continue
+            if ioc_value not in self.iocs:
+                raise BusinessProcessingError('Data error', data={
+                    "Error": f"IoC not recognized : {ioc_value}.\nrow number: {line}"})
+            iocs.append(self.iocs[ioc_value])
+        row['event_iocs'] = iocs
+
+        event_category_name = row.pop('event_category', None)
+        if event_category_name:
+            if event_category_name not in self.categories:
+                raise BusinessProcessingError('Data error', data={
+                    "Error": f"event_category not recognized : {event_category_name}.\nrow number: {line}"})
+            row['event_category_id'] = self.categories[event_category_name]
+        else:
+            row['event_category_id'] = self.default_category_id
+
+        if row.get('event_tags'):
+            row['event_tags'] = ','.join(row['event_tags'].split('|'))
+
+        row['event_in_summary'] = self.event_in_summary
+        row['event_in_graph'] = self.event_in_graph
+        row['event_source'] = self.event_source
+
+        return row
+
+    def save_chunk(self, rows: list, first_line: int):
+        rows = [self.prepare_row(row, line) for line, row in enumerate(rows, start=first_line)]
+        rows = call_modules_hook_batch('on_preload_event_create', data=rows, caseid=self.caseid)
+
+        events = []
+        for line, row in enumerate(rows, start=first_line):
+            if row is None:
+                continue
+
+            try:
+                event = self.event_schema.load(row)
+                event.event_date, event.event_date_wtz = self.event_schema.validate_date(row.get('event_date'),
+                                                                                         row.get('event_tz'))
+            except ValidationError as e:
+                raise BusinessProcessingError('Data error', data={"Error": f"{e.normalized_messages()}\n"
+                                                                           f"row number: {line}"})
+
+            event.case_id = self.caseid
+            event.event_added = datetime.utcnow()
+            event.user_id = current_user.id
+            add_obj_history_entry(event, 'created')
+
+            events.append((event, row))
+
+        # The events are inserted with multi-rows statements, then the links with one statement per table
+        db.session.add_all([event for event, _ in events])
+        db.session.flush()
+
+        add_events_links(self.caseid, [(event.event_id, row.get('event_category_id'), row.get('event_assets'),
+                                        row.get('event_iocs')) for event, row in events])
+
+        for event, row in events:
+            self.events_ids.append(event.event_id)
+
+            if event.event_tags:
+                self.tags.update(tag.strip() for tag in event.event_tags.split(','))
+
+            if self.sync_iocs_assets:
+                self.iocs_assets_links.update((asset_id, ioc_id) for asset_id in row.get('event_assets')
+                                              for ioc_id in row.get('event_iocs'))
+
+    def finalize(self):
+        add_db_tags(self.tags)
+        add_iocs_assets_links(self.iocs_assets_links)
+        update_timeline_state(caseid=self.caseid)
+
+        db.session.commit()
+
+    def call_postload_hooks(self, chunk_size: int):
+        for index in range(0, len(self.events_ids), chunk_size):
+            # Reloads the expired events of the chunk with a single query
+            events = CasesEvent.query.filter(
+                CasesEvent.event_id.in_(self.events_ids[index:index + chunk_size])
+            ).order_by(
+                CasesEvent.event_id
+            ).all()
+
+            call_modules_hook_batch('on_postload_event_create', data=events, caseid=self.caseid)
+
+
+def _events_csv_imports_path():
+    return os.path.join(app.config.get('UPLOADED_PATH'), 'timeline_imports')
+
+
+def events_csv_store(file_storage) -> tuple:
+    """
+    Store an uploaded CSV file of events until it is imported, and check its header
+
+    args:
+        file_storage (FileStorage): The uploaded file
+
+    returns:
+        tuple: The path of the stored file and its number of events lines
+    """
+    imports_path = _events_csv_imports_path()
+    os.makedirs(imports_path, exist_ok=True)
+    csv_path = os.path.join(imports_path, f'{uuid.uuid4()}.csv')
+
+    lines_count = 0
+    last_byte = b'\n'
+    with open(csv_path, 'wb') as fout:
+        while True:
+            buffer = file_storage.stream.read(_EVENTS_CSV_COPY_BUFFER_SIZE)
+            if not buffer:
+                break
+            fout.write(buffer)
+            lines_count += buffer.count(b'\n')
+            last_byte = buffer[-1:]
+
+    if last_byte != b'\n':
+        lines_count += 1
+
+    try:
+        with open(csv_path, newline='', encoding='utf-8-sig') as fin:
+            csv_fields = next(csv.reader(fin, delimiter=','), [])
+    except UnicodeDecodeError:
+        os.remove(csv_path)
+        raise BusinessProcessingError('Data error', data={"Error": "The file is not UTF-8 encoded"})
+
+    missing_fields = [field for field in EVENTS_CSV_FIELDS if field not in csv_fields]
+    if missing_fields:
+        os.remove(csv_path)
+        raise BusinessProcessingError(f"Bad SCV Fields Mapping. Fields missing: [{','.join(missing_fields)}]", data={
+            "error_code": "BAD_FIELDS_MAPPING",
+            "expected": ','.join(EVENTS_CSV_FIELDS),
+            "found": ','.join(csv_fields),
+            "missing": ','.join(missing_fields)
+        })
+
+    return csv_path, max(lines_count - 1, 0)
+
+
+def events_csv_discard(csv_path: str):
+    """
+    Remove a CSV file stored by events_csv_store which will not be imported
+
+    args:
+        csv_path (str): The path of the stored file
+    """
+    if csv_path and os.path.exists(csv_path):
+        os.remove(csv_path)
+
+
+def events_import_csv(caseid: int, csv_path: str, csv_options: dict,
+                      progress_callback: Callable[[int], None] = None) -> int:
+    """
+    Import the events of a CSV file stored by events_csv_store. The file is read and saved in chunks of
+    TIMELINE_IMPORT_CHUNK_SIZE lines, within a single transaction, so either all the events are imported or none.
+    The file is removed once imported.
+
+    args:
+        caseid (int): The case ID
+        csv_path (str): The path of the stored file
+        csv_options (dict): The options of the import, as accepted by the CSV upload endpoint
+        progress_callback (Callable): Called with the number of lines processed after each chunk
+
+    returns:
+        int: The number of events imported
+    """
+    chunk_size = app.config.get('TIMELINE_IMPORT_CHUNK_SIZE')
+
+    try:
+        events_import = _EventsCsvImport(caseid, csv_options or {})
+
+        with open(csv_path, newline='', encoding='utf-8-sig') as fin:
+            reader = csv.DictReader(fin, delimiter=',')
+
+            line = 1
+            while True:
+                rows = list(islice(reader, chunk_size))
+                if not rows:
+                    break
+
+                events_import.save_chunk(rows, line)
+                line += len(rows)
+
+                if progress_callback:
+                    progress_callback(line - 1)
+
+        events_import.finalize()
+
+    except BusinessProcessingError:
+        db.session.rollback()
+        raise
+
+    except (SQLAlchemyError, UnicodeDecodeError, csv.Error) as e:
+        db.session.rollback()
+        app.logger.exception(e)
+        raise BusinessProcessingError('Data error', data={"Error": f"{e}"})
+
+    finally:
+        events_csv_discard(csv_path)
+
+    events_import.call_postload_hooks(chunk_size)
+
+    track_activity(f"imported {len(events_import.events_ids)} events from a CSV file", caseid=caseid)
+
+    return len(events_import.events_ids)
@@ -122,6 +122,7 @@ def iocs_delete(ioc: Ioc):
     call_modules_hook('on_preload_ioc_delete', data=ioc.ioc_id)
 
     delete_ioc(ioc)
+    db.session.commit()
 
     call_modules_hook('on_postload_ioc_delete', data=ioc.ioc_id, caseid=ioc.case_id)
 
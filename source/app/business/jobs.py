@@ -0,0 +1,316 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+import json
+import os
+import shutil
+import tempfile
+from flask_login import current_user
+
+from app import db
+from app.business.alerts import alerts_batch_merge
+from app.business.cases import cases_delete
+from app.business.errors import BusinessProcessingError
+from app.business.errors import ObjectNotFoundError
+from app.business.events import events_csv_discard
+from app.business.events import events_import_csv
+from app.business.reports import REPORT_TYPE_ACTIVITIES
+from app.business.reports import REPORT_TYPE_INVESTIGATION
+from app.business.reports import reports_generate
+from app.datamgmt.alerts.alerts_db import get_alert_by_id
+from app.datamgmt.case.case_db import get_case
+from app.datamgmt.manage.manage_access_control_db import check_ua_case_client
+from app.datamgmt.manage.manage_access_control_db import user_has_client_access
+from app.datamgmt.reporter.report_db import export_case_json_extended
+from app.iris_engine.access_control.utils import ac_current_user_has_permission
+from app.iris_engine.access_control.utils import ac_fast_check_current_user_has_case_access
+from app.iris_engine.tasker.jobs import JobCancelled
+from app.iris_engine.tasker.jobs import JobContext
+from app.iris_engine.tasker.jobs import job_cancel
+from app.iris_engine.tasker.jobs import job_submit
+from app.iris_engine.tasker.jobs import register_job_type
+from app.iris_engine.utils.tracker import track_activity
+from app.models.authorization import CaseAccessLevel
+from app.models.authorization import Permissions
+from app.models.models import IrisJob
+
+JOB_TYPE_TIMELINE_CSV_IMPORT = 'timeline_csv_import'
+JOB_TYPE_CASE_EXPORT = 'case_export'
+JOB_TYPE_CASE_REPORT = 'case_report'
+JOB_TYPE_CASE_DELETE = 'case_delete'
+JOB_TYPE_ALERTS_MERGE = 'alerts_merge'
+
+_REPORT_TYPES = {
+    'activities': REPORT_TYPE_ACTIVITIES,
+    'investigation': REPORT_TYPE_INVESTIGATION
+}
+
+
+def _job_timeline_csv_import(context: JobContext) -> dict:
+    def _progress(processed_lines):
+        context.check_cancelled()
+        context.set_progress(processed_lines)
+
+    parameters = context.parameters
+    events_count = events_import_csv(context.case_id, parameters.get('csv_path'), parameters.get('csv_options'),
+                                     progress_callback=_progress)
+
+    return {
+        'message': f'{events_count} events added (CSV File)',
+        'events_count': events_count
+    }
+
+
+def _job_timeline_csv_import_cleanup(parameters: dict):
+    events_csv_discard(parameters.get('csv_path'))
+
+
+def _job_case_export(context: JobContext) -> dict:
+    context.set_progress(0, total=1, message='Exporting the case')
+
+    export = export_case_json_extended(context.case_id)
+    if export.get('errors'):
+        raise BusinessProcessingError('Unable to export the case', data=export.get('errors'))
+
+    context.check_cancelled()
+
+    fd, export_path = tempfile.mkstemp(suffix='.json')
+    with os.fdopen(fd, 'w') as fout:
+        json.dump(export, fout, default=str)
+
+    context.store_result_file(export_path, f'case_{context.case_id}_export.json')
+    context.set_progress(1)
+
+    track_activity("exported the case", caseid=context.case_id)
+
+    return {'message': 'Case exported'}
+
+
+def _job_case_report(context: JobContext) -> dict:
+    parameters = context.parameters
+    context.set_progress(0, total=1, message='Generating the report')
+
+    try:
+        fpath, tmp_dir = reports_generate(parameters.get('report_id'), context.case_id,
+                                          _REPORT_TYPES[parameters.get('report_type')],
+                                          safe_mode=parameters.get('safe_mode', False))
+    except ObjectNotFoundError:
+        raise BusinessProcessingError('Unknown report')
+
+    try:
+        context.store_result_file(fpath)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    context.set_progress(1)
+
+    return {'message': 'Report generated'}
+
+
+def _job_case_delete(context: JobContext) -> dict:
+    context.set_progress(0, total=1, message='Deleting the case')
+    cases_delete(context.case_id)
+    context.set_progress(1)
+
+    return {'message': 'Case successfully deleted'}
+
+
+def _job_alerts_merge(context: JobContext) -> dict:
+    parameters = context.parameters
+
+    case = get_case(context.case_id)
+    if not case:
+        raise BusinessProcessingError('Target case not found')
+
+    alerts = [alert for alert in (get_alert_by_id(alert_id) for alert_id in parameters.get('alert_ids')) if alert]
+
+    # Each alert is committed once merged, so a cancelled job reports the alerts it already merged
+    def _progress(merged_alerts):
+        try:
+            context.check_cancelled()
+        except JobCancelled:
+            raise JobCancelled(message=f'Cancelled after merging {merged_alerts} of {len(alerts)} alerts',
+                               result={'merged_alert_ids': [alert.alert_id for alert in alerts[:merged_alerts]]})
+        context.set_progress(merged_alerts)
+
+    context.set_progress(0, total=len(alerts))
+    alerts_batch_merge(case, alerts, iocs_import_list=parameters.get('iocs_import_list'),
+                       assets_import_list=parameters.get('assets_import_list'), note=parameters.get('note'),
+                       import_as_event=parameters.get('import_as_event'), case_tags=parameters.get('case_tags'),
+                       progress_callback=_progress)
+
+    return {'message': f'{len(alerts)} alerts merged'}
+
+
+register_job_type(JOB_TYPE_TIMELINE_CSV_IMPORT, _job_timeline_csv_import, cleanup=_job_timeline_csv_import_cleanup)
+register_job_type(JOB_TYPE_CASE_EXPORT, _job_case_export)
+register_job_type(JOB_TYPE_CASE_REPORT, _job_case_report)
+register_job_type(JOB_TYPE_CASE_DELETE, _job_case_delete)
+register_job_type(JOB_TYPE_ALERTS_MERGE, _job_alerts_merge)
+
+
+def _check_case_access(case_identifier, access_levels):
+    if case_identifier is None:
+        raise BusinessProcessingError('A case_id is expected for this job type')
+
+    if not get_case(case_identifier):
+        raise ObjectNotFoundError()
+
+    return bool(ac_fast_check_current_user_has_case_access(case_identifier, access_levels))
+
+
+def _check_alerts_merge(case_identifier, parameters) -> bool:
+    if not ac_current_user_has_permission(Permissions.alerts_write):
+        return False
+
+    if not _check_case_access(case_identifier, [CaseAccessLevel.full_access]):
+        return False
+
+    if not check_ua_case_client(current_user.id, case_identifier):
+        return False
+
+    alert_ids = parameters.get('alert_ids')
+    if not alert_ids or not isinstance(alert_ids, list) or not all(isinstance(i, int) for i in alert_ids):
+        raise BusinessProcessingError('A list of alert_ids is expected')
+
+    for alert_id in alert_ids:
+        alert = get_alert_by_id(alert_id)
+        if alert and not user_has_client_access(current_user.id, alert.alert_customer_id):
+            return False
+
+    return True
+
+
+def _check_case_report(case_identifier, parameters) -> bool:
+    if not isinstance(parameters.get('report_id'), int):
+        raise BusinessProcessingError('A report_id is expected')
+
+    if parameters.get('report_type') not in _REPORT_TYPES:
+        raise BusinessProcessingError(f'The report_type is expected in {", ".join(_REPORT_TYPES)}')
+
+    return _check_case_access(case_identifier, [CaseAccessLevel.read_only, CaseAccessLevel.full_access])
+
+
+def _check_case_delete(case_identifier, _) -> bool:
+    if not ac_current_user_has_permission(Permissions.standard_user):
+        return False
+
+    if not _check_case_access(case_identifier, [CaseAccessLevel.full_access]):
+        return False
+
+    if case_identifier == 1:
+        raise BusinessProcessingError('Cannot delete a primary case to keep consistency')
+
+    return True
+
+
+def _check_case_export(case_identifier, _) -> bool:
+    return _check_case_access(case_identifier, [CaseAccessLevel.read_only, CaseAccessLevel.full_access])
+
+
+# Jobs which can be submitted through the jobs endpoint. The CSV imports are submitted along with their file
+_SUBMITTABLE_JOB_TYPES = {
+    JOB_TYPE_CASE_EXPORT: _check_case_export,
+    JOB_TYPE_CASE_REPORT: _check_case_report,
+    JOB_TYPE_CASE_DELETE: _check_case_delete,
+    JOB_TYPE_ALERTS_MERGE: _check_alerts_merge
+}
+
+
+def jobs_check_submit_access(job_type, case_identifier, parameters) -> bool:
+    """
+    Check the current user may submit a job, and validate its parameters
+
+    args:
+        job_type (str): The type of the job
+        case_identifier (int): The case the job applies to
+        parameters (dict): The parameters of the job
+
+    returns:
+        bool: Whether the current user may submit the job
+    """
+    check = _SUBMITTABLE_JOB_TYPES.get(job_type)
+    if check is None:
+        raise BusinessProcessingError(f'Unknown job type, expecting one of {", ".join(_SUBMITTABLE_JOB_TYPES)}')
+
+    if not isinstance(parameters, dict):
+        raise BusinessProcessingError('The parameters are expected as a JSON object')
+
+    return check(case_identifier, parameters)
+
+
+def jobs_submit(job_type, case_identifier, parameters, progress_total=None) -> IrisJob:
+    """
+    Queue a job on behalf of the current user. The access is checked by the caller
+
+    args:
+        job_type (str): The type of the job
+        case_identifier (int): The case the job applies to
+        parameters (dict): The parameters of the job
+        progress_total (int): The number of items to process, if known beforehand
+
+    returns:
+        IrisJob: The job
+    """
+    job = job_submit(job_type, current_user.id, case_id=case_identifier, parameters=parameters,
+                     progress_total=progress_total)
+
+    track_activity(f"submitted job #{job.id} ({job_type})", caseid=case_identifier, ctx_less=case_identifier is None)
+
+    return job
+
+
+def jobs_get(identifier) -> IrisJob:
+    """
+    Get a job of the current user. Server administrators can get the jobs of all users
+
+    args:
+        identifier (int): The job ID
+
+    returns:
+        IrisJob: The job
+    """
+    job = db.session.get(IrisJob, identifier)
+    if job is None:
+        raise ObjectNotFoundError()
+
+    if job.user_id != current_user.id and not ac_current_user_has_permission(Permissions.server_administrator):
+        raise ObjectNotFoundError()
+
+    return job
+
+
+def jobs_cancel(job: IrisJob):
+    job_cancel(job)
+    track_activity(f"cancelled job #{job.id} ({job.job_type})", caseid=job.case_id, ctx_less=job.case_id is None)
+
+
+def jobs_get_result_file(job: IrisJob) -> tuple:
+    """
+    Get the file produced by a job
+
+    args:
+        job (IrisJob): The job
+
+    returns:
+        tuple: The path of the file and its download name
+    """
+    if not job.result_file_path or not os.path.isfile(job.result_file_path):
+        raise BusinessProcessingError('The job has no result file, or it expired')
+
+    return job.result_file_path, job.result_file_name
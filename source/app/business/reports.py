@@ -0,0 +1,106 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+import base64
+import os
+import shutil
+import tempfile
+
+from app.business.errors import BusinessProcessingError
+from app.business.errors import ObjectNotFoundError
+from app.datamgmt.case.case_db import get_case
+from app.iris_engine.module_handler.module_handler import call_modules_hook
+from app.iris_engine.reporter.reporter import IrisMakeDocReport
+from app.iris_engine.reporter.reporter import IrisMakeMdReport
+from app.iris_engine.utils.tracker import track_activity
+from app.models.models import CaseTemplateReport
+
+REPORT_TYPE_ACTIVITIES = 'Activities'
+REPORT_TYPE_INVESTIGATION = 'Investigation'
+
+
+def _reports_call_postload_hook(report_id, caseid, doc_type, fpath):
+    if doc_type == REPORT_TYPE_ACTIVITIES:
+        call_modules_hook('on_postload_activities_report_create', data=report_id, caseid=caseid)
+        return
+
+    with open(fpath, 'rb') as rfile:
+        encoded_file = base64.b64encode(rfile.read()).decode('utf-8')
+
+    res = get_case(caseid)
+
+    _data = {
+        'report_id': report_id,
+        'file_path': fpath,
+        'case_id': res.case_id,
+        'user_name': res.user.name,
+        'file': encoded_file
+    }
+
+    call_modules_hook('on_postload_report_create', data=_data, caseid=caseid)
+
+
+def reports_generate(report_id, caseid, doc_type, safe_mode=False) -> tuple:
+    """
+    Generate a report of a case from a template
+
+    args:
+        report_id (int): The report template ID
+        caseid (int): The case ID
+        doc_type (str): REPORT_TYPE_ACTIVITIES or REPORT_TYPE_INVESTIGATION
+        safe_mode (bool): Whether the template is rendered in safe mode
+
+    returns:
+        tuple: The path of the report and the temporary directory holding it, to remove once the report is sent
+    """
+    if doc_type == REPORT_TYPE_ACTIVITIES:
+        call_modules_hook('on_preload_activities_report_create', data=report_id, caseid=caseid)
+    else:
+        call_modules_hook('on_preload_report_create', data=report_id, caseid=caseid)
+
+    report = CaseTemplateReport.query.filter(CaseTemplateReport.id == report_id).first() if report_id else None
+    if not report:
+        raise ObjectNotFoundError()
+
+    tmp_dir = tempfile.mkdtemp()
+
+    # Depending on the template format, the generation process is different
+    _, report_format = os.path.splitext(report.internal_reference)
+
+    if report_format == ".docx":
+        mreport = IrisMakeDocReport(tmp_dir, report_id, caseid, safe_mode)
+        fpath, logs = mreport.generate_doc_report(doc_type=doc_type)
+
+    elif report_format in (".md", ".html"):
+        mreport = IrisMakeMdReport(tmp_dir, report_id, caseid, safe_mode)
+        fpath, logs = mreport.generate_md_report(doc_type=doc_type)
+
+    else:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise BusinessProcessingError("Report error", "Unknown report format.")
+
+    if fpath is None:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        track_activity("failed to generate the report")
+        raise BusinessProcessingError("Failed to generate the report", data=logs)
+
+    _reports_call_postload_hook(report_id, caseid, doc_type, fpath)
+
+    track_activity("generated a report")
+
+    return fpath, tmp_dir
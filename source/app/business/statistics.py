@@ -0,0 +1,71 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+import datetime
+from flask_login import current_user
+
+from app.business.errors import BusinessProcessingError
+from app.datamgmt.dashboard.statistics_db import get_daily_statistics
+from app.datamgmt.manage.manage_access_control_db import get_user_clients_id
+from app.iris_engine.tasker import statistics  # noqa: F401
+
+STATISTICS_OBJECT_TYPES = ['case', 'alert', 'task']
+
+_DEFAULT_STATISTICS_DAYS = 30
+
+
+def _parse_day(value, name):
+    try:
+        return datetime.date.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise BusinessProcessingError(f'The {name} is expected as YYYY-MM-DD')
+
+
+def statistics_get_daily(object_type, start_date=None, end_date=None, client_id=None) -> list:
+    """
+    Get the daily statistics of a type of objects, for the customers the current user has access to
+
+    args:
+        object_type (str): case, alert or task
+        start_date (str): First day, as YYYY-MM-DD. Defaults to 30 days before the end date
+        end_date (str): Last day, as YYYY-MM-DD. Defaults to today
+        client_id (int): Restrict the statistics to a customer
+
+    returns:
+        list: The number of objects created per day, per customer and current status
+    """
+    if object_type not in STATISTICS_OBJECT_TYPES:
+        raise BusinessProcessingError(f'The object_type is expected in {", ".join(STATISTICS_OBJECT_TYPES)}')
+
+    end_day = _parse_day(end_date, 'end_date') if end_date else datetime.date.today()
+    start_day = _parse_day(start_date, 'start_date') if start_date else end_day - datetime.timedelta(
+        days=_DEFAULT_STATISTICS_DAYS)
+    if start_day > end_day:
+        raise BusinessProcessingError('The start_date is expected before the end_date')
+
+    client_ids = get_user_clients_id(current_user.id)
+    if client_id is not None:
+        client_ids = [client_id] if client_id in client_ids else []
+
+    return [{
+        'day': row.stat_day.isoformat(),
+        'client_id': row.client_id,
+        'status_id': row.status_id,
+        'count': row.object_count
+    } for row in get_daily_statistics(object_type, start_day, end_day, client_ids)]
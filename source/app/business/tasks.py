@@ -51,6 +51,7 @@ def tasks_delete(task: CaseTasks):
 
     delete_task(task.id)
     update_tasks_state(caseid=task.task_case_id)
+    db.session.commit()
     call_modules_hook('on_postload_task_delete', data=task.id, caseid=task.task_case_id)
     track_activity(f'deleted task "{task.task_title}"')
 
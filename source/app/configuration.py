@@ -276,6 +276,66 @@ class Config:
     MODULES_INTERFACE_MIN_VERSION = '1.1'
     MODULES_INTERFACE_MAX_VERSION = '1.2.0'
 
+    # Maximum delay, in seconds, for a process to see the modules hooks changes made by another process
+    MODULES_HOOKS_REGISTRY_REFRESH = int(config.load('MODULES', 'HOOKS_REGISTRY_REFRESH', fallback=5))
+    # Maximum delay, in seconds, for a process to drop the module instances built with an outdated configuration
+    MODULES_INSTANCES_POOL_REFRESH = int(config.load('MODULES', 'INSTANCES_POOL_REFRESH', fallback=5))
+    # Maximum number of objects passed to a module in one hook call, or one Celery task, by batched operations
+    MODULES_HOOKS_BATCH_SIZE = int(config.load('MODULES', 'HOOKS_BATCH_SIZE', fallback=500))
+    # Hooks which asynchronous tasks receive primary keys instead of pickled objects. 'all' selects every hook
+    MODULES_HOOKS_COMPACT_PAYLOAD = [hook.strip() for hook in
+                                     config.load('MODULES', 'HOOKS_COMPACT_PAYLOAD', fallback='').split(',')
+                                     if hook.strip()]
+
+    # Maximum time, in seconds, the related alerts graph of an alert is served from the cache. The graph is rebuilt
+    # earlier when an alert sharing one of its assets or IOCs is added or deleted
+    ALERTS_SIMILARITIES_CACHE_TIMEOUT = int(config.load('ALERTS', 'SIMILARITIES_CACHE_TIMEOUT', fallback=300))
+    # Maximum number of similar alerts linked to a new alert. 0 disables the registration of the similarities
+    ALERTS_SIMILARITY_MAX_FANOUT = int(config.load('ALERTS', 'SIMILARITY_MAX_FANOUT', fallback=100))
+    # Number of alerts validated, inserted and committed together by the bulk creation endpoint
+    ALERTS_BULK_BATCH_SIZE = int(config.load('ALERTS', 'BULK_BATCH_SIZE', fallback=500))
+
+    # Maximum time, in seconds, a case access decision is reused by a process. The changes made by the process itself
+    # are seen at once, this delay bounds how long the changes made by other processes take to apply. 0 disables it
+    ACCESS_CONTROL_CACHE_TTL = int(config.load('ACCESS_CONTROL', 'CACHE_TTL', fallback=5))
+    # Number of users which effective access are recomputed and committed together
+    ACCESS_CONTROL_RECOMPUTE_BATCH_SIZE = int(config.load('ACCESS_CONTROL', 'RECOMPUTE_BATCH_SIZE', fallback=50))
+
+    # Number of lines read and inserted together by the streaming CSV timeline import
+    TIMELINE_IMPORT_CHUNK_SIZE = int(config.load('TIMELINE', 'IMPORT_CHUNK_SIZE', fallback=1000))
+
+    # Number of hours the files produced by the jobs, such as exports and reports, are kept for download
+    JOBS_RESULTS_RETENTION = int(config.load('JOBS', 'RESULTS_RETENTION', fallback=24))
+
+    # Number of hours after which a running job which did not report any progress is considered as stopped
+    JOBS_STALE_TIMEOUT = int(config.load('JOBS', 'STALE_TIMEOUT', fallback=6))
+
+    # Number of hours an unfinished datastore upload is kept without receiving any chunk
+    DATASTORE_UPLOADS_RETENTION = int(config.load('DATASTORE', 'UPLOADS_RETENTION', fallback=48))
+
+    # Maximum depth of the GraphQL queries, and maximum number of fields they resolve, counting the fields under a
+    # connection once per element of the page. 0 disables the limit
+    GRAPHQL_MAX_DEPTH = int(config.load('GRAPHQL', 'MAX_DEPTH', fallback=10))
+    GRAPHQL_MAX_COST = int(config.load('GRAPHQL', 'MAX_COST', fallback=200000))
+
+    # Maximum number of elements of a page of a GraphQL connection, also used when the query gives no page size
+    GRAPHQL_MAX_PAGE_SIZE = int(config.load('GRAPHQL', 'MAX_PAGE_SIZE', fallback=100))
+
+    # Number of parsed and validated GraphQL documents kept by each worker, and number of seconds the responses to the
+    # GraphQL queries are cached for each user. 0 disables the responses cache
+    GRAPHQL_DOCUMENTS_CACHE_SIZE = int(config.load('GRAPHQL', 'DOCUMENTS_CACHE_SIZE', fallback=500))
+    GRAPHQL_RESPONSES_CACHE_TIMEOUT = int(config.load('GRAPHQL', 'RESPONSES_CACHE_TIMEOUT', fallback=0))
+
+    # Number of pending user activities, and number of seconds, after which the activities tracked outside of a
+    # request are written. Within a request, they are written at its end, or once the buffer is full
+    ACTIVITIES_BUFFER_SIZE = int(config.load('ACTIVITIES', 'BUFFER_SIZE', fallback=500))
+    ACTIVITIES_FLUSH_INTERVAL = int(config.load('ACTIVITIES', 'FLUSH_INTERVAL', fallback=5))
+
+    # Number of months of user activities kept besides the current one, 0 keeps them all, and whether the expired
+    # months are archived as standalone tables or dropped
+    ACTIVITIES_RETENTION = int(config.load('ACTIVITIES', 'RETENTION', fallback=0))
+    ACTIVITIES_RETENTION_POLICY = config.load('ACTIVITIES', 'RETENTION_POLICY', fallback='archive')
+
     if os.environ.get('IRIS_WORKER') is None:
         CSRF_ENABLED = True
 
@@ -16,13 +16,22 @@
 #  along with this program; if not, write to the Free Software Foundation,
 #  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
+import re
+from datetime import date
 from sqlalchemy import and_
 from sqlalchemy import desc
+from sqlalchemy import text
 
+from app import db
 from app.models.cases import Cases
 from app.models.authorization import User
 from app.models.models import UserActivity
 
+# Maximum number of activities of the unpaginated lists
+_ACTIVITIES_LIST_LIMIT = 10000
+
+_ACTIVITIES_PARTITION_NAME = re.compile(r'^user_activity_(\d{4})(\d{2})$')
+
 
 def get_auto_activities(caseid):
     """
@@ -81,8 +90,9 @@ def get_manual_activities(caseid):
     return manual_activities
 
 
-def get_users_activities():
-    user_activities = UserActivity.query.with_entities(
+def _get_activities_query():
+    return UserActivity.query.with_entities(
+        UserActivity.id,
         Cases.name.label("case_name"),
         User.name.label("user_name"),
         UserActivity.user_id,
@@ -91,42 +101,95 @@ def get_users_activities():
         UserActivity.activity_desc,
         UserActivity.user_input,
         UserActivity.is_from_api
-    ).filter(
-        UserActivity.display_in_ui == True
     ).outerjoin(
         UserActivity.user
     ).outerjoin(
         UserActivity.case
-    ).order_by(desc(UserActivity.activity_date)).limit(10000).all()
+    )
 
-    return user_activities
 
+def get_users_activities(limit=_ACTIVITIES_LIST_LIMIT):
+    return _get_activities_query().filter(
+        UserActivity.display_in_ui == True
+    ).order_by(
+        desc(UserActivity.activity_date), desc(UserActivity.id)
+    ).limit(limit).all()
 
-def get_all_users_activities():
-    user_activities = UserActivity.query.with_entities(
-        Cases.name.label("case_name"),
-        User.name.label("user_name"),
-        UserActivity.user_id,
-        UserActivity.case_id,
-        UserActivity.activity_date,
-        UserActivity.activity_desc,
-        UserActivity.user_input,
-        UserActivity.is_from_api
-    ).join(
-        UserActivity.case
-    ).join(
-        UserActivity.user
-    ).order_by(desc(UserActivity.activity_date)).limit(10000).all()
 
-    user_activities += UserActivity.query.with_entities(
-        UserActivity.case_id.label("case_name"),
-        UserActivity.user_id.label("user_name"),
-        UserActivity.activity_date,
-        UserActivity.activity_desc,
-        UserActivity.user_input,
-        UserActivity.is_from_api
-    ).filter(and_(
-        UserActivity.case_id == None
-    )).order_by(desc(UserActivity.activity_date)).limit(10000).all()
+def get_all_users_activities(limit=_ACTIVITIES_LIST_LIMIT):
+    return _get_activities_query().order_by(
+        desc(UserActivity.activity_date), desc(UserActivity.id)
+    ).limit(limit).all()
+
+
+def get_filtered_activities_query(case_id=None, user_id=None, start_date=None, end_date=None, include_hidden=False):
+    """
+    Build the query of the activities matching the filters, to paginate on
+    [UserActivity.activity_date, UserActivity.id]. A date range restricts the query to the partitions of its months
+
+    args:
+        case_id (int): Only the activities of this case
+        user_id (int): Only the activities of this user
+        start_date (datetime): Only the activities since this date
+        end_date (datetime): Only the activities before this date
+        include_hidden (bool): Whether the activities not displayed in the UI are included
+
+    returns:
+        The query of the activities
+    """
+    conditions = []
+    if case_id is not None:
+        conditions.append(UserActivity.case_id == case_id)
+    if user_id is not None:
+        conditions.append(UserActivity.user_id == user_id)
+    if start_date is not None:
+        conditions.append(UserActivity.activity_date >= start_date)
+    if end_date is not None:
+        conditions.append(UserActivity.activity_date < end_date)
+    if not include_hidden:
+        conditions.append(UserActivity.display_in_ui == True)
+
+    return _get_activities_query().filter(*conditions)
+
+
+def get_activities_partitions() -> list:
+    """
+    Get the monthly partitions of the activities
+
+    returns:
+        list: The name and first day of the month of each partition, oldest first
+    """
+    names = db.session.execute(text("""
+        SELECT c.relname FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'user_activity'::regclass
+    """)).scalars().all()
 
-    return user_activities
+    partitions = []
+    for name in names:
+        match = _ACTIVITIES_PARTITION_NAME.match(name)
+        if match:
+            partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def create_activities_partitions(first_month: date, last_month: date):
+    """
+    Create the missing monthly partitions of the activities between two months, included
+    """
+    db.session.execute(text("""
+        SELECT user_activity_create_partition(month::date)
+        FROM generate_series(:first_month, :last_month, interval '1 month') AS month
+    """), {'first_month': first_month, 'last_month': last_month})
+    db.session.commit()
+
+
+def expire_activities_partition(name: str, archive: bool):
+    """
+    Detach a monthly partition of the activities, then either keep it as the user_activity_archive_YYYYMM table or
+    drop it
+    """
+    db.session.execute(text("SELECT user_activity_expire_partition(:name, :archive)"),
+                       {'name': name, 'archive': archive})
+    db.session.commit()
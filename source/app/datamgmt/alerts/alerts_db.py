@@ -17,14 +17,23 @@
 #  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 from copy import deepcopy
 
+import hashlib
 import json
 from datetime import datetime, timedelta
 from flask_login import current_user
-from sqlalchemy import desc, asc, func, tuple_, or_, not_, and_
-from sqlalchemy.orm import aliased, make_transient, selectinload
+from sqlalchemy import BigInteger
+from sqlalchemy import cast
+from sqlalchemy import insert
+from sqlalchemy import inspect
+from sqlalchemy import null
+from sqlalchemy import select
+from sqlalchemy import union
+from sqlalchemy import desc, asc, func, or_, not_, and_, literal
+from sqlalchemy.orm import aliased, make_transient, selectinload, contains_eager, load_only
 from typing import List, Tuple
 
 import app
+from app import cache
 from app import db
 from app.datamgmt.case.case_assets_db import create_asset
 from app.datamgmt.case.case_assets_db import set_ioc_links
@@ -32,11 +41,14 @@ from app.datamgmt.case.case_assets_db import get_unspecified_analysis_status_id
 from app.datamgmt.case.case_events_db import update_event_assets
 from app.datamgmt.case.case_events_db import update_event_iocs
 from app.datamgmt.case.case_iocs_db import add_ioc
+from app.datamgmt.cursor_pagination import InvalidCursorError
+from app.datamgmt.cursor_pagination import cursor_paginate
 from app.datamgmt.manage.manage_access_control_db import get_user_clients_id
 from app.datamgmt.manage.manage_case_state_db import get_case_state_by_name
 from app.datamgmt.manage.manage_case_templates_db import get_case_template_by_id
 from app.datamgmt.manage.manage_case_templates_db import case_template_post_modifier
 from app.datamgmt.states import update_timeline_state
+from app.datamgmt.text_filters import text_filter
 from app.iris_engine.access_control.utils import ac_current_user_has_permission
 from app.iris_engine.utils.common import parse_bf_date_format
 from app.models.cases import Cases
@@ -53,6 +65,10 @@ from app.models.alerts import Alert
 from app.models.alerts import AlertStatus
 from app.models.alerts import AlertCaseAssociation
 from app.models.alerts import SimilarAlertsCache
+from app.models.alerts import SIMILAR_ALERTS_OBSERVABLE_ASSET
+from app.models.alerts import SIMILAR_ALERTS_OBSERVABLE_IOC
+from app.models.alerts import similar_alerts_observable_hash
+from app.models.alerts import similar_alerts_time_bucket
 from app.models.alerts import AlertResolutionStatus
 from app.models.alerts import AlertSimilarity
 from app.models.alerts import Severity
@@ -122,7 +138,7 @@ def build_condition(column, operator, value):
     elif operator == 'eq':
         return column == value
     elif operator == 'like':
-        return column.ilike(f"%{value}%")
+        return text_filter(column, value)
     else:
         raise ValueError(f"Unsupported operator: {operator}")
 
@@ -166,7 +182,10 @@ def get_filtered_alerts(
         sort: str = 'desc',
         current_user_id: int = None,
         source_reference=None,
-        custom_conditions: List[dict] = None):
+        custom_conditions: List[dict] = None,
+        cursor_mode: bool = False,
+        cursor: str = None,
+        with_total: bool = True):
     """
     Get a list of alerts that match the given filter conditions
 
@@ -194,6 +213,9 @@ def get_filtered_alerts(
         current_user_id (int): The ID of the current user
         source_reference (str): Alert source reference
         custom_conditions (list): Custom conditions to be applied (e.g., NOT client AND owner_id in [1,2,3])
+        cursor_mode (bool): Use keyset pagination on (alert_source_event_time, alert_id) instead of page numbers
+        cursor (str): The opaque cursor of the page to fetch in cursor mode, None for the first page
+        with_total (bool): In cursor mode, count the exact total instead of returning the planner estimation
 
     returns:
         list: A list of alerts that match the given filter conditions
@@ -202,6 +224,7 @@ def get_filtered_alerts(
 
     returns:
         dict: Dictionary with pagination info and list of serialized alerts
+        or CursorPagination in cursor mode
     """
     conditions = []
 
@@ -218,10 +241,10 @@ def get_filtered_alerts(
             conditions.append(Alert.alert_source_event_time.between(source_start_date, source_end_date))
 
     if title is not None:
-        conditions.append(Alert.alert_title.ilike(f'%{title}%'))
+        conditions.append(text_filter(Alert.alert_title, title))
 
     if description is not None:
-        conditions.append(Alert.alert_description.ilike(f'%{description}%'))
+        conditions.append(text_filter(Alert.alert_description, description))
 
     if status is not None:
         conditions.append(Alert.alert_status_id == status)
@@ -236,7 +259,7 @@ def get_filtered_alerts(
             conditions.append(Alert.alert_resolution_status_id == resolution_status)
 
     if source_reference is not None:
-        conditions.append(Alert.alert_source_ref.like(f'%{source_reference}%'))
+        conditions.append(text_filter(Alert.alert_source_ref, source_reference, case_sensitive=True))
 
     if owner is not None:
         if owner == -1:
@@ -245,10 +268,10 @@ def get_filtered_alerts(
             conditions.append(Alert.alert_owner_id == owner)
 
     if source is not None:
-        conditions.append(Alert.alert_source.ilike(f'%{source}%'))
+        conditions.append(text_filter(Alert.alert_source, source))
 
     if tags is not None:
-        conditions.append(Alert.alert_tags.ilike(f"%{tags}%"))
+        conditions.append(text_filter(Alert.alert_tags, tags))
 
     if client is not None:
         conditions.append(Alert.alert_customer_id == client)
@@ -346,18 +369,28 @@ def get_filtered_alerts(
 
     order_func = desc if sort == "desc" else asc
 
+    keyset_columns = [Alert.alert_source_event_time, Alert.alert_id]
+
     try:
         # Query the alerts using the filter conditions
 
         if combined_conditions is not None:
             query = query.filter(combined_conditions)
 
+        if cursor_mode:
+            return cursor_paginate(query, keyset_columns,
+                                   cursor=cursor, per_page=per_page, sort=sort, with_total=with_total)
+
         filtered_alerts = query.order_by(
             order_func(Alert.alert_source_event_time)
         ).paginate(page=page, per_page=per_page, error_out=False)
 
         return filtered_alerts
 
+    except InvalidCursorError:
+        # Reported by the caller
+        raise
+
     except Exception as e:
         app.app.logger.exception(f"Error getting alerts: {str(e)}")
         return None
@@ -990,55 +1023,214 @@ def cache_similar_alert(customer_id, assets, iocs, alert_id, creation_date):
     db.session.commit()
 
 
+def cache_similar_alerts(alerts: List[Alert]):
+    """
+    Cache a batch of alerts for the similarities checks. The entries are added to the session, so that they are
+    inserted along with the next flush, and the caller is in charge of the commit
+
+    args:
+        alerts (List[Alert]): The alerts, already flushed with their assets and IOCs
+
+    returns:
+        None
+    """
+    cache_entries = []
+    for alert in alerts:
+        for asset in alert.assets:
+            cache_entries.append(SimilarAlertsCache(customer_id=alert.alert_customer_id, asset_name=asset.asset_name,
+                                                    asset_type_id=asset.asset_type_id, alert_id=alert.alert_id,
+                                                    created_at=alert.alert_source_event_time))
+
+        for ioc in alert.iocs:
+            cache_entries.append(SimilarAlertsCache(customer_id=alert.alert_customer_id, ioc_value=ioc.ioc_value,
+                                                    ioc_type_id=ioc.ioc_type_id, alert_id=alert.alert_id,
+                                                    created_at=alert.alert_source_event_time))
+
+    db.session.add_all(cache_entries)
+
+
+def get_missing_references(objects: list) -> dict:
+    """
+    Find the foreign keys of objects not yet flushed which point to rows that do not exist.
+    A single query is issued per referenced table, whatever the number of objects
+
+    args:
+        objects (list): The objects to check, of any model
+
+    returns:
+        dict: The names of the invalid fields, indexed by the id() of the objects having some
+    """
+    objects_by_model = {}
+    for obj in objects:
+        objects_by_model.setdefault(type(obj), []).append(obj)
+
+    missing_references = {}
+    for model, model_objects in objects_by_model.items():
+        mapper = inspect(model)
+        for column in model.__table__.columns:
+            for foreign_key in column.foreign_keys:
+                attribute = mapper.get_property_by_column(column).key
+                values = {getattr(obj, attribute) for obj in model_objects} - {None}
+                if not values:
+                    continue
+
+                target = foreign_key.column
+                existing = set(db.session.execute(select(target).where(target.in_(values))).scalars())
+
+                for obj in model_objects:
+                    value = getattr(obj, attribute)
+                    if value is not None and value not in existing:
+                        missing_references.setdefault(id(obj), []).append(attribute)
+
+    return missing_references
+
+
 def register_related_alerts(new_alert=None, assets_list=None, iocs_list=None):
     """
     Register related alerts
+
+    The alerts of the same customer matching the title, an asset name or an IOC value of the new alert are linked to
+    it, see register_related_alerts_batch. The caller is in charge of the commit
+
+    args:
+        new_alert (Alert): The new alert, already flushed with its assets and IOCs
+        assets_list (list): Unused, the assets are read from the database
+        iocs_list (list): Unused, the IOCs are read from the database
+
+    returns:
+        int: The number of similarities registered
     """
+    return register_related_alerts_batch([new_alert])
 
 
-    # Step 1: Identify similar alerts based on title, assets, and IOCs
-    similar_alerts = db.session.query(Alert).filter(
-        Alert.alert_customer_id == new_alert.alert_customer_id,
-        Alert.alert_id != new_alert.alert_id,
-        or_(
-            Alert.alert_title == new_alert.alert_title,
-            Alert.assets.any(CaseAssets.asset_name.in_([asset.asset_name for asset in new_alert.assets])),
-            Alert.iocs.any(Ioc.ioc_value.in_([ioc.ioc_value for ioc in new_alert.iocs]))
+def register_related_alerts_batch(new_alerts: List[Alert]):
+    """
+    Register the related alerts of new alerts
+
+    The alerts of the same customer matching the title, an asset name or an IOC value of each new alert, and created
+    before it, are computed and inserted in the AlertSimilarity table with a single INSERT ... SELECT. The alerts of
+    the batch are thus linked once, the later ones to the earlier ones. At most ALERTS_SIMILARITY_MAX_FANOUT similar
+    alerts, the most recent ones, are linked to each new alert. The caller is in charge of the commit
+
+    args:
+        new_alerts (list): The new alerts, already flushed with their assets and IOCs
+
+    returns:
+        int: The number of similarities registered
+    """
+    max_fanout = app.app.config.get('ALERTS_SIMILARITY_MAX_FANOUT')
+    if not max_fanout or not new_alerts:
+        return 0
+
+    new_alert_ids = [alert.alert_id for alert in new_alerts]
+
+    new_alert = aliased(Alert)
+    similar_alert = aliased(Alert)
+    new_asset = aliased(CaseAssets)
+    similar_asset = aliased(CaseAssets)
+    new_ioc = aliased(Ioc)
+    similar_ioc = aliased(Ioc)
+    new_assets_link = alert_assets_association.alias()
+    similar_assets_link = alert_assets_association.alias()
+    new_iocs_link = alert_iocs_association.alias()
+    similar_iocs_link = alert_iocs_association.alias()
+
+    is_candidate = and_(
+        similar_alert.alert_customer_id == new_alert.alert_customer_id,
+        similar_alert.alert_id < new_alert.alert_id
+    )
+
+    title_matches = select(
+        new_alert.alert_id.label('alert_id'),
+        similar_alert.alert_id.label('similar_alert_id'),
+        literal('title_match').label('similarity_type'),
+        cast(null(), BigInteger).label('matching_asset_id'),
+        cast(null(), BigInteger).label('matching_ioc_id')
+    ).select_from(
+        new_alert
+    ).join(
+        similar_alert, and_(is_candidate, similar_alert.alert_title == new_alert.alert_title)
+    ).where(
+        new_alert.alert_id.in_(new_alert_ids)
+    )
+
+    asset_matches = select(
+        new_alert.alert_id,
+        similar_alert.alert_id,
+        literal('asset_match'),
+        new_asset.asset_id,
+        cast(null(), BigInteger)
+    ).select_from(
+        new_assets_link
+    ).join(
+        new_alert, new_alert.alert_id == new_assets_link.c.alert_id
+    ).join(
+        new_asset, new_asset.asset_id == new_assets_link.c.asset_id
+    ).join(
+        similar_asset, similar_asset.asset_name == new_asset.asset_name
+    ).join(
+        similar_assets_link, similar_assets_link.c.asset_id == similar_asset.asset_id
+    ).join(
+        similar_alert, similar_alert.alert_id == similar_assets_link.c.alert_id
+    ).where(
+        new_assets_link.c.alert_id.in_(new_alert_ids),
+        is_candidate
+    )
+
+    # The md5 condition lets the join use the idx_ioc_value_hash index
+    ioc_matches = select(
+        new_alert.alert_id,
+        similar_alert.alert_id,
+        literal('ioc_match'),
+        cast(null(), BigInteger),
+        new_ioc.ioc_id
+    ).select_from(
+        new_iocs_link
+    ).join(
+        new_alert, new_alert.alert_id == new_iocs_link.c.alert_id
+    ).join(
+        new_ioc, new_ioc.ioc_id == new_iocs_link.c.ioc_id
+    ).join(
+        similar_ioc, and_(func.md5(similar_ioc.ioc_value) == func.md5(new_ioc.ioc_value),
+                          similar_ioc.ioc_value == new_ioc.ioc_value)
+    ).join(
+        similar_iocs_link, similar_iocs_link.c.ioc_id == similar_ioc.ioc_id
+    ).join(
+        similar_alert, similar_alert.alert_id == similar_iocs_link.c.alert_id
+    ).where(
+        new_iocs_link.c.alert_id.in_(new_alert_ids),
+        is_candidate
+    )
+
+    matches = union(title_matches, asset_matches, ioc_matches).subquery('matches')
+
+    # The matches of the same similar alert share their rank, so the fan-out counts the similar alerts
+    ranked_matches = select(
+        matches,
+        func.dense_rank().over(
+            partition_by=matches.c.alert_id,
+            order_by=matches.c.similar_alert_id.desc()
+        ).label('similar_rank')
+    ).subquery('ranked_matches')
+
+    similarities = select(
+        ranked_matches.c.alert_id,
+        ranked_matches.c.similar_alert_id,
+        ranked_matches.c.similarity_type,
+        ranked_matches.c.matching_asset_id,
+        ranked_matches.c.matching_ioc_id
+    ).where(
+        ranked_matches.c.similar_rank <= max_fanout
+    )
+
+    result = db.session.execute(
+        insert(AlertSimilarity).from_select(
+            ['alert_id', 'similar_alert_id', 'similarity_type', 'matching_asset_id', 'matching_ioc_id'],
+            similarities
         )
-    ).all()
+    )
 
-    # Step 2: Create relationships in the AlertSimilarity table
-    for similar_alert in similar_alerts:
-        # Matching on title
-        if new_alert.alert_title == similar_alert.alert_title:
-            alert_similarity = AlertSimilarity(
-                alert_id=new_alert.alert_id,
-                similar_alert_id=similar_alert.alert_id,
-                similarity_type="title_match"
-            )
-            db.session.add(alert_similarity)
-
-        # Matching on assets
-        for asset in new_alert.assets:
-            if asset in similar_alert.assets:
-                alert_similarity = AlertSimilarity(
-                    alert_id=new_alert.alert_id,
-                    similar_alert_id=similar_alert.alert_id,
-                    similarity_type="asset_match",
-                    matching_asset_id=asset.asset_id
-                )
-                db.session.add(alert_similarity)
-
-        # Matching on IOCs
-        for ioc in new_alert.iocs:
-            if ioc in similar_alert.iocs:
-                alert_similarity = AlertSimilarity(
-                    alert_id=new_alert.alert_id,
-                    similar_alert_id=similar_alert.alert_id,
-                    similarity_type="ioc_match",
-                    matching_ioc_id=ioc.ioc_id
-                )
-                db.session.add(alert_similarity)
+    return result.rowcount
 
 
 def delete_similar_alert_cache(alert_id):
@@ -1140,8 +1332,62 @@ def get_related_alerts(customer_id, assets, iocs, details=False):
     return similarities
 
 
+def _related_alerts_observables(assets, iocs):
+    """
+    Returns the lookup keys of the assets and IOCs of an alert in the similar alerts cache
+
+    args:
+        assets (list): The list of assets
+        iocs (list): The list of IOCs
+
+    returns:
+        dict: The (kind, value) of the observables, indexed by their key
+    """
+    observables = {}
+    for asset in assets:
+        observable_hash = similar_alerts_observable_hash(SIMILAR_ALERTS_OBSERVABLE_ASSET, asset.asset_name,
+                                                         asset.asset_type_id)
+        observables[observable_hash] = (SIMILAR_ALERTS_OBSERVABLE_ASSET, asset.asset_name)
+
+    for ioc in iocs:
+        observable_hash = similar_alerts_observable_hash(SIMILAR_ALERTS_OBSERVABLE_IOC, ioc.ioc_value, ioc.ioc_type_id)
+        observables[observable_hash] = (SIMILAR_ALERTS_OBSERVABLE_IOC, ioc.ioc_value)
+
+    return observables
+
+
+def _related_alerts_graph_cache_key(alert_id, customer_id, observables, min_time_bucket, parameters):
+    """
+    Returns the cache key of the related alerts graph of an alert.
+    The key embeds the last id and the number of cache entries sharing the observables of the alert, so that a
+    graph is no longer served once an alert touching the same observables is added or deleted
+
+    args:
+        alert_id (int): The ID of the alert
+        customer_id (int): The ID of the customer
+        observables (dict): The observables of the alert, as returned by _related_alerts_observables
+        min_time_bucket (int): The oldest time bucket looked up
+        parameters (list): The other parameters the graph depends on
+
+    returns:
+        str: The cache key
+    """
+    last_id, entries_count = db.session.query(
+        func.max(SimilarAlertsCache.id),
+        func.count(SimilarAlertsCache.id)
+    ).filter(
+        SimilarAlertsCache.customer_id == customer_id,
+        SimilarAlertsCache.observable_hash.in_(list(observables)),
+        SimilarAlertsCache.time_bucket >= min_time_bucket
+    ).one()
+
+    fingerprint = hashlib.md5(json.dumps([sorted(observables), parameters]).encode('utf-8')).hexdigest()
+
+    return f'related_alerts_graph:{alert_id}:{fingerprint}:{last_id}:{entries_count}'
+
+
 def get_related_alerts_details(customer_id, assets, iocs, open_alerts, closed_alerts, open_cases, closed_cases,
-                               days_back=30, number_of_results=200):
+                               days_back=30, number_of_results=200, alert_id=None):
     """
     Get the details of the related alerts
 
@@ -1155,6 +1401,7 @@ def get_related_alerts_details(customer_id, assets, iocs, open_alerts, closed_al
         closed_cases (bool): Include closed cases
         days_back (int): The number of days to look back
         number_of_results (int): The maximum number of alerts to return
+        alert_id (int): The ID of the alert the assets and IOCs belong to. If set, the result is cached
 
     returns:
         dict: The details of the related alerts with matched assets and/or IOCs
@@ -1165,9 +1412,28 @@ def get_related_alerts_details(customer_id, assets, iocs, open_alerts, closed_al
             'edges': []
         }
 
-    asset_names = [(asset.asset_name, asset.asset_type_id) for asset in assets]
-    ioc_values = [(ioc.ioc_value, ioc.ioc_type_id) for ioc in iocs]
+    observables = _related_alerts_observables(assets, iocs)
+    min_time_bucket = similar_alerts_time_bucket(datetime.utcnow() - timedelta(days=days_back))
+
+    if alert_id is None:
+        return _build_related_alerts_graph(customer_id, observables, min_time_bucket, open_alerts, closed_alerts,
+                                           open_cases, closed_cases, days_back, number_of_results)
+
+    parameters = [open_alerts, closed_alerts, open_cases, closed_cases, days_back, number_of_results,
+                  current_user.in_dark_mode]
+    cache_key = _related_alerts_graph_cache_key(alert_id, customer_id, observables, min_time_bucket, parameters)
 
+    graph = cache.get(cache_key)
+    if graph is None:
+        graph = _build_related_alerts_graph(customer_id, observables, min_time_bucket, open_alerts, closed_alerts,
+                                            open_cases, closed_cases, days_back, number_of_results)
+        cache.set(cache_key, graph, timeout=app.app.config.get('ALERTS_SIMILARITIES_CACHE_TIMEOUT'))
+
+    return graph
+
+
+def _build_related_alerts_graph(customer_id, observables, min_time_bucket, open_alerts, closed_alerts, open_cases,
+                                closed_cases, days_back, number_of_results):
     asset_type_alias = aliased(AssetsType)
     alert_status_filter = []
 
@@ -1183,25 +1449,30 @@ def get_related_alerts_details(customer_id, assets, iocs, open_alerts, closed_al
         ).filter(AlertStatus.status_name.in_(['Closed', 'Merged', 'Escalated'])).all()
         alert_status_filter += [status_id[0] for status_id in closed_alert_status_ids]
 
+    # Served by the (customer_id, observable_hash, time_bucket) index. The created_at condition only trims the
+    # oldest bucket to the exact requested window
     conditions = and_(
         SimilarAlertsCache.customer_id == customer_id,
-        and_(or_(
-            tuple_(SimilarAlertsCache.asset_name, SimilarAlertsCache.asset_type_id).in_(asset_names),
-            tuple_(SimilarAlertsCache.ioc_value, SimilarAlertsCache.ioc_type_id).in_(ioc_values)
-        ),
+        SimilarAlertsCache.observable_hash.in_(list(observables)),
+        SimilarAlertsCache.time_bucket >= min_time_bucket,
         SimilarAlertsCache.created_at >= (func.now() - timedelta(days=days_back))
-        )
     )
 
     if alert_status_filter:
         conditions = and_(conditions, Alert.alert_status_id.in_(alert_status_filter))
 
     related_alerts = (
-        db.session.query(Alert, SimilarAlertsCache.asset_name, SimilarAlertsCache.ioc_value,
-                         asset_type_alias.asset_icon_not_compromised)
+        db.session.query(Alert, SimilarAlertsCache.observable_hash, SimilarAlertsCache.asset_name,
+                         SimilarAlertsCache.ioc_value, asset_type_alias.asset_icon_not_compromised)
         .join(SimilarAlertsCache, Alert.alert_id == SimilarAlertsCache.alert_id)
         .outerjoin(Alert.resolution_status)
         .outerjoin(asset_type_alias, SimilarAlertsCache.asset_type_id == asset_type_alias.asset_id)
+        .options(
+            load_only(Alert.alert_id, Alert.alert_title, Alert.alert_description, Alert.alert_status_id,
+                      Alert.alert_resolution_status_id),
+            contains_eager(Alert.resolution_status),
+            selectinload(Alert.status)
+        )
         .filter(conditions)
         .limit(number_of_results)
         .all()
@@ -1209,15 +1480,18 @@ def get_related_alerts_details(customer_id, assets, iocs, open_alerts, closed_al
 
     alerts_dict = {}
 
-    for alert, asset_name, ioc_value, asset_icon_not_compromised in related_alerts:
+    for alert, observable_hash, asset_name, ioc_value, asset_icon_not_compromised in related_alerts:
         if alert.alert_id not in alerts_dict:
             alerts_dict[alert.alert_id] = {'alert': alert, 'assets': [], 'iocs': []}
 
-        if any(name == asset_name for name, _ in asset_names):
+        # The values are compared as well, in case of a key collision
+        observable_kind, observable_value = observables.get(observable_hash, (None, None))
+
+        if observable_kind == SIMILAR_ALERTS_OBSERVABLE_ASSET and asset_name == observable_value:
             asset_info = {'asset_name': asset_name, 'icon': asset_icon_not_compromised}
             alerts_dict[alert.alert_id]['assets'].append(asset_info)
 
-        if any(value == ioc_value for value, _ in ioc_values):
+        if observable_kind == SIMILAR_ALERTS_OBSERVABLE_IOC and ioc_value == observable_value:
             alerts_dict[alert.alert_id]['iocs'].append(ioc_value)
 
     nodes = []
@@ -1299,8 +1573,8 @@ def get_related_alerts_details(customer_id, assets, iocs, open_alerts, closed_al
             close_condition = Cases.close_date.isnot(None) | Cases.close_date.is_(None)
 
         matching_ioc_cases = (
-            db.session.query(Ioc)
-            .with_entities(Ioc.case_id, Ioc.ioc_value, Cases.name, Cases.close_date, Cases.description)
+            db.session.query(Ioc.case_id, literal(SIMILAR_ALERTS_OBSERVABLE_IOC), Ioc.ioc_value, Cases.name,
+                             Cases.close_date, Cases.description)
             .join(Ioc.case)
             .filter(
                 and_(
@@ -1311,13 +1585,11 @@ def get_related_alerts_details(customer_id, assets, iocs, open_alerts, closed_al
                     Cases.client_id == customer_id
                 )
             )
-            .distinct()
-            .all()
         )
 
         matching_asset_cases = (
-            db.session.query(CaseAssets)
-            .with_entities(CaseAssets.case_id, CaseAssets.asset_name, Cases.name, Cases.close_date, Cases.description)
+            db.session.query(CaseAssets.case_id, literal(SIMILAR_ALERTS_OBSERVABLE_ASSET), CaseAssets.asset_name,
+                             Cases.name, Cases.close_date, Cases.description)
             .join(CaseAssets.case)
             .filter(
                 and_(
@@ -1328,23 +1600,21 @@ def get_related_alerts_details(customer_id, assets, iocs, open_alerts, closed_al
                     Cases.client_id == customer_id
                 )
             )
-            .distinct(CaseAssets.case_id)
-            .all()
         )
 
-        cases_data = {}
+        # Single round trip, the union also removes the duplicates
+        matching_cases = matching_ioc_cases.union(matching_asset_cases).all()
 
-        for case_id, ioc_value, case_name, close_date, case_desc in matching_ioc_cases:
-            if case_id not in cases_data:
-                cases_data[case_id] = {'name': case_name, 'matching_ioc': [], 'matching_assets': [],
-                                       'close_date': close_date, 'description': case_desc}
-            cases_data[case_id]['matching_ioc'].append(ioc_value)
+        cases_data = {}
 
-        for case_id, asset_name, case_name, close_date, case_desc in matching_asset_cases:
+        for case_id, observable_kind, observable_value, case_name, close_date, case_desc in matching_cases:
             if case_id not in cases_data:
                 cases_data[case_id] = {'name': case_name, 'matching_ioc': [], 'matching_assets': [],
                                        'close_date': close_date, 'description': case_desc}
-            cases_data[case_id]['matching_assets'].append(asset_name)
+            if observable_kind == SIMILAR_ALERTS_OBSERVABLE_IOC:
+                cases_data[case_id]['matching_ioc'].append(observable_value)
+            else:
+                cases_data[case_id]['matching_assets'].append(observable_value)
 
         for case_id in cases_data:
             if case_id not in added_cases:
@@ -1460,6 +1730,7 @@ def remove_alerts_from_assets_by_ids(alert_ids: List[int]) -> None:
 
         # Delete the CaseAsset if it's not related to a case
         if case_asset.case_id is None:
+            AlertSimilarity.query.filter(AlertSimilarity.matching_asset_id == case_asset.asset_id).delete()
             db.session.delete(case_asset)
 
     # Commit the changes
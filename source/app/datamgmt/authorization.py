@@ -16,8 +16,30 @@
 #  along with this program; if not, write to the Free Software Foundation,
 #  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
+from sqlalchemy import exists
+
 from app.models.authorization import CaseAccessLevel
+from app.models.authorization import UserCaseEffectiveAccess
 
 
 def has_deny_all_access_level(row):
     return (row.access_level & CaseAccessLevel.deny_all.value) == CaseAccessLevel.deny_all.value
+
+
+def user_cases_access_condition(user_id, case_id_column):
+    """
+    Restrict a query to the cases a user can access. This is a semi-join on the effective accesses, correlated to the
+    case column of the query, so its cost does not depend on the number of cases the user can access
+
+    args:
+        user_id (int): The user
+        case_id_column: The column holding the case of the rows to restrict, such as Cases.case_id
+
+    returns:
+        The SQLAlchemy condition
+    """
+    return exists().where(
+        UserCaseEffectiveAccess.user_id == user_id,
+        UserCaseEffectiveAccess.case_id == case_id_column,
+        UserCaseEffectiveAccess.access_level != CaseAccessLevel.deny_all.value
+    )
@@ -24,6 +24,7 @@ from sqlalchemy import func
 from flask_sqlalchemy.pagination import Pagination
 
 from app import db, app
+from app.datamgmt.authorization import user_cases_access_condition
 from app.datamgmt.states import update_assets_state
 from app.datamgmt.conversions import convert_sort_direction
 from app.models.models import AnalysisStatus
@@ -32,6 +33,7 @@ from app.models.models import AssetComments
 from app.models.models import AssetsType
 from app.models.models import CaseAssets
 from app.models.models import CaseEventsAssets
+from app.models.alerts import AlertSimilarity
 from app.models.cases import Cases
 from app.models.models import Comments
 from app.models.models import CompromiseStatus
@@ -179,6 +181,8 @@ def delete_asset(asset: CaseAssets):
         Comments.comment_id.in_(com_ids)
     ).delete()
 
+    AlertSimilarity.query.filter(AlertSimilarity.matching_asset_id == asset.asset_id).delete()
+
     db.session.delete(asset)
 
     update_assets_state(asset.case_id)
@@ -251,7 +255,7 @@ def get_assets_ioc_links(caseid):
     return ioc_links_req
 
 
-def get_similar_assets(asset_name, asset_type_id, caseid, customer_id, cases_limitation):
+def get_similar_assets(asset_name, asset_type_id, caseid, customer_id, user_id):
 
     linked_assets = CaseAssets.query.with_entities(
         Cases.name.label('case_name'),
@@ -266,7 +270,7 @@ def get_similar_assets(asset_name, asset_type_id, caseid, customer_id, cases_lim
     ).filter(
         CaseAssets.asset_name == asset_name,
         CaseAssets.asset_type_id == asset_type_id,
-        Cases.case_id.in_(cases_limitation)
+        user_cases_access_condition(user_id, Cases.case_id)
     ).join(CaseAssets.case).all()
 
     return (lasset._asdict() for lasset in linked_assets)
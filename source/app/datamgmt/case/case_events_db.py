@@ -17,6 +17,9 @@
 #  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 from flask_login import current_user
 from sqlalchemy import and_
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import or_
 
 from app import db
 from app.datamgmt.states import update_timeline_state
@@ -26,6 +29,7 @@ from app.models.models import CaseEventCategory
 from app.models.models import CaseEventsAssets
 from app.models.models import CaseEventsIoc
 from app.models.cases import CasesEvent
+from app.models.cases import CasesEventDeletion
 from app.models.models import Comments
 from app.models.models import EventCategory
 from app.models.models import EventComments
@@ -137,6 +141,220 @@ def get_case_events_comments_count(events_list):
     ).all()
 
 
+def get_case_timeline_filter_query(caseid, condition, assets=None, assets_id=None, iocs=None, iocs_id=None):
+    """
+    Build the query of the timeline events of a case matching condition. The assets and IOCs predicates are
+    evaluated by the database rather than on the links of every event.
+
+    args:
+        caseid (int): The case ID
+        condition: The SQL condition on the events and their category
+        assets (list): Lower cased names of assets the events must all be linked to, or None
+        assets_id (list): IDs of assets the events must all be linked to, or None
+        iocs (list): Lower cased values of IOCs the events must be linked to at least one of, or None
+        iocs_id (list): IDs of the IOCs the IOCs filter is restricted to, or None
+
+    returns:
+        The unordered query of the events
+    """
+    query = CasesEvent.query.with_entities(
+        CasesEvent.event_id,
+        CasesEvent.event_uuid,
+        CasesEvent.event_date,
+        CasesEvent.event_date_wtz,
+        CasesEvent.event_tz,
+        CasesEvent.event_title,
+        CasesEvent.event_color,
+        CasesEvent.event_tags,
+        CasesEvent.event_content,
+        CasesEvent.event_in_summary,
+        CasesEvent.event_in_graph,
+        CasesEvent.event_is_flagged,
+        CasesEvent.parent_event_id,
+        User.user,
+        CasesEvent.event_added,
+        CasesEvent.event_change_seq,
+        EventCategory.name.label("category_name")
+    ).filter(condition).outerjoin(
+        CasesEvent.category
+    ).join(
+        CasesEvent.user
+    )
+
+    if assets is not None or assets_id is not None:
+        # The events linked to as many of the requested assets as requested
+        links_condition = CaseEventsAssets.case_id == caseid
+        if assets_id:
+            links_condition = and_(links_condition, CaseEventsAssets.asset_id.in_(assets_id))
+
+        links_condition = and_(links_condition, or_(
+            func.lower(CaseAssets.asset_name).in_(assets or []),
+            CaseEventsAssets.asset_id.in_(assets_id or [])
+        ))
+
+        assets_events = CaseEventsAssets.query.with_entities(
+            CaseEventsAssets.event_id
+        ).join(
+            CaseEventsAssets.asset
+        ).filter(
+            links_condition
+        ).group_by(
+            CaseEventsAssets.event_id
+        ).having(
+            func.count() == len(assets or []) + len(assets_id or [])
+        )
+
+        query = query.filter(CasesEvent.event_id.in_(assets_events))
+
+    if iocs is not None:
+        links_condition = and_(
+            CaseEventsIoc.case_id == caseid,
+            func.lower(Ioc.ioc_value).in_(iocs)
+        )
+        if iocs_id:
+            links_condition = and_(links_condition, CaseEventsIoc.ioc_id.in_(iocs_id))
+
+        iocs_events = CaseEventsIoc.query.with_entities(
+            CaseEventsIoc.event_id
+        ).join(
+            CaseEventsIoc.ioc
+        ).filter(
+            links_condition
+        )
+
+        query = query.filter(CasesEvent.event_id.in_(iocs_events))
+
+    return query
+
+
+def get_case_timeline_links(caseid, events_list=None, assets_id=None, iocs_id=None):
+    """
+    Get the assets and IOCs linked to the timeline events of a case, indexed by event ID
+
+    args:
+        caseid (int): The case ID
+        events_list (list): IDs of the events to get the links of, or None for all the events of the case
+        assets_id (list): IDs of the assets to restrict the links to, or None
+        iocs_id (list): IDs of the IOCs to restrict the links to, or None
+
+    returns:
+        tuple: The assets links and the IOCs links, each as a dict of event ID to list of rows
+    """
+    assets_condition = CaseEventsAssets.case_id == caseid
+    iocs_condition = CaseEventsIoc.case_id == caseid
+
+    if events_list is not None:
+        assets_condition = and_(assets_condition, CaseEventsAssets.event_id.in_(events_list))
+        iocs_condition = and_(iocs_condition, CaseEventsIoc.event_id.in_(events_list))
+
+    if assets_id:
+        assets_condition = and_(assets_condition, CaseEventsAssets.asset_id.in_(assets_id))
+
+    if iocs_id:
+        iocs_condition = and_(iocs_condition, CaseEventsIoc.ioc_id.in_(iocs_id))
+
+    assets_links = CaseAssets.query.with_entities(
+        CaseEventsAssets.event_id,
+        CaseAssets.asset_id,
+        CaseAssets.asset_name,
+        AssetsType.asset_name.label('type'),
+        CaseAssets.asset_ip,
+        CaseAssets.asset_description,
+        CaseAssets.asset_compromise_status_id
+    ).filter(
+        assets_condition
+    ).join(
+        CaseEventsAssets.asset
+    ).join(
+        CaseAssets.asset_type
+    ).all()
+
+    iocs_links = CaseEventsIoc.query.with_entities(
+        CaseEventsIoc.event_id,
+        CaseEventsIoc.ioc_id,
+        Ioc.ioc_value,
+        Ioc.ioc_description
+    ).filter(
+        iocs_condition
+    ).join(
+        CaseEventsIoc.ioc
+    ).all()
+
+    assets_by_event = {}
+    for link in assets_links:
+        assets_by_event.setdefault(link.event_id, []).append(link)
+
+    iocs_by_event = {}
+    for link in iocs_links:
+        iocs_by_event.setdefault(link.event_id, []).append(link)
+
+    return assets_by_event, iocs_by_event
+
+
+def get_timeline_changes_version(caseid):
+    """
+    Get the version of the last change of the timeline of a case, to be passed to get_case_timeline_changes
+
+    args:
+        caseid (int): The case ID
+
+    returns:
+        int: The version, 0 if the timeline never changed
+    """
+    events_version = db.session.query(func.max(CasesEvent.event_change_seq)).filter(
+        CasesEvent.case_id == caseid
+    ).scalar()
+
+    deletions_version = db.session.query(func.max(CasesEventDeletion.event_change_seq)).filter(
+        CasesEventDeletion.case_id == caseid
+    ).scalar()
+
+    return max(events_version or 0, deletions_version or 0)
+
+
+def get_case_timeline_changes(caseid, since, limit):
+    """
+    Get the events of a case created, modified or deleted after a version, in the order of the changes
+
+    args:
+        caseid (int): The case ID
+        since (int): The version returned by a previous call or by get_timeline_changes_version
+        limit (int): The maximum number of changes returned
+
+    returns:
+        tuple: The changed events rows, the IDs of the deleted events, the version of the last change returned and
+               whether more changes are available
+    """
+    events = get_case_timeline_filter_query(
+        caseid, and_(CasesEvent.case_id == caseid, CasesEvent.event_change_seq > since)
+    ).order_by(
+        CasesEvent.event_change_seq
+    ).limit(limit + 1).all()
+
+    deletions = CasesEventDeletion.query.with_entities(
+        CasesEventDeletion.event_id,
+        CasesEventDeletion.event_change_seq
+    ).filter(
+        CasesEventDeletion.case_id == caseid,
+        CasesEventDeletion.event_change_seq > since
+    ).order_by(
+        CasesEventDeletion.event_change_seq
+    ).limit(limit + 1).all()
+
+    changes = sorted([(event.event_change_seq, event, False) for event in events] +
+                     [(deletion.event_change_seq, deletion, True) for deletion in deletions],
+                     key=lambda change: change[0])
+
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+
+    changed_events = [change for _, change, deleted in changes if not deleted]
+    deleted_events = [change.event_id for _, change, deleted in changes if deleted]
+    version = changes[-1][0] if changes else since
+
+    return changed_events, deleted_events, version, has_more
+
+
 def get_case_event_comment(event_id, comment_id, caseid):
     return EventComments.query.filter(
         EventComments.comment_event_id == event_id,
@@ -378,6 +596,7 @@ def delete_event(event, caseid):
 
     db.session.commit()
 
+    db.session.add(CasesEventDeletion(case_id=caseid, event_id=event.event_id))
     db.session.delete(event)
     update_timeline_state(caseid=caseid)
 
@@ -398,3 +617,105 @@ def get_default_category():
         EventCategory.name == "Unspecified"
     ).first()
 
+
+
+def get_categories_ids_by_name():
+    """
+    Get the IDs of the events categories, to resolve the categories of many events at once
+
+    returns:
+        dict: The category ID by name
+    """
+    return {category.name: category.id for category in EventCategory.query.with_entities(
+        EventCategory.id,
+        EventCategory.name
+    ).order_by(
+        EventCategory.id.desc()
+    ).all()}
+
+
+def get_case_assets_ids_by_name(caseid):
+    """
+    Get the IDs of the assets of a case, to resolve the assets of many events at once
+
+    args:
+        caseid (int): The case ID
+
+    returns:
+        dict: The asset ID by name
+    """
+    return {asset.asset_name: asset.asset_id for asset in CaseAssets.query.with_entities(
+        CaseAssets.asset_id,
+        CaseAssets.asset_name
+    ).filter(
+        CaseAssets.case_id == caseid
+    ).order_by(
+        CaseAssets.asset_id.desc()
+    ).all()}
+
+
+def get_case_iocs_ids_by_value(caseid):
+    """
+    Get the IDs of the IOCs of a case, to resolve the IOCs of many events at once
+
+    args:
+        caseid (int): The case ID
+
+    returns:
+        dict: The IOC ID by value
+    """
+    return {ioc.ioc_value: ioc.ioc_id for ioc in Ioc.query.with_entities(
+        Ioc.ioc_id,
+        Ioc.ioc_value
+    ).filter(
+        Ioc.case_id == caseid
+    ).order_by(
+        Ioc.ioc_id.desc()
+    ).all()}
+
+
+def add_events_links(caseid, events_links):
+    """
+    Save the category, assets and IOCs of new events with one statement per table. The caller commits.
+
+    args:
+        caseid (int): The case ID
+        events_links (list): Tuples (event ID, category ID, assets IDs, IOCs IDs) of the events, which must not have
+                             any link yet
+    """
+    categories = []
+    assets_links = []
+    iocs_links = []
+    for event_id, category_id, assets_ids, iocs_ids in events_links:
+        categories.append({'event_id': event_id, 'category_id': category_id})
+        assets_links.extend({'event_id': event_id, 'asset_id': asset_id, 'case_id': caseid}
+                            for asset_id in assets_ids)
+        iocs_links.extend({'event_id': event_id, 'ioc_id': ioc_id, 'case_id': caseid} for ioc_id in iocs_ids)
+
+    for model, rows in ((CaseEventCategory, categories), (CaseEventsAssets, assets_links),
+                        (CaseEventsIoc, iocs_links)):
+        if rows:
+            db.session.execute(insert(model), rows)
+
+
+def add_iocs_assets_links(links):
+    """
+    Link IOCs to assets, skipping the existing links. The caller commits.
+
+    args:
+        links (set): Tuples (asset ID, IOC ID)
+    """
+    if not links:
+        return
+
+    existing_links = IocAssetLink.query.with_entities(
+        IocAssetLink.asset_id,
+        IocAssetLink.ioc_id
+    ).filter(
+        IocAssetLink.asset_id.in_({asset_id for asset_id, _ in links})
+    ).all()
+
+    new_links = set(links) - {(link.asset_id, link.ioc_id) for link in existing_links}
+    if new_links:
+        db.session.execute(insert(IocAssetLink), [{'asset_id': asset_id, 'ioc_id': ioc_id}
+                                                  for asset_id, ioc_id in new_links])
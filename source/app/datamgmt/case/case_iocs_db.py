@@ -23,7 +23,8 @@ from app import db
 from app import app
 from app.datamgmt.states import update_ioc_state
 from app.datamgmt.conversions import convert_sort_direction
-from app.iris_engine.access_control.utils import ac_get_fast_user_cases_access
+from app.datamgmt.authorization import user_cases_access_condition
+from app.models.alerts import AlertSimilarity
 from app.models.cases import Cases
 from app.models.models import Client
 from app.models.models import Comments
@@ -32,8 +33,6 @@ from app.models.models import IocComments
 from app.models.models import IocType
 from app.models.models import Tlp
 from app.models.authorization import User
-from app.models.authorization import UserCaseEffectiveAccess
-from app.models.authorization import CaseAccessLevel
 from app.models.pagination_parameters import PaginationParameters
 
 
@@ -84,6 +83,8 @@ def delete_ioc(ioc: Ioc):
         Comments.comment_id.in_(com_ids)
     ).delete()
 
+    AlertSimilarity.query.filter(AlertSimilarity.matching_ioc_id == ioc.ioc_id).delete()
+
     db.session.delete(ioc)
 
     update_ioc_state(ioc.case_id)
@@ -112,11 +113,7 @@ def get_detailed_iocs(caseid):
 
 
 def get_ioc_links(ioc_id):
-    search_condition = and_(Cases.case_id.in_([]))
-
-    user_search_limitations = ac_get_fast_user_cases_access(current_user.id)
-    if user_search_limitations:
-        search_condition = and_(Cases.case_id.in_(user_search_limitations))
+    search_condition = user_cases_access_condition(current_user.id, Cases.case_id)
 
     ioc = Ioc.query.filter(Ioc.ioc_id == ioc_id).first()
 
@@ -281,17 +278,6 @@ def get_ioc_by_value(ioc_value, caseid=None):
     return Ioc.query.filter(Ioc.ioc_value == ioc_value).first()
 
 
-def user_list_cases_view(user_id):
-    res = UserCaseEffectiveAccess.query.with_entities(
-        UserCaseEffectiveAccess.case_id
-    ).filter(and_(
-        UserCaseEffectiveAccess.user_id == user_id,
-        UserCaseEffectiveAccess.access_level != CaseAccessLevel.deny_all.value
-    )).all()
-
-    return [r.case_id for r in res]
-
-
 def _build_filter_ioc_query(
         caseid: int = None,
         ioc_type_id: int = None,
@@ -20,6 +20,7 @@ from datetime import datetime
 from flask_login import current_user
 from sqlalchemy import desc
 from sqlalchemy import and_
+from sqlalchemy import func
 
 from app import db
 from app.datamgmt.conversions import convert_sort_direction
@@ -316,14 +317,25 @@ def delete_task_comment(task_id, comment_id):
     return True, "Comment deleted"
 
 
-def get_tasks_cases_mapping(open_cases_only=False):
-    condition = Cases.close_date == None if open_cases_only else True
+def get_tasks_status_count_by_case(cases_condition):
+    """
+    Count the open and closed tasks of each case matching a condition, in a single aggregate query. The cases without
+    tasks are omitted
 
-    return CaseTasks.query.filter(
-        condition
-    ).with_entities(
+    args:
+        cases_condition: The SQLAlchemy condition on Cases selecting the cases to count the tasks of
+
+    returns:
+        The rows of the case id, open tasks and closed tasks counts
+    """
+    return CaseTasks.query.with_entities(
         CaseTasks.task_case_id,
-        CaseTasks.task_status_id
+        func.count(CaseTasks.id).filter(CaseTasks.task_status_id.in_([1, 2, 3])).label('open_tasks'),
+        func.count(CaseTasks.id).filter(CaseTasks.task_status_id == 4).label('closed_tasks')
     ).join(
-        CaseTasks.case
+        Cases, Cases.case_id == CaseTasks.task_case_id
+    ).filter(
+        cases_condition
+    ).group_by(
+        CaseTasks.task_case_id
     ).all()
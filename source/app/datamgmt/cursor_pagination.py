@@ -0,0 +1,200 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from sqlalchemy import asc
+from sqlalchemy import desc
+from sqlalchemy import tuple_
+from typing import List
+from typing import Optional
+
+from app import app
+from app import db
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+class CursorPagination:
+    """
+    Result of a keyset (cursor) paginated query.
+
+    Unlike flask_sqlalchemy Pagination, no OFFSET is used and the total is only computed on demand,
+    so deep pages cost the same as the first one.
+    """
+
+    def __init__(self, items, per_page, next_cursor=None, prev_cursor=None, total=None, total_is_estimate=False):
+        self.items = items
+        self.per_page = per_page
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+        self.total = total
+        self.total_is_estimate = total_is_estimate
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self):
+        return self.prev_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+def _cursor_serialize_value(value):
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    return value
+
+
+def _cursor_deserialize_value(value):
+    if isinstance(value, dict) and 'dt' in value:
+        return datetime.fromisoformat(value['dt'])
+    return value
+
+
+def cursor_encode(values: list, direction: str = 'next') -> str:
+    """
+    Encode the sort key values of a boundary row into an opaque cursor
+    """
+    payload = {
+        'v': [_cursor_serialize_value(value) for value in values],
+        'd': direction
+    }
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def cursor_decode(cursor: str, expected_length: int):
+    """
+    Decode an opaque cursor into its sort key values and direction
+
+    raises:
+        InvalidCursorError: if the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        values = [_cursor_deserialize_value(value) for value in payload['v']]
+        direction = payload.get('d', 'next')
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+        raise InvalidCursorError('Invalid cursor')
+
+    if len(values) != expected_length or direction not in ('next', 'prev'):
+        raise InvalidCursorError('Invalid cursor')
+
+    return values, direction
+
+
+def estimate_query_count(query) -> Optional[int]:
+    """
+    Return the planner estimation of the number of rows a query returns, without executing it.
+    Returns None if the estimation is not available.
+    """
+    try:
+        compiled = query.order_by(None).statement.compile(dialect=db.engine.dialect,
+                                                          compile_kwargs={'render_postcompile': True})
+        # Within a savepoint, so that a failure does not abort the transaction of the caller
+        with db.session.begin_nested():
+            plan = db.session.connection().exec_driver_sql(f'EXPLAIN (FORMAT JSON) {compiled.string}',
+                                                           compiled.params).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return int(plan[0]['Plan']['Plan Rows'])
+
+    except Exception as e:
+        app.logger.warning(f'Unable to estimate query count: {e}')
+        return None
+
+
+def cursor_paginate(query, columns: List, cursor: str = None, per_page: int = 10, sort: str = 'desc',
+                    with_total: Optional[bool] = False) -> CursorPagination:
+    """
+    Paginate a query with a keyset on the provided columns.
+
+    The last column must be unique (typically the primary key) so that the keyset is a total order.
+    A composite index on the columns lets each page be served by an index range scan.
+
+    args:
+        query: The filtered query to paginate. It must not be ordered yet
+        columns: The model attributes making the keyset, e.g. [Alert.alert_source_event_time, Alert.alert_id]
+        cursor: The opaque cursor returned by a previous call, or None for the first page
+        per_page: The number of elements per page
+        sort: The sort order, 'asc' or 'desc'
+        with_total: If True the exact total is counted, if False the planner estimation is returned, and if None
+                    no total is returned
+
+    returns:
+        CursorPagination: The page of elements with its next and previous cursors
+
+    raises:
+        InvalidCursorError: if the cursor is malformed
+    """
+    descending = (sort == 'desc')
+    direction = 'next'
+    paginated_query = query
+
+    if cursor:
+        values, direction = cursor_decode(cursor, len(columns))
+        forward = (direction == 'next')
+        if forward == descending:
+            paginated_query = paginated_query.filter(tuple_(*columns) < tuple_(*values))
+        else:
+            paginated_query = paginated_query.filter(tuple_(*columns) > tuple_(*values))
+
+    # Walking backwards means reading in the reverse order, then flipping the page
+    reverse_read = (direction == 'prev')
+    order_func = desc if descending != reverse_read else asc
+
+    items = paginated_query.order_by(*[order_func(column) for column in columns]).limit(per_page + 1).all()
+    has_more = len(items) > per_page
+    items = items[:per_page]
+
+    if reverse_read:
+        items.reverse()
+        has_next = True
+        has_prev = has_more
+    else:
+        has_next = has_more
+        has_prev = bool(cursor)
+
+    next_cursor = None
+    prev_cursor = None
+    if items:
+        if has_next:
+            next_cursor = cursor_encode([getattr(items[-1], column.key) for column in columns], 'next')
+        if has_prev:
+            prev_cursor = cursor_encode([getattr(items[0], column.key) for column in columns], 'prev')
+
+    total = None
+    total_is_estimate = False
+    if with_total:
+        total = query.order_by(None).count()
+    elif with_total is not None:
+        total = estimate_query_count(query)
+        total_is_estimate = True
+
+    return CursorPagination(items, per_page, next_cursor=next_cursor, prev_cursor=prev_cursor,
+                            total=total, total_is_estimate=total_is_estimate)
@@ -20,6 +20,7 @@ from sqlalchemy import and_
 from sqlalchemy import desc
 
 from app import db
+from app.datamgmt.authorization import user_cases_access_condition
 from app.models.models import CaseTasks
 from app.models.models import TaskAssignee
 from app.models.models import ReviewStatus
@@ -173,14 +174,13 @@ def get_task_status(task_status_id):
 
 
 def list_user_cases(show_all=False):
-    if show_all:
-        return Cases.query.filter(
-            Cases.owner_id == current_user.id
-        ).all()
-
-    return Cases.query.filter(
+    conditions = [
         Cases.owner_id == current_user.id,
-        Cases.close_date == None
-    ).all()
+        user_cases_access_condition(current_user.id, Cases.case_id)
+    ]
+    if not show_all:
+        conditions.append(Cases.close_date == None)
+
+    return Cases.query.filter(*conditions).all()
 
 
@@ -0,0 +1,125 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+import datetime
+from sqlalchemy import BigInteger
+from sqlalchemy import cast
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy import text
+from sqlalchemy import union_all
+
+from app import db
+from app.models.models import DailyStatistics
+from app.models.models import DailyStatisticsDelta
+
+
+def _statistics_rows():
+    # The deltas not rolled up yet are read along with the statistics, so the counts are always up to date
+    return union_all(*(
+        select(
+            model.stat_day,
+            model.client_id,
+            model.object_type,
+            model.status_id,
+            model.object_count
+        ) for model in (DailyStatistics, DailyStatisticsDelta)
+    )).subquery()
+
+
+def get_daily_counts(object_type: str, start_day: datetime.date, end_day: datetime.date = None) -> list:
+    """
+    Get the number of objects created per day, all customers and statuses together. The days without any object are
+    omitted
+
+    args:
+        object_type (str): case, alert or task
+        start_day (date): First day, included
+        end_day (date): Last day, included. Defaults to no limit
+
+    returns:
+        list: Rows of stat_day and object_count, ordered by day
+    """
+    rows = _statistics_rows()
+    query = db.session.query(
+        rows.c.stat_day,
+        cast(func.sum(rows.c.object_count), BigInteger).label('object_count')
+    ).filter(
+        rows.c.object_type == object_type,
+        rows.c.stat_day >= start_day
+    )
+    if end_day is not None:
+        query = query.filter(rows.c.stat_day <= end_day)
+
+    return query.group_by(
+        rows.c.stat_day
+    ).having(
+        func.sum(rows.c.object_count) > 0
+    ).order_by(
+        rows.c.stat_day
+    ).all()
+
+
+def get_daily_statistics(object_type: str, start_day: datetime.date, end_day: datetime.date, client_ids: list) -> list:
+    """
+    Get the number of objects created per day, per customer and current status
+
+    args:
+        object_type (str): case, alert or task
+        start_day (date): First day, included
+        end_day (date): Last day, included
+        client_ids (list): Customers to get the statistics of
+
+    returns:
+        list: Rows of stat_day, client_id, status_id and object_count, ordered by day
+    """
+    rows = _statistics_rows()
+    return db.session.query(
+        rows.c.stat_day,
+        rows.c.client_id,
+        rows.c.status_id,
+        cast(func.sum(rows.c.object_count), BigInteger).label('object_count')
+    ).filter(
+        rows.c.object_type == object_type,
+        rows.c.stat_day >= start_day,
+        rows.c.stat_day <= end_day,
+        rows.c.client_id.in_(client_ids)
+    ).group_by(
+        rows.c.stat_day,
+        rows.c.client_id,
+        rows.c.status_id
+    ).having(
+        func.sum(rows.c.object_count) != 0
+    ).order_by(
+        rows.c.stat_day,
+        rows.c.client_id,
+        rows.c.status_id
+    ).all()
+
+
+def rollup_daily_statistics() -> int:
+    """
+    Move the deltas appended by the triggers into the daily statistics. Does nothing when a roll-up is already running
+
+    returns:
+        int: The number of daily statistics rows updated
+    """
+    rolled_up = db.session.execute(text("SELECT daily_statistics_rollup()")).scalar()
+    db.session.commit()
+
+    return rolled_up
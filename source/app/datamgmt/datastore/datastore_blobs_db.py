@@ -0,0 +1,318 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# Content addressed storage of the datastore files. The uploads are hashed while they are streamed to the blobs
+# folder, then renamed to their final location, so that each content is written once. A blob is shared by all the
+# datastore files with the same content, across cases, and removed with the last of them. The password protected
+# contents are stored zipped, once per password.
+import base64
+import datetime
+import hashlib
+import os
+import pyminizip
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from sqlalchemy import delete
+from sqlalchemy import event
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
+from typing import Iterable
+from typing import Optional
+
+from app import app
+from app import db
+from app.models.models import DataStoreBlob
+from app.models.models import DataStoreFile
+
+BLOB_CHUNK_SIZE = 1024 * 1024
+
+# Key of the session info holding the blobs which lost their last reference within the transaction
+_RELEASED_BLOBS_KEY = 'datastore_released_blobs'
+
+# Base64 decodes by blocks of 4 characters
+_BASE64_CHUNK_SIZE = BLOB_CHUNK_SIZE // 3 * 4
+
+
+def _blobs_path() -> Path:
+    return Path(app.config['DATASTORE_PATH']) / 'blobs'
+
+
+def _blob_local_path(file_hash: str, password_hash: str) -> Path:
+    blob_dir = _blobs_path() / file_hash[:2]
+    blob_dir.mkdir(parents=True, exist_ok=True)
+
+    if password_hash:
+        return blob_dir / f'{file_hash}-{password_hash[:16]}.zip'
+
+    return blob_dir / file_hash
+
+
+def file_storage_chunks(file_storage) -> Iterable[bytes]:
+    """
+    Read an uploaded file by chunks
+
+    args:
+        file_storage (FileStorage): The uploaded file
+
+    returns:
+        Iterable[bytes]: The chunks of the file
+    """
+    for chunk in iter(lambda: file_storage.stream.read(BLOB_CHUNK_SIZE), b''):
+        yield chunk
+
+
+def base64_chunks(encoded: str) -> Iterable[bytes]:
+    """
+    Decode a base64 content by chunks, rather than holding the whole decoded content in memory
+
+    args:
+        encoded (str): The base64 content
+
+    returns:
+        Iterable[bytes]: The chunks of the decoded content
+    """
+    if re.search(r'\s', encoded):
+        encoded = re.sub(r'\s', '', encoded)
+
+    for index in range(0, len(encoded), _BASE64_CHUNK_SIZE):
+        yield base64.b64decode(encoded[index:index + _BASE64_CHUNK_SIZE], validate=True)
+
+
+def blobs_temporary_dir() -> Path:
+    """
+    Folder for the files being written before they become blobs. It is on the same filesystem as the blobs, so that
+    they are placed by renaming them
+
+    returns:
+        Path: The folder
+    """
+    temporary_dir = _blobs_path() / '.tmp'
+    temporary_dir.mkdir(parents=True, exist_ok=True)
+
+    return temporary_dir
+
+
+def _place_blob(file_path: Path, local_path: Path, file_hash: str, password: str):
+    if not password:
+        os.replace(file_path, local_path)
+        return
+
+    # The zip entry is named after the hash of the file
+    zip_dir = Path(tempfile.mkdtemp(dir=blobs_temporary_dir()))
+    entry_path = zip_dir / file_hash
+    try:
+        os.replace(file_path, entry_path)
+
+        zip_path = zip_dir / f'{file_hash}.zip'
+        pyminizip.compress(entry_path.as_posix(), None, zip_path.as_posix(), password, 0)
+        os.replace(zip_path, local_path)
+
+    except Exception:
+        # The file is given back, so that storing it can be retried
+        if entry_path.is_file():
+            os.replace(entry_path, file_path)
+        raise
+
+    finally:
+        shutil.rmtree(zip_dir, ignore_errors=True)
+
+
+def datastore_blob_store_file(file_path: Path, file_hash: str, size: int,
+                              password: Optional[str] = None) -> DataStoreBlob:
+    """
+    Store a file as a blob, or reference the existing blob with the same content and password. The file is moved
+    into the blob, or removed if the blob already exists. It is left in place if the blob cannot be stored
+
+    args:
+        file_path (Path): The file, within the blobs temporary folder
+        file_hash (str): The SHA256 of the file, in upper case
+        size (int): The size of the file
+        password (str): The password of the zip to store the content in, if any
+
+    returns:
+        DataStoreBlob: The blob, whose reference count includes the new reference
+    """
+    password_hash = hashlib.sha256(password.encode('utf-8')).hexdigest() if password else ''
+    local_path = _blob_local_path(file_hash, password_hash)
+
+    # Waits on the row of a blob being released, so the file is placed again once it is removed
+    blob_id = db.session.execute(insert(DataStoreBlob).values(
+        blob_sha256=file_hash,
+        blob_password_sha256=password_hash,
+        blob_size=size,
+        blob_local_name=local_path.as_posix(),
+        blob_ref_count=1,
+        blob_date_added=datetime.datetime.now()
+    ).on_conflict_do_update(
+        constraint='data_store_blob_sha256_password_key',
+        set_={'blob_ref_count': DataStoreBlob.blob_ref_count + 1}
+    ).returning(DataStoreBlob.blob_id)).scalar()
+
+    if local_path.is_file():
+        file_path.unlink(missing_ok=True)
+    else:
+        _place_blob(file_path, local_path, file_hash, password)
+
+    return db.session.get(DataStoreBlob, blob_id, populate_existing=True)
+
+
+def datastore_blob_store(chunks: Iterable[bytes], password: Optional[str] = None) -> DataStoreBlob:
+    """
+    Store a content as a blob, or reference the existing blob with the same content and password. The content is
+    hashed while it is written
+
+    args:
+        chunks (Iterable[bytes]): The content, by chunks
+        password (str): The password of the zip to store the content in, if any
+
+    returns:
+        DataStoreBlob: The blob, whose reference count includes the new reference
+    """
+    sha256_hash = hashlib.sha256()
+    size = 0
+
+    with tempfile.NamedTemporaryFile(dir=blobs_temporary_dir(), delete=False) as fout:
+        try:
+            for chunk in chunks:
+                sha256_hash.update(chunk)
+                size += len(chunk)
+                fout.write(chunk)
+
+        except Exception:
+            os.unlink(fout.name)
+            raise
+
+    try:
+        return datastore_blob_store_file(Path(fout.name), sha256_hash.hexdigest().upper(), size, password=password)
+
+    finally:
+        Path(fout.name).unlink(missing_ok=True)
+
+
+def datastore_blob_release(blob_id: int):
+    """
+    Drop a reference to a blob. The blob is removed with its last reference once the transaction is committed, so
+    that a rollback of the caller keeps its file
+
+    args:
+        blob_id (int): The blob
+    """
+    released = db.session.execute(update(DataStoreBlob).where(
+        DataStoreBlob.blob_id == blob_id
+    ).values(
+        blob_ref_count=DataStoreBlob.blob_ref_count - 1
+    ).returning(DataStoreBlob.blob_ref_count)).first()
+
+    if released is None or released.blob_ref_count > 0:
+        return
+
+    db.session.info.setdefault(_RELEASED_BLOBS_KEY, set()).add(blob_id)
+
+
+def datastore_blobs_purge(blob_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    Remove the blobs without any reference, with their file
+
+    args:
+        blob_ids (Iterable[int]): The blobs to check, or all the blobs if None
+
+    returns:
+        int: The number of blobs removed
+    """
+    purged = 0
+
+    with db.engine.begin() as connection:
+        if blob_ids is None:
+            blob_ids = connection.execute(
+                select(DataStoreBlob.blob_id).where(DataStoreBlob.blob_ref_count <= 0)
+            ).scalars().all()
+
+        for blob_id in blob_ids:
+            # A blob referenced again meanwhile, or being referenced by a running upload, is kept
+            blob = connection.execute(select(DataStoreBlob.blob_local_name).where(
+                DataStoreBlob.blob_id == blob_id,
+                DataStoreBlob.blob_ref_count <= 0
+            ).with_for_update(skip_locked=True)).first()
+            if blob is None:
+                continue
+
+            # Removed while the row is locked, so a concurrent upload of the same content places the file again.
+            # Should the deletion of the row fail, the blob stays without reference and its file is placed again
+            # by the next upload of the content
+            Path(blob.blob_local_name).unlink(missing_ok=True)
+            connection.execute(delete(DataStoreBlob).where(DataStoreBlob.blob_id == blob_id))
+            purged += 1
+
+    return purged
+
+
+@event.listens_for(db.session, 'after_commit')
+def _purge_released_blobs(session):
+    blob_ids = session.info.pop(_RELEASED_BLOBS_KEY, None)
+    if not blob_ids:
+        return
+
+    try:
+        datastore_blobs_purge(blob_ids)
+    except Exception as e:
+        # The blobs left without reference are removed by the periodic purge
+        app.logger.warning(f'Unable to remove the released blobs {blob_ids}: {e}')
+
+
+@event.listens_for(db.session, 'after_rollback')
+def _forget_released_blobs(session):
+    session.info.pop(_RELEASED_BLOBS_KEY, None)
+
+
+def datastore_attach_blob(dsf: DataStoreFile, blob: DataStoreBlob):
+    """
+    Make a datastore file point to a blob, releasing its previous content
+
+    args:
+        dsf (DataStoreFile): The datastore file
+        blob (DataStoreBlob): The blob holding its new content
+    """
+    datastore_release_file(dsf)
+
+    dsf.file_blob_id = blob.blob_id
+    dsf.file_local_name = blob.blob_local_name
+    dsf.file_size = blob.blob_size
+    dsf.file_sha256 = blob.blob_sha256
+
+
+def datastore_release_file(dsf: DataStoreFile):
+    """
+    Release the content of a datastore file, before it is deleted or its content replaced. The files stored before
+    the blobs own their copy, which is removed
+
+    args:
+        dsf (DataStoreFile): The datastore file
+    """
+    if dsf.file_blob_id is None:
+        if dsf.file_local_name and Path(dsf.file_local_name).is_absolute():
+            Path(dsf.file_local_name).unlink(missing_ok=True)
+        return
+
+    blob_id = dsf.file_blob_id
+    dsf.file_blob_id = None
+    db.session.flush()
+
+    datastore_blob_release(blob_id)
@@ -19,14 +19,13 @@
 #  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
 import datetime
-from pathlib import Path
 
 from flask_login import current_user
 from sqlalchemy import and_
 from sqlalchemy import func
 
-from app import app
 from app import db
+from app.datamgmt.datastore.datastore_blobs_db import datastore_release_file
 from app.models.models import CaseReceivedFile
 from app.models.models import DataStoreFile
 from app.models.models import DataStorePath
@@ -264,10 +263,7 @@ def datastore_delete_files_of_path(node_id, cid):
     ).all()
 
     for dsf_list_item in dsf_list:
-
-        fln = Path(dsf_list_item.file_local_name)
-        if fln.is_file():
-            fln.unlink(missing_ok=True)
+        datastore_release_file(dsf_list_item)
 
         db.session.delete(dsf_list_item)
         db.session.commit()
@@ -302,24 +298,6 @@ def datastore_get_interactive_path_node(cid):
     return dsp
 
 
-def datastore_get_standard_path(datastore_file, cid):
-    root_path = Path(app.config['DATASTORE_PATH'])
-
-    if datastore_file.file_is_ioc:
-        target_path = root_path / 'IOCs'
-    elif datastore_file.file_is_evidence:
-        target_path = root_path / 'Evidences'
-    else:
-        target_path = root_path / 'Regulars'
-
-    target_path = target_path / f"case-{cid}"
-
-    if not target_path.is_dir():
-        target_path.mkdir(parents=True, exist_ok=True)
-
-    return target_path / f"dsf-{datastore_file.file_uuid}"
-
-
 def datastore_get_file(file_id, cid):
     dsf = DataStoreFile.query.filter(
         DataStoreFile.file_id == file_id,
@@ -338,9 +316,7 @@ def datastore_delete_file(cur_id, cid):
     if dsf is None:
         return True, 'Invalid DS file ID for this case'
 
-    fln = Path(dsf.file_local_name)
-    if fln.is_file():
-        fln.unlink(missing_ok=True)
+    datastore_release_file(dsf)
 
     db.session.delete(dsf)
     db.session.commit()
@@ -0,0 +1,198 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# Resumable uploads of the datastore files. The chunks are written at their offset in a partial file, within the
+# blobs temporary folder so that the committed file is renamed into its blob. The SHA256 is computed while the chunks
+# are written. As the hash state cannot be stored, each worker keeps the state of the uploads it served, and catches
+# up from the partial file with the chunks written by the other workers.
+import datetime
+import hashlib
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import BinaryIO
+from typing import Optional
+
+from app import db
+from app.datamgmt.datastore.datastore_blobs_db import BLOB_CHUNK_SIZE
+from app.datamgmt.datastore.datastore_blobs_db import blobs_temporary_dir
+from app.models.models import DataStoreUpload
+
+_MAX_CACHED_HASHERS = 64
+
+# upload_uuid -> (offset, hasher)
+_upload_hashers = OrderedDict()
+
+
+def _upload_hasher(upload: DataStoreUpload):
+    offset, hasher = _upload_hashers.pop(upload.upload_uuid, (0, None))
+    if hasher is None or offset > upload.upload_offset:
+        offset, hasher = 0, hashlib.sha256()
+
+    if offset < upload.upload_offset:
+        with open(upload.upload_local_name, 'rb') as fin:
+            fin.seek(offset)
+            remaining = upload.upload_offset - offset
+            while remaining > 0:
+                chunk = fin.read(min(BLOB_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                remaining -= len(chunk)
+
+    return hasher
+
+
+def _keep_upload_hasher(upload: DataStoreUpload, hasher):
+    _upload_hashers[upload.upload_uuid] = (upload.upload_offset, hasher)
+    while len(_upload_hashers) > _MAX_CACHED_HASHERS:
+        _upload_hashers.popitem(last=False)
+
+
+def datastore_upload_create(upload: DataStoreUpload) -> DataStoreUpload:
+    """
+    Create an upload session along with its empty partial file
+
+    args:
+        upload (DataStoreUpload): The upload, with its case, user, target folder, size and file attributes
+
+    returns:
+        DataStoreUpload: The upload
+    """
+    upload.upload_uuid = uuid.uuid4()
+    upload.upload_offset = 0
+    upload.upload_local_name = (blobs_temporary_dir() / f'upload-{upload.upload_uuid}.part').as_posix()
+    upload.upload_date_created = datetime.datetime.now()
+    upload.upload_date_updated = upload.upload_date_created
+
+    Path(upload.upload_local_name).touch()
+
+    db.session.add(upload)
+    db.session.commit()
+
+    return upload
+
+
+def datastore_upload_get(upload_uuid, for_update: bool = False) -> Optional[DataStoreUpload]:
+    """
+    Get an upload session
+
+    args:
+        upload_uuid (UUID): The upload
+        for_update (bool): Lock the upload until the end of the transaction, so its chunks are written one at a time
+
+    returns:
+        DataStoreUpload: The upload, None if not found
+    """
+    query = DataStoreUpload.query.filter(DataStoreUpload.upload_uuid == upload_uuid)
+    if for_update:
+        query = query.with_for_update().populate_existing()
+
+    return query.first()
+
+
+def datastore_upload_write(upload: DataStoreUpload, stream: BinaryIO, length: int):
+    """
+    Write a chunk at the current offset of an upload. The progress is recorded even when the stream breaks, so the
+    upload resumes from the last byte received
+
+    args:
+        upload (DataStoreUpload): The upload, locked
+        stream (BinaryIO): The chunk
+        length (int): The length of the chunk
+    """
+    hasher = _upload_hasher(upload)
+    written = 0
+
+    try:
+        with open(upload.upload_local_name, 'r+b') as fout:
+            fout.seek(upload.upload_offset)
+            fout.truncate()
+
+            while written < length:
+                chunk = stream.read(min(BLOB_CHUNK_SIZE, length - written))
+                if not chunk:
+                    break
+                fout.write(chunk)
+                hasher.update(chunk)
+                written += len(chunk)
+
+    finally:
+        upload.upload_offset += written
+        upload.upload_date_updated = datetime.datetime.now()
+        db.session.commit()
+
+        _keep_upload_hasher(upload, hasher)
+
+
+def datastore_upload_sha256(upload: DataStoreUpload) -> str:
+    """
+    Get the SHA256 of the data received for an upload
+
+    args:
+        upload (DataStoreUpload): The upload
+
+    returns:
+        str: The SHA256, in upper case
+    """
+    hasher = _upload_hasher(upload)
+    _keep_upload_hasher(upload, hasher)
+
+    return hasher.hexdigest().upper()
+
+
+def datastore_upload_restart(upload: DataStoreUpload):
+    """
+    Restart an upload from its first byte, when its partial file was lost
+
+    args:
+        upload (DataStoreUpload): The upload
+    """
+    _upload_hashers.pop(upload.upload_uuid, None)
+    Path(upload.upload_local_name).touch()
+
+    upload.upload_offset = 0
+    upload.upload_date_updated = datetime.datetime.now()
+    db.session.commit()
+
+
+def datastore_upload_delete(upload: DataStoreUpload):
+    """
+    Delete an upload session along with its partial file, if it was not committed
+
+    args:
+        upload (DataStoreUpload): The upload
+    """
+    _upload_hashers.pop(upload.upload_uuid, None)
+    Path(upload.upload_local_name).unlink(missing_ok=True)
+
+    db.session.delete(upload)
+    db.session.commit()
+
+
+def datastore_uploads_get_expired(limit: datetime.datetime) -> list:
+    """
+    List the uploads without any chunk received since a date
+
+    args:
+        limit (datetime): The date
+
+    returns:
+        list: The uploads
+    """
+    return DataStoreUpload.query.filter(DataStoreUpload.upload_date_updated < limit).all()
@@ -0,0 +1,58 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+import datetime
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from app import db
+from app.models.models import GraphQLPersistedQuery
+
+
+def get_persisted_query(query_hash):
+    """
+    Get the document of a persisted query
+
+    args:
+        query_hash (str): The SHA256 of the document, in hexadecimal
+
+    returns:
+        str: The document, or None if the query was not registered
+    """
+    return db.session.execute(
+        select(GraphQLPersistedQuery.query_document).where(GraphQLPersistedQuery.query_hash == query_hash)
+    ).scalar()
+
+
+def register_persisted_query(query_hash, query, user_id):
+    """
+    Register the document of a persisted query. Registering a document twice is a no-op
+
+    args:
+        query_hash (str): The SHA256 of the document, in hexadecimal
+        query (str): The document
+        user_id (int): The user registering the query
+    """
+    db.session.execute(insert(GraphQLPersistedQuery).values(
+        query_hash=query_hash,
+        query_document=query,
+        created_by_id=user_id,
+        created_at=datetime.datetime.utcnow()
+    ).on_conflict_do_nothing(index_elements=['query_hash']))
+    db.session.commit()
@@ -20,6 +20,8 @@ import datetime
 from flask_login import current_user
 
 from app import db, app
+from app.iris_engine.module_handler.hooks_registry import hooks_registry_invalidate
+from app.iris_engine.module_handler.modules_pool import modules_pool_evict
 from app.models.models import IrisHook
 from app.models.models import IrisModule
 from app.models.models import IrisModuleHook
@@ -92,6 +94,7 @@ def iris_module_save_parameter(mod_id, mod_config, parameter, value, section=Non
 
             mod_config[index]["value"] = value
             data.module_config = mod_config
+            modules_pool_evict(data.module_name)
             db.session.commit()
             return True
 
@@ -103,6 +106,8 @@ def iris_module_save_parameter(mod_id, mod_config, parameter, value, section=Non
 def iris_module_enable_by_id(module_id):
     data = IrisModule.query.filter(IrisModule.id == module_id).first()
     if data:
+        if not data.is_active:
+            hooks_registry_invalidate()
         data.is_active = True
         db.session.commit()
         return True
@@ -112,6 +117,8 @@ def iris_module_enable_by_id(module_id):
 def iris_module_disable_by_id(module_id):
     data = IrisModule.query.filter(IrisModule.id == module_id).first()
     if data:
+        if data.is_active:
+            hooks_registry_invalidate()
         data.is_active = False
         db.session.commit()
         return True
@@ -192,9 +199,14 @@ def get_pipelines_args_from_name(module_name):
 
 
 def delete_module_from_id(module_id):
+    module_name = iris_module_name_from_id(module_id)
+    if module_name:
+        modules_pool_evict(module_name)
+
     IrisModuleHook.query.filter(
         IrisModuleHook.module_id == module_id
     ).delete()
+    hooks_registry_invalidate()
     db.session.commit()
 
     IrisModule.query.filter(IrisModule.id == module_id).delete()
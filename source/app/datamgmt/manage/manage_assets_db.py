@@ -3,7 +3,7 @@ from sqlalchemy import and_
 from functools import reduce
 
 import app
-from app.datamgmt.manage.manage_cases_db import user_list_cases_view
+from app.datamgmt.authorization import user_cases_access_condition
 from app.datamgmt.conversions import convert_sort_direction
 from app.models.cases import Cases
 from app.models.models import CaseAssets
@@ -49,7 +49,7 @@ def get_filtered_assets(case_id=None,
     if len(conditions) > 1:
         conditions = [reduce(and_, conditions)]
 
-    conditions.append(CaseAssets.case_id.in_(user_list_cases_view(current_user.id)))
+    conditions.append(user_cases_access_condition(current_user.id, CaseAssets.case_id))
 
     data = CaseAssets.query.filter(*conditions)
 
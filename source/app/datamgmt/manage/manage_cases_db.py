@@ -18,9 +18,9 @@
 from datetime import datetime
 from datetime import date
 from datetime import timedelta
-from pathlib import Path
 
 from sqlalchemy import and_
+from sqlalchemy import select
 from sqlalchemy.orm import aliased
 from functools import reduce
 
@@ -30,8 +30,12 @@ from app.datamgmt.alerts.alerts_db import search_alert_resolution_by_name
 from app.datamgmt.case.case_db import get_case_tags
 from app.datamgmt.manage.manage_case_state_db import get_case_state_by_name
 from app.datamgmt.conversions import convert_sort_direction
+from app.datamgmt.datastore.datastore_blobs_db import datastore_release_file
 from app.datamgmt.authorization import has_deny_all_access_level
+from app.datamgmt.authorization import user_cases_access_condition
 from app.datamgmt.states import delete_case_states
+from app.datamgmt.text_filters import text_filter
+from app.iris_engine.access_control.case_access_cache import case_access_cache_invalidate
 from app.models.models import CaseAssets
 from app.models.models import NoteRevisions
 from app.models.models import CaseClassification
@@ -47,6 +51,7 @@ from app.models.models import CaseReceivedFile
 from app.models.models import CaseTasks
 from app.models.cases import Cases
 from app.models.cases import CasesEvent
+from app.models.cases import CasesEventDeletion
 from app.models.models import Client
 from app.models.models import DataStoreFile
 from app.models.models import DataStorePath
@@ -56,7 +61,6 @@ from app.models.models import NotesGroup
 from app.models.models import NotesGroupLink
 from app.models.models import UserActivity
 from app.models.alerts import AlertCaseAssociation
-from app.models.authorization import CaseAccessLevel
 from app.models.authorization import GroupCaseAccess
 from app.models.authorization import OrganisationCaseAccess
 from app.models.authorization import User
@@ -168,17 +172,6 @@ def list_cases_dict(user_id):
     return data
 
 
-def user_list_cases_view(user_id):
-    res = UserCaseEffectiveAccess.query.with_entities(
-        UserCaseEffectiveAccess.case_id
-    ).filter(and_(
-        UserCaseEffectiveAccess.user_id == user_id,
-        UserCaseEffectiveAccess.access_level != CaseAccessLevel.deny_all.value
-    )).all()
-
-    return [r.case_id for r in res]
-
-
 def close_case(case_id):
     res = Cases.query.filter(
         Cases.case_id == case_id
@@ -330,10 +323,7 @@ def delete_case(case_id):
     dsf_list = DataStoreFile.query.filter(DataStoreFile.file_case_id == case_id).all()
 
     for dsf_list_item in dsf_list:
-
-        fln = Path(dsf_list_item.file_local_name)
-        if fln.is_file():
-            fln.unlink(missing_ok=True)
+        datastore_release_file(dsf_list_item)
 
         db.session.delete(dsf_list_item)
     db.session.commit()
@@ -393,6 +383,7 @@ def delete_case(case_id):
         CaseEventCategory.query.filter(CaseEventCategory.event_id == event.event_id).delete()
 
     CasesEvent.query.filter(CasesEvent.case_id == case_id).delete()
+    CasesEventDeletion.query.filter(CasesEventDeletion.case_id == case_id).delete()
 
     UserCaseAccess.query.filter(UserCaseAccess.case_id == case_id).delete()
     UserCaseEffectiveAccess.query.filter(UserCaseEffectiveAccess.case_id == case_id).delete()
@@ -401,6 +392,7 @@ def delete_case(case_id):
 
     Cases.query.filter(Cases.case_id == case_id).delete()
     db.session.commit()
+    case_access_cache_invalidate(case_ids=[case_id])
 
     return True
 
@@ -441,10 +433,10 @@ def build_filter_case_query(current_user_id,
         conditions.append(Cases.case_id.in_(case_ids))
 
     if case_name is not None:
-        conditions.append(Cases.name.ilike(f'%{case_name}%'))
+        conditions.append(text_filter(Cases.name, case_name))
 
     if case_description is not None:
-        conditions.append(Cases.description.ilike(f'%{case_description}%'))
+        conditions.append(text_filter(Cases.description, case_description))
 
     if case_classification_id is not None:
         conditions.append(Cases.classification_id == case_classification_id)
@@ -465,7 +457,14 @@ def build_filter_case_query(current_user_id,
         conditions.append(Cases.soc_id == case_soc_id)
 
     if search_value is not None:
-        conditions.append(Cases.name.like(f"%{search_value}%"))
+        conditions.append(text_filter(Cases.name, search_value, case_sensitive=True))
+
+    if case_tags is not None:
+        conditions.append(Cases.case_id.in_(
+            select(CaseTags.case_id).join(Tags, Tags.id == CaseTags.tag_id).where(
+                text_filter(Tags.tag_title, case_tags)
+            )
+        ))
 
     if case_open_since is not None:
         result = date.today() - timedelta(case_open_since)
@@ -480,12 +479,9 @@ def build_filter_case_query(current_user_id,
 
     if len(conditions) > 1:
         conditions = [reduce(and_, conditions)]
-    conditions.append(Cases.case_id.in_(user_list_cases_view(current_user_id)))
+    conditions.append(user_cases_access_condition(current_user_id, Cases.case_id))
     query = Cases.query.filter(*conditions)
 
-    if case_tags is not None:
-        return query.join(Tags, Tags.tag_title.ilike(f'%{case_tags}%')).filter(CaseTags.case_id == Cases.case_id)
-
     if sort_by is not None:
         order_func = convert_sort_direction(sort_dir)
 
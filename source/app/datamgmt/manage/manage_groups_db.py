@@ -22,7 +22,8 @@ from app.datamgmt.case.case_db import get_case
 from app.datamgmt.manage.manage_cases_db import list_cases_id
 from app.iris_engine.access_control.utils import ac_access_level_mask_from_val_list, ac_ldp_group_removal
 from app.iris_engine.access_control.utils import ac_access_level_to_list
-from app.iris_engine.access_control.utils import ac_auto_update_user_effective_access
+from app.iris_engine.access_control.utils import ac_recompute_effective_access
+from app.iris_engine.access_control.utils import ac_recompute_groups_effective_access
 from app.iris_engine.access_control.utils import ac_permission_to_list
 from app.models.cases import Cases
 from app.models.authorization import Group
@@ -174,8 +175,8 @@ def update_group_members(group, members):
             db.session.add(ug)
 
         db.session.commit()
-        ac_auto_update_user_effective_access(uid)
 
+    updated_users = list(users_to_add)
     for uid in users_to_remove:
         if current_user.id == uid and ac_ldp_group_removal(uid, group.group_id):
             continue
@@ -186,7 +187,9 @@ def update_group_members(group, members):
         ).delete()
 
         db.session.commit()
-        ac_auto_update_user_effective_access(uid)
+        updated_users.append(uid)
+
+    ac_recompute_groups_effective_access([group.group_id], updated_users)
 
     return group
 
@@ -201,7 +204,7 @@ def remove_user_from_group(group, member):
     ).delete()
     db.session.commit()
 
-    ac_auto_update_user_effective_access(member.id)
+    ac_recompute_groups_effective_access([group.group_id], [member.id])
 
     return group
 
@@ -210,12 +213,22 @@ def delete_group(group):
     if not group:
         return None
 
+    members = UserGroup.query.with_entities(
+        UserGroup.user_id
+    ).filter(UserGroup.group_id == group.group_id).all()
+    cases = GroupCaseAccess.query.with_entities(
+        GroupCaseAccess.case_id
+    ).filter(GroupCaseAccess.group_id == group.group_id).all()
+
     UserGroup.query.filter(UserGroup.group_id == group.group_id).delete()
     GroupCaseAccess.query.filter(GroupCaseAccess.group_id == group.group_id).delete()
 
     db.session.delete(group)
     db.session.commit()
 
+    ac_recompute_effective_access(user_ids=[member.user_id for member in members],
+                                  case_ids=[case.case_id for case in cases])
+
 
 def add_case_access_to_group(group, cases_list, access_level):
     if not group:
@@ -1,6 +1,8 @@
+import datetime
 from functools import reduce
 
 from sqlalchemy import and_
+from sqlalchemy.dialects.postgresql import insert
 
 import app
 from app.models.models import Tags
@@ -84,3 +86,22 @@ def add_db_tag(tag_title, tag_namespace=None):
 
     return tag
 
+
+
+def add_db_tags(tags_titles):
+    """
+    Adds the missing tags to the database, in a single statement. The caller commits.
+
+    :param tags_titles: Tags titles
+    :return: Nothing
+    """
+    tags_titles = {tag_title for tag_title in tags_titles if tag_title}
+    if not tags_titles:
+        return
+
+    app.db.session.execute(insert(Tags).values([
+        {
+            'tag_title': tag_title,
+            'tag_creation_date': datetime.datetime.now()
+        } for tag_title in tags_titles
+    ]).on_conflict_do_nothing(index_elements=['tag_title']))
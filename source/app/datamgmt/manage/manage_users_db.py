@@ -27,10 +27,14 @@ from app import bc
 from app import db
 from app.datamgmt.case.case_db import get_case
 from app.datamgmt.conversions import convert_sort_direction
+from app.iris_engine.access_control.case_access_cache import case_access_cache_invalidate
 from app.iris_engine.access_control.utils import ac_access_level_mask_from_val_list
 from app.iris_engine.access_control.utils import ac_ldp_group_removal
 from app.iris_engine.access_control.utils import ac_access_level_to_list
 from app.iris_engine.access_control.utils import ac_auto_update_user_effective_access
+from app.iris_engine.access_control.utils import ac_recompute_clients_effective_access
+from app.iris_engine.access_control.utils import ac_recompute_effective_access
+from app.iris_engine.access_control.utils import ac_recompute_groups_effective_access
 from app.iris_engine.access_control.utils import ac_get_detailed_effective_permissions_from_groups
 from app.iris_engine.access_control.utils import ac_remove_case_access_from_user
 from app.iris_engine.access_control.utils import ac_set_case_access_for_user
@@ -114,6 +118,7 @@ def update_user_groups(user_id, groups):
 
     groups_to_add = set_new_groups - set_cur_groups
     groups_to_remove = set_cur_groups - set_new_groups
+    updated_groups = list(groups_to_add)
 
     for group_id in groups_to_add:
         user_group = UserGroup()
@@ -129,10 +134,11 @@ def update_user_groups(user_id, groups):
             UserGroup.user_id == user_id,
             UserGroup.group_id == group_id
         ).delete()
+        updated_groups.append(group_id)
 
     db.session.commit()
 
-    ac_auto_update_user_effective_access(user_id)
+    ac_recompute_groups_effective_access(updated_groups, [user_id])
 
 def add_user_to_customer(user_id, customer_id):
     user_client = UserClient.query.filter(
@@ -151,7 +157,7 @@ def add_user_to_customer(user_id, customer_id):
     db.session.add(user_client)
     db.session.commit()
 
-    ac_auto_update_user_effective_access(user_id)
+    ac_recompute_clients_effective_access([customer_id], [user_id])
 
     return True
 
@@ -182,10 +188,10 @@ def update_user_customers(user_id, customers):
             UserClient.client_id == client_id
         ).delete()
 
-    ac_auto_update_user_effective_access(user_id)
-
     db.session.commit()
 
+    ac_recompute_clients_effective_access(customers_to_add | customers_to_remove, [user_id])
+
 
 def update_user_orgs(user_id, orgs):
     cur_orgs = UserOrganisation.query.with_entities(
@@ -393,18 +399,6 @@ def get_user_clients(user_id: int) -> List[Client]:
     return clients_out
 
 
-def get_user_cases_fast(user_id):
-
-    user_cases = UserCaseEffectiveAccess.query.with_entities(
-        UserCaseEffectiveAccess.case_id
-    ).where(
-        UserCaseEffectiveAccess.user_id == user_id,
-        UserCaseEffectiveAccess.access_level != CaseAccessLevel.deny_all.value
-    ).all()
-
-    return [c.case_id for c  in user_cases]
-
-
 def remove_cases_access_from_user(user_id, cases_list):
     if not user_id or type(user_id) is not int:
         return False, 'Invalid user id'
@@ -420,7 +414,7 @@ def remove_cases_access_from_user(user_id, cases_list):
 
     db.session.commit()
 
-    ac_auto_update_user_effective_access(user_id)
+    ac_recompute_effective_access(user_ids=[user_id], case_ids=cases_list)
     return True, 'Cases access removed'
 
 
@@ -541,7 +535,7 @@ def add_case_access_to_user(user, cases_list, access_level):
         db.session.add(oca)
 
     db.session.commit()
-    ac_auto_update_user_effective_access(user.id)
+    ac_recompute_effective_access(user_ids=[user.id], case_ids=cases_list)
 
     return user, "Updated"
 
@@ -716,6 +710,7 @@ def delete_user(user_id):
 
     User.query.filter(User.id == user_id).delete()
     db.session.commit()
+    case_access_cache_invalidate(user_ids=[user_id])
 
 
 def user_exists(user_name, user_email):
@@ -17,9 +17,10 @@
 #  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 import datetime
 from sqlalchemy import and_
+from sqlalchemy.orm import selectinload
 
-from app.datamgmt.case.case_tasks_db import get_tasks_cases_mapping
-from app.datamgmt.manage.manage_cases_db import user_list_cases_view
+from app.datamgmt.authorization import user_cases_access_condition
+from app.datamgmt.case.case_tasks_db import get_tasks_status_count_by_case
 from app.models.cases import Cases
 from app.schema.marshables import CaseDetailsSchema
 
@@ -28,37 +29,42 @@ def get_overview_db(user_id, show_full):
     """
     Get overview data from the database
     """
-    condition = and_(Cases.case_id.in_(user_list_cases_view(user_id)))
+    condition = user_cases_access_condition(user_id, Cases.case_id)
 
     if not show_full:
         condition = and_(condition, Cases.close_date == None)
 
+    # The relationships dumped by CaseDetailsSchema are loaded for all the cases at once
     open_cases = Cases.query.filter(
        condition
     ).join(
         Cases.owner
     ).join(
         Cases.client
+    ).options(
+        selectinload(Cases.client),
+        selectinload(Cases.owner),
+        selectinload(Cases.user),
+        selectinload(Cases.reviewer),
+        selectinload(Cases.classification),
+        selectinload(Cases.state),
+        selectinload(Cases.tags),
+        selectinload(Cases.review_status),
+        selectinload(Cases.severity),
+        selectinload(Cases.alerts)
     ).all()
 
     cases_list = []
-    tasks_map = get_tasks_cases_mapping(open_cases_only=not show_full)
-    tmap = {}
-    for task in tasks_map:
-        if tmap.get(task.task_case_id) is None:
-            tmap[task.task_case_id] = {
-                'open_tasks': 0,
-                'closed_tasks': 0
-            }
+    tmap = {
+        task_count.task_case_id: {
+            'open_tasks': task_count.open_tasks,
+            'closed_tasks': task_count.closed_tasks
+        } for task_count in get_tasks_status_count_by_case(condition)
+    }
 
-        if task.task_status_id in [1, 2, 3]:
-            tmap[task.task_case_id]['open_tasks'] += 1
-        elif task.task_status_id == 4:
-            tmap[task.task_case_id]['closed_tasks'] += 1
-
-    # open_cases_list = []
+    case_schema = CaseDetailsSchema()
     for case in open_cases:
-        c_case = CaseDetailsSchema().dump(case)
+        c_case = case_schema.dump(case)
         c_case['case_open_since_days'] = (datetime.date.today() - case.open_date).days
         c_case['tasks_status'] = tmap.get(case.case_id)
         cases_list.append(c_case)
@@ -0,0 +1,313 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# Loads the data of a case for its exports and reports. Each collection is fetched along with its links in a constant
+# number of queries, whatever the size of the case, and the links are attached to their objects in memory.
+from collections import defaultdict
+from sqlalchemy import desc
+from sqlalchemy.orm import selectinload
+
+from app.datamgmt.reporter.report_db import process_md_images_links_for_report
+from app.models.authorization import User
+from app.models.cases import CasesEvent
+from app.models.models import AnalysisStatus
+from app.models.models import AssetsType
+from app.models.models import CaseAssets
+from app.models.models import CaseEventsAssets
+from app.models.models import CaseEventsIoc
+from app.models.models import CaseTasks
+from app.models.models import Comments
+from app.models.models import CompromiseStatus
+from app.models.models import EventCategory
+from app.models.models import Ioc
+from app.models.models import IocAssetLink
+from app.models.models import IocType
+from app.models.models import Notes
+from app.models.models import NotesComments
+from app.models.models import TaskAssignee
+from app.models.models import TaskStatus
+from app.models.models import Tlp
+from app.schema.marshables import CaseNoteSchema
+from app.schema.marshables import CommentSchema
+from app.schema.marshables import IocSchema
+
+
+def _group_by(rows, key: str) -> dict:
+    groups = defaultdict(list)
+    for row in rows:
+        row = row._asdict()
+        groups[row.pop(key)].append(row)
+
+    return groups
+
+
+class ReportDataLoader(object):
+    """
+    Batched loader of the data of a case, shared by the JSON export and the DOCX and Markdown reports
+    """
+
+    def __init__(self, case_id):
+        self._case_id = case_id
+
+    def timeline(self) -> list:
+        """
+        Events of the case, in chronological order, with the names of their assets and their IOCs. Three queries.
+
+        returns:
+            list: The events as dicts
+        """
+        timeline = CasesEvent.query.with_entities(
+            CasesEvent.event_id,
+            CasesEvent.event_title,
+            CasesEvent.event_in_summary,
+            CasesEvent.event_date,
+            CasesEvent.event_tz,
+            CasesEvent.event_date_wtz,
+            CasesEvent.event_content,
+            CasesEvent.event_tags,
+            CasesEvent.event_source,
+            CasesEvent.event_raw,
+            CasesEvent.custom_attributes,
+            EventCategory.name.label('category'),
+            User.name.label('last_edited_by'),
+            CasesEvent.event_uuid,
+            CasesEvent.event_in_graph,
+            CasesEvent.event_in_summary,
+            CasesEvent.event_color,
+            CasesEvent.event_is_flagged
+        ).filter(
+            CasesEvent.case_id == self._case_id
+        ).order_by(
+            CasesEvent.event_date
+        ).join(
+            CasesEvent.user
+        ).outerjoin(
+            CasesEvent.category
+        ).all()
+
+        events_assets = _group_by(CaseEventsAssets.query.with_entities(
+            CaseEventsAssets.event_id,
+            CaseAssets.asset_name,
+            AssetsType.asset_name.label('type')
+        ).filter(
+            CaseEventsAssets.case_id == self._case_id
+        ).join(
+            CaseEventsAssets.asset
+        ).join(
+            CaseAssets.asset_type
+        ).order_by(
+            CaseEventsAssets.id
+        ).all(), 'event_id')
+
+        events_iocs = _group_by(CaseEventsIoc.query.with_entities(
+            CaseEventsIoc.event_id,
+            CaseEventsIoc.ioc_id,
+            Ioc.ioc_value,
+            Ioc.ioc_description,
+            Tlp.tlp_name,
+            IocType.type_name.label('type')
+        ).filter(
+            CaseEventsIoc.case_id == self._case_id
+        ).join(
+            CaseEventsIoc.ioc
+        ).join(
+            Ioc.ioc_type
+        ).join(
+            Ioc.tlp
+        ).order_by(
+            CaseEventsIoc.id
+        ).all(), 'event_id')
+
+        tim = []
+        for row in timeline:
+            ras = row._asdict()
+            ras['assets'] = [f"{asset['asset_name']} ({asset['type']})" for asset in events_assets[row.event_id]]
+            ras['iocs'] = events_iocs[row.event_id]
+
+            tim.append(ras)
+
+        return tim
+
+    def assets(self) -> list:
+        """
+        Assets of the case, the compromised first, with their IOCs. Two queries.
+
+        returns:
+            list: The assets as dicts
+        """
+        res = CaseAssets.query.with_entities(
+            CaseAssets.asset_id,
+            CaseAssets.asset_uuid,
+            CaseAssets.asset_name,
+            CaseAssets.asset_description,
+            CaseAssets.asset_compromise_status_id,
+            AssetsType.asset_name.label("type"),
+            AnalysisStatus.name.label('analysis_status'),
+            CaseAssets.date_added,
+            CaseAssets.asset_domain,
+            CaseAssets.asset_ip,
+            CaseAssets.asset_info,
+            CaseAssets.asset_tags,
+            CaseAssets.custom_attributes
+        ).filter(
+            CaseAssets.case_id == self._case_id
+        ).join(
+            CaseAssets.asset_type
+        ).join(
+            CaseAssets.analysis_status
+        ).order_by(desc(CaseAssets.asset_compromise_status_id)).all()
+
+        assets_iocs = _group_by(IocAssetLink.query.with_entities(
+            IocAssetLink.asset_id,
+            Ioc.ioc_value,
+            IocType.type_name,
+            Ioc.ioc_description
+        ).join(
+            IocAssetLink.asset
+        ).join(
+            IocAssetLink.ioc
+        ).join(
+            Ioc.ioc_type
+        ).filter(
+            CaseAssets.case_id == self._case_id
+        ).order_by(
+            IocAssetLink.ioc_asset_link_id
+        ).all(), 'asset_id')
+
+        ret = []
+        for row in res:
+            row = row._asdict()
+            row['light_asset_description'] = row['asset_description']
+            row['asset_ioc'] = assets_iocs[row['asset_id']]
+
+            if row['asset_compromise_status_id'] is None:
+                row['asset_compromise_status_id'] = CompromiseStatus.unknown.value
+                status_text = CompromiseStatus.unknown.name.replace('_', ' ').title()
+            else:
+                status_text = CompromiseStatus(row['asset_compromise_status_id']).name.replace('_', ' ').title()
+
+            row['asset_compromise_status'] = status_text
+
+            ret.append(row)
+
+        return ret
+
+    def iocs(self) -> list:
+        """
+        IOCs of the case, with their type. Two queries.
+
+        returns:
+            list: The IOCs as dumped by IocSchema
+        """
+        iocs = Ioc.query.filter(
+            Ioc.case_id == self._case_id
+        ).options(
+            selectinload(Ioc.ioc_type)
+        ).all()
+
+        return IocSchema().dump(iocs, many=True)
+
+    def tasks(self) -> list:
+        """
+        Tasks of the case, with their assignees. Two queries.
+
+        returns:
+            list: The tasks as dicts
+        """
+        res = CaseTasks.query.with_entities(
+            CaseTasks.task_title,
+            TaskStatus.status_name.label('task_status'),
+            CaseTasks.task_tags,
+            CaseTasks.task_open_date,
+            CaseTasks.task_close_date,
+            CaseTasks.task_last_update,
+            CaseTasks.task_description,
+            CaseTasks.custom_attributes,
+            CaseTasks.task_uuid,
+            CaseTasks.id
+        ).filter(
+            CaseTasks.task_case_id == self._case_id
+        ).join(
+            CaseTasks.status
+        ).all()
+
+        assignees = _group_by(TaskAssignee.query.with_entities(
+            TaskAssignee.task_id,
+            User.user,
+            User.name,
+            User.id
+        ).join(
+            TaskAssignee.user
+        ).join(
+            CaseTasks, CaseTasks.id == TaskAssignee.task_id
+        ).filter(
+            CaseTasks.task_case_id == self._case_id
+        ).all(), 'task_id')
+
+        tasks = []
+        for row in res:
+            task = row._asdict()
+            task['task_assignees'] = assignees[task['id']]
+            tasks.append(task)
+
+        return tasks
+
+    def notes(self) -> list:
+        """
+        Notes of the case, with their directory and comments. Four queries.
+
+        returns:
+            list: The notes as dumped by CaseNoteSchema
+        """
+        notes = Notes.query.filter(
+            Notes.note_case_id == self._case_id
+        ).options(
+            selectinload(Notes.directory)
+        ).all()
+
+        comments = Comments.query.with_entities(
+            NotesComments.comment_note_id,
+            Comments
+        ).join(
+            NotesComments, Comments.comment_id == NotesComments.comment_id
+        ).join(
+            Notes, Notes.note_id == NotesComments.comment_note_id
+        ).filter(
+            Notes.note_case_id == self._case_id
+        ).options(
+            selectinload(Comments.user)
+        ).order_by(
+            Comments.comment_date.asc()
+        ).all()
+
+        notes_comments = defaultdict(list)
+        for note_id, comment in comments:
+            notes_comments[note_id].append(comment)
+
+        note_schema = CaseNoteSchema()
+        comments_schema = CommentSchema(many=True)
+
+        serialized_notes = []
+        for note in notes:
+            serialized_note = note_schema.dump(note)
+            serialized_note['comments'] = comments_schema.dump(notes_comments[note.note_id])
+            serialized_note["note_content"] = process_md_images_links_for_report(serialized_note["note_content"])
+
+            serialized_notes.append(serialized_note)
+
+        return serialized_notes
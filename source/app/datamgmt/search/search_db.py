@@ -0,0 +1,206 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from sqlalchemy import and_
+from sqlalchemy import desc
+from sqlalchemy import func
+from sqlalchemy import literal_column
+from sqlalchemy import or_
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from app.datamgmt.authorization import user_cases_access_condition
+from app.models.cases import Cases
+from app.models.cases import CasesEvent
+from app.models.models import CaseAssets
+from app.models.models import Client
+from app.models.models import Comments
+from app.models.models import Ioc
+from app.models.models import IocType
+from app.models.models import Notes
+from app.models.models import Tlp
+
+# Must match the configuration used by the search_vector triggers
+SEARCH_TEXT_CONFIGURATION = 'simple'
+
+_SUBSTRING_MIN_LENGTH = 3
+
+
+def _search_vector(table_name):
+    # The search vectors are maintained by triggers and not mapped, so they are never loaded with the objects
+    return literal_column(f'{table_name}.search_vector', type_=TSVECTOR)
+
+
+def _search_query(search_value):
+    return func.websearch_to_tsquery(SEARCH_TEXT_CONFIGURATION, search_value)
+
+
+def _search_condition(search_vector, query, substring_columns, search_value):
+    condition = search_vector.op('@@')(query)
+    # The words of the full text search are whole tokens, so the partial IPs, hostnames or hashes are also searched
+    # as substrings. The trigram indexes only serve the patterns of at least 3 characters
+    if len(search_value) < _SUBSTRING_MIN_LENGTH:
+        return condition
+
+    pattern = '%{}%'.format(search_value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_'))
+    return or_(condition, *(column.ilike(pattern, escape='\\') for column in substring_columns))
+
+
+def _search_text(model, table_name, case_id_column, entities, substring_columns, search_value, user_id, page,
+                 per_page, client_name_label='client_name'):
+    search_vector = _search_vector(table_name)
+    query = _search_query(search_value)
+    rank = func.ts_rank_cd(search_vector, query).label('rank')
+
+    res = model.query.with_entities(
+        *entities,
+        Cases.name.label('case_name'),
+        Client.name.label(client_name_label),
+        Cases.case_id,
+        rank
+    ).join(
+        Cases, Cases.case_id == case_id_column
+    ).join(
+        Client, Client.client_id == Cases.client_id
+    ).filter(
+        _search_condition(search_vector, query, substring_columns, search_value),
+        user_cases_access_condition(user_id, Cases.case_id)
+    ).order_by(
+        desc(rank), model.__mapper__.primary_key[0]
+    ).limit(per_page).offset((page - 1) * per_page).all()
+
+    return [row._asdict() for row in res]
+
+
+def search_iocs(search_value, user_id, page, per_page):
+    """
+    Search the IOCs by value, in the cases the user can access
+
+    args:
+        search_value (str): LIKE pattern of the value
+        user_id (int): The user searching
+        page (int): The page of results
+        per_page (int): The number of results per page
+
+    returns:
+        list: The matching IOCs
+    """
+    res = Ioc.query.with_entities(
+        Ioc.ioc_value.label('ioc_name'),
+        Ioc.ioc_description.label('ioc_description'),
+        Ioc.ioc_misp,
+        IocType.type_name,
+        Tlp.tlp_name,
+        Tlp.tlp_bscolor,
+        Cases.name.label('case_name'),
+        Cases.case_id,
+        Client.name.label('customer_name')
+    ).filter(
+        and_(
+            Ioc.ioc_value.like(search_value),
+            Ioc.case_id == Cases.case_id,
+            Client.client_id == Cases.client_id,
+            Ioc.ioc_tlp_id == Tlp.tlp_id,
+            user_cases_access_condition(user_id, Cases.case_id)
+        )
+    ).join(
+        Ioc.ioc_type
+    ).order_by(
+        Ioc.ioc_value, Ioc.ioc_id
+    ).limit(per_page).offset((page - 1) * per_page).all()
+
+    return [row._asdict() for row in res]
+
+
+def search_notes(search_value, user_id, page, per_page):
+    """
+    Search the titles and contents of the notes, in the cases the user can access. The results are ranked,
+    a match in the title weighing more than a match in the content
+
+    args:
+        search_value (str): Words to search, with the web search syntax (quoted phrases, or, -excluded), or a substring
+        user_id (int): The user searching
+        page (int): The page of results
+        per_page (int): The number of results per page
+
+    returns:
+        list: The matching notes
+    """
+    return _search_text(Notes, 'notes', Notes.note_case_id, [
+        Notes.note_id,
+        Notes.note_title
+    ], [Notes.note_title, Notes.note_content], search_value, user_id, page, per_page)
+
+
+def search_comments(search_value, user_id, page, per_page):
+    """
+    Search the comments, in the cases the user can access. The results are ranked
+
+    args:
+        search_value (str): Words to search, with the web search syntax (quoted phrases, or, -excluded), or a substring
+        user_id (int): The user searching
+        page (int): The page of results
+        per_page (int): The number of results per page
+
+    returns:
+        list: The matching comments
+    """
+    return _search_text(Comments, 'comments', Comments.comment_case_id, [
+        Comments.comment_id,
+        Comments.comment_text
+    ], [Comments.comment_text], search_value, user_id, page, per_page, client_name_label='customer_name')
+
+
+def search_events(search_value, user_id, page, per_page):
+    """
+    Search the titles, contents and raw data of the timeline events, in the cases the user can access.
+    The results are ranked, from the title to the raw data
+
+    args:
+        search_value (str): Words to search, with the web search syntax (quoted phrases, or, -excluded), or a substring
+        user_id (int): The user searching
+        page (int): The page of results
+        per_page (int): The number of results per page
+
+    returns:
+        list: The matching events
+    """
+    return _search_text(CasesEvent, 'cases_events', CasesEvent.case_id, [
+        CasesEvent.event_id,
+        CasesEvent.event_title,
+        CasesEvent.event_date
+    ], [CasesEvent.event_title, CasesEvent.event_content, CasesEvent.event_raw], search_value, user_id, page, per_page)
+
+
+def search_assets(search_value, user_id, page, per_page):
+    """
+    Search the names and descriptions of the assets, in the cases the user can access. The results are ranked
+
+    args:
+        search_value (str): Words to search, with the web search syntax (quoted phrases, or, -excluded), or a substring
+        user_id (int): The user searching
+        page (int): The page of results
+        per_page (int): The number of results per page
+
+    returns:
+        list: The matching assets
+    """
+    return _search_text(CaseAssets, 'case_assets', CaseAssets.case_id, [
+        CaseAssets.asset_id,
+        CaseAssets.asset_name,
+        CaseAssets.asset_description
+    ], [CaseAssets.asset_name, CaseAssets.asset_description], search_value, user_id, page, per_page)
@@ -19,6 +19,7 @@
 from datetime import datetime
 from flask_login import current_user
 from sqlalchemy import and_
+from sqlalchemy import func
 
 from app import db
 from app.models.models import ObjectState
@@ -129,3 +130,116 @@ def update_notes_state(caseid, userid=None):
 
 def get_notes_state(caseid):
     return get_object_state('notes', caseid=caseid)
+
+
+def _update_global_object_state(object_name) -> ObjectState:
+    """
+    Bump the version of a state which is not attached to a case. Expects a db commit soon after
+
+    Args:
+        object_name: name of the object to update
+
+    Returns:
+        ObjectState object
+    """
+    os = ObjectState.query.filter(and_(
+        ObjectState.object_name == object_name,
+        ObjectState.object_case_id.is_(None)
+    )).first()
+    if os:
+        os.object_last_update = datetime.utcnow()
+        os.object_state = os.object_state + 1
+
+    else:
+        os = ObjectState()
+        os.object_name = object_name
+        os.object_state = 0
+        os.object_last_update = datetime.utcnow()
+
+        db.session.add(os)
+
+    return os
+
+
+def _get_global_object_state_version(object_name):
+    return db.session.query(ObjectState.object_state).filter(and_(
+        ObjectState.object_name == object_name,
+        ObjectState.object_case_id.is_(None)
+    )).scalar()
+
+
+def update_modules_hooks_state():
+    return _update_global_object_state('modules_hooks')
+
+
+def get_modules_hooks_state_version():
+    return _get_global_object_state_version('modules_hooks')
+
+
+def update_module_config_state(module_name):
+    return _update_global_object_state(f'module_config:{module_name}')
+
+
+def get_modules_config_states_versions():
+    """
+    Returns the configuration state version of every module which configuration was changed at least once
+
+    Returns:
+        dict of module name -> version
+    """
+    states = db.session.query(
+        ObjectState.object_name,
+        ObjectState.object_state
+    ).filter(and_(
+        ObjectState.object_name.startswith('module_config:'),
+        ObjectState.object_case_id.is_(None)
+    )).all()
+
+    return {state.object_name.split(':', 1)[1]: state.object_state for state in states}
+
+
+def get_cases_state_version():
+    """
+    Returns the version of the cases state. The state is bumped in the database whenever cases are created, updated
+    or deleted
+
+    Returns:
+        int or None if the cases never changed
+    """
+    return _get_global_object_state_version('cases')
+
+
+def get_case_access_state_version(user_id):
+    """
+    Returns the version of the effective cases access of a user. The state is bumped in the database
+    whenever the user_case_effective_access rows of the user change
+
+    Args:
+        user_id: id of the user
+
+    Returns:
+        int or None if the access of the user never changed
+    """
+    return _get_global_object_state_version(f'case_access:{user_id}')
+
+
+def get_objects_states_version(object_names) -> str:
+    """
+    Returns a version of the states of the given objects across all the cases, along with their global states.
+    It changes whenever one of the states is updated, created or deleted
+
+    Args:
+        object_names: names of the objects
+
+    Returns:
+        str
+    """
+    version = db.session.query(
+        func.count(ObjectState.object_id),
+        func.coalesce(func.sum(ObjectState.object_state), 0),
+        func.max(ObjectState.object_last_update)
+    ).filter(
+        ObjectState.object_name.in_(object_names)
+    ).one()
+
+    return ':'.join(str(value) for value in version)
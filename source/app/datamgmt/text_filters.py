@@ -0,0 +1,68 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# Plans the predicates of the free text filters, so that they can be served by the pg_trgm GIN indexes of the
+# filtered columns. A trigram index serves any LIKE pattern holding at least one full trigram, but substring patterns
+# shorter than three characters degrade into a scan of the whole index.
+
+_LIKE_ESCAPE = '\\'
+_TRIGRAM_MIN_LENGTH = 3
+
+
+def _escape_like(value: str) -> str:
+    return value.replace(_LIKE_ESCAPE, _LIKE_ESCAPE * 2).replace('%', f'{_LIKE_ESCAPE}%').replace(
+        '_', f'{_LIKE_ESCAPE}_')
+
+
+def text_filter(column, value: str, case_sensitive: bool = False):
+    """
+    Build the predicate filtering a text column on a value entered by a user
+
+    - a value within double quotes, or shorter than three characters, matches the whole column
+    - any other value matches a substring of the column
+
+    The LIKE wildcards of the value are matched literally.
+
+    args:
+        column: The column to filter
+        value (str): The value entered by the user
+        case_sensitive (bool): Whether the case of the value matters
+
+    returns:
+        The SQLAlchemy predicate
+    """
+    value = str(value)
+
+    if len(value) >= 2 and value.startswith('"') and value.endswith('"'):
+        value = value[1:-1]
+        exact_match = True
+    else:
+        exact_match = len(value) < _TRIGRAM_MIN_LENGTH
+
+    if exact_match and case_sensitive:
+        # Also served by the b-tree indexes
+        return column == value
+
+    pattern = _escape_like(value)
+    if not exact_match:
+        pattern = f'%{pattern}%'
+
+    if case_sensitive:
+        return column.like(pattern, escape=_LIKE_ESCAPE)
+
+    return column.ilike(pattern, escape=_LIKE_ESCAPE)
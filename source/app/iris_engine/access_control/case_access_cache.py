@@ -0,0 +1,213 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# Cache of the case access decisions, keyed by (user_id, case_id), and of the existence of the cases.
+# Entries are kept for the duration of the request in flask.g, and in the process for ACCESS_CONTROL_CACHE_TTL
+# seconds. The ac_* mutators drop the entries they affect in the current process. The process entries also hold the
+# version of the case_access:<user_id> or cases state they were computed at. These states are bumped by the database,
+# so an entry is dropped as soon as another process changed the access of its user or the cases.
+import threading
+import time
+from flask import g
+from flask import has_app_context
+
+from app import app
+from app.datamgmt.states import get_case_access_state_version
+from app.datamgmt.states import get_cases_state_version
+
+_CASE_ACCESS_CACHE_MAX_ENTRIES = 50000
+
+# Returned by the getters when the decision is not in the cache, as None is a valid cached decision
+CASE_ACCESS_NOT_CACHED = object()
+
+_lock = threading.Lock()
+_case_access = {}
+_case_exists = {}
+
+
+def _case_access_cache_ttl():
+    return app.config.get('ACCESS_CONTROL_CACHE_TTL')
+
+
+def _cache_id(identifier):
+    # Identifiers read from the request data may be strings, while the mutators use integers
+    try:
+        return int(identifier)
+    except (TypeError, ValueError):
+        return identifier
+
+
+def _request_cache(name):
+    if not has_app_context():
+        return None
+
+    cache = g.get(name)
+    if cache is None:
+        cache = {}
+        setattr(g, name, cache)
+
+    return cache
+
+
+def _state_version(state_name, get_version):
+    # Read once per request, the changes made by the request itself are handled by case_access_cache_invalidate
+    versions = _request_cache('_case_access_states')
+    if versions is not None and state_name in versions:
+        return versions[state_name]
+
+    version = get_version()
+    if versions is not None:
+        versions[state_name] = version
+
+    return version
+
+
+def _case_access_version(user_id):
+    return _state_version(f'case_access:{user_id}', lambda: get_case_access_state_version(user_id))
+
+
+def _cases_version():
+    return _state_version('cases', get_cases_state_version)
+
+
+def _cache_get(process_cache, request_cache_name, key, get_version):
+    request_cache = _request_cache(request_cache_name)
+    if request_cache is not None and key in request_cache:
+        return request_cache[key]
+
+    # Read before the decision is computed on a miss, so that a change made meanwhile is not hidden by the entry
+    current_version = get_version()
+    entry = process_cache.get(key)
+    if entry is None:
+        return CASE_ACCESS_NOT_CACHED
+
+    value, expires_at, version = entry
+    if expires_at <= time.monotonic() or version != current_version:
+        with _lock:
+            process_cache.pop(key, None)
+        return CASE_ACCESS_NOT_CACHED
+
+    if request_cache is not None:
+        request_cache[key] = value
+
+    return value
+
+
+def _cache_set(process_cache, request_cache_name, key, value, get_version):
+    request_cache = _request_cache(request_cache_name)
+    if request_cache is not None:
+        request_cache[key] = value
+
+    ttl = _case_access_cache_ttl()
+    if ttl <= 0:
+        return
+
+    version = get_version()
+    with _lock:
+        if len(process_cache) >= _CASE_ACCESS_CACHE_MAX_ENTRIES:
+            process_cache.clear()
+        process_cache[key] = (value, time.monotonic() + ttl, version)
+
+
+def case_access_cache_get(user_id, case_id):
+    """
+    Get the cached access decision of a user to a case
+
+    :param user_id: ID of the user
+    :param case_id: ID of the case
+    :return: Tuple (access level, whether the access level is still to be matched against the requested levels), None
+             if the user has no access, or CASE_ACCESS_NOT_CACHED
+    """
+    return _cache_get(_case_access, '_case_access_cache', (_cache_id(user_id), _cache_id(case_id)),
+                      lambda: _case_access_version(_cache_id(user_id)))
+
+
+def case_access_cache_set(user_id, case_id, decision):
+    """
+    Cache the access decision of a user to a case
+
+    :param user_id: ID of the user
+    :param case_id: ID of the case
+    :param decision: Decision, as returned by case_access_cache_get
+    """
+    _cache_set(_case_access, '_case_access_cache', (_cache_id(user_id), _cache_id(case_id)), decision,
+               lambda: _case_access_version(_cache_id(user_id)))
+
+
+def case_exists_cache_get(case_id):
+    """
+    Get the cached existence of a case
+
+    :param case_id: ID of the case
+    :return: True if the case is known to exist, CASE_ACCESS_NOT_CACHED otherwise
+    """
+    return _cache_get(_case_exists, '_case_exists_cache', _cache_id(case_id), _cases_version)
+
+
+def case_exists_cache_set(case_id):
+    """
+    Cache that a case exists. Missing cases are not cached, so that a case created right after the lookup is seen at
+    once
+
+    :param case_id: ID of the case
+    """
+    _cache_set(_case_exists, '_case_exists_cache', _cache_id(case_id), True, _cases_version)
+
+
+def case_access_cache_invalidate(user_ids=None, case_ids=None):
+    """
+    Drop the cached decisions of the given users and cases in the current process and request. Without any user or
+    case, all the decisions are dropped
+
+    :param user_ids: IDs of the users, or None to match all the users
+    :param case_ids: IDs of the cases, or None to match all the cases. The existence of these cases is dropped as well
+    """
+    user_ids = {_cache_id(user_id) for user_id in user_ids} if user_ids is not None else None
+    case_ids = {_cache_id(case_id) for case_id in case_ids} if case_ids is not None else None
+
+    def _matches(key):
+        user_id, case_id = key
+        return (user_ids is None or user_id in user_ids) and (case_ids is None or case_id in case_ids)
+
+    caches = [_case_access]
+    request_cache = _request_cache('_case_access_cache')
+    if request_cache is not None:
+        caches.append(request_cache)
+
+    exists_caches = [_case_exists]
+    request_exists_cache = _request_cache('_case_exists_cache')
+    if request_exists_cache is not None:
+        exists_caches.append(request_exists_cache)
+
+    # The states bumped by these changes are read again by the next lookups of the request
+    request_versions = _request_cache('_case_access_states')
+    if request_versions is not None:
+        request_versions.clear()
+
+    with _lock:
+        for cache in caches:
+            if user_ids is None and case_ids is None:
+                cache.clear()
+                continue
+            for key in [key for key in cache if _matches(key)]:
+                cache.pop(key, None)
+
+        if case_ids is not None:
+            for cache in exists_caches:
+                for case_id in case_ids:
+                    cache.pop(case_id, None)
@@ -1,10 +1,19 @@
 from flask import session
 from flask_login import current_user
 from sqlalchemy import and_
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import select
+from sqlalchemy import true
+from sqlalchemy.dialects.postgresql import insert
 
 import app
 from app import db
 from app.datamgmt.manage.manage_access_control_db import check_ua_case_client
+from app.iris_engine.access_control.case_access_cache import CASE_ACCESS_NOT_CACHED
+from app.iris_engine.access_control.case_access_cache import case_access_cache_get
+from app.iris_engine.access_control.case_access_cache import case_access_cache_invalidate
+from app.iris_engine.access_control.case_access_cache import case_access_cache_set
 from app.models.cases import Cases
 from app.models.models import Client
 from app.models.authorization import CaseAccessLevel
@@ -288,11 +297,10 @@ def ac_trace_effective_user_permissions(user_id):
     return perms
 
 
-def ac_fast_check_user_has_case_access(user_id, cid, access_level: list[CaseAccessLevel]):
+def _ac_get_case_access_decision(user_id, cid):
     """
-    Checks the user has access to the case with at least one of the access_level
-    if the user has access, returns the access level of the user to the case
-    Returns None otherwise
+    Returns a tuple (access level of the user to the case, whether it has to match the requested access levels),
+    or None if the user has no access to the case
     """
     ucea = UserCaseEffectiveAccess.query.with_entities(
         UserCaseEffectiveAccess.access_level
@@ -308,14 +316,37 @@ def ac_fast_check_user_has_case_access(user_id, cid, access_level: list[CaseAcce
             return None
         ac_set_case_access_for_user(user_id, cid, cuacu.access_level)
 
-        return cuacu.access_level
+        return cuacu.access_level, False
+
+    return ucea[0], True
+
+
+def ac_fast_check_user_has_case_access(user_id, cid, access_level: list[CaseAccessLevel]):
+    """
+    Checks the user has access to the case with at least one of the access_level
+    if the user has access, returns the access level of the user to the case
+    Returns None otherwise
+    The decisions are cached for the request, and in the process until the access of the user changes or for at most
+    ACCESS_CONTROL_CACHE_TTL seconds
+    """
+    decision = case_access_cache_get(user_id, cid)
+    if decision is CASE_ACCESS_NOT_CACHED:
+        decision = _ac_get_case_access_decision(user_id, cid)
+        case_access_cache_set(user_id, cid, decision)
+
+    if decision is None:
+        return None
+
+    effective_access_level, match_required = decision
+    if not match_required:
+        return effective_access_level
 
-    if ac_flag_match_mask(ucea[0], CaseAccessLevel.deny_all.value):
+    if ac_flag_match_mask(effective_access_level, CaseAccessLevel.deny_all.value):
         return None
 
     for acl in access_level:
-        if ac_flag_match_mask(ucea[0], acl.value):
-            return ucea[0]
+        if ac_flag_match_mask(effective_access_level, acl.value):
+            return effective_access_level
 
     return None
 
@@ -324,12 +355,33 @@ def ac_fast_check_current_user_has_case_access(cid, access_level):
     return ac_fast_check_user_has_case_access(current_user.id, cid, access_level)
 
 
-def ac_recompute_effective_ac_from_users_list(users_list):
+def ac_prefetch_user_cases_access(user_id, case_ids):
     """
-    Recompute all users effective access of users
+    Load in a single query the access decisions of a user to a list of cases, into the cache used by
+    ac_fast_check_user_has_case_access. The cases without an effective access entry are left to the regular check
     """
-    for member in users_list:
-        ac_auto_update_user_effective_access(user_id=member['id'])
+    case_ids = [case_id for case_id in set(case_ids)
+                if case_access_cache_get(user_id, case_id) is CASE_ACCESS_NOT_CACHED]
+    if not case_ids:
+        return
+
+    rows = UserCaseEffectiveAccess.query.with_entities(
+        UserCaseEffectiveAccess.case_id,
+        UserCaseEffectiveAccess.access_level
+    ).filter(
+        UserCaseEffectiveAccess.user_id == user_id,
+        UserCaseEffectiveAccess.case_id.in_(case_ids)
+    ).all()
+
+    for row in rows:
+        case_access_cache_set(user_id, row.case_id, (row.access_level, True))
+
+
+def ac_recompute_effective_ac_from_users_list(users_list, case_ids=None):
+    """
+    Recompute all users effective access of users, limited to case_ids if set
+    """
+    ac_recompute_effective_access(user_ids=[member['id'] for member in users_list], case_ids=case_ids)
 
     return
 
@@ -338,11 +390,7 @@ def ac_recompute_all_users_effective_ac():
     """
     Recompute all users effective access
     """
-    users = User.query.with_entities(
-        User.id
-    ).all()
-    for user_id in users:
-        ac_auto_update_user_effective_access(user_id[0])
+    ac_recompute_effective_access()
 
     return
 
@@ -355,6 +403,153 @@ def ac_recompute_effective_ac(user_id):
     return ac_auto_update_user_effective_access(user_id)
 
 
+def _ac_effective_access_select(user_ids, case_ids):
+    """
+    Build the select of the effective access of the users to the cases, with the same precedence as
+    ac_get_user_cases_access: user access, then client access, then groups access, then deny all.
+    When the user is part of several groups with an access to the case, the highest access level is kept
+    """
+    def _scope(query, user_column, case_column=None):
+        if user_ids is not None:
+            query = query.where(user_column.in_(user_ids))
+        if case_column is not None and case_ids is not None:
+            query = query.where(case_column.in_(case_ids))
+        return query
+
+    users_access = _scope(select(
+        UserCaseAccess.user_id,
+        UserCaseAccess.case_id,
+        func.max(UserCaseAccess.access_level).label('access_level')
+    ), UserCaseAccess.user_id, UserCaseAccess.case_id).group_by(
+        UserCaseAccess.user_id,
+        UserCaseAccess.case_id
+    ).subquery()
+
+    clients_access = _scope(select(
+        UserClient.user_id,
+        UserClient.client_id,
+        func.max(UserClient.access_level).label('access_level')
+    ), UserClient.user_id).group_by(
+        UserClient.user_id,
+        UserClient.client_id
+    ).subquery()
+
+    groups_access = _scope(select(
+        UserGroup.user_id,
+        GroupCaseAccess.case_id,
+        func.max(GroupCaseAccess.access_level).label('access_level')
+    ).join(
+        GroupCaseAccess, GroupCaseAccess.group_id == UserGroup.group_id
+    ), UserGroup.user_id, GroupCaseAccess.case_id).group_by(
+        UserGroup.user_id,
+        GroupCaseAccess.case_id
+    ).subquery()
+
+    query = select(
+        User.id,
+        Cases.case_id,
+        func.coalesce(
+            users_access.c.access_level,
+            clients_access.c.access_level,
+            groups_access.c.access_level,
+            literal(CaseAccessLevel.deny_all.value)
+        )
+    ).select_from(
+        User
+    ).join(
+        Cases, true()
+    ).outerjoin(
+        users_access, and_(users_access.c.user_id == User.id, users_access.c.case_id == Cases.case_id)
+    ).outerjoin(
+        clients_access, and_(clients_access.c.user_id == User.id, clients_access.c.client_id == Cases.client_id)
+    ).outerjoin(
+        groups_access, and_(groups_access.c.user_id == User.id, groups_access.c.case_id == Cases.case_id)
+    )
+
+    return _scope(query, User.id, Cases.case_id)
+
+
+def ac_recompute_effective_access(user_ids=None, case_ids=None):
+    """
+    Recompute the effective access of the given users to the given cases, and only of these pairs.
+    The access levels are computed by the database and written with bulk upserts, one transaction per batch of
+    ACCESS_CONTROL_RECOMPUTE_BATCH_SIZE users, so that the locks are held for a short time.
+
+    :param user_ids: IDs of the users, or None for all the users
+    :param case_ids: IDs of the cases, or None for all the cases
+    :return: Number of effective access rows inserted or updated
+    """
+    if user_ids is not None:
+        user_ids = sorted(set(user_ids))
+    else:
+        user_ids = [row[0] for row in db.session.execute(select(User.id).order_by(User.id)).all()]
+
+    if case_ids is not None:
+        case_ids = sorted(set(case_ids))
+        if not case_ids:
+            return 0
+
+    batch_size = app.app.config.get('ACCESS_CONTROL_RECOMPUTE_BATCH_SIZE')
+    updated_rows = 0
+
+    for index in range(0, len(user_ids), batch_size):
+        users_batch = user_ids[index:index + batch_size]
+
+        stmt = insert(UserCaseEffectiveAccess).from_select(
+            ['user_id', 'case_id', 'access_level'],
+            _ac_effective_access_select(users_batch, case_ids)
+        )
+        # Same comparison as ac_auto_update_user_effective_access used, existing access levels covering the computed
+        # one are left untouched
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['user_id', 'case_id'],
+            set_={'access_level': stmt.excluded.access_level},
+            where=UserCaseEffectiveAccess.access_level.op('&')(stmt.excluded.access_level) != stmt.excluded.access_level
+        )
+
+        updated_rows += db.session.execute(stmt).rowcount
+        db.session.commit()
+        case_access_cache_invalidate(user_ids=users_batch, case_ids=case_ids)
+
+    return updated_rows
+
+
+def ac_recompute_groups_effective_access(group_ids, user_ids):
+    """
+    Recompute the effective access of users which membership to groups changed. Only the cases the groups have an
+    access to are affected
+
+    :param group_ids: IDs of the groups
+    :param user_ids: IDs of the users which joined or left the groups
+    :return: Number of effective access rows inserted or updated
+    """
+    cases = GroupCaseAccess.query.with_entities(
+        GroupCaseAccess.case_id
+    ).filter(
+        GroupCaseAccess.group_id.in_(group_ids)
+    ).distinct().all()
+
+    return ac_recompute_effective_access(user_ids=user_ids, case_ids=[case.case_id for case in cases])
+
+
+def ac_recompute_clients_effective_access(client_ids, user_ids):
+    """
+    Recompute the effective access of users which membership to clients changed. Only the cases of the clients are
+    affected
+
+    :param client_ids: IDs of the clients
+    :param user_ids: IDs of the users which joined or left the clients
+    :return: Number of effective access rows inserted or updated
+    """
+    cases = Cases.query.with_entities(
+        Cases.case_id
+    ).filter(
+        Cases.client_id.in_(client_ids)
+    ).all()
+
+    return ac_recompute_effective_access(user_ids=user_ids, case_ids=[case.case_id for case in cases])
+
+
 def ac_add_users_multi_effective_access(users_list, cases_list, access_level):
     """
     Add multiple users to multiple cases with a specific access level
@@ -385,6 +580,7 @@ def ac_add_user_effective_access(users_list, case_id, access_level):
 
     db.session.add_all(access_to_add)
     db.session.commit()
+    case_access_cache_invalidate(user_ids=users_list, case_ids=[case_id])
 
 
 def ac_add_user_effective_access_from_map(users_map, case_id):
@@ -406,6 +602,7 @@ def ac_add_user_effective_access_from_map(users_map, case_id):
 
     db.session.add_all(access_to_add)
     db.session.commit()
+    case_access_cache_invalidate(user_ids=users_map.keys(), case_ids=[case_id])
 
 
 def ac_set_new_case_access(org_members, case_id, customer_id = None):
@@ -449,6 +646,9 @@ def ac_set_new_case_access(org_members, case_id, customer_id = None):
         users_map = { u.user_id: u.access_level for u in users_client }
         ac_add_user_effective_access_from_map(users_map, case_id)
 
+    # Decisions taken before the case existed, e.g. through the client of the case
+    case_access_cache_invalidate(case_ids=[case_id])
+
 
 def ac_apply_autofollow_groups_access(case_id):
     """
@@ -480,6 +680,7 @@ def ac_apply_autofollow_groups_access(case_id):
 
     db.session.add_all(rows_to_push)
     db.session.commit()
+    case_access_cache_invalidate(user_ids=users.keys(), case_ids=[case_id])
     return users
 
 
@@ -487,44 +688,7 @@ def ac_auto_update_user_effective_access(user_id):
     """
     Updates the effective access of a user given its ID
     """
-    uceas = UserCaseEffectiveAccess.query.filter(
-        UserCaseEffectiveAccess.user_id == user_id
-    ).all()
-
-    grouped_uca = {}
-    for ucea in uceas:
-        grouped_uca[ucea.case_id] = ucea.access_level
-
-    target_ucas = ac_get_user_cases_access(user_id)
-
-    ucea_to_add = {}
-    cid_to_remove = []
-
-    for case_id in target_ucas:
-        if case_id not in grouped_uca:
-            ucea_to_add.update({case_id: target_ucas[case_id]})
-        else:
-            if not ac_flag_match_mask(grouped_uca[case_id], target_ucas[case_id]):
-                cid_to_remove.append(case_id)
-                ucea_to_add.update({case_id: target_ucas[case_id]})
-
-    for prev_case_id in grouped_uca:
-        if prev_case_id not in target_ucas.keys():
-            cid_to_remove.append(prev_case_id)
-
-    UserCaseEffectiveAccess.query.where(and_(
-        UserCaseEffectiveAccess.user_id == user_id,
-        UserCaseEffectiveAccess.case_id.in_(cid_to_remove)
-    )).delete()
-
-    for case_id in ucea_to_add:
-        ucea = UserCaseEffectiveAccess()
-        ucea.user_id = user_id
-        ucea.case_id = case_id
-        ucea.access_level = ucea_to_add[case_id]
-        db.session.add(ucea)
-
-    db.session.commit()
+    ac_recompute_effective_access(user_ids=[user_id])
 
     return
 
@@ -556,6 +720,7 @@ def ac_remove_case_access_from_user(user_id, case_id):
         uac.access_level = CaseAccessLevel.deny_all.value
 
     db.session.commit()
+    case_access_cache_invalidate(user_ids=[user_id], case_ids=[case_id])
 
     return
 
@@ -607,21 +772,11 @@ def ac_set_case_access_for_user(user_id, case_id, access_level, commit=True):
 
     if commit:
         db.session.commit()
+    case_access_cache_invalidate(user_ids=[user_id], case_ids=[case_id])
 
     return
 
 
-def ac_get_fast_user_cases_access(user_id):
-    ucea = UserCaseEffectiveAccess.query.with_entities(
-        UserCaseEffectiveAccess.case_id
-    ).filter(and_(
-        UserCaseEffectiveAccess.user_id == user_id,
-        UserCaseEffectiveAccess.access_level != CaseAccessLevel.deny_all.value
-    )).all()
-
-    return [e.case_id for e in ucea]
-
-
 def ac_get_user_case_counts(user_id):
     query = UserCaseEffectiveAccess.query.filter(
         UserCaseEffectiveAccess.user_id == user_id,
@@ -0,0 +1,190 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# Serialization of the data sent to the asynchronous hooks tasks.
+# The 'pickle' format sends the whole objects. The 'compact' format only sends the model name, the primary keys and
+# a projection of the small scalar fields already loaded, and the worker reloads all the objects in one query.
+import base64
+import json
+import uuid
+from datetime import date
+from datetime import datetime
+from pickle import dumps
+from pickle import loads
+from sqlalchemy import inspect
+from sqlalchemy.exc import NoInspectionAvailable
+
+from app import app
+from app import db
+
+HOOK_PAYLOAD_FORMAT_PICKLE = 'pickle'
+HOOK_PAYLOAD_FORMAT_COMPACT = 'compact'
+
+_COMPACT_PAYLOAD_VERSION = 1
+_PROJECTION_MAX_TEXT_LENGTH = 256
+
+_NOT_PROJECTED = object()
+
+_models_by_name = {}
+
+
+def _hook_payload_compact_enabled(hook_name):
+    hooks = app.config.get('MODULES_HOOKS_COMPACT_PAYLOAD')
+    return 'all' in hooks or hook_name in hooks
+
+
+def _hook_payload_get_model(model_name):
+    if not _models_by_name:
+        for mapper in db.Model.registry.mappers:
+            _models_by_name[mapper.class_.__name__] = mapper.class_
+
+    model = _models_by_name.get(model_name)
+    if model is None:
+        raise ValueError(f'Unknown model {model_name} in hook payload')
+
+    return model
+
+
+def _projection_encode(value):
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return value if len(value) <= _PROJECTION_MAX_TEXT_LENGTH else _NOT_PROJECTED
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    if isinstance(value, date):
+        return {'d': value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {'uuid': str(value)}
+    return _NOT_PROJECTED
+
+
+def _projection_decode(value):
+    if isinstance(value, dict):
+        if 'dt' in value:
+            return datetime.fromisoformat(value['dt'])
+        if 'd' in value:
+            return date.fromisoformat(value['d'])
+        if 'uuid' in value:
+            return uuid.UUID(value['uuid'])
+    return value
+
+
+def _hook_payload_build_compact(data):
+    """
+    Returns the compact payload of data, or None if data is not a list of persisted objects of a single model
+    """
+    objects = data if isinstance(data, list) else [data]
+    if not objects:
+        return None
+
+    try:
+        states = [inspect(obj) for obj in objects]
+    except NoInspectionAvailable:
+        return None
+
+    mapper = states[0].mapper
+    if len(mapper.primary_key) != 1:
+        return None
+
+    column_attributes = [attribute.key for attribute in mapper.column_attrs]
+    keys = []
+    projections = []
+    for state in states:
+        if state.mapper is not mapper or state.identity is None:
+            return None
+
+        key = state.identity[0]
+        if not isinstance(key, (int, str)):
+            return None
+        keys.append(key)
+
+        # Only the values already loaded are read, so that expired objects are not refreshed
+        projection = {}
+        for attribute in column_attributes:
+            if attribute not in state.dict:
+                continue
+            value = _projection_encode(state.dict[attribute])
+            if value is not _NOT_PROJECTED:
+                projection[attribute] = value
+        projections.append(projection)
+
+    return {
+        'v': _COMPACT_PAYLOAD_VERSION,
+        'model': mapper.class_.__name__,
+        'keys': keys,
+        'projections': projections
+    }
+
+
+def hook_payload_serialize(hook_name, data):
+    """
+    Serialize the data of a hook for an asynchronous task
+
+    :param hook_name: Name of the hook, used to select the format
+    :param data: Data associated with the hook
+    :return: Tuple (base64 encoded payload, payload format)
+    """
+    if _hook_payload_compact_enabled(hook_name):
+        payload = _hook_payload_build_compact(data)
+        if payload is not None:
+            raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+            return base64.b64encode(raw), HOOK_PAYLOAD_FORMAT_COMPACT
+
+    return base64.b64encode(dumps(data)), HOOK_PAYLOAD_FORMAT_PICKLE
+
+
+def hook_payload_deserialize(payload_format, payload):
+    """
+    Deserialize the data of a hook. Payloads in pickle format are returned as is, the caller being in charge of
+    attaching the objects to the session. Payloads in compact format are returned as a list of objects attached to the
+    session, loaded with a single query. Objects which no longer exist are rebuilt, detached, from their projection.
+
+    :param payload_format: Format of the payload
+    :param payload: Base64 encoded payload
+    :return: Deserialized data
+    """
+    if payload_format == HOOK_PAYLOAD_FORMAT_PICKLE:
+        return loads(base64.b64decode(payload))
+
+    if payload_format != HOOK_PAYLOAD_FORMAT_COMPACT:
+        raise ValueError(f'Unknown hook payload format {payload_format}')
+
+    content = json.loads(base64.b64decode(payload))
+    if content.get('v') != _COMPACT_PAYLOAD_VERSION:
+        raise ValueError(f'Unsupported compact hook payload version {content.get("v")}')
+
+    model = _hook_payload_get_model(content['model'])
+    mapper = inspect(model)
+    primary_key = mapper.primary_key[0]
+    keys = content['keys']
+
+    loaded = {}
+    for obj in db.session.query(model).filter(primary_key.in_(keys)).all():
+        loaded[inspect(obj).identity[0]] = obj
+
+    objects = []
+    for key, projection in zip(keys, content['projections']):
+        obj = loaded.get(key)
+        if obj is None:
+            obj = mapper.class_manager.new_instance()
+            for attribute, value in projection.items():
+                setattr(obj, attribute, _projection_decode(value))
+        objects.append(obj)
+
+    return objects
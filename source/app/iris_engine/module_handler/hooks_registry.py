@@ -0,0 +1,132 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# Process local registry of the modules subscribed to each hook.
+# The registry is loaded in one go and kept until invalidated. Invalidations are propagated to the other
+# gunicorn workers and Celery processes through the 'modules_hooks' global object state, which is checked
+# at most once every MODULES_HOOKS_REGISTRY_REFRESH seconds.
+import threading
+import time
+from collections import namedtuple
+
+from app import app
+from app import db
+from app.datamgmt.states import get_modules_hooks_state_version
+from app.datamgmt.states import update_modules_hooks_state
+from app.models.models import IrisHook
+from app.models.models import IrisModule
+from app.models.models import IrisModuleHook
+
+log = app.logger
+
+HookSubscription = namedtuple('HookSubscription', ['run_asynchronously', 'module_name', 'manual_hook_ui_name'])
+
+
+class _HooksRegistrySnapshot:
+
+    def __init__(self, version, subscriptions):
+        self.version = version
+        self.subscriptions = subscriptions
+        self.checked_at = time.monotonic()
+
+
+_lock = threading.Lock()
+_snapshot = None
+
+
+def _hooks_registry_load() -> _HooksRegistrySnapshot:
+    version = get_modules_hooks_state_version()
+
+    subscriptions = {}
+    for hook_name, in db.session.query(IrisHook.hook_name).all():
+        subscriptions[hook_name] = []
+
+    modules_hooks = db.session.query(
+        IrisHook.hook_name,
+        IrisModuleHook.run_asynchronously,
+        IrisModule.module_name,
+        IrisModuleHook.manual_hook_ui_name
+    ).join(
+        IrisModuleHook, IrisModuleHook.hook_id == IrisHook.id
+    ).join(
+        IrisModule, IrisModuleHook.module_id == IrisModule.id
+    ).filter(
+        IrisModule.is_active == True
+    ).order_by(
+        IrisModuleHook.id
+    ).all()
+
+    for module_hook in modules_hooks:
+        subscriptions[module_hook.hook_name].append(HookSubscription(module_hook.run_asynchronously,
+                                                                     module_hook.module_name,
+                                                                     module_hook.manual_hook_ui_name))
+
+    return _HooksRegistrySnapshot(version, subscriptions)
+
+
+def _hooks_registry_get_snapshot() -> _HooksRegistrySnapshot:
+    global _snapshot
+
+    snapshot = _snapshot
+    if snapshot is not None:
+        if time.monotonic() - snapshot.checked_at < app.config.get('MODULES_HOOKS_REGISTRY_REFRESH'):
+            return snapshot
+
+        if get_modules_hooks_state_version() == snapshot.version:
+            snapshot.checked_at = time.monotonic()
+            return snapshot
+
+    with _lock:
+        if _snapshot is snapshot:
+            _snapshot = _hooks_registry_load()
+
+        return _snapshot
+
+
+def hooks_registry_get_subscriptions(hook_name: str, hook_ui_name: str = None, module_name: str = None):
+    """
+    Returns the subscriptions of the active modules to a hook, without querying the database when the registry is warm
+
+    :param hook_name: Name of the hook
+    :param hook_ui_name: If set, only the subscriptions of the manual hook with this UI name are returned
+    :param module_name: If set, only the subscriptions of this module are returned
+    :return: List of HookSubscription, or None if the hook is unknown
+    """
+    subscriptions = _hooks_registry_get_snapshot().subscriptions.get(hook_name)
+    if subscriptions is None:
+        return None
+
+    if hook_ui_name:
+        subscriptions = [s for s in subscriptions if s.manual_hook_ui_name == hook_ui_name]
+
+    if module_name:
+        subscriptions = [s for s in subscriptions if s.module_name == module_name]
+
+    return subscriptions
+
+
+def hooks_registry_invalidate():
+    """
+    Drop the registry of the current process and signal the other processes to reload theirs.
+    The signal is a state update, so it expects a db commit soon after
+    """
+    global _snapshot
+
+    update_modules_hooks_state()
+    with _lock:
+        _snapshot = None
@@ -19,13 +19,10 @@
 #  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 import traceback
 
-import base64
 import importlib
+from contextlib import contextmanager
 from flask_login import current_user
 from packaging import version
-from pickle import dumps
-from pickle import loads
-from sqlalchemy import and_
 
 from app import app
 from app import celery
@@ -34,6 +31,14 @@ from app.datamgmt.iris_engine.modules_db import get_module_config_from_hname
 from app.datamgmt.iris_engine.modules_db import iris_module_add
 from app.datamgmt.iris_engine.modules_db import iris_module_exists
 from app.datamgmt.iris_engine.modules_db import modules_list_pipelines
+from app.iris_engine.module_handler.hook_payloads import HOOK_PAYLOAD_FORMAT_COMPACT
+from app.iris_engine.module_handler.hook_payloads import HOOK_PAYLOAD_FORMAT_PICKLE
+from app.iris_engine.module_handler.hook_payloads import hook_payload_deserialize
+from app.iris_engine.module_handler.hook_payloads import hook_payload_serialize
+from app.iris_engine.module_handler.hooks_registry import hooks_registry_get_subscriptions
+from app.iris_engine.module_handler.hooks_registry import hooks_registry_invalidate
+from app.iris_engine.module_handler.modules_pool import modules_pool_acquire
+from app.iris_engine.module_handler.modules_pool import modules_pool_release
 from app.models.models import IrisHook
 from app.models.models import IrisModule
 from app.models.models import IrisModuleHook
@@ -205,6 +210,44 @@ def instantiate_module_from_name(module_name):
     return mod_inst, 'Success'
 
 
+@contextmanager
+def pooled_module_instance(module_name):
+    """
+    Provide a configured instance of a module, taken from the process pool when possible instead of being
+    instantiated. The instance goes back to the pool if the caller did not raise.
+    :param module_name: Name of the module
+    :return: Class instance or None
+    """
+    mod_inst, version = modules_pool_acquire(module_name)
+    if mod_inst is None:
+        mod_inst, _ = instantiate_module_from_name(module_name=module_name)
+
+    yield mod_inst
+
+    modules_pool_release(module_name, version, mod_inst)
+
+
+def modules_pool_warm_up():
+    """
+    Build one instance of each active processor module, so the first hooks do not pay the instantiation
+    """
+    modules = IrisModule.query.with_entities(
+        IrisModule.module_name
+    ).filter(
+        IrisModule.is_active == True,
+        IrisModule.module_type == 'module_processor'
+    ).all()
+
+    for module in modules:
+        try:
+            with pooled_module_instance(module.module_name) as mod_inst:
+                if not mod_inst:
+                    log.warning(f'Unable to warm up module {module.module_name}')
+
+        except Exception as e:
+            log.warning(f'Unable to warm up module {module.module_name}: {e}')
+
+
 def configure_module_on_init(module_instance):
     """
     Configure a module after instantiation, with the current configuration
@@ -380,6 +423,7 @@ def register_hook(module_id: int, iris_hook_name: str, manual_hook_name: str = N
 
         try:
             db.session.add(imh)
+            hooks_registry_invalidate()
             db.session.commit()
         except Exception as e:
             return False, [str(e)]
@@ -410,11 +454,14 @@ def deregister_from_hook(module_id: int, iris_hook_name: str):
             log.info(f'Deregistered module #{module_id} from {iris_hook_name}')
             db.session.delete(hook)
 
+        hooks_registry_invalidate()
+
     return True, ['Hook deregistered']
 
 
 @celery.task(bind=True)
-def task_hook_wrapper(self, module_name, hook_name, hook_ui_name, data, init_user, caseid):
+def task_hook_wrapper(self, module_name, hook_name, hook_ui_name, data, init_user, caseid,
+                      payload_format=HOOK_PAYLOAD_FORMAT_PICKLE):
     """
     Wrap a hook call into a Celery task to run asynchronously
 
@@ -425,6 +472,7 @@ def task_hook_wrapper(self, module_name, hook_name, hook_ui_name, data, init_use
     :param data: Data associated to the hook to process
     :param init_user: User initiating the task
     :param caseid: Case associated
+    :param payload_format: Format of the serialized data, see hook_payloads
     :return: A task status JSON task_success or task_failure
     """
     try:
@@ -435,7 +483,7 @@ def task_hook_wrapper(self, module_name, hook_name, hook_ui_name, data, init_use
             log.warning("data argument has not been correctly serialised")
             raise Exception('Unable to instantiate target module. Data has not been correctly serialised')
 
-        deser_data = loads(base64.b64decode(pdata))
+        deser_data = hook_payload_deserialize(payload_format, pdata)
 
     except Exception as e:
         log.exception(e)
@@ -445,9 +493,12 @@ def task_hook_wrapper(self, module_name, hook_name, hook_ui_name, data, init_use
 
         _obj = None
         # The received object will most likely be cleared when handled by the task,
-        # so we need to attach it to the session in the task
-        _obj = []
-        if isinstance(deser_data, list):
+        # so we need to attach it to the session in the task.
+        # Compact payloads are already loaded in the task session
+        if payload_format == HOOK_PAYLOAD_FORMAT_COMPACT:
+            _obj = deser_data
+
+        elif isinstance(deser_data, list):
             _obj = []
             for dse_data in deser_data:
                 obj = db.session.merge(dse_data)
@@ -463,7 +514,7 @@ def task_hook_wrapper(self, module_name, hook_name, hook_ui_name, data, init_use
         else:
             _obj_a = db.session.merge(deser_data)
             db.session.commit()
-            _obj.append(_obj_a)
+            _obj = [_obj_a]
 
     except Exception as e:
         log.exception(e)
@@ -472,16 +523,16 @@ def task_hook_wrapper(self, module_name, hook_name, hook_ui_name, data, init_use
     log.info(f'Calling module {module_name} for hook {hook_name}')
 
     try:
-        mod_inst, _ = instantiate_module_from_name(module_name=module_name)
+        with pooled_module_instance(module_name) as mod_inst:
 
-        if mod_inst:
-            task_status = mod_inst.hooks_handler(hook_name, hook_ui_name, data=_obj)
+            if mod_inst:
+                task_status = mod_inst.hooks_handler(hook_name, hook_ui_name, data=_obj)
 
-            # Recommit the changes made by the module
-            db.session.commit()
+                # Recommit the changes made by the module
+                db.session.commit()
 
-        else:
-            raise Exception('Unable to instantiate target module')
+            else:
+                raise Exception('Unable to instantiate target module')
 
     except Exception as e:
         msg = f"Failed to run hook {hook_name} with module {module_name}. Error {str(e)}"
@@ -504,47 +555,27 @@ def call_modules_hook(hook_name: str, data: any, caseid: int = None, hook_ui_nam
     :param caseid: Case ID
     :return: Any
     """
-    hook = IrisHook.query.filter(IrisHook.hook_name == hook_name).first()
-    if not hook:
+    modules = hooks_registry_get_subscriptions(hook_name, hook_ui_name=hook_ui_name, module_name=module_name)
+    if modules is None:
         log.critical(f'Hook name {hook_name} not found')
         raise Exception(f'Hook name {hook_name} not found')
 
-    if hook_ui_name:
-        condition = and_(
-            IrisModule.is_active == True,
-            IrisModuleHook.hook_id == hook.id,
-            IrisModuleHook.manual_hook_ui_name == hook_ui_name
-        )
-    else:
-        condition = and_(
-            IrisModule.is_active == True,
-            IrisModuleHook.hook_id == hook.id
-        )
-
-    if module_name:
-        condition = and_(
-            condition,
-            IrisModule.module_name == module_name
-        )
-
-    modules = IrisModuleHook.query.with_entities(
-        IrisModuleHook.run_asynchronously,
-        IrisModule.module_name,
-        IrisModuleHook.manual_hook_ui_name
-    ).filter(condition).join(
-        IrisModule, IrisModuleHook.module_id == IrisModule.id
-    ).all()
+    # The serialized data is shared by the asynchronous modules, until a synchronous module changes it
+    ser_data_auth = None
+    payload_format = None
 
     for module in modules:
         if module.run_asynchronously and "on_preload_" not in hook_name:
             log.info(f'Calling module {module.module_name} asynchronously for hook {hook_name} :: {hook_ui_name}')
             # We cannot directly pass the sqlalchemy in data, as it needs to be serializable
             # So pass a dumped instance and then rebuild on the task side
-            ser_data = base64.b64encode(dumps(data))
-            ser_data_auth = hmac_sign(ser_data) + b" " + ser_data
+            if ser_data_auth is None:
+                ser_data, payload_format = hook_payload_serialize(hook_name, data)
+                ser_data_auth = hmac_sign(ser_data) + b" " + ser_data
+
             task_hook_wrapper.delay(module_name=module.module_name, hook_name=hook_name,
                                     hook_ui_name=module.manual_hook_ui_name, data=ser_data_auth.decode("utf8"),
-                                    init_user=current_user.name, caseid=caseid)
+                                    init_user=current_user.name, caseid=caseid, payload_format=payload_format)
 
         else:
             # Direct call. Should be fast
@@ -560,14 +591,15 @@ def call_modules_hook(hook_name: str, data: any, caseid: int = None, hook_ui_nam
                 else:
                     data_list = data
 
-                mod_inst, _ = instantiate_module_from_name(module_name=module.module_name)
-                status = mod_inst.hooks_handler(hook_name, module.manual_hook_ui_name, data=data_list)
+                with pooled_module_instance(module.module_name) as mod_inst:
+                    status = mod_inst.hooks_handler(hook_name, module.manual_hook_ui_name, data=data_list)
 
             except Exception as e:
                 log.critical(f"Failed to run hook {hook_name} with module {module.module_name}. Error {str(e)}")
                 continue
 
             if status.is_success():
+                ser_data_auth = None
                 data_result = status.get_data()
                 if not was_list:
                     if not isinstance(data_result, list):
@@ -583,6 +615,42 @@ def call_modules_hook(hook_name: str, data: any, caseid: int = None, hook_ui_nam
     return data
 
 
+def call_modules_hook_batch(hook_name: str, data: list, caseid: int = None, hook_ui_name: str = None,
+                            module_name: str = None) -> list:
+    """
+    Calls modules which have registered the specified hook, with many objects at once.
+    The objects are sent in chunks of MODULES_HOOKS_BATCH_SIZE, so each subscribed module gets one hooks_handler call
+    or one Celery task per chunk instead of one per object. hooks_handler already expects a list, so modules
+    do not need any change.
+
+    :raises: Exception if hook name doesn't exist. This shouldn't happen
+    :param hook_name: Name of the hook to call
+    :param data: List of objects associated with the hook
+    :param caseid: Case ID
+    :param hook_ui_name: UI name of the hook
+    :param module_name: Name of the module to call. If None, all modules matching the hook will be called
+    :return: List of objects, possibly modified by the synchronous modules
+    """
+    if not data:
+        return data
+
+    batch_size = app.config.get('MODULES_HOOKS_BATCH_SIZE')
+    result = []
+    for index in range(0, len(data), batch_size):
+        chunk = data[index:index + batch_size]
+        chunk_result = call_modules_hook(hook_name, data=chunk, caseid=caseid, hook_ui_name=hook_ui_name,
+                                         module_name=module_name)
+
+        if isinstance(chunk_result, list) and len(chunk_result) == len(chunk):
+            result.extend(chunk_result)
+        else:
+            log.critical(f"Error getting data result from hook {hook_name}: "
+                         f"A list of {len(chunk)} elements is expected, instead got {type(chunk_result)}")
+            result.extend(chunk)
+
+    return result
+
+
 def list_available_pipelines():
     """
     Return a list of available pipelines by requesting the DB
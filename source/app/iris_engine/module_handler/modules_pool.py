@@ -0,0 +1,123 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# Process local pool of configured module instances.
+# Idle instances are kept per module name, together with the configuration version they were built with. An instance
+# is handed out to a single caller at a time, so modules do not need to be thread safe, but they are reused across
+# calls. Modules keeping state between calls can opt out by setting the class attribute _module_reentrant to False.
+# Configuration changes are propagated to the other processes through the 'module_config:<name>' global object
+# states, which are checked at most once every MODULES_INSTANCES_POOL_REFRESH seconds.
+import threading
+import time
+
+from app import app
+from app.datamgmt.states import get_modules_config_states_versions
+from app.datamgmt.states import update_module_config_state
+
+log = app.logger
+
+_MODULES_POOL_MAX_IDLE_INSTANCES = 16
+
+
+class _ModulePool:
+
+    def __init__(self, version):
+        self.version = version
+        self.idle_instances = []
+
+
+_lock = threading.Lock()
+_pools = {}
+_versions = None
+_versions_checked_at = 0
+
+
+def _modules_pool_get_version(module_name):
+    global _versions
+    global _versions_checked_at
+
+    versions = _versions
+    if versions is None or time.monotonic() - _versions_checked_at >= app.config.get('MODULES_INSTANCES_POOL_REFRESH'):
+        versions = get_modules_config_states_versions()
+        _versions = versions
+        _versions_checked_at = time.monotonic()
+
+    return versions.get(module_name)
+
+
+def modules_pool_acquire(module_name):
+    """
+    Take an idle instance of a module out of the pool
+
+    :param module_name: Name of the module
+    :return: Tuple (instance or None if the pool has no idle instance, configuration version to release it with)
+    """
+    version = _modules_pool_get_version(module_name)
+
+    with _lock:
+        pool = _pools.get(module_name)
+        if pool is None or pool.version != version:
+            # The configuration changed since the instances were built, drop them
+            _pools[module_name] = _ModulePool(version)
+            return None, version
+
+        if pool.idle_instances:
+            return pool.idle_instances.pop(), version
+
+    return None, version
+
+
+def modules_pool_release(module_name, version, module_instance):
+    """
+    Give an instance back to the pool once the caller is done with it
+
+    :param module_name: Name of the module
+    :param version: Configuration version returned by modules_pool_acquire
+    :param module_instance: Instance of the module
+    """
+    if not module_instance or not getattr(module_instance, '_module_reentrant', True):
+        return
+
+    # Logs queued during the previous call are not relevant for the next one
+    message_queue = getattr(module_instance, 'message_queue', None)
+    if message_queue is not None:
+        del message_queue[:]
+
+    with _lock:
+        pool = _pools.get(module_name)
+        if pool is None:
+            pool = _ModulePool(version)
+            _pools[module_name] = pool
+
+        if pool.version == version and len(pool.idle_instances) < _MODULES_POOL_MAX_IDLE_INSTANCES:
+            pool.idle_instances.append(module_instance)
+
+
+def modules_pool_evict(module_name):
+    """
+    Drop the instances of a module in the current process and signal the other processes to drop theirs.
+    The signal is a state update, so it expects a db commit soon after
+
+    :param module_name: Name of the module
+    """
+    global _versions
+
+    update_module_config_state(module_name)
+    with _lock:
+        _pools.pop(module_name, None)
+        _versions = None
@@ -24,7 +24,6 @@ from datetime import datetime
 from docx_generator.docx_generator import DocxGenerator
 from docx_generator.exceptions import rendering_error
 from flask_login import current_user
-from sqlalchemy import desc
 
 from app import app
 from app.business.cases import cases_export_to_report_json
@@ -34,14 +33,9 @@ from app.datamgmt.activities.activities_db import get_auto_activities
 from app.datamgmt.activities.activities_db import get_manual_activities
 from app.datamgmt.case.case_db import case_get_desc_crc
 
-from app.models.models import AssetsType
-from app.models.models import CaseAssets
-from app.models.models import CaseEventsAssets
 from app.models.models import CaseReceivedFile
 from app.models.models import CaseTemplateReport
-from app.models.cases import CasesEvent
 from app.models.models import Ioc
-from app.models.models import IocAssetLink
 
 from app.iris_engine.reporter.ImageHandler import ImageHandler
 from app.iris_engine.utils.common import IrisJinjaEnv
@@ -153,43 +147,6 @@ class IrisReportMaker(object):
         else:
             return []
 
-    @staticmethod
-    def get_case_timeline(caseid):
-        """
-        Retrieve the case timeline
-        :return:
-        """
-        timeline = CasesEvent.query.filter(
-            CasesEvent.case_id == caseid
-        ).order_by(
-            CasesEvent.event_date
-        ).all()
-
-        cache_id = {}
-        ras = {}
-        tim = []
-        for row in timeline:
-            ras = row
-            setattr(ras, 'asset', None)
-
-            as_list = CaseEventsAssets.query.with_entities(
-                CaseAssets.asset_id,
-                CaseAssets.asset_name,
-                AssetsType.asset_name.label('type')
-            ).filter(
-                CaseEventsAssets.event_id == row.event_id
-            ).join(CaseEventsAssets.asset, CaseAssets.asset_type).all()
-
-            alki = []
-            for asset in as_list:
-                alki.append("{} ({})".format(asset.asset_name, asset.type))
-
-            setattr(ras, 'asset', "\r\n".join(alki))
-
-            tim.append(ras)
-
-        return tim
-
     @staticmethod
     def get_case_ioc(caseid):
         """
@@ -212,51 +169,6 @@ class IrisReportMaker(object):
         else:
             return []
 
-    @staticmethod
-    def get_case_assets(caseid):
-        """
-        Retrieve the assets linked ot the case
-        :return:
-        """
-        ret = []
-
-        res = CaseAssets.query.distinct().with_entities(
-            CaseAssets.asset_id,
-            CaseAssets.asset_name,
-            CaseAssets.asset_description,
-            CaseAssets.asset_compromised.label('compromised'),
-            AssetsType.asset_name.label("type"),
-            CaseAssets.custom_attributes,
-            CaseAssets.asset_tags
-        ).filter(
-            CaseAssets.case_id == caseid
-        ).join(
-            CaseAssets.asset_type
-        ).order_by(desc(CaseAssets.asset_compromised)).all()
-
-        for row in res:
-            row = row._asdict()
-            row['light_asset_description'] = row['asset_description']
-
-            ial = IocAssetLink.query.with_entities(
-                Ioc.ioc_value,
-                Ioc.ioc_type,
-                Ioc.ioc_description
-            ).filter(
-                IocAssetLink.asset_id == row['asset_id']
-            ).join(
-                IocAssetLink.ioc
-            ).all()
-
-            if ial:
-                row['asset_ioc'] = [row._asdict() for row in ial]
-            else:
-                row['asset_ioc'] = []
-
-            ret.append(row)
-
-        return ret
-
     @staticmethod
     def get_docid():
         return "{}".format(
@@ -364,157 +276,6 @@ class IrisMakeDocReport(IrisReportMaker):
 
         return case_info
 
-    @staticmethod
-    def get_case_summary(caseid):
-        """
-        Retrieve the case summary from thehive
-        :return:
-        """
-
-        _crc32, descr = case_get_desc_crc(caseid)
-
-        return descr
-
-    @staticmethod
-    def get_case_files(caseid):
-        """
-        Retrieve the list of files with their hashes
-        :return:
-        """
-        files = CaseReceivedFile.query.filter(
-            CaseReceivedFile.case_id == caseid
-        ).with_entities(
-            CaseReceivedFile.filename,
-            CaseReceivedFile.date_added,
-            CaseReceivedFile.file_hash,
-            CaseReceivedFile.custom_attributes
-        ).order_by(
-            CaseReceivedFile.date_added
-        ).all()
-
-        if files:
-            return [row._asdict() for row in files]
-
-        else:
-            return []
-
-    @staticmethod
-    def get_case_timeline(caseid):
-        """
-        Retrieve the case timeline
-        :return:
-        """
-        timeline = CasesEvent.query.filter(
-            CasesEvent.case_id == caseid
-        ).order_by(
-            CasesEvent.event_date
-        ).all()
-
-        cache_id = {}
-        ras = {}
-        tim = []
-        for row in timeline:
-            ras = row
-            setattr(ras, 'asset', None)
-
-            as_list = CaseEventsAssets.query.with_entities(
-                CaseAssets.asset_id,
-                CaseAssets.asset_name,
-                AssetsType.asset_name.label('type')
-            ).filter(
-                CaseEventsAssets.event_id == row.event_id
-            ).join(CaseEventsAssets.asset, CaseAssets.asset_type).all()
-
-            alki = []
-            for asset in as_list:
-                alki.append("{} ({})".format(asset.asset_name, asset.type))
-
-            setattr(ras, 'asset', "\r\n".join(alki))
-
-            tim.append(ras)
-
-        return tim
-
-    @staticmethod
-    def get_case_ioc(caseid):
-        """
-        Retrieve the list of IOC linked to the case
-        :return:
-        """
-        res = Ioc.query.distinct().with_entities(
-            Ioc.ioc_value,
-            Ioc.ioc_type,
-            Ioc.ioc_description,
-            Ioc.ioc_tags,
-            Ioc.custom_attributes
-        ).filter(
-            Ioc.case_id == caseid
-        ).order_by(Ioc.ioc_type).all()
-
-        if res:
-            return [row._asdict() for row in res]
-
-        else:
-            return []
-
-    @staticmethod
-    def get_case_assets(caseid):
-        """
-        Retrieve the assets linked ot the case
-        :return:
-        """
-        ret = []
-
-        res = CaseAssets.query.distinct().with_entities(
-            CaseAssets.asset_id,
-            CaseAssets.asset_name,
-            CaseAssets.asset_description,
-            CaseAssets.asset_compromise_status_id.label('compromise_status'),
-            AssetsType.asset_name.label("type"),
-            CaseAssets.custom_attributes,
-            CaseAssets.asset_tags
-        ).filter(
-            CaseAssets.case_id == caseid
-        ).join(
-            CaseAssets.asset_type
-        ).order_by(desc(CaseAssets.asset_compromise_status_id)).all()
-
-        for row in res:
-            row = row._asdict()
-            row['light_asset_description'] = row['asset_description']
-
-            ial = IocAssetLink.query.with_entities(
-                Ioc.ioc_value,
-                Ioc.ioc_type,
-                Ioc.ioc_description
-            ).filter(
-                IocAssetLink.asset_id == row['asset_id']
-            ).join(
-                IocAssetLink.ioc
-            ).all()
-
-            if ial:
-                row['asset_ioc'] = [row._asdict() for row in ial]
-            else:
-                row['asset_ioc'] = []
-
-            ret.append(row)
-
-        return ret
-
-    @staticmethod
-    def get_docid():
-        return "{}".format(
-            datetime.utcnow().strftime("%y%m%d_%H%M"))
-
-    @staticmethod
-    def markdown_to_text(markdown_string):
-        """
-        Converts a markdown string to plaintext
-        """
-        return markdown_string.replace('\n', '</w:t></w:r><w:r/></w:p><w:p><w:r><w:t xml:space="preserve">').replace(
-            '#', '')
-
 
 class IrisMakeMdReport(IrisReportMaker):
     """
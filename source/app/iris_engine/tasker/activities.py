@@ -0,0 +1,69 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+import datetime
+from celery.schedules import crontab
+
+from app import app
+from app import celery
+from app.datamgmt.activities.activities_db import create_activities_partitions
+from app.datamgmt.activities.activities_db import expire_activities_partition
+from app.datamgmt.activities.activities_db import get_activities_partitions
+
+# Number of months after the current one which get a partition in advance
+_PARTITIONS_AHEAD_MONTHS = 2
+
+
+def _add_months(month: datetime.date, months: int) -> datetime.date:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+@celery.on_after_finalize.connect
+def setup_periodic_activities_partitions_maintenance(self, **kwargs):
+    self.add_periodic_task(
+        crontab(hour=1, minute=15),
+        task_maintain_activities_partitions.s(),
+        name='iris_maintain_activities_partitions'
+    )
+
+
+@celery.task
+def task_maintain_activities_partitions():
+    """
+    Create the partitions of the user activities for the coming months, then archive or drop the partitions older
+    than ACTIVITIES_RETENTION months
+
+    :return: The number of partitions expired
+    """
+    current_month = datetime.datetime.utcnow().date().replace(day=1)
+    create_activities_partitions(current_month, _add_months(current_month, _PARTITIONS_AHEAD_MONTHS))
+
+    retention = app.config.get('ACTIVITIES_RETENTION')
+    if retention <= 0:
+        return 0
+
+    limit = _add_months(current_month, -retention)
+    archive = app.config.get('ACTIVITIES_RETENTION_POLICY') != 'drop'
+
+    expired = [name for name, month in get_activities_partitions() if month < limit]
+    for name in expired:
+        expire_activities_partition(name, archive)
+
+    return len(expired)
@@ -0,0 +1,62 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+import datetime
+from celery.schedules import crontab
+
+from app import app
+from app import celery
+from app.datamgmt.datastore.datastore_blobs_db import datastore_blobs_purge
+from app.datamgmt.datastore.datastore_uploads_db import datastore_upload_delete
+from app.datamgmt.datastore.datastore_uploads_db import datastore_uploads_get_expired
+
+
+@celery.on_after_finalize.connect
+def setup_periodic_datastore_uploads_purge(self, **kwargs):
+    self.add_periodic_task(
+        crontab(minute=30),
+        task_purge_datastore_uploads.s(),
+        name='iris_purge_datastore_uploads'
+    )
+    self.add_periodic_task(
+        crontab(minute=45),
+        task_purge_datastore_blobs.s(),
+        name='iris_purge_datastore_blobs'
+    )
+
+
+@celery.task
+def task_purge_datastore_uploads():
+    """
+    Remove the datastore uploads which did not receive any chunk for more than DATASTORE_UPLOADS_RETENTION hours
+    """
+    limit = datetime.datetime.now() - datetime.timedelta(hours=app.config.get('DATASTORE_UPLOADS_RETENTION'))
+
+    uploads = datastore_uploads_get_expired(limit)
+    for upload in uploads:
+        datastore_upload_delete(upload)
+
+    return len(uploads)
+
+
+@celery.task
+def task_purge_datastore_blobs():
+    """
+    Remove the blobs left without reference, when their removal after the commit which released them failed
+    """
+    return datastore_blobs_purge()
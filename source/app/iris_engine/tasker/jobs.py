@@ -0,0 +1,375 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# Long operations run as jobs in the Celery workers rather than within the web requests. A job is an IrisJob row,
+# which holds its status, progress and result, and a Celery task running the handler registered for its type.
+# The progress and the cancellation flag are written through their own connection, so that they are visible while
+# the handler is still within its transaction.
+import datetime
+import os
+import shutil
+import time
+from celery.schedules import crontab
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy import update
+from typing import Callable
+
+from app import app
+from app import celery
+from app import db
+from app.business.errors import BusinessProcessingError
+from app.iris_engine.tasker.tasks import task_user_context
+from app.models.models import IrisJob
+from app.models.models import IrisJobStatus
+
+log = app.logger
+
+_CANCEL_CHECK_INTERVAL = 1
+
+_job_handlers = {}
+_job_cleanups = {}
+
+
+class JobCancelled(Exception):
+    """
+    Raised when a job is cancelled. The handlers which commit as they go give the result of the part already done,
+    and the job then ends with the partial status
+    """
+
+    def __init__(self, message: str = None, result: dict = None):
+        super().__init__(message)
+        self.message = message
+        self.result = result
+
+
+class JobContext:
+    """
+    Given to the job handlers to report their progress, check whether they are cancelled and store their result file
+    """
+
+    def __init__(self, job: IrisJob):
+        self.job_id = job.id
+        self.job_uuid = job.job_uuid
+        self.case_id = job.case_id
+        self.user_id = job.user_id
+        self.parameters = job.parameters or {}
+        self.result_file_path = None
+        self.result_file_name = None
+
+        self._cancel_checked_at = 0
+
+    def _update_job(self, **values):
+        with db.engine.begin() as connection:
+            connection.execute(update(IrisJob).where(IrisJob.id == self.job_id).values(**values))
+
+    def set_progress(self, current: int, total: int = None, message: str = None):
+        """
+        Report the progress of the job
+
+        :param current: Number of items processed
+        :param total: Number of items to process, if known
+        :param message: Description of the current step
+        """
+        values = {'progress_current': current, 'progress_updated_at': datetime.datetime.utcnow()}
+        if total is not None:
+            values['progress_total'] = total
+        if message is not None:
+            values['message'] = message
+
+        self._update_job(**values)
+
+    def check_cancelled(self):
+        """
+        Raise JobCancelled if the cancellation of the job was requested. The flag is read at most once per second,
+        so the handlers can call it for each item they process
+
+        :raises: JobCancelled
+        """
+        now = time.monotonic()
+        if now - self._cancel_checked_at < _CANCEL_CHECK_INTERVAL:
+            return
+        self._cancel_checked_at = now
+
+        with db.engine.connect() as connection:
+            cancel_requested = connection.execute(
+                select(IrisJob.cancel_requested).where(IrisJob.id == self.job_id)
+            ).scalar()
+
+        if cancel_requested:
+            raise JobCancelled()
+
+    def store_result_file(self, file_path: str, file_name: str = None):
+        """
+        Move a file produced by the job to the jobs results folder, from where it can be downloaded
+
+        :param file_path: Path of the file, which is moved
+        :param file_name: Name of the file when downloaded. Defaults to the name of the file
+        """
+        result_dir = os.path.join(_jobs_results_path(), str(self.job_uuid))
+        os.makedirs(result_dir, exist_ok=True)
+
+        self.result_file_name = file_name or os.path.basename(file_path)
+        self.result_file_path = os.path.join(result_dir, os.path.basename(file_path))
+        shutil.move(file_path, self.result_file_path)
+
+    def discard_result_file(self):
+        """
+        Remove the result file stored by the job, if any, when the job does not succeed
+        """
+        if self.result_file_path:
+            shutil.rmtree(os.path.dirname(self.result_file_path), ignore_errors=True)
+
+        self.result_file_path = None
+        self.result_file_name = None
+
+
+def _jobs_results_path():
+    return os.path.join(app.config.get('UPLOADED_PATH'), 'jobs')
+
+
+def register_job_type(job_type: str, handler: Callable[[JobContext], dict],
+                      cleanup: Callable[[dict], None] = None):
+    """
+    Register the handler of a type of jobs. The handler runs in a worker, on behalf of the user who submitted the job.
+    It returns the result of the job as a JSON serializable dict, and raises BusinessProcessingError on failure.
+
+    :param job_type: Name of the type of jobs
+    :param handler: Function called with the JobContext of the job
+    :param cleanup: Function called with the parameters of a job whose handler never ran or was stopped along with
+                    its worker, to remove what was prepared for it
+    """
+    _job_handlers[job_type] = handler
+    if cleanup is not None:
+        _job_cleanups[job_type] = cleanup
+
+
+def _job_cleanup(job: IrisJob):
+    cleanup = _job_cleanups.get(job.job_type)
+    if cleanup is None:
+        return
+
+    try:
+        cleanup(job.parameters or {})
+    except Exception as e:
+        log.exception(e)
+
+
+def is_job_type_registered(job_type: str) -> bool:
+    return job_type in _job_handlers
+
+
+def job_submit(job_type: str, user_id: int, case_id: int = None, parameters: dict = None,
+               progress_total: int = None) -> IrisJob:
+    """
+    Create a job and queue its task
+
+    :param job_type: Type of the job, registered with register_job_type
+    :param user_id: User submitting the job
+    :param case_id: Case the job applies to, if any
+    :param parameters: JSON serializable parameters of the handler
+    :param progress_total: Number of items to process, if known beforehand
+    :return: The job
+    """
+    if not is_job_type_registered(job_type):
+        raise BusinessProcessingError(f'Unknown job type {job_type}')
+
+    job = IrisJob()
+    job.job_type = job_type
+    job.status = IrisJobStatus.pending.value
+    job.user_id = user_id
+    job.case_id = case_id
+    job.parameters = parameters or {}
+    job.progress_current = 0
+    job.progress_total = progress_total
+    job.cancel_requested = False
+    job.created_at = datetime.datetime.utcnow()
+
+    db.session.add(job)
+    db.session.commit()
+
+    task = task_run_job.delay(job.id)
+    job.task_id = task.id
+    db.session.commit()
+
+    return job
+
+
+def job_cancel(job: IrisJob):
+    """
+    Request the cancellation of a job. A pending job is cancelled at once, a running job stops at the next
+    check_cancelled of its handler, and the changes it did not commit yet are rolled back
+
+    :param job: The job
+    """
+    if job.status not in (IrisJobStatus.pending.value, IrisJobStatus.running.value):
+        raise BusinessProcessingError(f'The job is already {job.status}')
+
+    job.cancel_requested = True
+    db.session.commit()
+
+    # Conditional, as the worker may be starting the job meanwhile
+    cancelled = db.session.execute(update(IrisJob).where(
+        IrisJob.id == job.id,
+        IrisJob.status == IrisJobStatus.pending.value
+    ).values(
+        status=IrisJobStatus.cancelled.value,
+        message='Cancelled',
+        finished_at=datetime.datetime.utcnow()
+    )).rowcount
+    db.session.commit()
+
+    if cancelled:
+        if job.task_id:
+            celery.control.revoke(job.task_id)
+        _job_cleanup(job)
+
+    db.session.refresh(job)
+
+
+def _job_finish(job_id: int, status: IrisJobStatus, message: str = None, result: dict = None,
+                context: JobContext = None):
+    job = db.session.get(IrisJob, job_id)
+    job.status = status.value
+    job.message = message
+    job.result = result
+    job.finished_at = datetime.datetime.utcnow()
+
+    if context is not None and context.result_file_path:
+        job.result_file_path = context.result_file_path
+        job.result_file_name = context.result_file_name
+
+    db.session.commit()
+
+
+@celery.task(bind=True)
+def task_run_job(self, job_id):
+    """
+    Run the handler of a job and record its outcome
+
+    :param job_id: ID of the job
+    :return: The status of the job
+    """
+    job = db.session.get(IrisJob, job_id)
+    if job is None:
+        log.warning(f'Job {job_id} not found')
+        return IrisJobStatus.failure.value
+
+    handler = _job_handlers.get(job.job_type)
+    if handler is None:
+        _job_finish(job_id, IrisJobStatus.failure, message=f'Unknown job type {job.job_type}')
+        return IrisJobStatus.failure.value
+
+    # Conditional, as the job may be cancelled meanwhile
+    started = db.session.execute(update(IrisJob).where(
+        IrisJob.id == job_id,
+        IrisJob.status == IrisJobStatus.pending.value,
+        IrisJob.cancel_requested.is_(False)
+    ).values(
+        status=IrisJobStatus.running.value,
+        started_at=datetime.datetime.utcnow(),
+        progress_updated_at=datetime.datetime.utcnow()
+    )).rowcount
+    db.session.commit()
+
+    if not started:
+        return IrisJobStatus.cancelled.value
+
+    context = JobContext(job)
+
+    with task_user_context(context.user_id):
+        try:
+            result = handler(context)
+
+        except JobCancelled as e:
+            db.session.rollback()
+            context.discard_result_file()
+            status = IrisJobStatus.partial if e.result else IrisJobStatus.cancelled
+            _job_finish(job_id, status, message=e.message or 'Cancelled', result=e.result)
+            return status.value
+
+        except BusinessProcessingError as e:
+            db.session.rollback()
+            context.discard_result_file()
+            _job_finish(job_id, IrisJobStatus.failure, message=e.get_message(), result=e.get_data())
+            return IrisJobStatus.failure.value
+
+        except Exception as e:
+            db.session.rollback()
+            context.discard_result_file()
+            log.exception(e)
+            _job_finish(job_id, IrisJobStatus.failure, message='Unexpected error, please check the worker logs')
+            return IrisJobStatus.failure.value
+
+    _job_finish(job_id, IrisJobStatus.success, message=(result or {}).pop('message', None), result=result,
+                context=context)
+
+    return IrisJobStatus.success.value
+
+
+@celery.on_after_finalize.connect
+def setup_periodic_jobs_results_purge(self, **kwargs):
+    self.add_periodic_task(
+        crontab(minute=0),
+        task_purge_jobs_results.s(),
+        name='iris_purge_jobs_results'
+    )
+
+
+def _fail_stale_jobs():
+    # The worker running these jobs was stopped before it could record their outcome
+    limit = datetime.datetime.utcnow() - datetime.timedelta(hours=app.config.get('JOBS_STALE_TIMEOUT'))
+
+    jobs = IrisJob.query.filter(
+        IrisJob.status == IrisJobStatus.running.value,
+        func.coalesce(IrisJob.progress_updated_at, IrisJob.started_at) < limit
+    ).with_for_update(skip_locked=True).all()
+
+    for job in jobs:
+        job.status = IrisJobStatus.failure.value
+        job.message = 'The job stopped progressing, please check the worker logs'
+        job.finished_at = datetime.datetime.utcnow()
+        _job_cleanup(job)
+
+    db.session.commit()
+
+    return len(jobs)
+
+
+@celery.task
+def task_purge_jobs_results():
+    """
+    Remove the result files of the jobs finished for more than JOBS_RESULTS_RETENTION hours, and fail the running jobs
+    which did not progress for JOBS_STALE_TIMEOUT hours
+    """
+    _fail_stale_jobs()
+
+    limit = datetime.datetime.utcnow() - datetime.timedelta(hours=app.config.get('JOBS_RESULTS_RETENTION'))
+
+    jobs = IrisJob.query.filter(
+        IrisJob.result_file_path.isnot(None),
+        IrisJob.finished_at < limit
+    ).all()
+
+    for job in jobs:
+        shutil.rmtree(os.path.dirname(job.result_file_path), ignore_errors=True)
+        job.result_file_path = None
+
+    db.session.commit()
+
+    return len(jobs)
@@ -0,0 +1,41 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from celery.schedules import crontab
+
+from app import celery
+from app.datamgmt.dashboard.statistics_db import rollup_daily_statistics
+
+
+@celery.on_after_finalize.connect
+def setup_periodic_daily_statistics_rollup(self, **kwargs):
+    self.add_periodic_task(
+        crontab(),
+        task_rollup_daily_statistics.s(),
+        name='iris_rollup_daily_statistics'
+    )
+
+
+@celery.task
+def task_rollup_daily_statistics():
+    """
+    Roll up the deltas of the daily statistics appended by the database triggers
+
+    :return: The number of daily statistics rows updated
+    """
+    return rollup_daily_statistics()
@@ -20,14 +20,19 @@
 import os
 import urllib.parse
 from celery.signals import task_prerun
+from celery.signals import worker_process_init
+from contextlib import contextmanager
 from flask_login import current_user
+from flask_login import login_user
 
 from app import app
 from app import db
 from app.datamgmt.case.case_db import get_case
+from app.iris_engine.module_handler.module_handler import modules_pool_warm_up
 from app.iris_engine.module_handler.module_handler import pipeline_dispatcher
 from app.iris_engine.utils.common import build_upload_path
 from app.iris_engine.utils.tracker import track_activity
+from app.models.authorization import User
 from iris_interface import IrisInterfaceStatus as IStatus
 from iris_interface.IrisModuleInterface import IrisPipelineTypes
 
@@ -40,6 +45,13 @@ def on_task_init(*args, **kwargs):
     db.engine.dispose()
 
 
+@worker_process_init.connect
+def on_worker_process_init(*args, **kwargs):
+    db.engine.dispose()
+    with app.app_context():
+        modules_pool_warm_up()
+
+
 def task_case_update(module, pipeline, pipeline_args, caseid):
     """
     Update the current case of the current user with fresh data.
@@ -94,6 +106,17 @@ def task_case_update(module, pipeline, pipeline_args, caseid):
         return IStatus.I2UnexpectedResult("Invalid context")
 
 
+@contextmanager
+def task_user_context(user_id):
+    """
+    Run the business code of a task on behalf of the user who submitted it, as the code relies on current_user
+    for the history, the activities and the modules hooks
+    """
+    with app.test_request_context():
+        login_user(User.query.get(user_id))
+        yield
+
+
 def chunks(lst, n):
     """Yield successive n-sized chunks from lst."""
     for i in range(0, len(lst), n):
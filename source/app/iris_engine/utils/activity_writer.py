@@ -0,0 +1,177 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+# The user activities are buffered and written with a single multi-row insert, through their own connection, so that
+# tracking an activity never commits the transaction of the caller. The activities tracked within a request, which
+# includes the jobs running on behalf of a user, are written once the session of the request is removed, and dropped if
+# the request fails with an unhandled error, as its changes are rolled back. The ones tracked outside of a request are
+# written once ACTIVITIES_BUFFER_SIZE are pending or ACTIVITIES_FLUSH_INTERVAL seconds elapsed, at the end
+# of each Celery task, and when the process exits.
+import atexit
+import threading
+import time
+from celery.signals import task_postrun
+from celery.signals import worker_process_shutdown
+from flask import g
+from flask import has_app_context
+from flask import has_request_context
+from sqlalchemy import insert
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app import app
+from app import db
+from app.models.models import UserActivity
+
+log = app.logger
+
+# An activity may reference a case the caller still locks within its transaction. The writes made while the caller
+# is running give up after this delay and are retried later, rather than waiting for the caller forever
+_FLUSH_LOCK_TIMEOUT = '2s'
+
+_pending_activities = []
+_pending_activities_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+def _insert_activities(activities: list):
+    with db.engine.begin() as connection:
+        connection.execute(text(f"SET LOCAL lock_timeout = '{_FLUSH_LOCK_TIMEOUT}'"))
+        connection.execute(insert(UserActivity).values(activities))
+
+
+def _write_activities(activities: list, final: bool) -> list:
+    """
+    Write activities with a single insert
+
+    :param activities: Values of the activities to write
+    :param final: Whether the activities can no longer be retried. They are then written one by one if the insert
+                  fails, so that an invalid activity does not discard the others
+    :return: The activities left to write later
+    """
+    if not activities:
+        return []
+
+    try:
+        _insert_activities(activities)
+        return []
+
+    except SQLAlchemyError as e:
+        if not final:
+            log.warning(f'Unable to write {len(activities)} activities, retrying later: {e.__class__.__name__}')
+            return activities
+
+        log.warning(f'Unable to write {len(activities)} activities at once, writing them one by one')
+
+    for activity in activities:
+        try:
+            _insert_activities([activity])
+        except SQLAlchemyError as e:
+            log.error(f'Activity not recorded: {activity}: {e}')
+
+    return []
+
+
+def _flush_process_activities(final: bool):
+    global _last_flush
+
+    with _pending_activities_lock:
+        activities = _pending_activities[:]
+        _pending_activities.clear()
+        _last_flush = time.monotonic()
+
+    if not activities:
+        return
+
+    if has_app_context():
+        remaining = _write_activities(activities, final)
+    else:
+        with app.app_context():
+            remaining = _write_activities(activities, final)
+
+    if remaining:
+        with _pending_activities_lock:
+            _pending_activities[:0] = remaining
+
+
+def buffer_activity(activity: dict):
+    """
+    Queue an activity to be written
+
+    :param activity: Values of the UserActivity columns. All the activities are expected to hold the same columns
+    """
+    if has_request_context():
+        activities = g.setdefault('pending_activities', [])
+        activities.append(activity)
+
+        # A failed write is not retried before the end of the request
+        if len(activities) >= app.config.get('ACTIVITIES_BUFFER_SIZE') and not g.get('activities_flush_failed'):
+            g.pending_activities = _write_activities(activities, final=False)
+            g.activities_flush_failed = bool(g.pending_activities)
+
+        return
+
+    with _pending_activities_lock:
+        _pending_activities.append(activity)
+        flush_due = (len(_pending_activities) >= app.config.get('ACTIVITIES_BUFFER_SIZE') or
+                     time.monotonic() - _last_flush >= app.config.get('ACTIVITIES_FLUSH_INTERVAL'))
+
+    if flush_due:
+        _flush_process_activities(final=False)
+
+
+def flush_activities():
+    """
+    Write the pending activities of the current request, or of the process outside of a request
+    """
+    if has_request_context():
+        _write_activities(g.pop('pending_activities', []), final=True)
+        g.pop('activities_flush_failed', None)
+        return
+
+    _flush_process_activities(final=True)
+
+
+@app.teardown_appcontext
+def _flush_request_activities(exception=None):
+    # The teardown handlers run in the reverse order of their registration, hence before the session is removed by
+    # shutdown_session. Remove it first, so that the transaction of the request no longer holds its locks
+    db.session.remove()
+
+    activities = g.pop('pending_activities', [])
+    g.pop('activities_flush_failed', None)
+
+    if exception is not None:
+        if activities:
+            log.warning(f'Request failed, {len(activities)} activities of its rolled back changes not recorded')
+        return
+
+    _write_activities(activities, final=True)
+
+
+@task_postrun.connect
+def _flush_task_activities(**kwargs):
+    _flush_process_activities(final=True)
+
+
+@worker_process_shutdown.connect
+def _flush_worker_activities(**kwargs):
+    _flush_process_activities(final=True)
+
+
+atexit.register(_flush_process_activities, final=True)
@@ -21,7 +21,7 @@ from flask import request
 from flask_login import current_user
 
 import app
-from app import db
+from app.iris_engine.utils.activity_writer import buffer_activity
 from app.models.models import UserActivity
 
 log = app.app.logger
@@ -29,38 +29,33 @@ log = app.app.logger
 
 def track_activity(message, caseid=None, ctx_less=False, user_input=False, display_in_ui=True):
     """
-    Register a user activity in DB.
+    Register a user activity in DB. The activity is buffered and written outside of the transaction of the caller,
+    at the end of the request at the latest, so the caller commits its own changes.
     :param message: Message to save as activity
-    :return: Nothing
+    :return: The activity, which is not attached to the session
     """
-    ua = UserActivity()
-
-    try:
-
-        ua.user_id = current_user.id
-
-    except:
-        pass
-
     try:
-        ua.case_id = caseid if ctx_less is False else None
+        user_id = current_user.id
     except Exception:
-        pass
+        user_id = None
 
-    ua.activity_date = datetime.utcnow()
-    ua.activity_desc = message.capitalize()
+    activity_desc = message.capitalize()
 
     if current_user.is_authenticated:
-        log.info(f"{current_user.user} [#{current_user.id}] :: Case {caseid} :: {ua.activity_desc}")
+        log.info(f"{current_user.user} [#{current_user.id}] :: Case {caseid} :: {activity_desc}")
     else:
-        log.info(f"Anonymous :: Case {caseid} :: {ua.activity_desc}")
-
-    ua.user_input = user_input
-    ua.display_in_ui = display_in_ui
+        log.info(f"Anonymous :: Case {caseid} :: {activity_desc}")
 
-    ua.is_from_api = (request.cookies.get('session') is None if request else False)
+    activity = {
+        'user_id': user_id,
+        'case_id': caseid if ctx_less is False else None,
+        'activity_date': datetime.utcnow(),
+        'activity_desc': activity_desc,
+        'user_input': user_input,
+        'is_from_api': (request.cookies.get('session') is None if request else False),
+        'display_in_ui': display_in_ui
+    }
 
-    db.session.add(ua)
-    db.session.commit()
+    buffer_activity(activity)
 
-    return ua
+    return UserActivity(**activity)
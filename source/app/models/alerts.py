@@ -16,8 +16,10 @@
 #  along with this program; if not, write to the Free Software Foundation,
 #  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
+from datetime import date
 from datetime import datetime
 
+import hashlib
 import uuid
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy import BigInteger
@@ -35,6 +37,28 @@ from app import db
 from app.models.models import alert_assets_association
 from app.models.models import alert_iocs_association
 
+SIMILAR_ALERTS_OBSERVABLE_ASSET = 'asset'
+SIMILAR_ALERTS_OBSERVABLE_IOC = 'ioc'
+
+_TIME_BUCKET_EPOCH = date(1970, 1, 1)
+
+
+def similar_alerts_observable_hash(observable_kind, observable_value, observable_type_id):
+    """
+    Returns the signed 64 bits key of an observable in the similar alerts cache.
+    The same key is computed in SQL by the migration which backfilled the cache, both must be kept in sync
+    """
+    type_id = '' if observable_type_id is None else observable_type_id
+    key = f'{observable_kind}:{type_id}:{observable_value or ""}'
+    return int.from_bytes(hashlib.md5(key.encode('utf-8')).digest()[:8], 'big', signed=True)
+
+
+def similar_alerts_time_bucket(moment: datetime):
+    """
+    Returns the day bucket, in days since epoch, of a moment in the similar alerts cache
+    """
+    return (moment.date() - _TIME_BUCKET_EPOCH).days
+
 
 class AlertCaseAssociation(db.Model):
     __tablename__ = 'alert_case_association'
@@ -119,6 +143,10 @@ class SimilarAlertsCache(db.Model):
     asset_type_id = Column(Integer, ForeignKey('assets_type.asset_id'), nullable=True)
     ioc_type_id = Column(Integer, ForeignKey('ioc_type.type_id'), nullable=True)
 
+    # Lookup keys, indexed with customer_id as (customer_id, observable_hash, time_bucket)
+    observable_hash = Column(BigInteger, nullable=True)
+    time_bucket = Column(Integer, nullable=True)
+
     alert = relationship('Alert')
     customer = relationship('Client')
     asset_type = relationship('AssetsType')
@@ -134,6 +162,14 @@ class SimilarAlertsCache(db.Model):
         self.ioc_type_id = ioc_type_id
         self.created_at = created_at if created_at else datetime.utcnow()
 
+        if asset_name is not None:
+            self.observable_hash = similar_alerts_observable_hash(SIMILAR_ALERTS_OBSERVABLE_ASSET, asset_name,
+                                                                  asset_type_id)
+        else:
+            self.observable_hash = similar_alerts_observable_hash(SIMILAR_ALERTS_OBSERVABLE_IOC, ioc_value,
+                                                                  ioc_type_id)
+        self.time_bucket = similar_alerts_time_bucket(self.created_at)
+
 
 class AlertSimilarity(db.Model):
     __tablename__ = 'alert_similarity'
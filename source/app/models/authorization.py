@@ -24,6 +24,7 @@ from sqlalchemy import BigInteger, JSON
 from sqlalchemy import Boolean
 from sqlalchemy import Column
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import String
 from sqlalchemy import Text
@@ -142,6 +143,10 @@ class UserCaseAccess(db.Model):
 
 class UserCaseEffectiveAccess(db.Model):
     __tablename__ = "user_case_effective_access"
+    __table_args__ = (
+        # Target of the effective access upserts
+        Index('idx_user_case_effective_access_user_case', 'user_id', 'case_id', unique=True),
+    )
 
     id = Column(BigInteger, primary_key=True, nullable=False)
     user_id = Column(BigInteger, ForeignKey('user.id'), nullable=False)
@@ -26,7 +26,9 @@ from sqlalchemy import Column
 from sqlalchemy import Date
 from sqlalchemy import DateTime
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import Integer
+from sqlalchemy import Sequence
 from sqlalchemy import String
 from sqlalchemy import Text
 from sqlalchemy import UniqueConstraint
@@ -169,6 +171,12 @@ class CaseTags(db.Model):
     tag_id = Column(ForeignKey('tags.id'), primary_key=True, nullable=False, index=True)
 
 
+# Shared by the events and their deletions, so that the changes of a timeline can be read in order. The values are
+# taken again when the transaction commits, by the triggers of the cases_events, case_events_category,
+# case_events_assets, case_events_ioc and cases_events_deletions tables, so that they follow the commit order
+cases_events_change_sequence = Sequence('cases_events_change_seq', metadata=db.Model.metadata)
+
+
 class CasesEvent(db.Model):
     __tablename__ = "cases_events"
 
@@ -193,6 +201,7 @@ class CasesEvent(db.Model):
     event_date_wtz = Column(DateTime)
     event_is_flagged = Column(Boolean, default=False)
     custom_attributes = Column(JSONB)
+    event_change_seq = Column(BigInteger, cases_events_change_sequence)
 
     case = relationship('Cases')
     user = relationship('User')
@@ -207,6 +216,19 @@ class CasesEvent(db.Model):
     )
 
 
+class CasesEventDeletion(db.Model):
+    __tablename__ = "cases_events_deletions"
+
+    id = Column(BigInteger, primary_key=True)
+    case_id = Column(ForeignKey('cases.case_id'), nullable=False)
+    event_id = Column(BigInteger, nullable=False)
+    event_change_seq = Column(BigInteger, cases_events_change_sequence, nullable=False)
+
+    __table_args__ = (
+        Index('idx_cases_events_deletions_case_seq', 'case_id', 'event_change_seq'),
+    )
+
+
 class CaseState(db.Model):
     __tablename__ = 'case_state'
 
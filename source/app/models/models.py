@@ -23,8 +23,10 @@ import uuid
 from sqlalchemy import BigInteger, UniqueConstraint, Table
 from sqlalchemy import Boolean
 from sqlalchemy import Column
+from sqlalchemy import Date
 from sqlalchemy import DateTime
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import LargeBinary
 from sqlalchemy import Sequence
@@ -315,6 +317,35 @@ class ObjectState(db.Model):
     updated_by = relationship('User')
 
 
+class DailyStatistics(db.Model):
+    """
+    Number of cases, alerts and tasks per day of creation, customer and current status. The rows are maintained from
+    the deltas appended by database triggers on the objects tables, so the dashboards read O(days) rows whatever the
+    number of objects
+    """
+    __tablename__ = 'daily_statistics'
+
+    stat_day = Column(Date, primary_key=True)
+    client_id = Column(Integer, primary_key=True)
+    object_type = Column(Text, primary_key=True)
+    status_id = Column(Integer, primary_key=True)
+    object_count = Column(BigInteger, nullable=False, server_default='0')
+
+
+class DailyStatisticsDelta(db.Model):
+    """
+    Changes of the daily statistics appended by the triggers, which are periodically rolled up into DailyStatistics
+    """
+    __tablename__ = 'daily_statistics_delta'
+
+    id = Column(BigInteger, primary_key=True)
+    stat_day = Column(Date, nullable=False)
+    client_id = Column(Integer, nullable=False)
+    object_type = Column(Text, nullable=False)
+    status_id = Column(Integer, nullable=False)
+    object_count = Column(BigInteger, nullable=False)
+
+
 class EventCategory(db.Model):
     __tablename__ = 'event_category'
 
@@ -448,6 +479,22 @@ class DataStorePath(db.Model):
     case = relationship('Cases')
 
 
+class DataStoreBlob(db.Model):
+    __tablename__ = 'data_store_blob'
+    __table_args__ = (
+        UniqueConstraint('blob_sha256', 'blob_password_sha256', name='data_store_blob_sha256_password_key'),
+    )
+
+    blob_id = Column(BigInteger, primary_key=True)
+    blob_sha256 = Column(Text, nullable=False)
+    # Password protected blobs are stored zipped, once per password. Empty for the plain blobs
+    blob_password_sha256 = Column(Text, nullable=False, server_default='')
+    blob_size = Column(BigInteger, nullable=False)
+    blob_local_name = Column(Text, nullable=False)
+    blob_ref_count = Column(BigInteger, nullable=False, server_default='0')
+    blob_date_added = Column(DateTime)
+
+
 class DataStoreFile(db.Model):
     __tablename__ = 'data_store_file'
 
@@ -467,12 +514,51 @@ class DataStoreFile(db.Model):
     added_by_user_id = Column(ForeignKey('user.id'), nullable=False)
     modification_history = Column(JSON)
     file_case_id = Column(ForeignKey('cases.case_id'), nullable=False)
+    file_blob_id = Column(ForeignKey('data_store_blob.blob_id'), nullable=True, index=True)
+
+    case = relationship('Cases')
+    user = relationship('User')
+    data_parent = relationship('DataStorePath')
+
+
+class DataStoreUpload(db.Model):
+    __tablename__ = 'data_store_upload'
+
+    upload_id = Column(BigInteger, primary_key=True)
+    upload_uuid = Column(UUID(as_uuid=True), default=uuid.uuid4, server_default=text("gen_random_uuid()"),
+                         nullable=False, unique=True)
+    upload_case_id = Column(ForeignKey('cases.case_id'), nullable=False, index=True)
+    upload_user_id = Column(ForeignKey('user.id'), nullable=False)
+    upload_parent_id = Column(ForeignKey('data_store_path.path_id'), nullable=False)
+    upload_size = Column(BigInteger, nullable=False)
+    upload_offset = Column(BigInteger, nullable=False, server_default='0')
+    upload_local_name = Column(Text, nullable=False)
+    upload_date_created = Column(DateTime, nullable=False)
+    upload_date_updated = Column(DateTime, nullable=False)
+    file_original_name = Column(Text, nullable=False)
+    file_description = Column(Text)
+    file_tags = Column(Text)
+    file_password = Column(Text)
+    file_is_ioc = Column(Boolean, nullable=False, server_default=text('false'))
+    file_is_evidence = Column(Boolean, nullable=False, server_default=text('false'))
 
     case = relationship('Cases')
     user = relationship('User')
     data_parent = relationship('DataStorePath')
 
 
+class GraphQLPersistedQuery(db.Model):
+    __tablename__ = 'graphql_persisted_query'
+
+    id = Column(BigInteger, primary_key=True)
+    query_hash = Column(Text, nullable=False, unique=True)
+    query_document = Column(Text, nullable=False)
+    created_by_id = Column(ForeignKey('user.id'), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+    created_by = relationship('User')
+
+
 class IocType(db.Model):
     __tablename__ = 'ioc_type'
 
@@ -730,10 +816,11 @@ class GlobalTasks(db.Model):
 class UserActivity(db.Model):
     __tablename__ = "user_activity"
 
-    id = Column(BigInteger, primary_key=True)
+    # Partitioned by month of activity_date, which is therefore part of the primary key
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
     user_id = Column(ForeignKey('user.id'), nullable=True)
     case_id = Column(ForeignKey('cases.case_id'), nullable=True)
-    activity_date = Column(DateTime)
+    activity_date = Column(DateTime, primary_key=True)
     activity_desc = Column(Text)
     user_input = Column(Boolean, default=False)
     is_from_api = Column(Boolean, default=False)
@@ -742,6 +829,12 @@ class UserActivity(db.Model):
     user = relationship('User')
     case = relationship('Cases')
 
+    __table_args__ = (
+        Index('idx_user_activity_date_id', 'activity_date', 'id'),
+        Index('idx_user_activity_case_date_id', 'case_id', 'activity_date', 'id'),
+        Index('idx_user_activity_user_date_id', 'user_id', 'activity_date', 'id'),
+    )
+
 
 class ServerSettings(db.Model):
     __table_name__ = "server_settings"
@@ -975,6 +1068,43 @@ class CeleryTaskMeta(db.Model):
         return str(self.id) + ' - ' + str(self.user)
 
 
+class IrisJobStatus(enum.Enum):
+    pending = 'pending'
+    running = 'running'
+    success = 'success'
+    failure = 'failure'
+    cancelled = 'cancelled'
+    # Cancelled after some of its changes were committed, which are listed in its result
+    partial = 'partial'
+
+
+class IrisJob(db.Model):
+    __tablename__ = 'iris_jobs'
+
+    id = Column(BigInteger, primary_key=True)
+    job_uuid = Column(UUID(as_uuid=True), default=uuid.uuid4, server_default=text("gen_random_uuid()"),
+                      nullable=False, unique=True)
+    job_type = Column(Text, nullable=False)
+    status = Column(Text, nullable=False, default=IrisJobStatus.pending.value)
+    # Not foreign keys, the jobs outlive the cases they delete and are kept as an audit of the users actions
+    case_id = Column(BigInteger, nullable=True)
+    user_id = Column(Integer, nullable=False, index=True)
+    task_id = Column(Text, nullable=True)
+    parameters = Column(JSONB, nullable=True)
+    progress_current = Column(BigInteger, nullable=False, default=0)
+    progress_total = Column(BigInteger, nullable=True)
+    message = Column(Text, nullable=True)
+    result = Column(JSONB, nullable=True)
+    result_file_path = Column(Text, nullable=True)
+    result_file_name = Column(Text, nullable=True)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    # Tells the jobs still progressing from the ones whose worker stopped
+    progress_updated_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+
 def create_safe_attr(session, attribute_display_name, attribute_description, attribute_for, attribute_content):
     cat = CustomAttribute.query.filter(
         CustomAttribute.attribute_display_name == attribute_display_name,
@@ -47,6 +47,7 @@ from app.datamgmt.manage.manage_groups_db import get_group_by_name
 from app.iris_engine.access_control.utils import ac_get_mask_full_permissions
 from app.iris_engine.module_handler.module_handler import check_module_health
 from app.iris_engine.module_handler.module_handler import instantiate_module_from_name
+from app.iris_engine.module_handler.module_handler import modules_pool_warm_up
 from app.iris_engine.module_handler.module_handler import register_module
 from app.models.models import create_safe_limited
 from app.models.alerts import Severity, AlertStatus, AlertResolutionStatus
@@ -267,6 +268,9 @@ def run_post_init(development=False):
                                   cases_count=int(app.config.get('DEMO_CASES_COUNT', 20)),
                                   clients_count=int(app.config.get('DEMO_CLIENTS_COUNT', 4)))
 
+            log.info("Warming up modules instances pool")
+            modules_pool_warm_up()
+
             # Log completion message
             log.info("Post-init steps completed")
             log.warning("===============================")
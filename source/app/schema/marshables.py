@@ -20,12 +20,9 @@ import datetime
 import dateutil.parser
 import marshmallow
 import os
-import pyminizip
 import random
 import re
-import shutil
 import string
-import tempfile
 from flask_login import current_user
 from marshmallow import ValidationError
 from marshmallow import EXCLUDE
@@ -34,7 +31,6 @@ from marshmallow import post_load
 from marshmallow import pre_load
 from marshmallow.validate import Length
 from marshmallow_sqlalchemy import auto_field
-from pathlib import Path
 from sqlalchemy import func
 from sqlalchemy.orm import aliased
 from typing import Any
@@ -49,7 +45,11 @@ from werkzeug.datastructures import FileStorage
 from app import app
 from app import db
 from app import ma
-from app.datamgmt.datastore.datastore_db import datastore_get_standard_path
+from app.datamgmt.datastore.datastore_blobs_db import base64_chunks
+from app.datamgmt.datastore.datastore_blobs_db import datastore_attach_blob
+from app.datamgmt.datastore.datastore_blobs_db import datastore_blob_release
+from app.datamgmt.datastore.datastore_blobs_db import datastore_blob_store
+from app.datamgmt.datastore.datastore_blobs_db import file_storage_chunks
 from app.datamgmt.manage.manage_attribute_db import merge_custom_attributes
 from app.datamgmt.manage.manage_tags_db import add_db_tag
 from app.datamgmt.case.case_iocs_db import get_ioc_links
@@ -75,10 +75,12 @@ from app.models.models import Client
 from app.models.models import Comments
 from app.models.models import Contact
 from app.models.models import DataStoreFile
+from app.models.models import DataStoreUpload
 from app.models.models import EventCategory
 from app.models.models import GlobalTasks
 from app.models.models import Ioc
 from app.models.models import IocType
+from app.models.models import IrisJob
 from app.models.models import IrisModule
 from app.models.models import Notes
 from app.models.models import NotesGroup
@@ -94,10 +96,8 @@ from app.models.authorization import Organisation
 from app.models.authorization import User
 from app.models.cases import CaseState
 from app.models.cases import CaseProtagonist
-from app.util import file_sha256sum
 from app.util import str_to_bool
 from app.util import assert_type_mml
-from app.util import stream_sha256sum
 
 ALLOWED_EXTENSIONS = {'png', 'svg'}
 POSTGRES_INT_MAX = 2147483647
@@ -1230,13 +1230,18 @@ class EventSchema(ma.SQLAlchemyAutoSchema):
             if field not in data:
                 raise marshmallow.exceptions.ValidationError(f"Missing field {field}", field_name=field)
 
+        # Bulk imports resolve the references and register the tags once for all the events
+        bulk_import = self.context.get('bulk_import', False)
+
         assert_type_mml(input_var=int(data.get('event_category_id')),
                         field_name='event_category_id',
                         type=int)
 
-        event_cat = EventCategory.query.filter(EventCategory.id == int(data.get('event_category_id'))).count()
-        if not event_cat:
-            raise marshmallow.exceptions.ValidationError("Invalid event category ID", field_name="event_category_id")
+        if not bulk_import:
+            event_cat = EventCategory.query.filter(EventCategory.id == int(data.get('event_category_id'))).count()
+            if not event_cat:
+                raise marshmallow.exceptions.ValidationError("Invalid event category ID",
+                                                             field_name="event_category_id")
 
         assert_type_mml(input_var=data.get('event_assets'),
                         field_name='event_assets',
@@ -1248,6 +1253,9 @@ class EventSchema(ma.SQLAlchemyAutoSchema):
                             field_name='event_assets',
                             type=int)
 
+            if bulk_import:
+                continue
+
             ast = CaseAssets.query.filter(CaseAssets.asset_id == asset).count()
             if not ast:
                 raise marshmallow.exceptions.ValidationError("Invalid assets ID", field_name="event_assets")
@@ -1262,6 +1270,9 @@ class EventSchema(ma.SQLAlchemyAutoSchema):
                             field_name='event_iocs',
                             type=int)
 
+            if bulk_import:
+                continue
+
             ast = Ioc.query.filter(Ioc.ioc_id == ioc).count()
             if not ast:
                 raise marshmallow.exceptions.ValidationError("Invalid IOC ID", field_name="event_assets")
@@ -1275,7 +1286,8 @@ class EventSchema(ma.SQLAlchemyAutoSchema):
                 if not isinstance(tag, str):
                     raise marshmallow.exceptions.ValidationError("All items in list must be strings",
                                                                  field_name="event_tags")
-                add_db_tag(tag.strip())
+                if not bulk_import:
+                    add_db_tag(tag.strip())
 
         return data
 
@@ -1338,16 +1350,17 @@ class DSFileSchema(ma.SQLAlchemyAutoSchema):
         load_instance = True
         unknown = EXCLUDE
 
-    def ds_store_file_b64(self, filename: str, file_content: bytes, dsp: DataStorePath, cid: int) -> Tuple[
+    def ds_store_file_b64(self, filename: str, file_content: str, dsp: DataStorePath, cid: int) -> Tuple[
         DataStoreFile, bool]:
-        """Stores a file in the data store.
+        """Stores a base64 encoded file in the data store.
 
-        This method stores a file in the data store. If the file already exists in the data store, it returns the
-        existing file. Otherwise, it creates a new file and returns it.
+        This method stores a file in the data store. If the file already exists in the data store of the case, it
+        returns the existing file. Otherwise, it creates a new file and returns it. The content is decoded by chunks
+        while it is stored.
 
         Args:
             filename: The name of the file.
-            file_content: The content of the file.
+            file_content: The base64 encoded content of the file.
             dsp: The data store path where the file should be stored.
             cid: The ID of the case associated with the file.
 
@@ -1360,10 +1373,15 @@ class DSFileSchema(ma.SQLAlchemyAutoSchema):
         """
         try:
             filename = filename.rstrip().replace('\t', '').replace('\n', '').replace('\r', '')
-            file_hash = stream_sha256sum(file_content)
+            blob = datastore_blob_store(base64_chunks(file_content))
 
-            dsf = DataStoreFile.query.filter(DataStoreFile.file_sha256 == file_hash).first()
+            dsf = DataStoreFile.query.filter(
+                DataStoreFile.file_sha256 == blob.blob_sha256,
+                DataStoreFile.file_case_id == cid
+            ).first()
             if dsf:
+                datastore_blob_release(blob.blob_id)
+                db.session.commit()
                 exists = True
 
             else:
@@ -1377,22 +1395,16 @@ class DSFileSchema(ma.SQLAlchemyAutoSchema):
                 dsf.file_case_id = cid
                 dsf.file_date_added = datetime.datetime.now()
                 dsf.added_by_user_id = current_user.id
-                dsf.file_local_name = 'tmp_xc'
                 dsf.file_parent_id = dsp.path_id
-                dsf.file_sha256 = file_hash
+                datastore_attach_blob(dsf, blob)
 
                 db.session.add(dsf)
                 db.session.commit()
 
-                dsf.file_local_name = datastore_get_standard_path(dsf, cid).as_posix()
-                db.session.commit()
-
-                with open(dsf.file_local_name, 'wb') as fout:
-                    fout.write(file_content)
-
                 exists = False
 
         except Exception as e:
+            db.session.rollback()
             raise marshmallow.exceptions.ValidationError(
                 str(e),
                 field_name='file_password'
@@ -1402,23 +1414,21 @@ class DSFileSchema(ma.SQLAlchemyAutoSchema):
 
         return dsf, exists
 
-    def ds_store_file(self, file_storage: FileStorage, location: Path, is_ioc: bool, password: Optional[str]) -> Tuple[
-        str, int, str]:
-        """Stores a file in the data store.
+    def ds_store_file(self, file_storage: FileStorage, dsf: DataStoreFile, is_ioc: bool,
+                      password: Optional[str]) -> None:
+        """Stores the content of a file in the data store.
 
-        This method stores a file in the data store. If the file is an IOC and no password is provided, it uses a default
-        password. If a password is provided, it encrypts the file with the password. It returns the path, size, and hash
-        of the stored file.
+        This method streams the uploaded file to the data store blobs, and points the data store file to its blob,
+        releasing its previous content. If the file is an IOC and no password is provided, it uses a default
+        password. If a password is provided, the file is stored zipped with the password. The local name, size and
+        hash of the data store file are updated.
 
         Args:
             file_storage: The file to store.
-            location: The location where the file should be stored.
+            dsf: The data store file the content belongs to.
             is_ioc: Whether the file is an IOC.
             password: The password to use for encrypting the file.
 
-        Returns:
-            A tuple containing the path, size, and hash of the stored file.
-
         Raises:
             ValidationError: If there is an error storing the file.
 
@@ -1430,64 +1440,39 @@ class DSFileSchema(ma.SQLAlchemyAutoSchema):
             )
 
         if not file_storage.filename:
-            return None
+            return
 
         passwd = None
+        if is_ioc and not password:
+            passwd = 'infected'
+        elif password:
+            passwd = password
 
         try:
-            if is_ioc and not password:
-                passwd = 'infected'
-            elif password:
-                passwd = password
-
-            if passwd is not None:
-                try:
-                    with tempfile.NamedTemporaryFile(delete=False) as tmp:
-                        file_storage.save(tmp)
-                        file_storage.close()
-
-                        fn = tmp
-
-                    file_hash = file_sha256sum(fn.name)
-                    file_size = os.stat(fn.name).st_size
-
-                    file_path = location.as_posix() + '.zip'
-
-                    shutil.copyfile(fn.name, Path(fn.name).parent / file_hash)
-
-                    pyminizip.compress((Path(fn.name).parent / file_hash).as_posix(), None, file_path, passwd, 0)
-                    os.unlink(Path(tmp.name).parent / file_hash)
-                    os.unlink(fn.name)
-
-                except Exception as e:
-                    log.exception(e)
-                    raise marshmallow.exceptions.ValidationError(
-                        str(e),
-                        field_name='file_password'
-                    )
-
-            else:
-                file_storage.save(location)
-                file_storage.close()
-                file_path = location.as_posix()
-                file_size = location.stat().st_size
-                file_hash = file_sha256sum(file_path)
+            blob = datastore_blob_store(file_storage_chunks(file_storage), password=passwd)
+            file_storage.close()
 
         except Exception as e:
+            log.exception(e)
             raise marshmallow.exceptions.ValidationError(
                 str(e),
-                field_name='file_content'
+                field_name='file_password' if passwd is not None else 'file_content'
             )
 
-        if location is None:
-            raise marshmallow.exceptions.ValidationError(
-                "Unable to save file in target location",
-                field_name='file_content'
-            )
+        datastore_attach_blob(dsf, blob)
 
-        setattr(self, 'file_local_path', str(location))
+        setattr(self, 'file_local_path', str(dsf.file_local_name))
 
-        return file_path, file_size, file_hash
+
+class DataStoreUploadSchema(ma.SQLAlchemyAutoSchema):
+    """Schema for serializing the DataStoreUpload objects, without their password and partial file."""
+
+    class Meta:
+        model = DataStoreUpload
+        include_fk = True
+        exclude = ['upload_id', 'upload_local_name', 'file_password']
+        load_instance = True
+        unknown = EXCLUDE
 
 
 class ServerSettingsSchema(ma.SQLAlchemyAutoSchema):
@@ -2582,3 +2567,17 @@ class CaseDetailsSchema(ma.SQLAlchemyAutoSchema):
         load_instance = True
         include_relationships = True
         unknown = EXCLUDE
+
+
+class IrisJobSchema(ma.SQLAlchemyAutoSchema):
+    """Schema for serializing the IrisJob objects, without their internal parameters and file paths."""
+    has_result_file = ma.Method('get_has_result_file')
+
+    def get_has_result_file(self, obj):
+        return obj.result_file_path is not None
+
+    class Meta:
+        model = IrisJob
+        exclude = ['task_id', 'parameters', 'result_file_path', 'cancel_requested']
+        load_instance = True
+        unknown = EXCLUDE
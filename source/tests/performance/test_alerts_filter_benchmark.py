@@ -0,0 +1,106 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+from unittest import TestCase
+
+import logging
+import os
+import time
+from sqlalchemy import select
+from sqlalchemy import text
+
+from app import db
+from app.datamgmt.alerts.alerts_db import get_filtered_alerts
+from app.datamgmt.text_filters import text_filter
+from app.models.alerts import Alert
+from app.models.alerts import AlertStatus
+from app.models.alerts import Severity
+from app.models.models import Client
+from app.post_init import run_post_init
+from tests.clean_database import clean_db
+from tests.test_helper import TestHelper
+
+_ALERTS_NB = int(os.environ.get('IRIS_BENCHMARK_ALERTS', 1000000))
+_SOURCES = ['Wazuh', 'Elastic', 'Sentinel', 'Splunk', 'QRadar']
+_PER_PAGE = 100
+
+
+class TestAlertsFilterBenchmark(TestCase):
+    def setUp(self) -> None:
+        logging.info('SetUp called')
+        clean_db()
+        run_post_init()
+
+    def tearDown(self) -> None:
+        logging.info('Teardown called')
+        clean_db()
+
+    @staticmethod
+    def _create_alerts():
+        client = Client.query.first()
+        severity = Severity.query.first()
+        status = AlertStatus.query.first()
+
+        TestHelper.insert_chunks(Alert, ({
+            'alert_title': f'Suspicious logon on host-{i}',
+            'alert_description': f'Logon of account svc-{i % 1000} from an unusual location',
+            'alert_source': _SOURCES[i % len(_SOURCES)],
+            'alert_source_ref': f'REF-{i:08d}',
+            'alert_tags': f'logon,batch-{i % 100}',
+            'alert_severity_id': severity.severity_id,
+            'alert_status_id': status.status_id,
+            'alert_customer_id': client.client_id
+        } for i in range(_ALERTS_NB)))
+
+        db.session.execute(text('ANALYZE alerts'))
+        db.session.commit()
+
+    @staticmethod
+    def _run_filter(**filters):
+        start_time = time.perf_counter()
+        alerts = get_filtered_alerts(per_page=_PER_PAGE, cursor_mode=True, with_total=False, **filters)
+        return alerts.items, time.perf_counter() - start_time
+
+    @staticmethod
+    def _query_plan(condition):
+        query = select(Alert.alert_id).where(condition)
+        compiled = query.compile(db.engine, compile_kwargs={'literal_binds': True})
+        return '\n'.join(row[0] for row in db.session.execute(text(f'EXPLAIN {compiled}')))
+
+    def test_alerts_filters_on_large_table(self):
+        self._create_alerts()
+
+        # The last seeded alert is the only one whose title holds its number, the others have lower numbers
+        last_title = f'host-{_ALERTS_NB - 1}'
+        alerts, elapsed = self._run_filter(title=last_title)
+        logging.info(f'Alerts filtered on a title substring, {len(alerts)} alerts: {elapsed * 1000:.2f}ms')
+        self.assertEqual(1, len(alerts))
+
+        alerts, elapsed = self._run_filter(source_reference=f'"REF-{_ALERTS_NB - 1:08d}"')
+        logging.info(f'Alerts filtered on an exact source reference, {len(alerts)} alerts: {elapsed * 1000:.2f}ms')
+        self.assertEqual(1, len(alerts))
+
+        # One alert out of a thousand is from svc-999, all of them are in batch-99
+        alerts, elapsed = self._run_filter(description='svc-999 ', tags='batch-99')
+        logging.info(f'Alerts filtered on description and tags, {len(alerts)} alerts: {elapsed * 1000:.2f}ms')
+        self.assertEqual(min(_PER_PAGE, _ALERTS_NB // 1000), len(alerts))
+
+        self.assertIn('idx_alerts_alert_title_trgm', self._query_plan(text_filter(Alert.alert_title, last_title)))
+        self.assertIn('idx_alerts_alert_description_trgm',
+                      self._query_plan(text_filter(Alert.alert_description, 'svc-999 ')))
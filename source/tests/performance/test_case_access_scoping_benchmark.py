@@ -0,0 +1,118 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from unittest import TestCase
+
+import logging
+import os
+import time
+from sqlalchemy import desc
+from sqlalchemy import event
+from sqlalchemy import text
+
+from app import db
+from app.datamgmt.manage.manage_cases_db import build_filter_case_query
+from app.models.authorization import CaseAccessLevel
+from app.models.authorization import User
+from app.models.authorization import UserCaseEffectiveAccess
+from app.models.cases import Cases
+from app.models.models import Client
+from app.post_init import run_post_init
+from tests.clean_database import clean_db
+from tests.test_helper import TestHelper
+
+# The cases are added in steps, the query of the listing is checked after each of them
+_CASES_NB = int(os.environ.get('IRIS_BENCHMARK_CASES', 80000))
+_STEPS_NB = 4
+_PER_PAGE = 100
+
+
+class TestCaseAccessScopingBenchmark(TestCase):
+    def setUp(self) -> None:
+        logging.info('SetUp called')
+        clean_db()
+        run_post_init()
+
+    def tearDown(self) -> None:
+        logging.info('Teardown called')
+        clean_db()
+
+    def _add_cases(self, user_id, client_id, first, last):
+        TestHelper.insert_chunks(Cases, [{
+            'name': f'#{i} - Benchmark case',
+            'description': 'Benchmark case',
+            'client_id': client_id,
+            'user_id': user_id
+        } for i in range(first, last)])
+
+        cases = Cases.query.with_entities(Cases.case_id).filter(
+            ~Cases.case_id.in_(
+                UserCaseEffectiveAccess.query.with_entities(UserCaseEffectiveAccess.case_id).filter(
+                    UserCaseEffectiveAccess.user_id == user_id
+                )
+            )
+        ).all()
+
+        TestHelper.insert_chunks(UserCaseEffectiveAccess, [{
+            'user_id': user_id,
+            'case_id': case.case_id,
+            'access_level': CaseAccessLevel.full_access.value
+        } for case in cases])
+
+        db.session.execute(text('ANALYZE cases'))
+        db.session.execute(text('ANALYZE user_case_effective_access'))
+        db.session.commit()
+
+    @staticmethod
+    def _run_listing(user_id):
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(db.engine, 'before_cursor_execute', _record)
+        try:
+            start_time = time.perf_counter()
+            cases = build_filter_case_query(user_id).order_by(desc(Cases.case_id)).limit(_PER_PAGE).all()
+            elapsed = time.perf_counter() - start_time
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', _record)
+
+        return cases, statements, elapsed
+
+    def test_cases_listing_query_does_not_grow_with_the_cases(self):
+        user = User.query.first()
+        client = Client.query.first()
+
+        shapes = []
+        step_size = _CASES_NB // _STEPS_NB
+        for step in range(_STEPS_NB):
+            self._add_cases(user.id, client.client_id, step * step_size, (step + 1) * step_size)
+
+            cases, statements, elapsed = self._run_listing(user.id)
+            logging.info(f'Listing of {_PER_PAGE} cases out of {(step + 1) * step_size}: {elapsed * 1000:.2f}ms')
+            self.assertEqual(_PER_PAGE, len(cases))
+
+            # A single statement, restricted by a semi-join rather than by the list of the accessible cases
+            self.assertEqual(1, len(statements))
+            statement, parameters = statements[0]
+            self.assertIn('EXISTS (SELECT', statement)
+            self.assertIn('user_case_effective_access', statement)
+            shapes.append((statement, len(parameters)))
+
+        self.assertEqual(1, len(set(shapes)))
@@ -0,0 +1,135 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+from unittest import TestCase
+
+import logging
+import os
+import time
+
+from app import db
+from app.iris_engine.access_control.utils import ac_recompute_all_users_effective_ac
+from app.iris_engine.access_control.utils import ac_recompute_clients_effective_access
+from app.iris_engine.access_control.utils import ac_recompute_groups_effective_access
+from app.models.authorization import CaseAccessLevel
+from app.models.authorization import Group
+from app.models.authorization import GroupCaseAccess
+from app.models.authorization import User
+from app.models.authorization import UserCaseEffectiveAccess
+from app.models.authorization import UserClient
+from app.models.authorization import UserGroup
+from app.models.cases import Cases
+from app.models.models import Client
+from app.post_init import run_post_init
+from tests.clean_database import clean_db
+from tests.test_helper import TestHelper
+
+# Large tenant scenario, can be reduced through the environment for quicker runs
+_USERS_NB = int(os.environ.get('IRIS_BENCHMARK_USERS', 500))
+_CASES_NB = int(os.environ.get('IRIS_BENCHMARK_CASES', 50000))
+_CLIENTS_NB = 10
+_GROUP_CASES_NB = 5000
+
+
+class TestEffectiveAccessBenchmark(TestCase):
+    def setUp(self) -> None:
+        logging.info('SetUp called')
+        clean_db()
+        run_post_init()
+
+    def tearDown(self) -> None:
+        logging.info('Teardown called')
+        clean_db()
+
+    def _create_large_tenant(self):
+        TestHelper.insert_chunks(Client, [{'name': f'benchmark_client_{i}'} for i in range(_CLIENTS_NB)])
+        clients = [client.client_id for client in Client.query.filter(Client.name.like('benchmark_client_%')).all()]
+
+        TestHelper.insert_chunks(User, [{
+            'user': f'benchmark_user_{i}',
+            'name': f'Benchmark user {i}',
+            'email': f'benchmark_user_{i}@iris.local',
+            'active': True
+        } for i in range(_USERS_NB)])
+        users = [user.id for user in User.query.filter(User.user.like('benchmark_user_%')).all()]
+
+        TestHelper.insert_chunks(Cases, [{
+            'name': f'#{i} - Benchmark case',
+            'description': 'Benchmark case',
+            'client_id': clients[i % len(clients)],
+            'user_id': users[0]
+        } for i in range(_CASES_NB)])
+        cases = [case.case_id for case in Cases.query.with_entities(Cases.case_id).all()]
+
+        group = Group(group_name='Benchmark group', group_description='Benchmark group', group_permissions=0)
+        db.session.add(group)
+        db.session.commit()
+
+        TestHelper.insert_chunks(GroupCaseAccess, [{
+            'group_id': group.group_id,
+            'case_id': case_id,
+            'access_level': CaseAccessLevel.read_only.value
+        } for case_id in cases[:_GROUP_CASES_NB]])
+
+        return users, cases, clients, group.group_id
+
+    @staticmethod
+    def _get_effective_access(user_id, case_id):
+        return UserCaseEffectiveAccess.query.with_entities(
+            UserCaseEffectiveAccess.access_level
+        ).filter(
+            UserCaseEffectiveAccess.user_id == user_id,
+            UserCaseEffectiveAccess.case_id == case_id
+        ).scalar()
+
+    def test_incremental_recompute_on_large_tenant(self):
+        users, cases, clients, group_id = self._create_large_tenant()
+
+        start_time = time.perf_counter()
+        ac_recompute_all_users_effective_ac()
+        full_time = time.perf_counter() - start_time
+        logging.info(f'Full recompute of {len(users)} users and {len(cases)} cases: {full_time:.2f}s')
+
+        members = users[:10]
+        db.session.add_all([UserGroup(user_id=user_id, group_id=group_id) for user_id in members])
+        db.session.commit()
+
+        start_time = time.perf_counter()
+        ac_recompute_groups_effective_access([group_id], members)
+        group_time = time.perf_counter() - start_time
+        logging.info(f'Group membership change of {len(members)} users: {group_time:.2f}s')
+
+        self.assertEqual(CaseAccessLevel.read_only.value, self._get_effective_access(members[0], cases[0]))
+        self.assertEqual(CaseAccessLevel.deny_all.value, self._get_effective_access(members[0], cases[-1]))
+
+        member = users[-1]
+        db.session.add(UserClient(user_id=member, client_id=clients[0],
+                                  access_level=CaseAccessLevel.full_access.value, allow_alerts=True))
+        db.session.commit()
+
+        start_time = time.perf_counter()
+        ac_recompute_clients_effective_access([clients[0]], [member])
+        client_time = time.perf_counter() - start_time
+        logging.info(f'Customer membership change of 1 user: {client_time:.2f}s')
+
+        client_case = Cases.query.filter(Cases.client_id == clients[0]).first()
+        self.assertEqual(CaseAccessLevel.full_access.value, self._get_effective_access(member, client_case.case_id))
+
+        self.assertLess(group_time, full_time)
+        self.assertLess(client_time, full_time)
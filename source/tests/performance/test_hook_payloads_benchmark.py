@@ -0,0 +1,123 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+from unittest import TestCase
+
+import logging
+import time
+from datetime import datetime
+
+from app import app
+from app import db
+from app.iris_engine.module_handler.hook_payloads import HOOK_PAYLOAD_FORMAT_COMPACT
+from app.iris_engine.module_handler.hook_payloads import HOOK_PAYLOAD_FORMAT_PICKLE
+from app.iris_engine.module_handler.hook_payloads import hook_payload_deserialize
+from app.iris_engine.module_handler.hook_payloads import hook_payload_serialize
+from app.models.alerts import Alert
+from app.models.alerts import AlertStatus
+from app.models.alerts import Severity
+from app.models.models import Client
+from app.post_init import run_post_init
+from tests.clean_database import clean_db
+
+
+class TestHookPayloadsBenchmark(TestCase):
+    def setUp(self) -> None:
+        logging.info('SetUp called')
+        clean_db()
+        run_post_init()
+        self._compact_hooks = app.config.get('MODULES_HOOKS_COMPACT_PAYLOAD')
+
+    def tearDown(self) -> None:
+        logging.info('Teardown called')
+        app.config['MODULES_HOOKS_COMPACT_PAYLOAD'] = self._compact_hooks
+        clean_db()
+
+    @staticmethod
+    def _create_burst_alerts(alerts_nb: int):
+        client = Client.query.first()
+        severity = Severity.query.first()
+        status = AlertStatus.query.first()
+
+        alerts = []
+        for i in range(alerts_nb):
+            alert = Alert(
+                alert_title=f"Alert #{str(i)}",
+                alert_description=f"Testing alert number {str(i)}",
+                alert_source="benchmark",
+                alert_source_content={'raw': 'x' * 4096, 'index': i},
+                alert_severity_id=severity.severity_id,
+                alert_status_id=status.status_id,
+                alert_source_event_time=datetime.utcnow(),
+                alert_customer_id=client.client_id
+            )
+            db.session.add(alert)
+            alerts.append(alert)
+
+        db.session.commit()
+        return alerts
+
+    def _benchmark_format(self, hook_name: str, alerts: list, rounds: int):
+        payload = None
+        payload_format = None
+
+        start_time = time.perf_counter()
+        for _ in range(rounds):
+            payload, payload_format = hook_payload_serialize(hook_name, alerts)
+        serialize_time = (time.perf_counter() - start_time) / rounds
+
+        start_time = time.perf_counter()
+        for _ in range(rounds):
+            data = hook_payload_deserialize(payload_format, payload)
+            if payload_format == HOOK_PAYLOAD_FORMAT_PICKLE:
+                # Same attachment as the task wrapper does for pickled objects
+                data = [db.session.merge(obj) for obj in data]
+            db.session.rollback()
+        deserialize_time = (time.perf_counter() - start_time) / rounds
+
+        logging.info(f"{payload_format}: {len(payload)} bytes, serialize {serialize_time * 1000:.2f}ms, "
+                     f"deserialize {deserialize_time * 1000:.2f}ms")
+
+        return payload_format, len(payload)
+
+    def test_compact_payload_against_pickle(self):
+        alerts = self._create_burst_alerts(500)
+        for alert in alerts:
+            # Loaded state as seen by a hook after an alert update
+            _ = alert.alert_title
+
+        app.config['MODULES_HOOKS_COMPACT_PAYLOAD'] = []
+        pickle_format, pickle_size = self._benchmark_format('on_postload_alert_update', alerts, 10)
+
+        app.config['MODULES_HOOKS_COMPACT_PAYLOAD'] = ['on_postload_alert_update']
+        compact_format, compact_size = self._benchmark_format('on_postload_alert_update', alerts, 10)
+
+        self.assertEqual(HOOK_PAYLOAD_FORMAT_PICKLE, pickle_format)
+        self.assertEqual(HOOK_PAYLOAD_FORMAT_COMPACT, compact_format)
+        self.assertLess(compact_size, pickle_size)
+
+    def test_compact_payload_rehydrates_objects(self):
+        alerts = self._create_burst_alerts(10)
+        app.config['MODULES_HOOKS_COMPACT_PAYLOAD'] = ['all']
+
+        payload, payload_format = hook_payload_serialize('on_postload_alert_create', alerts)
+        data = hook_payload_deserialize(payload_format, payload)
+
+        self.assertEqual([alert.alert_id for alert in alerts], [alert.alert_id for alert in data])
+        self.assertEqual({'raw': 'x' * 4096, 'index': 3}, data[3].alert_source_content)
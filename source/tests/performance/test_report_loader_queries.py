@@ -0,0 +1,149 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+from unittest import TestCase
+
+import logging
+from datetime import datetime
+from sqlalchemy import event
+
+from app import db
+from app.datamgmt.reporter.report_loader import ReportDataLoader
+from app.models.authorization import User
+from app.models.cases import Cases
+from app.models.cases import CasesEvent
+from app.models.models import AnalysisStatus
+from app.models.models import AssetsType
+from app.models.models import CaseAssets
+from app.models.models import CaseEventsAssets
+from app.models.models import CaseEventsIoc
+from app.models.models import CaseTasks
+from app.models.models import Comments
+from app.models.models import Ioc
+from app.models.models import IocAssetLink
+from app.models.models import IocType
+from app.models.models import Notes
+from app.models.models import NotesComments
+from app.models.models import TaskAssignee
+from app.models.models import TaskStatus
+from app.models.models import Tlp
+from app.post_init import run_post_init
+from tests.clean_database import clean_db
+
+
+class TestReportLoaderQueries(TestCase):
+    def setUp(self) -> None:
+        logging.info('SetUp called')
+        clean_db()
+        run_post_init()
+
+    def tearDown(self) -> None:
+        logging.info('Teardown called')
+        clean_db()
+
+    @staticmethod
+    def _add_case_objects(case_id, user_id, objects_nb):
+        asset_type = AssetsType.query.first()
+        analysis_status = AnalysisStatus.query.first()
+        ioc_types = IocType.query.limit(3).all()
+        tlp = Tlp.query.first()
+        task_status = TaskStatus.query.first()
+        now = datetime.utcnow()
+
+        for i in range(objects_nb):
+            asset = CaseAssets(asset_name=f'asset-{i}', asset_type_id=asset_type.asset_id, case_id=case_id,
+                               user_id=user_id, analysis_status_id=analysis_status.id, date_added=now)
+            ioc = Ioc(ioc_value=f'ioc-{i}', ioc_type_id=ioc_types[i % len(ioc_types)].type_id, ioc_tlp_id=tlp.tlp_id,
+                      user_id=user_id, case_id=case_id)
+            case_event = CasesEvent(case_id=case_id, event_title=f'event-{i}', event_date=now, event_added=now,
+                                    event_date_wtz=now, user_id=user_id)
+            task = CaseTasks(task_title=f'task-{i}', task_case_id=case_id, task_status_id=task_status.id,
+                             task_userid_open=user_id, task_open_date=now)
+            note = Notes(note_title=f'note-{i}', note_content='content', note_user=user_id, note_case_id=case_id,
+                         note_creationdate=now, note_lastupdate=now)
+            comment = Comments(comment_text=f'comment-{i}', comment_date=now, comment_user_id=user_id,
+                               comment_case_id=case_id)
+            db.session.add_all([asset, ioc, case_event, task, note, comment])
+            db.session.flush()
+
+            db.session.add_all([
+                IocAssetLink(ioc_id=ioc.ioc_id, asset_id=asset.asset_id),
+                CaseEventsAssets(event_id=case_event.event_id, asset_id=asset.asset_id, case_id=case_id),
+                CaseEventsIoc(event_id=case_event.event_id, ioc_id=ioc.ioc_id, case_id=case_id),
+                TaskAssignee(task_id=task.id, user_id=user_id),
+                NotesComments(comment_id=comment.comment_id, comment_note_id=note.note_id)
+            ])
+
+        db.session.commit()
+
+    @staticmethod
+    def _count_loader_queries(case_id):
+        statements = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        # Nothing in the identity map, so that every lazy load would show up
+        db.session.expunge_all()
+
+        event.listen(db.engine, 'before_cursor_execute', _count)
+        try:
+            loader = ReportDataLoader(case_id)
+            data = {
+                'timeline': loader.timeline(),
+                'assets': loader.assets(),
+                'iocs': loader.iocs(),
+                'tasks': loader.tasks(),
+                'notes': loader.notes()
+            }
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', _count)
+
+        return len(statements), data
+
+    def test_report_queries_do_not_grow_with_case_size(self):
+        case = Cases.query.first()
+        user = User.query.first()
+
+        self._add_case_objects(case.case_id, user.id, 5)
+        small_count, small_data = self._count_loader_queries(case.case_id)
+
+        self._add_case_objects(case.case_id, user.id, 200)
+        large_count, large_data = self._count_loader_queries(case.case_id)
+
+        logging.info(f'Report data loaded in {small_count} queries for 5 objects, {large_count} for 205 objects')
+        self.assertEqual(small_count, large_count)
+        self.assertEqual(205, len(large_data['timeline']))
+
+    def test_report_data_links_objects(self):
+        case = Cases.query.first()
+        user = User.query.first()
+
+        self._add_case_objects(case.case_id, user.id, 3)
+        _, data = self._count_loader_queries(case.case_id)
+
+        for case_event in data['timeline']:
+            self.assertEqual(1, len(case_event['assets']))
+            self.assertEqual(1, len(case_event['iocs']))
+        for asset in data['assets']:
+            self.assertEqual(1, len(asset['asset_ioc']))
+        for task in data['tasks']:
+            self.assertEqual(user.id, task['task_assignees'][0]['id'])
+        for note in data['notes']:
+            self.assertEqual(1, len(note['comments']))
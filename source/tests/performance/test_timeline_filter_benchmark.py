@@ -0,0 +1,147 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+from unittest import TestCase
+
+import logging
+import os
+import time
+from datetime import datetime
+from datetime import timedelta
+
+from app import db
+from app.datamgmt.case.case_events_db import get_case_timeline_filter_query
+from app.datamgmt.case.case_events_db import get_case_timeline_links
+from app.datamgmt.cursor_pagination import cursor_paginate
+from app.models.authorization import User
+from app.models.cases import Cases
+from app.models.cases import CasesEvent
+from app.models.models import AssetsType
+from app.models.models import CaseAssets
+from app.models.models import CaseEventsAssets
+from app.models.models import CaseEventsIoc
+from app.models.models import Ioc
+from app.post_init import run_post_init
+from tests.clean_database import clean_db
+from tests.test_helper import TestHelper
+
+_EVENTS_NB = int(os.environ.get('IRIS_BENCHMARK_EVENTS', 200000))
+_ASSETS_NB = 100
+_IOCS_NB = 100
+
+
+class TestTimelineFilterBenchmark(TestCase):
+    def setUp(self) -> None:
+        logging.info('SetUp called')
+        clean_db()
+        run_post_init()
+
+    def tearDown(self) -> None:
+        logging.info('Teardown called')
+        clean_db()
+
+    def _create_large_timeline(self):
+        case = Cases.query.first()
+        user = User.query.first()
+        asset_type = AssetsType.query.first()
+
+        TestHelper.insert_chunks(CaseAssets, [{
+            'asset_name': f'host-{i}',
+            'asset_type_id': asset_type.asset_id,
+            'case_id': case.case_id,
+            'user_id': user.id
+        } for i in range(_ASSETS_NB)])
+        assets = [asset.asset_id for asset in CaseAssets.query.filter(CaseAssets.case_id == case.case_id)
+                  .order_by(CaseAssets.asset_id).all()]
+
+        TestHelper.insert_chunks(Ioc, [{
+            'ioc_value': f'10.0.0.{i}',
+            'case_id': case.case_id,
+            'user_id': user.id
+        } for i in range(_IOCS_NB)])
+        iocs = [ioc.ioc_id for ioc in Ioc.query.filter(Ioc.case_id == case.case_id).order_by(Ioc.ioc_id).all()]
+
+        start_date = datetime(2026, 1, 1)
+        TestHelper.insert_chunks(CasesEvent, [{
+            'case_id': case.case_id,
+            'user_id': user.id,
+            'event_title': f'Event {i}',
+            'event_content': 'Synthetic event',
+            'event_date': start_date + timedelta(seconds=i),
+            'event_date_wtz': start_date + timedelta(seconds=i),
+            'event_tz': '+00:00',
+            'event_added': datetime.utcnow(),
+            'event_tags': '',
+            'event_in_graph': True,
+            'event_in_summary': False
+        } for i in range(_EVENTS_NB)])
+        events = [event.event_id for event in CasesEvent.query.with_entities(CasesEvent.event_id)
+                  .filter(CasesEvent.case_id == case.case_id).order_by(CasesEvent.event_id).all()]
+
+        # Each event is linked to two assets and one IOC
+        assets_links = []
+        iocs_links = []
+        for i, event_id in enumerate(events):
+            assets_links.append({'event_id': event_id, 'asset_id': assets[i % _ASSETS_NB], 'case_id': case.case_id})
+            assets_links.append({'event_id': event_id, 'asset_id': assets[(i + 1) % _ASSETS_NB],
+                                 'case_id': case.case_id})
+            iocs_links.append({'event_id': event_id, 'ioc_id': iocs[i % _IOCS_NB], 'case_id': case.case_id})
+
+        TestHelper.insert_chunks(CaseEventsAssets, assets_links)
+        TestHelper.insert_chunks(CaseEventsIoc, iocs_links)
+
+        return case.case_id, assets
+
+    @staticmethod
+    def _run_filter(caseid, per_page=None, **filters):
+        start_time = time.perf_counter()
+
+        query = get_case_timeline_filter_query(caseid, CasesEvent.case_id == caseid, **filters)
+        if per_page:
+            timeline = cursor_paginate(query, [CasesEvent.event_date, CasesEvent.event_id], per_page=per_page,
+                                       sort='asc').items
+            assets_links, iocs_links = get_case_timeline_links(caseid, events_list=[row.event_id for row in timeline])
+        else:
+            timeline = query.order_by(CasesEvent.event_date, CasesEvent.event_id).all()
+            assets_links, iocs_links = get_case_timeline_links(caseid)
+
+        for row in timeline:
+            assets_links.get(row.event_id, [])
+            iocs_links.get(row.event_id, [])
+
+        return timeline, time.perf_counter() - start_time
+
+    def test_timeline_filter_on_large_case(self):
+        caseid, assets = self._create_large_timeline()
+
+        timeline, elapsed = self._run_filter(caseid)
+        logging.info(f'Full timeline of {len(timeline)} events: {elapsed:.2f}s')
+        self.assertGreaterEqual(len(timeline), _EVENTS_NB)
+
+        timeline, elapsed = self._run_filter(caseid, assets=['host-1', 'host-2'])
+        logging.info(f'Timeline filtered on two assets, {len(timeline)} events: {elapsed:.2f}s')
+        self.assertEqual(_EVENTS_NB // _ASSETS_NB, len(timeline))
+
+        timeline, elapsed = self._run_filter(caseid, assets_id=[assets[3]], iocs=['10.0.0.3'])
+        logging.info(f'Timeline filtered on an asset and an IOC, {len(timeline)} events: {elapsed:.2f}s')
+        self.assertEqual(_EVENTS_NB // _ASSETS_NB, len(timeline))
+
+        timeline, elapsed = self._run_filter(caseid, per_page=500)
+        logging.info(f'First page of the timeline: {elapsed * 1000:.2f}ms')
+        self.assertEqual(500, len(timeline))
@@ -23,12 +23,18 @@ from unittest import TestCase
 import re
 from flask import url_for
 from flask.testing import FlaskClient
+from itertools import islice
 from random import randrange
+from sqlalchemy import insert
+from typing import Iterable
 
 from app import app
+from app import db
 from app.datamgmt.client.client_db import create_client
 from app.models import Client
 
+_INSERT_CHUNK_SIZE = 5000
+
 
 class TestHelper(TestCase):
     @staticmethod
@@ -59,3 +65,14 @@ class TestHelper(TestCase):
         new_client = create_client(client_name)
 
         return new_client
+
+    @staticmethod
+    def insert_chunks(model, rows: Iterable[dict]) -> None:
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, _INSERT_CHUNK_SIZE))
+            if not chunk:
+                break
+            db.session.execute(insert(model), chunk)
+
+        db.session.commit()
@@ -0,0 +1,149 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from unittest import TestCase
+
+import datetime
+from sqlalchemy import insert
+from sqlalchemy import text
+
+from app import app
+from app import db
+from app.datamgmt.activities.activities_db import create_activities_partitions
+from app.datamgmt.activities.activities_db import expire_activities_partition
+from app.datamgmt.activities.activities_db import get_activities_partitions
+from app.iris_engine.tasker.activities import task_maintain_activities_partitions
+from app.models.models import UserActivity
+from tests.clean_database import clean_db
+
+
+def _partition_name(month: datetime.date) -> str:
+    return f'user_activity_{month:%Y%m}'
+
+
+def _months_ago(months: int) -> datetime.date:
+    month = datetime.datetime.utcnow().date().replace(day=1)
+    for _ in range(months):
+        month = (month - datetime.timedelta(days=1)).replace(day=1)
+    return month
+
+
+class TestActivitiesPartitions(TestCase):
+    """
+    The tables are created by create_all, so the activities are partitioned here the same way as the migration does.
+    The partitions management functions are created by the migration
+    """
+
+    def setUp(self) -> None:
+        clean_db()
+        sequence = db.session.execute(text("SELECT pg_get_serial_sequence('user_activity', 'id')")).scalar()
+        db.session.execute(text(f'ALTER SEQUENCE {sequence} OWNED BY NONE'))
+        db.session.execute(text('DROP TABLE user_activity'))
+        db.session.execute(text(f"""
+            CREATE TABLE user_activity (
+                id bigint NOT NULL DEFAULT nextval('{sequence}'),
+                user_id integer REFERENCES "user" (id),
+                case_id integer REFERENCES cases (case_id),
+                activity_date timestamp NOT NULL,
+                activity_desc text,
+                user_input boolean,
+                is_from_api boolean,
+                display_in_ui boolean,
+                PRIMARY KEY (id, activity_date)
+            ) PARTITION BY RANGE (activity_date)
+        """))
+        db.session.execute(text(f'ALTER SEQUENCE {sequence} OWNED BY user_activity.id'))
+        db.session.execute(text('CREATE TABLE user_activity_default PARTITION OF user_activity DEFAULT'))
+        db.session.commit()
+
+        self._config = {key: app.config.get(key) for key in ('ACTIVITIES_RETENTION', 'ACTIVITIES_RETENTION_POLICY')}
+
+    def tearDown(self) -> None:
+        app.config.update(self._config)
+        db.session.rollback()
+        archives = db.session.execute(text(
+            "SELECT tablename FROM pg_tables WHERE tablename LIKE 'user_activity_archive_%'"
+        )).scalars().all()
+        for archive in archives:
+            db.session.execute(text(f'DROP TABLE {archive}'))
+        db.session.commit()
+        clean_db()
+
+    @staticmethod
+    def _add_activity(activity_date: datetime.datetime):
+        db.session.execute(insert(UserActivity).values(activity_date=activity_date, activity_desc='activity'))
+        db.session.commit()
+
+    @staticmethod
+    def _count_rows(table_name: str) -> int:
+        return db.session.execute(text(f'SELECT count(*) FROM {table_name}')).scalar()
+
+    @staticmethod
+    def _table_exists(table_name: str) -> bool:
+        return db.session.execute(text('SELECT to_regclass(:name) IS NOT NULL'), {'name': table_name}).scalar()
+
+    def test_maintain_partitions_should_create_the_partitions_of_the_coming_months(self):
+        app.config['ACTIVITIES_RETENTION'] = 0
+
+        task_maintain_activities_partitions()
+
+        current_month = _months_ago(0)
+        self.assertEqual(3, len([month for _, month in get_activities_partitions() if month >= current_month]))
+
+    def test_create_partition_should_move_the_rows_of_its_month_out_of_the_default_partition(self):
+        month = _months_ago(6)
+        self._add_activity(datetime.datetime.combine(month, datetime.time(12)))
+        self.assertEqual(1, self._count_rows('user_activity_default'))
+
+        create_activities_partitions(month, month)
+
+        self.assertEqual(0, self._count_rows('user_activity_default'))
+        self.assertEqual(1, self._count_rows(_partition_name(month)))
+
+    def test_expire_partition_should_keep_the_rows_of_an_archived_partition(self):
+        month = _months_ago(6)
+        create_activities_partitions(month, month)
+        self._add_activity(datetime.datetime.combine(month, datetime.time(12)))
+
+        expire_activities_partition(_partition_name(month), True)
+
+        self.assertNotIn(month, [partition_month for _, partition_month in get_activities_partitions()])
+        self.assertEqual(1, self._count_rows(f'user_activity_archive_{month:%Y%m}'))
+        self.assertEqual(0, UserActivity.query.count())
+
+    def test_expire_partition_should_drop_the_partition_when_not_archived(self):
+        month = _months_ago(6)
+        create_activities_partitions(month, month)
+        self._add_activity(datetime.datetime.combine(month, datetime.time(12)))
+
+        expire_activities_partition(_partition_name(month), False)
+
+        self.assertFalse(self._table_exists(_partition_name(month)))
+        self.assertFalse(self._table_exists(f'user_activity_archive_{month:%Y%m}'))
+        self.assertEqual(0, UserActivity.query.count())
+
+    def test_maintain_partitions_should_expire_the_partitions_older_than_the_retention(self):
+        app.config['ACTIVITIES_RETENTION'] = 2
+        app.config['ACTIVITIES_RETENTION_POLICY'] = 'drop'
+        create_activities_partitions(_months_ago(3), _months_ago(1))
+
+        expired = task_maintain_activities_partitions()
+
+        self.assertEqual(1, expired)
+        self.assertFalse(self._table_exists(_partition_name(_months_ago(3))))
+        self.assertTrue(self._table_exists(_partition_name(_months_ago(2))))
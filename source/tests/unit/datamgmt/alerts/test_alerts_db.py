@@ -0,0 +1,96 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from unittest import TestCase
+
+from uuid import uuid4
+
+from app import db
+from app.datamgmt.alerts.alerts_db import register_related_alerts
+from app.datamgmt.alerts.alerts_db import register_related_alerts_batch
+from app.models.alerts import Alert
+from app.models.alerts import AlertSimilarity
+from app.models.alerts import AlertStatus
+from app.models.alerts import Severity
+from app.models.models import Client
+from app.models.models import Ioc
+from app.models.models import IocType
+from app.models.models import Tlp
+from app.post_init import run_post_init
+from tests.clean_database import clean_db
+
+
+class TestAlertsDB(TestCase):
+    def setUp(self) -> None:
+        clean_db()
+        run_post_init()
+
+    def tearDown(self) -> None:
+        db.session.rollback()
+        clean_db()
+
+    @staticmethod
+    def _create_alert(title: str, ioc_value: str) -> Alert:
+        ioc = Ioc()
+        ioc.ioc_value = ioc_value
+        ioc.ioc_type_id = IocType.query.first().type_id
+        ioc.ioc_tlp_id = Tlp.query.first().tlp_id
+
+        alert = Alert()
+        alert.alert_title = title
+        alert.alert_severity_id = Severity.query.first().severity_id
+        alert.alert_status_id = AlertStatus.query.first().status_id
+        alert.alert_customer_id = Client.query.first().client_id
+        alert.iocs.append(ioc)
+
+        db.session.add(alert)
+        db.session.flush()
+
+        return alert
+
+    def test_register_related_alerts_sharing_title_and_ioc_should_register_each_similarity_once(self):
+        title = f'title{uuid4()}'
+        ioc_value = f'ioc{uuid4()}'
+        alert = self._create_alert(title, ioc_value)
+        register_related_alerts(alert)
+        similar_alert = self._create_alert(title, ioc_value)
+        register_related_alerts(similar_alert)
+        db.session.commit()
+
+        similarities = AlertSimilarity.query.filter(
+            AlertSimilarity.alert_id.in_([alert.alert_id, similar_alert.alert_id])
+        ).all()
+
+        self.assertEqual([
+            (similar_alert.alert_id, alert.alert_id, 'ioc_match'),
+            (similar_alert.alert_id, alert.alert_id, 'title_match')
+        ], sorted((s.alert_id, s.similar_alert_id, s.similarity_type) for s in similarities))
+
+    def test_register_related_alerts_batch_should_link_each_alert_to_the_earlier_ones_only(self):
+        title = f'title{uuid4()}'
+        alerts = [self._create_alert(title, f'ioc{uuid4()}') for _ in range(3)]
+        register_related_alerts_batch(alerts)
+        db.session.commit()
+
+        similarities = AlertSimilarity.query.filter(
+            AlertSimilarity.alert_id.in_([alert.alert_id for alert in alerts])
+        ).all()
+
+        first, second, third = [alert.alert_id for alert in alerts]
+        self.assertEqual([(second, first), (third, first), (third, second)],
+                         sorted((s.alert_id, s.similar_alert_id) for s in similarities))
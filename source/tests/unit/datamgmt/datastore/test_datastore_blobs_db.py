@@ -0,0 +1,142 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+from unittest import TestCase
+
+import hashlib
+from pathlib import Path
+
+from app import db
+from app.datamgmt.datastore.datastore_blobs_db import datastore_blob_release
+from app.datamgmt.datastore.datastore_blobs_db import _blob_local_path
+from app.datamgmt.datastore.datastore_blobs_db import blobs_temporary_dir
+from app.datamgmt.datastore.datastore_blobs_db import datastore_blob_store
+from app.datamgmt.datastore.datastore_blobs_db import datastore_blob_store_file
+from app.datamgmt.datastore.datastore_blobs_db import datastore_blobs_purge
+from app.models.models import DataStoreBlob
+from tests.clean_database import clean_db
+
+
+class TestDatastoreBlobsDB(TestCase):
+    def setUp(self) -> None:
+        clean_db()
+
+    def tearDown(self) -> None:
+        db.session.rollback()
+        for blob in DataStoreBlob.query.all():
+            Path(blob.blob_local_name).unlink(missing_ok=True)
+        clean_db()
+
+    @staticmethod
+    def _store(content: bytes) -> DataStoreBlob:
+        blob = datastore_blob_store(iter([content]))
+        db.session.commit()
+        return blob
+
+    @staticmethod
+    def _get_blob(blob_id) -> DataStoreBlob:
+        return db.session.get(DataStoreBlob, blob_id, populate_existing=True)
+
+    def test_store_same_content_should_reference_the_same_blob(self):
+        blob = self._store(b'same content')
+        other_blob = self._store(b'same content')
+
+        self.assertEqual(blob.blob_id, other_blob.blob_id)
+        self.assertEqual(2, self._get_blob(blob.blob_id).blob_ref_count)
+
+    def test_release_should_keep_the_blob_while_it_is_referenced(self):
+        blob = self._store(b'shared content')
+        self._store(b'shared content')
+
+        datastore_blob_release(blob.blob_id)
+        db.session.commit()
+
+        self.assertEqual(1, self._get_blob(blob.blob_id).blob_ref_count)
+        self.assertTrue(Path(blob.blob_local_name).is_file())
+
+    def test_release_of_the_last_reference_should_remove_the_blob_once_committed(self):
+        blob = self._store(b'released content')
+        blob_id = blob.blob_id
+        local_name = blob.blob_local_name
+
+        datastore_blob_release(blob_id)
+        self.assertTrue(Path(local_name).is_file())
+
+        db.session.commit()
+
+        self.assertIsNone(self._get_blob(blob_id))
+        self.assertFalse(Path(local_name).is_file())
+
+    def test_rolled_back_release_should_keep_the_blob(self):
+        blob = self._store(b'rolled back content')
+        blob_id = blob.blob_id
+        local_name = blob.blob_local_name
+
+        datastore_blob_release(blob_id)
+        db.session.rollback()
+        db.session.commit()
+
+        self.assertEqual(1, self._get_blob(blob_id).blob_ref_count)
+        self.assertTrue(Path(local_name).is_file())
+
+    def test_store_after_the_last_release_should_place_the_file_again(self):
+        blob = self._store(b'stored again content')
+        datastore_blob_release(blob.blob_id)
+        db.session.commit()
+
+        blob = self._store(b'stored again content')
+
+        self.assertEqual(1, self._get_blob(blob.blob_id).blob_ref_count)
+        self.assertTrue(Path(blob.blob_local_name).is_file())
+
+    def test_purge_should_remove_the_blobs_without_reference(self):
+        blob = self._store(b'unreferenced content')
+        blob_id = blob.blob_id
+        local_name = blob.blob_local_name
+        referenced_blob = self._store(b'referenced content')
+
+        # As if the removal after the commit of the release failed
+        blob.blob_ref_count = 0
+        db.session.commit()
+
+        self.assertEqual(1, datastore_blobs_purge())
+        self.assertIsNone(self._get_blob(blob_id))
+        self.assertFalse(Path(local_name).is_file())
+        self.assertTrue(Path(referenced_blob.blob_local_name).is_file())
+
+    def test_store_file_should_keep_the_file_when_the_blob_cannot_be_placed(self):
+        content = b'content of a blob that cannot be placed'
+        file_hash = hashlib.sha256(content).hexdigest().upper()
+        file_path = blobs_temporary_dir() / 'upload-unplaced.part'
+        file_path.write_bytes(content)
+
+        # A folder in place of the blob makes the move of the file fail
+        local_path = _blob_local_path(file_hash, '')
+        local_path.mkdir()
+        try:
+            with self.assertRaises(OSError):
+                datastore_blob_store_file(file_path, file_hash, len(content))
+            db.session.rollback()
+
+            self.assertEqual(content, file_path.read_bytes())
+            self.assertEqual(0, DataStoreBlob.query.filter(DataStoreBlob.blob_sha256 == file_hash).count())
+
+        finally:
+            local_path.rmdir()
+            file_path.unlink(missing_ok=True)
@@ -0,0 +1,70 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+from unittest import TestCase
+
+from app import db
+from app.datamgmt.states import _update_global_object_state
+from app.iris_engine.access_control.case_access_cache import CASE_ACCESS_NOT_CACHED
+from app.iris_engine.access_control.case_access_cache import case_access_cache_get
+from app.iris_engine.access_control.case_access_cache import case_access_cache_invalidate
+from app.iris_engine.access_control.case_access_cache import case_access_cache_set
+from app.iris_engine.access_control.case_access_cache import case_exists_cache_get
+from app.iris_engine.access_control.case_access_cache import case_exists_cache_set
+from tests.clean_database import clean_db
+
+
+class TestCaseAccessCache(TestCase):
+    def setUp(self) -> None:
+        clean_db()
+        case_access_cache_invalidate()
+
+    def tearDown(self) -> None:
+        case_access_cache_invalidate()
+        clean_db()
+
+    def test_case_access_cache_get_should_return_the_cached_decision(self):
+        case_access_cache_set(1, 1, (4, True))
+
+        self.assertEqual((4, True), case_access_cache_get(1, 1))
+
+    def test_case_access_cache_get_should_drop_the_decision_once_the_access_of_the_user_changed_elsewhere(self):
+        case_access_cache_set(1, 1, (4, True))
+
+        # As bumped by the database when another process changes the effective access of the user
+        _update_global_object_state('case_access:1')
+        db.session.commit()
+
+        self.assertIs(CASE_ACCESS_NOT_CACHED, case_access_cache_get(1, 1))
+
+    def test_case_access_cache_get_should_keep_the_decisions_of_the_other_users(self):
+        case_access_cache_set(2, 1, (4, True))
+
+        _update_global_object_state('case_access:1')
+        db.session.commit()
+
+        self.assertEqual((4, True), case_access_cache_get(2, 1))
+
+    def test_case_exists_cache_get_should_drop_the_case_once_the_cases_changed_elsewhere(self):
+        case_exists_cache_set(1)
+
+        _update_global_object_state('cases')
+        db.session.commit()
+
+        self.assertIs(CASE_ACCESS_NOT_CACHED, case_exists_cache_get(1))
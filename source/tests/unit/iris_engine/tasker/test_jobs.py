@@ -0,0 +1,73 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+from unittest import TestCase
+
+import datetime
+
+from app import app
+from app import db
+from app.iris_engine.tasker.jobs import task_purge_jobs_results
+from app.models.models import IrisJob
+from app.models.models import IrisJobStatus
+from tests.clean_database import clean_db
+
+
+class TestJobs(TestCase):
+    def setUp(self) -> None:
+        clean_db()
+
+    def tearDown(self) -> None:
+        clean_db()
+
+    @staticmethod
+    def _create_running_job(progress_hours_ago) -> int:
+        progress_updated_at = datetime.datetime.utcnow() - datetime.timedelta(hours=progress_hours_ago)
+
+        job = IrisJob()
+        job.job_type = 'case_export'
+        job.status = IrisJobStatus.running.value
+        job.user_id = 1
+        job.progress_current = 0
+        job.cancel_requested = False
+        job.created_at = progress_updated_at
+        job.started_at = progress_updated_at
+        job.progress_updated_at = progress_updated_at
+        db.session.add(job)
+        db.session.commit()
+
+        return job.id
+
+    @staticmethod
+    def _get_status(job_id):
+        return db.session.get(IrisJob, job_id, populate_existing=True).status
+
+    def test_purge_should_fail_the_running_jobs_which_stopped_progressing(self):
+        job_id = self._create_running_job(app.config.get('JOBS_STALE_TIMEOUT') + 1)
+
+        task_purge_jobs_results()
+
+        self.assertEqual(IrisJobStatus.failure.value, self._get_status(job_id))
+
+    def test_purge_should_keep_the_running_jobs_which_progress(self):
+        job_id = self._create_running_job(0)
+
+        task_purge_jobs_results()
+
+        self.assertEqual(IrisJobStatus.running.value, self._get_status(job_id))
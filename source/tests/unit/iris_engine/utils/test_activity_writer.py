@@ -0,0 +1,97 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+from unittest import TestCase
+
+import logging
+from sqlalchemy import event
+
+from app import app
+from app import db
+from app.iris_engine.utils.tracker import track_activity
+from app.models.models import Client
+from app.models.models import UserActivity
+from app.post_init import run_post_init
+from tests.clean_database import clean_db
+
+
+class TestActivityWriter(TestCase):
+    def setUp(self) -> None:
+        logging.info('SetUp called')
+        clean_db()
+        run_post_init()
+
+    def tearDown(self) -> None:
+        logging.info('Teardown called')
+        clean_db()
+
+    def test_request_activities_are_written_with_one_insert_at_request_end(self):
+        activities_nb = UserActivity.query.count()
+        inserts = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith('INSERT INTO user_activity'):
+                inserts.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', _count)
+        try:
+            with app.test_request_context():
+                for i in range(50):
+                    track_activity(f'activity {i}', ctx_less=True)
+                self.assertEqual(0, len(inserts))
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', _count)
+
+        self.assertEqual(1, len(inserts))
+        self.assertEqual(activities_nb + 50, UserActivity.query.count())
+
+    def test_request_activities_are_written_once_the_session_is_removed(self):
+        sessions_alive = []
+
+        def _check_session(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith('INSERT INTO user_activity'):
+                sessions_alive.append(db.session.registry.has())
+
+        event.listen(db.engine, 'before_cursor_execute', _check_session)
+        try:
+            with app.test_request_context():
+                db.session.add(Client(name='activity_writer_client'))
+                db.session.flush()
+                track_activity('activity of a committed change', ctx_less=True)
+                db.session.commit()
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', _check_session)
+
+        self.assertEqual([False], sessions_alive)
+        self.assertIsNotNone(UserActivity.query.filter(
+            UserActivity.activity_desc == 'Activity of a committed change'
+        ).first())
+
+    def test_activities_of_a_failed_request_are_not_written(self):
+        with self.assertRaises(RuntimeError):
+            with app.test_request_context():
+                db.session.add(Client(name='activity_writer_client'))
+                db.session.flush()
+                track_activity('activity of a rolled back change', ctx_less=True)
+                raise RuntimeError('request failed')
+
+        self.assertIsNone(Client.query.filter(Client.name == 'activity_writer_client').first())
+        self.assertIsNone(UserActivity.query.filter(
+            UserActivity.activity_desc == 'Activity of a rolled back change'
+        ).first())
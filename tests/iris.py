@@ -51,6 +51,12 @@ class Iris:
     def delete(self, path):
         return self._api.delete(path)
 
+    def upload(self, path, data, headers):
+        return self._api.put_data(path, data, headers)
+
+    def upload_files(self, path, files, data=None, query_parameters=None):
+        return self._api.post_files(path, files, data, query_parameters)
+
     def _create_user(self, user_name):
         body = {
             'user_name': user_name,
@@ -52,6 +52,15 @@ class RestApi:
         print(f'GET {url} => {response_as_string}')
         return response
 
+    def post_files(self, path, files, data=None, query_parameters=None):
+        url = self._build_url(path)
+        # The multipart Content-Type with its boundary is set by requests
+        headers = {name: value for name, value in self._headers.items() if name != 'Content-Type'}
+        response = requests.post(url, headers=headers, params=query_parameters, data=data, files=files)
+        response_as_string = self._convert_response_to_string(response)
+        print(f'POST {url} {list(files)} => {response_as_string}')
+        return response
+
     def put(self, path, payload):
         url = self._build_url(path)
         response = requests.put(url, headers=self._headers, json=payload)
@@ -59,6 +68,13 @@ class RestApi:
         print(f'PUT {url} {payload} => {response_as_string}')
         return response
 
+    def put_data(self, path, data, headers):
+        url = self._build_url(path)
+        response = requests.put(url, headers={**self._headers, **headers}, data=data)
+        response_as_string = self._convert_response_to_string(response)
+        print(f'PUT {url} {len(data)} bytes => {response_as_string}')
+        return response
+
     def delete(self, path, query_parameters=None):
         url = self._build_url(path)
         response = requests.delete(url, headers=self._headers, params=query_parameters)
@@ -21,6 +21,7 @@ from iris import Iris
 from iris import API_URL
 from graphql_api import GraphQLApi
 from base64 import b64encode
+from hashlib import sha256
 
 
 class TestsGraphQL(TestCase):
@@ -1132,3 +1133,80 @@ class TestsGraphQL(TestCase):
         for case in body['data']['cases']['edges']:
             test = case['node']['caseId']
             self.assertEqual(test, case_id)
+
+    def test_graphql_cases_iocs_should_only_return_the_iocs_of_each_case(self):
+        case_identifier = self._create_case()
+        payload = {
+            'query': f'mutation {{ iocCreate(caseId: {case_identifier}, typeId: 1, tlpId: 1, value: "batched") {{ ioc {{ iocId }} }} }}'
+        }
+        self._subject.execute_graphql_query(payload)
+        payload = {
+            'query': 'query { cases { edges { node { caseId iocs { edges { node { iocValue caseId } } } } } } }'
+        }
+        body = self._subject.execute_graphql_query(payload)
+        for case in body['data']['cases']['edges']:
+            for ioc in case['node']['iocs']['edges']:
+                self.assertEqual(case['node']['caseId'], ioc['node']['caseId'])
+
+    def test_graphql_cases_should_return_owner_and_client(self):
+        payload = {
+            'query': 'query { cases { edges { node { name owner { name } client { name } } } } }'
+        }
+        body = self._subject.execute_graphql_query(payload)
+        case = self._get_first_case(body)
+        self.assertIsNotNone(case['node']['client']['name'])
+
+    def test_graphql_cases_should_return_assets(self):
+        payload = {
+            'query': 'query { cases { totalCount edges { node { assets { totalCount edges { node { assetName } } } } } } }'
+        }
+        body = self._subject.execute_graphql_query(payload)
+        self.assertNotIn('errors', body)
+
+    def test_graphql_query_deeper_than_the_maximum_depth_should_fail(self):
+        payload = {
+            'query': '''query { cases { edges { node { iocs { edges { node { case { iocs { edges { node { case {
+                             iocs { edges { node { iocId } } } } } } } } } } } } } } }'''
+        }
+        body = self._subject.execute_graphql_query(payload)
+        self.assertIn('exceeds the maximum', body['errors'][0]['message'])
+
+    def test_graphql_query_costlier_than_the_maximum_cost_should_fail(self):
+        ioc_fields = ' '.join(f'field{index}: iocId' for index in range(25))
+        payload = {
+            'query': f'query {{ cases {{ edges {{ node {{ iocs {{ edges {{ node {{ {ioc_fields} }} }} }} }} }} }} }}'
+        }
+        body = self._subject.execute_graphql_query(payload)
+        self.assertIn('The query cost', body['errors'][0]['message'])
+
+    def test_graphql_query_should_return_at_most_the_maximum_page_size(self):
+        payload = {
+            'query': 'query { cases(first: 1000) { edges { node { iocs(first: 1000) { edges { node { iocId } } } } } } }'
+        }
+        body = self._subject.execute_graphql_query(payload)
+        self.assertNotIn('errors', body)
+        self.assertLessEqual(len(body['data']['cases']['edges']), 100)
+
+    def test_graphql_persisted_query_should_be_callable_by_its_hash_once_registered(self):
+        query = 'query { cases { edges { node { name } } } }'
+        query_hash = sha256(query.encode('utf-8')).hexdigest()
+        extensions = {'persistedQuery': {'version': 1, 'sha256Hash': query_hash}}
+        self._subject.execute_graphql_query({'query': query, 'extensions': extensions})
+        body = self._subject.execute_graphql_query({'extensions': extensions})
+        case = self._get_first_case(body)
+        self.assertEqual('#1 - Initial Demo', case['node']['name'])
+
+    def test_graphql_persisted_query_should_return_an_error_when_the_hash_is_unknown(self):
+        payload = {
+            'extensions': {'persistedQuery': {'version': 1, 'sha256Hash': sha256(b'unknown').hexdigest()}}
+        }
+        body = self._subject.execute_graphql_query(payload)
+        self.assertEqual('PERSISTED_QUERY_NOT_FOUND', body['errors'][0]['extensions']['code'])
+
+    def test_graphql_persisted_query_should_fail_when_the_hash_does_not_match_the_query(self):
+        payload = {
+            'query': 'query { cases { edges { node { name } } } }',
+            'extensions': {'persistedQuery': {'version': 1, 'sha256Hash': sha256(b'other').hexdigest()}}
+        }
+        body = self._subject.execute_graphql_query(payload)
+        self.assertEqual('The sha256Hash does not match the query.', body['errors'][0]['message'])
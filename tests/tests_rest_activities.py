@@ -0,0 +1,72 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from unittest import TestCase
+from iris import Iris
+
+
+class TestsRestActivities(TestCase):
+
+    def setUp(self) -> None:
+        self._subject = Iris()
+
+    def tearDown(self):
+        self._subject.clear_database()
+
+    def test_get_activities_should_return_200(self):
+        response = self._subject.get('/api/v2/activities')
+        self.assertEqual(200, response.status_code)
+
+    def test_get_activities_should_return_the_activities_of_a_case(self):
+        case_identifier = self._subject.create_dummy_case()
+        response = self._subject.get('/api/v2/activities', query_parameters={'case_id': case_identifier}).json()
+        self.assertNotEqual([], response['data'])
+        for activity in response['data']:
+            self.assertEqual(case_identifier, activity['case_id'])
+
+    def test_get_activities_should_return_the_next_page_with_the_next_cursor(self):
+        self._subject.create_dummy_case()
+        self._subject.create_dummy_case()
+        first_page = self._subject.get('/api/v2/activities', query_parameters={'per_page': 1}).json()
+        second_page = self._subject.get('/api/v2/activities', query_parameters={
+            'per_page': 1, 'cursor': first_page['next_cursor']
+        }).json()
+        self.assertGreaterEqual(first_page['data'][0]['activity_date'], second_page['data'][0]['activity_date'])
+        self.assertNotEqual(first_page['data'][0]['id'], second_page['data'][0]['id'])
+
+    def test_get_activities_should_return_nothing_after_the_end_date(self):
+        response = self._subject.get('/api/v2/activities', query_parameters={'end_date': '2000-01-01'}).json()
+        self.assertEqual([], response['data'])
+
+    def test_get_activities_should_return_400_when_cursor_is_invalid(self):
+        response = self._subject.get('/api/v2/activities', query_parameters={'cursor': 'invalid'})
+        self.assertEqual(400, response.status_code)
+
+    def test_get_activities_should_return_400_when_start_date_is_invalid(self):
+        response = self._subject.get('/api/v2/activities', query_parameters={'start_date': '18/10/2026'})
+        self.assertEqual(400, response.status_code)
+
+    def test_get_activities_should_return_200_when_only_one_date_has_an_offset(self):
+        query_parameters = {'start_date': '2026-10-18T00:00:00+02:00', 'end_date': '2026-10-19T00:00:00'}
+        response = self._subject.get('/api/v2/activities', query_parameters=query_parameters)
+        self.assertEqual(200, response.status_code)
+
+    def test_get_activities_should_return_400_when_start_date_is_after_end_date_in_utc(self):
+        query_parameters = {'start_date': '2026-10-19T01:00:00-02:00', 'end_date': '2026-10-19T02:00:00'}
+        response = self._subject.get('/api/v2/activities', query_parameters=query_parameters)
+        self.assertEqual(400, response.status_code)
@@ -85,3 +85,105 @@ class TestsRestAlerts(TestCase):
         response = self._subject.create(f'/alerts/merge/{alert_identifier}', body)
         # TODO should be 201
         self.assertEqual(200, response.status_code)
+
+    def test_get_alerts_with_cursor_should_page_through_all_alerts(self):
+        alert_title = f'title{uuid4()}'
+        body = {
+            'alert_title': alert_title,
+            'alert_severity_id': 4,
+            'alert_status_id': 3,
+            'alert_customer_id': 1
+        }
+        for _ in range(3):
+            self._subject.create('/alerts/add', body)
+        query_parameters = {'alert_title': alert_title, 'per_page': 2, 'cursor': ''}
+        first_page = self._subject.get('/api/v2/alerts', query_parameters=query_parameters).json()
+        query_parameters['cursor'] = first_page['next_cursor']
+        second_page = self._subject.get('/api/v2/alerts', query_parameters=query_parameters).json()
+        self.assertEqual(1, len(second_page['data']))
+
+    def test_get_alerts_with_cursor_should_return_exact_total_when_requested(self):
+        query_parameters = {'cursor': '', 'with_total': 'true'}
+        response = self._subject.get('/api/v2/alerts', query_parameters=query_parameters).json()
+        self.assertFalse(response['total_is_estimate'])
+
+    def test_get_alerts_with_invalid_cursor_should_return_400(self):
+        response = self._subject.get('/api/v2/alerts', query_parameters={'cursor': 'invalid'})
+        self.assertEqual(400, response.status_code)
+
+    def test_get_alert_similarities_should_include_new_alert_sharing_an_ioc(self):
+        ioc_value = f'ioc{uuid4()}'
+        body = {
+            'alert_title': 'title',
+            'alert_severity_id': 4,
+            'alert_status_id': 3,
+            'alert_customer_id': 1,
+            'alert_iocs': [{'ioc_value': ioc_value, 'ioc_type_id': 1, 'ioc_tlp_id': 1}]
+        }
+        response = self._subject.create('/alerts/add', body).json()
+        alert_identifier = response['data']['alert_id']
+        self._subject.get(f'/alerts/similarities/{alert_identifier}')
+        response = self._subject.create('/alerts/add', body).json()
+        similar_alert_identifier = response['data']['alert_id']
+        response = self._subject.get(f'/alerts/similarities/{alert_identifier}').json()
+        nodes = [node['id'] for node in response['data']['nodes']]
+        self.assertIn(f'alert_{similar_alert_identifier}', nodes)
+
+    def test_create_alerts_sharing_title_and_ioc_should_not_fail(self):
+        body = {
+            'alert_title': f'title{uuid4()}',
+            'alert_severity_id': 4,
+            'alert_status_id': 3,
+            'alert_customer_id': 1,
+            'alert_iocs': [{'ioc_value': f'ioc{uuid4()}', 'ioc_type_id': 1, 'ioc_tlp_id': 1}],
+            'alert_assets': [{'asset_name': f'asset{uuid4()}', 'asset_type_id': 1}]
+        }
+        alert_identifier = self._subject.create('/alerts/add', body).json()['data']['alert_id']
+        response = self._subject.create('/alerts/add', body)
+        self.assertEqual(200, response.status_code)
+        similar_alert_identifier = response.json()['data']['alert_id']
+        response = self._subject.get(f'/alerts/similarities/{similar_alert_identifier}').json()
+        nodes = [node['id'] for node in response['data']['nodes']]
+        self.assertEqual(1, nodes.count(f'alert_{alert_identifier}'))
+
+    def test_create_alerts_in_bulk_should_return_one_result_per_alert(self):
+        body = [
+            {
+                'alert_title': 'title',
+                'alert_severity_id': 4,
+                'alert_status_id': 3,
+                'alert_customer_id': 1
+            },
+            {
+                'alert_title': 'title',
+                'alert_severity_id': 4,
+                'alert_status_id': 3,
+                'alert_customer_id': 1
+            },
+            {
+                'alert_title': 'title',
+                'alert_severity_id': 4,
+                'alert_status_id': 3,
+                'alert_customer_id': 1000000
+            }
+        ]
+        response = self._subject.create('/api/v2/alerts/bulk', body).json()
+        self.assertEqual([True, True, False], [result['success'] for result in response['results']])
+
+    def test_create_alerts_in_bulk_should_return_400_when_body_is_not_an_array(self):
+        response = self._subject.create('/api/v2/alerts/bulk', {'alert_title': 'title'})
+        self.assertEqual(400, response.status_code)
+
+    def test_create_alerts_in_bulk_should_relate_alerts_of_the_same_batch(self):
+        alert = {
+            'alert_title': f'title{uuid4()}',
+            'alert_severity_id': 4,
+            'alert_status_id': 3,
+            'alert_customer_id': 1,
+            'alert_iocs': [{'ioc_value': f'ioc{uuid4()}', 'ioc_type_id': 1, 'ioc_tlp_id': 1}]
+        }
+        response = self._subject.create('/api/v2/alerts/bulk', [alert, alert]).json()
+        alert_identifier, similar_alert_identifier = [result['alert_id'] for result in response['results']]
+        response = self._subject.get(f'/alerts/similarities/{alert_identifier}').json()
+        nodes = [node['id'] for node in response['data']['nodes']]
+        self.assertIn(f'alert_{similar_alert_identifier}', nodes)
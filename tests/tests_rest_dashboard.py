@@ -0,0 +1,56 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from unittest import TestCase
+from iris import Iris
+
+
+class TestsRestDashboard(TestCase):
+
+    def setUp(self) -> None:
+        self._subject = Iris()
+
+    def tearDown(self):
+        self._subject.clear_database()
+
+    def _count_cases_in_statistics(self):
+        response = self._subject.get('/api/v2/dashboard/statistics', query_parameters={'object_type': 'case'}).json()
+        return sum(row['count'] for row in response)
+
+    def test_get_statistics_should_return_200(self):
+        response = self._subject.get('/api/v2/dashboard/statistics', query_parameters={'object_type': 'alert'})
+        self.assertEqual(200, response.status_code)
+
+    def test_get_statistics_should_count_a_new_case(self):
+        count = self._count_cases_in_statistics()
+        self._subject.create_dummy_case()
+        self.assertEqual(count + 1, self._count_cases_in_statistics())
+
+    def test_get_statistics_should_no_longer_count_a_deleted_case(self):
+        case_identifier = self._subject.create_dummy_case()
+        count = self._count_cases_in_statistics()
+        self._subject.delete(f'/api/v2/cases/{case_identifier}')
+        self.assertEqual(count - 1, self._count_cases_in_statistics())
+
+    def test_get_statistics_should_return_400_when_object_type_is_unknown(self):
+        response = self._subject.get('/api/v2/dashboard/statistics', query_parameters={'object_type': 'unknown'})
+        self.assertEqual(400, response.status_code)
+
+    def test_get_statistics_should_return_400_when_start_date_is_invalid(self):
+        response = self._subject.get('/api/v2/dashboard/statistics', query_parameters={'start_date': '18/10/2026'})
+        self.assertEqual(400, response.status_code)
@@ -0,0 +1,112 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+import hashlib
+from unittest import TestCase
+from iris import Iris
+
+_IDENTIFIER_FOR_NONEXISTENT_OBJECT = '00000000-0000-0000-0000-000000000000'
+_CONTENT = b'resumable upload content'
+
+
+class TestsRestDatastoreUploads(TestCase):
+
+    def setUp(self) -> None:
+        self._subject = Iris()
+
+    def tearDown(self):
+        self._subject.clear_database()
+
+    def _create_upload(self, content=_CONTENT):
+        case_identifier = self._subject.create_dummy_case()
+        body = {'case_id': case_identifier, 'file_original_name': 'evidence.bin', 'file_size': len(content)}
+        return self._subject.create('/api/v2/datastore/uploads', body).json()['upload_uuid']
+
+    def test_create_upload_should_return_201(self):
+        case_identifier = self._subject.create_dummy_case()
+        body = {'case_id': case_identifier, 'file_original_name': 'evidence.bin', 'file_size': len(_CONTENT)}
+        response = self._subject.create('/api/v2/datastore/uploads', body)
+        self.assertEqual(201, response.status_code)
+
+    def test_create_upload_without_file_size_should_return_400(self):
+        case_identifier = self._subject.create_dummy_case()
+        body = {'case_id': case_identifier, 'file_original_name': 'evidence.bin'}
+        response = self._subject.create('/api/v2/datastore/uploads', body)
+        self.assertEqual(400, response.status_code)
+
+    def test_put_chunk_should_advance_upload_offset(self):
+        identifier = self._create_upload()
+        response = self._subject.upload(f'/api/v2/datastore/uploads/{identifier}', _CONTENT[:10],
+                                        {'Upload-Offset': '0'}).json()
+        self.assertEqual(10, response['upload_offset'])
+
+    def test_put_chunk_at_wrong_offset_should_return_409(self):
+        identifier = self._create_upload()
+        response = self._subject.upload(f'/api/v2/datastore/uploads/{identifier}', _CONTENT[10:],
+                                        {'Upload-Offset': '10'})
+        self.assertEqual(409, response.status_code)
+
+    def test_put_chunk_at_wrong_offset_should_return_current_offset(self):
+        identifier = self._create_upload()
+        self._subject.upload(f'/api/v2/datastore/uploads/{identifier}', _CONTENT[:10], {'Upload-Offset': '0'})
+        response = self._subject.upload(f'/api/v2/datastore/uploads/{identifier}', _CONTENT[:10],
+                                        {'Upload-Offset': '0'}).json()
+        self.assertEqual(10, response['data']['upload_offset'])
+
+    def test_put_chunk_beyond_file_size_should_return_400(self):
+        identifier = self._create_upload()
+        response = self._subject.upload(f'/api/v2/datastore/uploads/{identifier}', _CONTENT + b'extra',
+                                        {'Upload-Offset': '0'})
+        self.assertEqual(400, response.status_code)
+
+    def test_commit_incomplete_upload_should_return_400(self):
+        identifier = self._create_upload()
+        self._subject.upload(f'/api/v2/datastore/uploads/{identifier}', _CONTENT[:10], {'Upload-Offset': '0'})
+        response = self._subject.create(f'/api/v2/datastore/uploads/{identifier}/commit', {})
+        self.assertEqual(400, response.status_code)
+
+    def test_commit_upload_should_return_sha256_of_chunks(self):
+        identifier = self._create_upload()
+        self._subject.upload(f'/api/v2/datastore/uploads/{identifier}', _CONTENT[:10], {'Upload-Offset': '0'})
+        self._subject.upload(f'/api/v2/datastore/uploads/{identifier}', _CONTENT[10:], {'Upload-Offset': '10'})
+        response = self._subject.create(f'/api/v2/datastore/uploads/{identifier}/commit', {}).json()
+        self.assertEqual(hashlib.sha256(_CONTENT).hexdigest().upper(), response['file_sha256'])
+
+    def test_commit_upload_with_wrong_expected_sha256_should_return_400(self):
+        identifier = self._create_upload()
+        self._subject.upload(f'/api/v2/datastore/uploads/{identifier}', _CONTENT, {'Upload-Offset': '0'})
+        response = self._subject.create(f'/api/v2/datastore/uploads/{identifier}/commit',
+                                        {'file_sha256': hashlib.sha256(b'other').hexdigest()})
+        self.assertEqual(400, response.status_code)
+
+    def test_get_upload_should_return_404_after_commit(self):
+        identifier = self._create_upload()
+        self._subject.upload(f'/api/v2/datastore/uploads/{identifier}', _CONTENT, {'Upload-Offset': '0'})
+        self._subject.create(f'/api/v2/datastore/uploads/{identifier}/commit', {})
+        response = self._subject.get(f'/api/v2/datastore/uploads/{identifier}')
+        self.assertEqual(404, response.status_code)
+
+    def test_delete_upload_should_return_204(self):
+        identifier = self._create_upload()
+        response = self._subject.delete(f'/api/v2/datastore/uploads/{identifier}')
+        self.assertEqual(204, response.status_code)
+
+    def test_get_upload_should_return_404_when_upload_does_not_exist(self):
+        response = self._subject.get(f'/api/v2/datastore/uploads/{_IDENTIFIER_FOR_NONEXISTENT_OBJECT}')
+        self.assertEqual(404, response.status_code)
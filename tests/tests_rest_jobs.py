@@ -0,0 +1,73 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+
+from unittest import TestCase
+from iris import Iris
+
+_IDENTIFIER_FOR_NONEXISTENT_OBJECT = 123456789
+
+
+class TestsRestJobs(TestCase):
+
+    def setUp(self) -> None:
+        self._subject = Iris()
+
+    def tearDown(self):
+        self._subject.clear_database()
+
+    def test_create_case_export_job_should_return_201(self):
+        case_identifier = self._subject.create_dummy_case()
+        body = {'job_type': 'case_export', 'case_id': case_identifier}
+        response = self._subject.create('/api/v2/jobs', body)
+        self.assertEqual(201, response.status_code)
+
+    def test_create_job_with_unknown_job_type_should_return_400(self):
+        case_identifier = self._subject.create_dummy_case()
+        body = {'job_type': 'unknown', 'case_id': case_identifier}
+        response = self._subject.create('/api/v2/jobs', body)
+        self.assertEqual(400, response.status_code)
+
+    def test_create_case_report_job_without_report_id_should_return_400(self):
+        case_identifier = self._subject.create_dummy_case()
+        body = {'job_type': 'case_report', 'case_id': case_identifier, 'parameters': {'report_type': 'activities'}}
+        response = self._subject.create('/api/v2/jobs', body)
+        self.assertEqual(400, response.status_code)
+
+    def test_get_job_should_return_job_type(self):
+        case_identifier = self._subject.create_dummy_case()
+        body = {'job_type': 'case_export', 'case_id': case_identifier}
+        identifier = self._subject.create('/api/v2/jobs', body).json()['id']
+        response = self._subject.get(f'/api/v2/jobs/{identifier}').json()
+        self.assertEqual('case_export', response['job_type'])
+
+    def test_get_job_should_return_404_when_job_does_not_exist(self):
+        response = self._subject.get(f'/api/v2/jobs/{_IDENTIFIER_FOR_NONEXISTENT_OBJECT}')
+        self.assertEqual(404, response.status_code)
+
+    def test_get_job_of_another_user_should_return_404(self):
+        case_identifier = self._subject.create_dummy_case()
+        body = {'job_type': 'case_export', 'case_id': case_identifier}
+        identifier = self._subject.create('/api/v2/jobs', body).json()['id']
+        user = self._subject.create_dummy_user()
+        response = user.get(f'/api/v2/jobs/{identifier}')
+        self.assertEqual(404, response.status_code)
+
+    def test_cancel_job_should_return_404_when_job_does_not_exist(self):
+        response = self._subject.create(f'/api/v2/jobs/{_IDENTIFIER_FOR_NONEXISTENT_OBJECT}/cancel', {})
+        self.assertEqual(404, response.status_code)
@@ -16,9 +16,12 @@
 #  along with this program; if not, write to the Free Software Foundation,
 #  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
+import time
 from unittest import TestCase
 from iris import Iris
 
+_JOB_TIMEOUT = 60
+
 
 class TestsRest(TestCase):
 
@@ -55,3 +58,99 @@ class TestsRest(TestCase):
     def test_get_timeline_state_should_return_200(self):
         response = self._subject.get('/case/timeline/state', query_parameters={'cid': 1})
         self.assertEqual(200, response.status_code)
+
+    def test_filter_timeline_with_per_page_should_return_cursors(self):
+        query_parameters = {'cid': 1, 'q': '{}', 'per_page': 1}
+        response = self._subject.get('/case/timeline/advanced-filter', query_parameters=query_parameters).json()
+        self.assertIn('next_cursor', response['data'])
+
+    def test_get_timeline_changes_should_return_changes_version(self):
+        query_parameters = {'cid': 1, 'since': 0}
+        response = self._subject.get('/case/timeline/events/changes', query_parameters=query_parameters).json()
+        self.assertIn('changes_version', response['data'])
+
+    def test_get_timeline_changes_should_return_the_events_whose_links_changed(self):
+        case_identifier = self._subject.create_dummy_case()
+        body = {'asset_type_id': 1, 'asset_name': 'admin_laptop_test'}
+        asset_identifier = self._subject.create(f'/api/v2/cases/{case_identifier}/assets', body).json()['asset_id']
+        body = {
+            'event_title': 'Event linked to an asset',
+            'event_date': '2026-10-19T09:00:00.000',
+            'event_tz': '+00:00',
+            'event_category_id': 1,
+            'event_assets': [asset_identifier],
+            'event_iocs': []
+        }
+        event_identifier = self._subject.create('/case/timeline/events/add', body,
+                                                {'cid': case_identifier}).json()['data']['event_id']
+        query_parameters = {'cid': case_identifier, 'since': 0}
+        since = self._subject.get('/case/timeline/events/changes',
+                                  query_parameters=query_parameters).json()['data']['changes_version']
+
+        self._subject.delete(f'/api/v2/cases/{case_identifier}/assets/{asset_identifier}')
+
+        query_parameters = {'cid': case_identifier, 'since': since}
+        response = self._subject.get('/case/timeline/events/changes', query_parameters=query_parameters).json()
+        self.assertEqual([event_identifier], [event['event_id'] for event in response['data']['timeline']])
+
+    def test_get_timeline_window_with_invalid_date_should_return_400(self):
+        query_parameters = {'cid': 1, 'start_date': 'not a date'}
+        response = self._subject.get('/case/timeline/events/window', query_parameters=query_parameters)
+        self.assertEqual(400, response.status_code)
+
+    def test_get_csv_import_job_status_of_unknown_job_should_return_404(self):
+        query_parameters = {'cid': 1}
+        response = self._subject.get('/case/timeline/events/csv_upload/jobs/123456789',
+                                     query_parameters=query_parameters)
+        self.assertEqual(404, response.status_code)
+
+    def _wait_for_job(self, job_identifier):
+        deadline = time.monotonic() + _JOB_TIMEOUT
+        while True:
+            job = self._subject.get(f'/api/v2/jobs/{job_identifier}').json()
+            if job['status'] not in ('pending', 'running') or time.monotonic() > deadline:
+                return job
+            time.sleep(0.5)
+
+    def test_upload_csv_stream_should_import_the_events_with_their_links_and_tags(self):
+        case_identifier = self._subject.create_dummy_case()
+        body = {'asset_type_id': 1, 'asset_name': 'csv_import_laptop'}
+        asset_identifier = self._subject.create(f'/api/v2/cases/{case_identifier}/assets', body).json()['asset_id']
+        body = {'ioc_type_id': 1, 'ioc_tlp_id': 2, 'ioc_value': '8.8.8.8', 'ioc_description': '', 'ioc_tags': ''}
+        ioc_identifier = self._subject.create(f'/api/v2/cases/{case_identifier}/iocs', body).json()['ioc_id']
+        csv_content = (
+            'event_date,event_tz,event_title,event_category,event_content,event_raw,event_source,event_assets,'
+            'event_iocs,event_tags\n'
+            '2026-10-19T09:00:00.000,+00:00,CSV event linked,,content,raw,source,csv_import_laptop,8.8.8.8,'
+            'first_tag|second_tag\n'
+            '2026-10-19T10:00:00.000,+00:00,CSV event alone,,content,raw,source,,,\n'
+        )
+        files = {'file': ('events.csv', csv_content.encode('utf-8'), 'text/csv')}
+        response = self._subject.upload_files('/case/timeline/events/csv_upload/stream', files,
+                                              query_parameters={'cid': case_identifier}).json()
+
+        job = self._wait_for_job(response['data']['id'])
+        self.assertEqual('success', job['status'])
+
+        timeline = self._subject.get('/case/timeline/events/list',
+                                     query_parameters={'cid': case_identifier}).json()['data']['timeline']
+        events = {event['event_title']: event for event in timeline}
+        self.assertEqual({'CSV event linked', 'CSV event alone'}, set(events))
+        self.assertEqual('first_tag,second_tag', events['CSV event linked']['event_tags'])
+
+        event_identifier = events['CSV event linked']['event_id']
+        event = self._subject.get(f'/case/timeline/events/{event_identifier}',
+                                  query_parameters={'cid': case_identifier}).json()['data']
+        self.assertEqual([asset_identifier], event['event_assets'])
+        self.assertEqual([ioc_identifier], event['event_iocs'])
+
+    def test_add_interactive_file_twice_should_reuse_the_stored_file(self):
+        body = {'file_original_name': 'pasted.txt', 'file_content': 'aW50ZXJhY3RpdmUgZmlsZQ=='}
+        first = self._subject.create('/datastore/file/add-interactive', body, {'cid': 1}).json()
+        second = self._subject.create('/datastore/file/add-interactive', body, {'cid': 1}).json()
+        self.assertEqual(first['data']['file_url'], second['data']['file_url'])
+
+    def test_add_interactive_file_with_invalid_base64_should_return_400(self):
+        body = {'file_original_name': 'pasted.txt', 'file_content': 'not base64!'}
+        response = self._subject.create('/datastore/file/add-interactive', body, {'cid': 1})
+        self.assertEqual(400, response.status_code)
@@ -173,3 +173,18 @@ class TestsRestPermissions(TestCase):
 
         response = user.delete(f'/api/v2/cases/{case_identifier}/tasks/{task_identifier}')
         self.assertEqual(403, response.status_code)
+
+    def test_get_case_should_return_403_once_user_case_access_is_removed(self):
+        case_identifier = self._subject.create_dummy_case()
+        user = self._subject.create_dummy_user()
+        body = {
+            'cases_list': [case_identifier],
+            'access_level': _CASE_ACCESS_LEVEL_FULL_ACCESS
+        }
+        self._subject.create(f'/manage/users/{user.get_identifier()}/cases-access/update', body)
+        user.get(f'/api/v2/cases/{case_identifier}')
+
+        body = {'cases': [case_identifier]}
+        self._subject.create(f'/manage/users/{user.get_identifier()}/cases-access/delete', body)
+        response = user.get(f'/api/v2/cases/{case_identifier}')
+        self.assertEqual(403, response.status_code)
@@ -0,0 +1,103 @@
+#  IRIS Source Code
+#  Copyright (C) 2026 - DFIR-IRIS
+#  contact@dfir-iris.org
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3 of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+
+from unittest import TestCase
+from iris import Iris
+
+
+class TestsRestSearch(TestCase):
+
+    def setUp(self) -> None:
+        self._subject = Iris()
+
+    def tearDown(self):
+        self._subject.clear_database()
+
+    def test_search_assets_should_find_asset_by_description(self):
+        case_identifier = self._subject.create_dummy_case()
+        body = {'asset_type_id': 1, 'asset_name': 'admin_laptop_test', 'asset_description': 'compromised workstation'}
+        self._subject.create(f'/api/v2/cases/{case_identifier}/assets', body)
+        body = {'search_value': 'compromised', 'search_type': 'assets'}
+        response = self._subject.create('/search', body).json()
+        self.assertEqual('admin_laptop_test', response['data'][0]['asset_name'])
+
+    def test_search_with_per_page_should_limit_results(self):
+        case_identifier = self._subject.create_dummy_case()
+        for asset_name in ('laptop1', 'laptop2'):
+            body = {'asset_type_id': 1, 'asset_name': asset_name, 'asset_description': 'compromised workstation'}
+            self._subject.create(f'/api/v2/cases/{case_identifier}/assets', body)
+        body = {'search_value': 'compromised', 'search_type': 'assets', 'per_page': 1}
+        response = self._subject.create('/search', body).json()
+        self.assertEqual(1, len(response['data']))
+
+    def test_search_with_unknown_type_should_return_400(self):
+        body = {'search_value': 'compromised', 'search_type': 'unknown'}
+        response = self._subject.create('/search', body)
+        self.assertEqual(400, response.status_code)
+
+    def test_search_notes_should_find_note_by_partial_ip(self):
+        case_identifier = self._subject.create_dummy_case()
+        directory_identifier = self._subject.create('/case/notes/directories/add', {'name': 'directory_name'},
+                                                    {'cid': case_identifier}).json()['data']['id']
+        body = {'directory_id': directory_identifier, 'note_title': 'Lateral movement',
+                'note_content': 'Connection from 192.168.10.25 to the domain controller'}
+        self._subject.create('/case/notes/add', body, {'cid': case_identifier})
+        body = {'search_value': '192.168.10', 'search_type': 'notes'}
+        response = self._subject.create('/search', body).json()
+        self.assertEqual('Lateral movement', response['data'][0]['note_title'])
+
+    def test_search_comments_should_find_comment_by_partial_hash(self):
+        case_identifier = self._subject.create_dummy_case()
+        body = {'asset_type_id': 1, 'asset_name': 'admin_laptop_test'}
+        asset_identifier = self._subject.create(f'/api/v2/cases/{case_identifier}/assets', body).json()['asset_id']
+        body = {'comment_text': 'dropped d41d8cd98f00b204e9800998ecf8427e in the temporary folder'}
+        self._subject.create(f'/case/assets/{asset_identifier}/comments/add', body, {'cid': case_identifier})
+        body = {'search_value': 'd41d8cd98f00', 'search_type': 'comments'}
+        response = self._subject.create('/search', body).json()
+        self.assertIn('d41d8cd98f00b204e9800998ecf8427e', response['data'][0]['comment_text'])
+
+    def test_search_events_should_find_event_by_partial_hostname(self):
+        case_identifier = self._subject.create_dummy_case()
+        body = {
+            'event_title': 'Beacon to dc01.corp.example.com',
+            'event_date': '2026-10-19T09:00:00.000',
+            'event_tz': '+00:00',
+            'event_category_id': 1,
+            'event_assets': [],
+            'event_iocs': []
+        }
+        self._subject.create('/case/timeline/events/add', body, {'cid': case_identifier})
+        body = {'search_value': 'corp.example', 'search_type': 'events'}
+        response = self._subject.create('/search', body).json()
+        self.assertEqual('Beacon to dc01.corp.example.com', response['data'][0]['event_title'])
+
+    def test_search_events_should_find_event_by_word(self):
+        case_identifier = self._subject.create_dummy_case()
+        body = {
+            'event_title': 'Suspicious logon',
+            'event_content': 'Interactive logon of the administrator',
+            'event_date': '2026-10-19T09:00:00.000',
+            'event_tz': '+00:00',
+            'event_category_id': 1,
+            'event_assets': [],
+            'event_iocs': []
+        }
+        self._subject.create('/case/timeline/events/add', body, {'cid': case_identifier})
+        body = {'search_value': 'administrator', 'search_type': 'events'}
+        response = self._subject.create('/search', body).json()
+        self.assertEqual('Suspicious logon', response['data'][0]['event_title'])